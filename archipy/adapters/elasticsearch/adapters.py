@@ -1,22 +1,303 @@
+import asyncio
+import contextlib
+import itertools
 import logging
-from typing import Any, override
-
-from elasticsearch import AsyncElasticsearch, Elasticsearch
-
+import re
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Literal, override
+
+from elastic_transport import ApiResponseMeta, ObjectApiResponse
+from elasticsearch import ApiError, AsyncElasticsearch, Elasticsearch, TransportError, helpers
+from elasticsearch.exceptions import HTTP_EXCEPTIONS
+
+from archipy.adapters.elasticsearch.cache import AsyncElasticsearchSearchCache, ElasticsearchSearchCache
 from archipy.adapters.elasticsearch.ports import (
+    BULK_MAX_CHUNK_BYTES,
     AsyncElasticsearchPort,
+    ElasticsearchBulkActionType,
+    ElasticsearchBulkResultType,
     ElasticsearchDocumentType,
+    ElasticsearchHitType,
     ElasticsearchIdType,
     ElasticsearchIndexType,
     ElasticsearchPort,
     ElasticsearchQueryType,
+    ElasticsearchReindexMethodType,
+    ElasticsearchReindexResultType,
     ElasticsearchResponseType,
+    ElasticsearchSearchRequestType,
 )
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
 from archipy.configs.base_config import BaseConfig
 from archipy.configs.config_template import ElasticsearchConfig
+from archipy.models.errors import FailedPreconditionError, InternalError, InvalidArgumentError
+
+if TYPE_CHECKING:
+    from archipy.adapters.elasticsearch.metrics import ElasticsearchMetrics
 
 logger = logging.getLogger(__name__)
 
+# Statuses of opening a point in time on clusters that do not support them
+_POINT_IN_TIME_UNSUPPORTED_STATUSES = frozenset((400, 404, 405))
+
+# Operations of the action lines of a bulk request
+_BULK_OPERATIONS = frozenset(("index", "create", "update", "delete"))
+
+# Values of the refresh option making writes visible to searches before the request returns
+_REFRESHED_VALUES = (True, "true", "wait_for")
+
+
+def _get_metrics(configs: ElasticsearchConfig) -> "ElasticsearchMetrics | None":
+    """Returns the process-wide Elasticsearch metrics when the configuration enables them.
+
+    Args:
+        configs (ElasticsearchConfig): Elasticsearch configuration.
+
+    Returns:
+        ElasticsearchMetrics | None: The metrics, or None when metrics are disabled.
+    """
+    if not configs.METRICS_ENABLED:
+        return None
+    from archipy.adapters.elasticsearch.metrics import get_elasticsearch_metrics
+
+    return get_elasticsearch_metrics()
+
+
+def _bulk_indices(actions: Iterable[Any], kwargs: dict[str, Any]) -> set[str]:
+    """Returns the indices written by the action lines of a bulk request.
+
+    Args:
+        actions (Iterable[Any]): The action and document lines of the request.
+        kwargs (dict[str, Any]): The options of the request, whose ``index`` is the default index.
+
+    Returns:
+        set[str]: The written indices.
+    """
+    indices = {str(kwargs["index"])} if kwargs.get("index") else set()
+    for action in actions:
+        if isinstance(action, dict) and len(action) == 1:
+            operation, meta = next(iter(action.items()))
+            if operation in _BULK_OPERATIONS and isinstance(meta, dict) and meta.get("_index"):
+                indices.add(str(meta["_index"]))
+    return indices
+
+
+def _tracked_actions(
+    actions: Iterable[ElasticsearchBulkActionType],
+    indices: set[str],
+) -> Iterator[ElasticsearchBulkActionType]:
+    """Yields bulk actions, collecting the indices they write."""
+    for action in actions:
+        if isinstance(action, dict) and action.get("_index"):
+            indices.add(str(action["_index"]))
+        yield action
+
+
+async def _async_tracked_actions(
+    actions: Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType],
+    indices: set[str],
+) -> AsyncIterator[ElasticsearchBulkActionType]:
+    """Yields bulk actions from an iterable or async iterable, collecting the indices they write."""
+    if isinstance(actions, AsyncIterable):
+        async for action in actions:
+            if isinstance(action, dict) and action.get("_index"):
+                indices.add(str(action["_index"]))
+            yield action
+    else:
+        for action in _tracked_actions(actions, indices):
+            yield action
+
+
+# Settings of an index while documents are loaded into it: no refreshes, and no replicas to copy them to
+_INGEST_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+
+# Seconds between two reports of the documents copied by a reindex
+_REINDEX_PROGRESS_INTERVAL = 1.0
+
+
+def _index_setting(settings: dict[str, Any], name: str) -> object:
+    """Returns an index setting given flat, prefixed with "index." or nested under "index", None if not set."""
+    nested = settings.get("index")
+    for value in (
+        settings.get(name),
+        settings.get(f"index.{name}"),
+        nested.get(name) if isinstance(nested, dict) else None,
+    ):
+        if value is not None:
+            return value
+    return None
+
+
+def _ingest_body(
+    body: dict[str, Any] | None,
+    source_settings: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Returns the body creating an index tuned for ingestion, and the settings to restore once it is loaded.
+
+    The refresh interval and replicas of ``body`` are restored, or else those of the source index, or
+    else their defaults.
+
+    Args:
+        body (dict[str, Any] | None): Settings and mappings of the new index.
+        source_settings (dict[str, Any]): Flat settings of the source index.
+
+    Returns:
+        tuple[dict[str, Any], dict[str, Any]]: The body of the index creation and the settings to restore.
+    """
+    body = dict(body or {})
+    settings = dict(body.get("settings") or {})
+    nested = dict(settings["index"]) if isinstance(settings.get("index"), dict) else None
+    restored: dict[str, Any] = {}
+    for name, value in _INGEST_SETTINGS.items():
+        configured = _index_setting(settings, name)
+        restored[name] = configured if configured is not None else _index_setting(source_settings, name)
+        settings.pop(name, None)
+        settings.pop(f"index.{name}", None)
+        if nested is not None:
+            nested.pop(name, None)
+        settings[f"index.{name}"] = value
+    if nested is not None:
+        settings["index"] = nested
+    body["settings"] = settings
+    return body, restored
+
+
+def _next_version(alias: str, indices: Iterable[str]) -> int:
+    """Returns the version following the highest ``{alias}-v{n}`` of the indices, 1 if there is none."""
+    pattern = re.compile(rf"{re.escape(alias)}-v(\d+)")
+    return max((int(match.group(1)) for index in indices if (match := pattern.fullmatch(index))), default=0) + 1
+
+
+def _copy_action(target: str, hit: ElasticsearchHitType) -> ElasticsearchBulkActionType:
+    """Returns the bulk action copying a hit into an index with its id and routing."""
+    action = {"_index": target, "_id": hit["_id"], "_source": hit["_source"]}
+    if "_routing" in hit:
+        action["routing"] = hit["_routing"]
+    return action
+
+
+def _alias_swap_actions(alias: str, target: str, previous: list[str], replaced: bool) -> list[dict[str, Any]]:
+    """Returns the actions moving an alias to a new index in one atomic request.
+
+    Args:
+        alias (str): The alias.
+        target (str): The index the alias moves to.
+        previous (list[str]): The indices the alias pointed to.
+        replaced (bool): Whether ``alias`` is a concrete index, deleted in the same request.
+
+    Returns:
+        list[dict[str, Any]]: The actions of the update_aliases request.
+    """
+    if replaced:
+        actions = [{"remove_index": {"index": alias}}]
+    else:
+        actions = [{"remove": {"index": index, "alias": alias}} for index in previous]
+    return [*actions, {"add": {"index": target, "alias": alias}}]
+
+
+def _page_body(
+    query: ElasticsearchQueryType | None,
+    page_size: int,
+    tiebreaker: str,
+    slice_id: int | None,
+    max_slices: int | None,
+) -> dict[str, Any]:
+    """Builds the body of the requests of a paginated search.
+
+    Args:
+        query (ElasticsearchQueryType | None): The search body given by the caller.
+        page_size (int): Number of hits per request.
+        tiebreaker (str): Sort used when the search body has none, in index order.
+        slice_id (int | None): The slice to search, if any.
+        max_slices (int | None): The number of slices, if any.
+
+    Returns:
+        dict[str, Any]: The search body.
+
+    Raises:
+        InvalidArgumentError: If page_size is not positive or the slice is out of range.
+    """
+    if page_size < 1:
+        raise InvalidArgumentError(argument_name="page_size")
+    body = {**(query or {}), "size": page_size}
+    body.setdefault("sort", [tiebreaker])
+    if slice_id is None and max_slices is None:
+        return body
+    if slice_id is None or max_slices is None or not 0 <= slice_id < max_slices:
+        raise InvalidArgumentError(argument_name="slice_id")
+    if max_slices > 1:
+        body["slice"] = {"id": slice_id, "max": max_slices}
+    return body
+
+
+def _msearch_body(searches: Sequence[ElasticsearchSearchRequestType]) -> list[dict[str, Any]]:
+    """Builds the header and body lines of an msearch request.
+
+    Args:
+        searches (Sequence[ElasticsearchSearchRequestType]): (index, query) of every search.
+
+    Returns:
+        list[dict[str, Any]]: The lines of the request.
+    """
+    return [line for index, query in searches for line in ({"index": index}, query)]
+
+
+def _msearch_item(item: dict[str, Any], meta: ApiResponseMeta) -> ObjectApiResponse[Any] | ApiError:
+    """Returns the response of one search of an msearch, or the error it would have raised on its own.
+
+    Args:
+        item (dict[str, Any]): The entry of the search in the msearch responses.
+        meta (ApiResponseMeta): The metadata of the msearch response.
+
+    Returns:
+        ObjectApiResponse[Any] | ApiError: The response of the search, or its error.
+    """
+    status = item.get("status", 200)
+    item_meta = ApiResponseMeta(
+        status=status,
+        http_version=meta.http_version,
+        headers=meta.headers,
+        duration=meta.duration,
+        node=meta.node,
+    )
+    if "error" not in item:
+        return ObjectApiResponse(body=item, meta=item_meta)
+    error = item["error"]
+    message = error.get("type", str(error)) if isinstance(error, dict) else str(error)
+    return HTTP_EXCEPTIONS.get(status, ApiError)(message=message, meta=item_meta, body=item)
+
+
+def _point_in_time_unsupported(error: ApiError) -> bool:
+    """Returns whether opening a point in time failed because the cluster does not support them."""
+    return error.status_code in _POINT_IN_TIME_UNSUPPORTED_STATUSES and error.error != "index_not_found_exception"
+
+
+async def _batched[T](items: Iterable[T] | AsyncIterable[T], size: int) -> AsyncIterator[list[T]]:
+    """Groups the items of an iterable or async iterable in lists of at most size items.
+
+    Args:
+        items (Iterable[T] | AsyncIterable[T]): The items.
+        size (int): Maximum number of items per list.
+
+    Yields:
+        list[T]: The next group of items.
+    """
+    if isinstance(items, AsyncIterable):
+        batch: list[T] = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    else:
+        for group in itertools.batched(items, size, strict=False):
+            yield list(group)
+
 
 class ElasticsearchAdapter(ElasticsearchPort):
     """Concrete implementation of the ElasticsearchPort interface using elasticsearch-py library.
@@ -36,6 +317,8 @@ class ElasticsearchAdapter(ElasticsearchPort):
             BaseConfig.global_config().ELASTIC if elasticsearch_config is None else elasticsearch_config
         )
         self.client = self._get_client(configs)
+        self._metrics = _get_metrics(configs)
+        self.search_cache = self._get_search_cache(configs)
 
     @staticmethod
     def _get_client(configs: ElasticsearchConfig) -> Elasticsearch:
@@ -75,6 +358,43 @@ class ElasticsearchAdapter(ElasticsearchPort):
             max_dead_node_backoff=configs.MAX_DEAD_NODE_BACKOFF,
         )
 
+    @staticmethod
+    def _get_search_cache(configs: ElasticsearchConfig) -> ElasticsearchSearchCache | None:
+        """Create the search result cache when the configuration enables it.
+
+        Args:
+            configs (ElasticsearchConfig): Configuration settings for Elasticsearch.
+
+        Returns:
+            ElasticsearchSearchCache | None: The cache, or None when search results are not cached.
+        """
+        if not configs.SEARCH_CACHE_ENABLED:
+            return None
+        redis_client: RedisPort | None = None
+        if configs.SEARCH_CACHE_REDIS_ENABLED:
+            from archipy.adapters.redis.adapters import RedisAdapter
+
+            redis_client = RedisAdapter()
+        return ElasticsearchSearchCache(
+            ttl_seconds=configs.SEARCH_CACHE_TTL_SECONDS,
+            local_ttl_seconds=configs.SEARCH_CACHE_LOCAL_TTL_SECONDS,
+            local_maxsize=configs.SEARCH_CACHE_LOCAL_MAXSIZE,
+            refresh_interval_seconds=configs.SEARCH_CACHE_REFRESH_INTERVAL_SECONDS,
+            redis_client=redis_client,
+            key_prefix=configs.SEARCH_CACHE_KEY_PREFIX,
+            metrics=_get_metrics(configs),
+        )
+
+    def _invalidate_search_cache(self, indices: Iterable[str], refreshed: bool) -> None:
+        """Drop the cached search results of written indices.
+
+        Args:
+            indices (Iterable[str]): The written indices.
+            refreshed (bool): Whether the writes are already visible to searches.
+        """
+        if self.search_cache is not None:
+            self.search_cache.invalidate(*indices, refreshed=refreshed)
+
     @override
     def ping(self) -> ElasticsearchResponseType:
         """Test the connection to the Elasticsearch server.
@@ -103,7 +423,10 @@ class ElasticsearchAdapter(ElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return self.client.index(index=index, document=document, id=doc_id, **kwargs)
+        try:
+            return self.client.index(index=index, document=document, id=doc_id, **kwargs)
+        finally:
+            self._invalidate_search_cache([index], kwargs.get("refresh") in _REFRESHED_VALUES)
 
     @override
     def get(
@@ -133,6 +456,9 @@ class ElasticsearchAdapter(ElasticsearchPort):
     ) -> ElasticsearchResponseType:
         """Search for documents in Elasticsearch.
 
+        When ``SEARCH_CACHE_ENABLED`` is set, results are served from the search cache when an equal
+        search of the index was cached, and the response body is returned.
+
         Args:
             index (ElasticsearchIndexType): The index name.
             query (ElasticsearchQueryType): The search query.
@@ -141,7 +467,36 @@ class ElasticsearchAdapter(ElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The search results.
         """
-        return self.client.search(index=index, body=query, **kwargs)
+        if self.search_cache is None:
+            return self.client.search(index=index, body=query, **kwargs)
+        return self.search_cache.fetch(
+            index,
+            query,
+            kwargs,
+            lambda: self.client.search(index=index, body=query, **kwargs),
+        )
+
+    @override
+    def msearch(
+        self,
+        searches: Sequence[ElasticsearchSearchRequestType],
+        **kwargs: object,
+    ) -> ElasticsearchResponseType:
+        """Run several searches in one request.
+
+        Sending searches together saves a round trip per search, and the cluster runs them
+        concurrently, up to ``max_concurrent_searches``. A failed search does not fail the others.
+
+        Args:
+            searches (Sequence[ElasticsearchSearchRequestType]): (index, query) of every search.
+            kwargs: Additional keyword arguments passed to the Elasticsearch client, such as
+                ``max_concurrent_searches``.
+
+        Returns:
+            ElasticsearchResponseType: The results, whose ``responses`` hold the response of every search in
+                order, or its ``error`` and ``status`` if it failed.
+        """
+        return self.client.msearch(searches=_msearch_body(searches), **kwargs)
 
     @override
     def update(
@@ -162,7 +517,10 @@ class ElasticsearchAdapter(ElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return self.client.update(index=index, id=doc_id, doc=doc, **kwargs)
+        try:
+            return self.client.update(index=index, id=doc_id, doc=doc, **kwargs)
+        finally:
+            self._invalidate_search_cache([index], kwargs.get("refresh") in _REFRESHED_VALUES)
 
     @override
     def delete(
@@ -181,7 +539,10 @@ class ElasticsearchAdapter(ElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return self.client.delete(index=index, id=doc_id, **kwargs)
+        try:
+            return self.client.delete(index=index, id=doc_id, **kwargs)
+        finally:
+            self._invalidate_search_cache([index], kwargs.get("refresh") in _REFRESHED_VALUES)
 
     @override
     def bulk(
@@ -201,7 +562,560 @@ class ElasticsearchAdapter(ElasticsearchPort):
         Raises:
             BulkIndexError: If any of the bulk operations fail.
         """
-        return self.client.bulk(operations=actions, **kwargs)
+        try:
+            return self.client.bulk(operations=actions, **kwargs)
+        finally:
+            self._invalidate_search_cache(_bulk_indices(actions, kwargs), kwargs.get("refresh") in _REFRESHED_VALUES)
+
+    @override
+    def streaming_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchBulkResultType]:
+        """Stream bulk actions to Elasticsearch in chunks, yielding the result of every action.
+
+        Actions are read lazily and sent in requests of at most ``chunk_size`` actions and
+        ``max_chunk_bytes`` bytes, so memory stays bounded however many actions there are. Actions
+        rejected with a 429 status are retried with exponential backoff.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType]): The actions, consumed lazily, such as a generator.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            kwargs: Additional keyword arguments passed to the bulk requests, such as ``index`` or ``refresh``.
+
+        Yields:
+            ElasticsearchBulkResultType: (success, item) for every action, chunk by chunk; actions retried
+                after a 429 status come after the other actions of their chunk.
+
+        Raises:
+            BulkIndexError: If raise_on_error is True and actions fail.
+        """
+        indices = _bulk_indices((), kwargs)
+        try:
+            yield from helpers.streaming_bulk(
+                self.client,
+                _tracked_actions(actions, indices),
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                max_retries=max_retries,
+                initial_backoff=initial_backoff,
+                max_backoff=max_backoff,
+                raise_on_error=raise_on_error,
+                **kwargs,
+            )
+        finally:
+            self._invalidate_search_cache(indices, kwargs.get("refresh") in _REFRESHED_VALUES)
+
+    @override
+    def parallel_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType],
+        thread_count: int = 4,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchBulkResultType]:
+        """Send bulk actions to Elasticsearch in chunks sent concurrently, yielding the result of every action.
+
+        Chunks of ``chunk_size`` actions are sent by ``thread_count`` threads, each retrying the actions
+        of its chunk rejected with a 429 status with exponential backoff. Actions are read only as
+        threads free up, so at most ``thread_count`` chunks are held in memory.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType]): The actions, consumed lazily, such as a generator.
+            thread_count (int): Maximum number of chunks sent at once. Defaults to 4.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            kwargs: Additional keyword arguments passed to the bulk requests, such as ``index`` or ``refresh``.
+
+        Yields:
+            ElasticsearchBulkResultType: (success, item) for every action, chunk by chunk; actions retried
+                after a 429 status come after the other actions of their chunk.
+
+        Raises:
+            BulkIndexError: If raise_on_error is True and actions fail.
+        """
+
+        def send(chunk: tuple[ElasticsearchBulkActionType, ...]) -> list[ElasticsearchBulkResultType]:
+            return list(
+                self.streaming_bulk(
+                    chunk,
+                    len(chunk),
+                    max_chunk_bytes,
+                    max_retries,
+                    initial_backoff,
+                    max_backoff,
+                    raise_on_error,
+                    **kwargs,
+                ),
+            )
+
+        with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="elasticsearch-bulk") as pool:
+            pending: deque[Future[list[ElasticsearchBulkResultType]]] = deque()
+            try:
+                for chunk in itertools.batched(actions, chunk_size, strict=False):
+                    pending.append(pool.submit(send, chunk))
+                    if len(pending) >= thread_count:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @override
+    def iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a point in time and search_after.
+
+        Unlike search, the number of hits is not limited by ``index.max_result_window``. The point in
+        time freezes the index as of the first request, so documents changed while iterating are seen
+        as they were, and it is closed when the iteration ends or the iterator is closed. Pages are
+        sorted by ``_shard_doc`` unless the search body has a sort, to which ``_shard_doc`` is added as
+        a tiebreaker.
+
+        When the cluster does not support points in time, falls back to scroll_hits.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the point in time is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            kwargs: Additional keyword arguments passed to the search requests.
+
+        Yields:
+            ElasticsearchHitType: Every hit of the search.
+
+        Raises:
+            InvalidArgumentError: If page_size is not positive or the slice is out of range.
+        """
+        body = _page_body(query, page_size, "_shard_doc", slice_id, max_slices)
+        pit_id = self._open_point_in_time(index, keep_alive)
+        if pit_id is None:
+            yield from self.scroll_hits(index, query, page_size, keep_alive, slice_id, max_slices, **kwargs)
+            return
+        try:
+            for hits in self._point_in_time_pages(pit_id, body, keep_alive, kwargs):
+                yield from hits
+        finally:
+            self._close_point_in_time(pit_id)
+
+    @override
+    def scroll_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a scroll.
+
+        Prefer iterate_hits, whose point in time is cheaper for the cluster to keep. The scroll is
+        cleared when the iteration ends or the iterator is closed. Pages are sorted by ``_doc`` unless
+        the search body has a sort.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the scroll is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            kwargs: Additional keyword arguments passed to the search requests.
+
+        Yields:
+            ElasticsearchHitType: Every hit of the search.
+
+        Raises:
+            InvalidArgumentError: If page_size is not positive or the slice is out of range.
+        """
+        body = _page_body(query, page_size, "_doc", slice_id, max_slices)
+        with contextlib.closing(self._scroll_pages(index, body, keep_alive, kwargs)) as pages:
+            for hits in pages:
+                yield from hits
+
+    @override
+    def parallel_iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        slices: int = 4,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search, fetching slices of the hits concurrently.
+
+        The hits are split in ``slices`` slices sharing one point in time, or scrolled slice by slice
+        when the cluster does not support points in time. One thread per slice fetches its next page
+        while the previous one is consumed, so at most one page per slice is held in memory. The point
+        in time or scrolls are released when the iteration ends or the iterator is closed.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query and _source. Defaults to
+                all documents.
+            slices (int): Number of slices fetched concurrently. Defaults to 4.
+            page_size (int): Number of hits fetched per request of a slice. Defaults to 1000.
+            keep_alive (str): How long the point in time or scroll is kept between requests. Defaults to "1m".
+            kwargs: Additional keyword arguments passed to the search requests.
+
+        Yields:
+            ElasticsearchHitType: Every hit of the search, in no particular order.
+
+        Raises:
+            InvalidArgumentError: If slices or page_size is not positive.
+        """
+        if slices < 1:
+            raise InvalidArgumentError(argument_name="slices")
+        if page_size < 1:
+            raise InvalidArgumentError(argument_name="page_size")
+        pit_id = self._open_point_in_time(index, keep_alive)
+        page_iterators: list[Generator[list[ElasticsearchHitType]]]
+        if pit_id is None:
+            page_iterators = [
+                self._scroll_pages(index, _page_body(query, page_size, "_doc", slice_id, slices), keep_alive, kwargs)
+                for slice_id in range(slices)
+            ]
+        else:
+            page_iterators = [
+                self._point_in_time_pages(
+                    pit_id,
+                    _page_body(query, page_size, "_shard_doc", slice_id, slices),
+                    keep_alive,
+                    kwargs,
+                )
+                for slice_id in range(slices)
+            ]
+        pool = ThreadPoolExecutor(max_workers=slices, thread_name_prefix="elasticsearch-slice")
+        try:
+            pending = {pool.submit(next, pages, None): pages for pages in page_iterators}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pages = pending.pop(future)
+                    if (hits := future.result()) is not None:
+                        pending[pool.submit(next, pages, None)] = pages
+                        yield from hits
+        finally:
+            pool.shutdown(cancel_futures=True)
+            for pages in page_iterators:
+                pages.close()
+            if pit_id is not None:
+                self._close_point_in_time(pit_id)
+
+    def _open_point_in_time(self, index: ElasticsearchIndexType, keep_alive: str) -> str | None:
+        """Opens a point in time on an index.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            keep_alive (str): How long the point in time is kept between requests.
+
+        Returns:
+            str | None: The id of the point in time, or None if the cluster does not support them.
+        """
+        try:
+            response = self.client.open_point_in_time(index=index, keep_alive=keep_alive)
+        except ApiError as e:
+            if not _point_in_time_unsupported(e):
+                raise
+            logger.info("Points in time are not supported for %s, falling back to scroll: %s", index, e)
+            return None
+        return str(response["id"])
+
+    def _close_point_in_time(self, pit_id: str) -> None:
+        """Closes a point in time, logging failures since it expires on its own anyway."""
+        try:
+            self.client.close_point_in_time(id=pit_id)
+        except (ApiError, TransportError) as e:
+            logger.warning("Failed to close Elasticsearch point in time: %s", e)
+
+    def _point_in_time_pages(
+        self,
+        pit_id: str,
+        body: dict[str, Any],
+        keep_alive: str,
+        kwargs: dict[str, object],
+    ) -> Generator[list[ElasticsearchHitType]]:
+        """Yields the pages of hits of a search over a point in time, following them with search_after.
+
+        Args:
+            pit_id (str): The id of the point in time.
+            body (dict[str, Any]): The search body.
+            keep_alive (str): How long the point in time is kept between requests.
+            kwargs (dict[str, object]): Additional keyword arguments passed to the search requests.
+
+        Yields:
+            list[ElasticsearchHitType]: The hits of every non-empty page.
+        """
+        body = {**body}
+        while True:
+            body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+            response = self.client.search(body=body, **kwargs)
+            # The point in time id may change between requests, and the latest one must be used
+            pit_id = response.get("pit_id", pit_id)
+            hits = response["hits"]["hits"]
+            if hits:
+                yield hits
+            if len(hits) < body["size"]:
+                return
+            body["search_after"] = hits[-1]["sort"]
+
+    def _scroll_pages(
+        self,
+        index: ElasticsearchIndexType,
+        body: dict[str, Any],
+        keep_alive: str,
+        kwargs: dict[str, object],
+    ) -> Generator[list[ElasticsearchHitType]]:
+        """Yields the pages of hits of a scrolled search, clearing the scroll when closed.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            body (dict[str, Any]): The search body.
+            keep_alive (str): How long the scroll is kept between requests.
+            kwargs (dict[str, object]): Additional keyword arguments passed to the search requests.
+
+        Yields:
+            list[ElasticsearchHitType]: The hits of every non-empty page.
+        """
+        response = self.client.search(index=index, body=body, scroll=keep_alive, **kwargs)
+        scroll_id = response.get("_scroll_id")
+        try:
+            while hits := response["hits"]["hits"]:
+                yield hits
+                if len(hits) < body["size"]:
+                    return
+                response = self.client.scroll(scroll_id=scroll_id, scroll=keep_alive)
+                scroll_id = response.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id is not None:
+                try:
+                    self.client.clear_scroll(scroll_id=scroll_id)
+                except (ApiError, TransportError) as e:
+                    logger.warning("Failed to clear Elasticsearch scroll: %s", e)
+
+    @override
+    def reindex_alias(
+        self,
+        alias: str,
+        body: dict[str, Any] | None = None,
+        source_index: ElasticsearchIndexType | None = None,
+        query: ElasticsearchQueryType | None = None,
+        method: ElasticsearchReindexMethodType = "reindex",
+        slices: int | Literal["auto"] = "auto",
+        requests_per_second: float | None = None,
+        batch_size: int = 1000,
+        max_num_segments: int | None = 1,
+        poll_interval: float = 5.0,
+        delete_source: bool = False,
+    ) -> ElasticsearchReindexResultType:
+        """Copy the documents behind an alias into a new versioned index and point the alias to it.
+
+        The new index, named ``{alias}-v{n}``, is created from ``body`` with refreshes disabled and no
+        replicas, so documents are written once and never searched while they are loaded. They are
+        copied by a sliced reindex task running on the cluster, or with ``method="bulk"`` by reading
+        them through a point in time and streaming them to bulk requests from this process. The index
+        is then force-merged, its refresh interval and replicas are restored from ``body``, or else from
+        the source index, and the alias is moved to it in one atomic request, so searches through the
+        alias switch from the old documents to the new ones at once. If anything fails before the
+        swap, the new index is deleted and the alias is left untouched.
+
+        Progress is logged, and with ``METRICS_ENABLED`` exported as the phase of the reindex, the
+        duration of every phase and the documents copied out of those to copy.
+
+        Args:
+            alias (str): The alias the new index is published under.
+            body (dict[str, Any] | None): Settings and mappings of the new index. Defaults to None.
+            source_index (ElasticsearchIndexType | None): Index to copy from instead of the indices of the
+                alias, such as for the first index published under the alias. Defaults to None.
+            query (ElasticsearchQueryType | None): Query selecting the documents to copy, such as
+                ``{"term": {"active": True}}``. Defaults to all documents.
+            method (ElasticsearchReindexMethodType): "reindex" to copy with a reindex task on the cluster,
+                "bulk" to stream the documents through bulk requests. Defaults to "reindex".
+            slices (int | Literal["auto"]): Slices of the reindex task copied in parallel, "auto" for one
+                per shard. Defaults to "auto".
+            requests_per_second (float | None): Maximum documents copied per second, to leave capacity to
+                the searches and writes of the cluster. Defaults to None, for no limit.
+            batch_size (int): Documents read and written per request. Defaults to 1000.
+            max_num_segments (int | None): Segments per shard the new index is force-merged to, None to skip
+                the force-merge. Defaults to 1.
+            poll_interval (float): Seconds between two checks of the reindex task. Defaults to 5.0.
+            delete_source (bool): Whether to delete the indices the alias pointed to once it is swapped.
+                Required when ``alias`` is a concrete index, which is then replaced by the alias in the
+                same atomic request. Defaults to False.
+
+        Returns:
+            ElasticsearchReindexResultType: ``index`` the alias points to, ``previous_indices`` it pointed to
+                and the number of ``documents`` copied.
+
+        Raises:
+            InvalidArgumentError: If the alias does not exist and no source index is given.
+            FailedPreconditionError: If ``alias`` is a concrete index and ``delete_source`` is False.
+            InternalError: If documents could not be copied.
+        """
+        previous = self._alias_indices(alias)
+        replaced = not previous and bool(self.client.indices.exists(index=alias))
+        if replaced and not delete_source:
+            raise FailedPreconditionError(
+                precondition=f"{alias} is an index, which can only be replaced by an alias with delete_source",
+            )
+        previous = previous or ([alias] if replaced else [])
+        sources = [source_index] if source_index else previous
+        if not sources:
+            raise InvalidArgumentError(
+                argument_name="source_index",
+                additional_data={"reason": f"Alias {alias} does not exist and no source index was given"},
+            )
+        target = f"{alias}-v{_next_version(alias, previous)}"
+        while self.client.indices.exists(index=target):
+            target = f"{alias}-v{_next_version(alias, [target])}"
+        progress = _ReindexProgress(alias, target, self._metrics)
+        settings: dict[str, Any] = self.client.indices.get_settings(index=sources[0], flat_settings=True).body
+        source_settings: dict[str, Any] = next(iter(settings.values()), {"settings": {}})["settings"]
+        create_body, restored = _ingest_body(body, source_settings)
+        self.client.indices.create(index=target, **create_body)
+        try:
+            progress.phase("copying")
+            if method == "bulk":
+                documents = self._bulk_copy(sources, target, query, requests_per_second, batch_size, progress)
+            else:
+                documents = self._reindex_copy(
+                    sources,
+                    target,
+                    query,
+                    slices,
+                    requests_per_second,
+                    batch_size,
+                    poll_interval,
+                    progress,
+                )
+            progress.phase("merging")
+            if max_num_segments is not None:
+                self.client.indices.forcemerge(index=target, max_num_segments=max_num_segments)
+            # Replicas copy the merged segments instead of merging them again
+            self.client.indices.put_settings(index=target, settings={"index": restored})
+            self.client.indices.refresh(index=target)
+            progress.phase("swapping")
+            self.client.indices.update_aliases(actions=_alias_swap_actions(alias, target, previous, replaced))
+        except BaseException:
+            progress.phase("failed")
+            try:
+                self.client.indices.delete(index=target)
+            except (ApiError, TransportError) as e:
+                logger.warning("Failed to delete index %s of the failed reindex: %s", target, e)
+            raise
+        if delete_source and previous and not replaced:
+            self.client.indices.delete(index=",".join(previous))
+        self._invalidate_search_cache([alias, *previous], refreshed=True)
+        progress.phase("completed")
+        return {"index": target, "previous_indices": previous, "documents": documents}
+
+    def _alias_indices(self, alias: str) -> list[str]:
+        """Return the indices an alias points to, none if the alias does not exist."""
+        try:
+            response = self.client.indices.get_alias(name=alias)
+        except ApiError as e:
+            if e.status_code == 404:
+                return []
+            raise
+        return sorted(response.body)
+
+    def _reindex_copy(
+        self,
+        sources: list[str],
+        target: str,
+        query: ElasticsearchQueryType | None,
+        slices: int | Literal["auto"],
+        requests_per_second: float | None,
+        batch_size: int,
+        poll_interval: float,
+        progress: "_ReindexProgress",
+    ) -> int:
+        """Copy documents with a reindex task, polling it until it completes, and return the number copied."""
+        source: dict[str, Any] = {"index": sources, "size": batch_size}
+        if query is not None:
+            source["query"] = query
+        response = self.client.reindex(
+            source=source,
+            dest={"index": target},
+            slices=slices,
+            requests_per_second=requests_per_second or -1,
+            wait_for_completion=False,
+        )
+        task_id = response["task"]
+        try:
+            while not (task := self.client.tasks.get(task_id=task_id))["completed"]:
+                progress.copied_status(task["task"]["status"])
+                time.sleep(poll_interval)
+        except BaseException:
+            with contextlib.suppress(ApiError, TransportError):
+                self.client.tasks.cancel(task_id=task_id)
+            raise
+        return progress.completed_task(task.body)
+
+    def _bulk_copy(
+        self,
+        sources: list[str],
+        target: str,
+        query: ElasticsearchQueryType | None,
+        requests_per_second: float | None,
+        batch_size: int,
+        progress: "_ReindexProgress",
+    ) -> int:
+        """Copy documents through a point in time and bulk requests, and return the number copied."""
+        index = ",".join(sources)
+        total = int(self.client.count(index=index, query=query)["count"])
+        progress.copied(0, total)
+
+        def actions() -> Iterator[ElasticsearchBulkActionType]:
+            started = time.monotonic()
+            hits = self.iterate_hits(index, None if query is None else {"query": query}, page_size=batch_size)
+            for number, hit in enumerate(hits, 1):
+                yield _copy_action(target, hit)
+                if requests_per_second and number % batch_size == 0:
+                    time.sleep(max(0.0, started + number / requests_per_second - time.monotonic()))
+
+        for ok, item in self.streaming_bulk(actions(), chunk_size=batch_size):
+            progress.result(ok, item, total)
+        return progress.completed_copy(total)
 
     @override
     def create_index(
@@ -237,7 +1151,10 @@ class ElasticsearchAdapter(ElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return self.client.indices.delete(index=index, **kwargs)
+        try:
+            return self.client.indices.delete(index=index, **kwargs)
+        finally:
+            self._invalidate_search_cache([index], refreshed=True)
 
     @override
     def exists(
@@ -294,6 +1211,13 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
             BaseConfig.global_config().ELASTIC if elasticsearch_config is None else elasticsearch_config
         )
         self.client = self._get_client(configs)
+        self._metrics = _get_metrics(configs)
+        self._search_coalescer = (
+            _SearchCoalescer(self, configs.SEARCH_COALESCING_WINDOW_MS / 1000, configs.SEARCH_COALESCING_MAX_BATCH)
+            if configs.SEARCH_COALESCING_WINDOW_MS > 0
+            else None
+        )
+        self.search_cache = self._get_search_cache(configs)
 
     @staticmethod
     def _get_client(configs: ElasticsearchConfig) -> AsyncElasticsearch:
@@ -333,6 +1257,43 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
             max_dead_node_backoff=configs.MAX_DEAD_NODE_BACKOFF,
         )
 
+    @staticmethod
+    def _get_search_cache(configs: ElasticsearchConfig) -> AsyncElasticsearchSearchCache | None:
+        """Create the search result cache when the configuration enables it.
+
+        Args:
+            configs (ElasticsearchConfig): Configuration settings for Elasticsearch.
+
+        Returns:
+            AsyncElasticsearchSearchCache | None: The cache, or None when search results are not cached.
+        """
+        if not configs.SEARCH_CACHE_ENABLED:
+            return None
+        redis_client: AsyncRedisPort | None = None
+        if configs.SEARCH_CACHE_REDIS_ENABLED:
+            from archipy.adapters.redis.adapters import AsyncRedisAdapter
+
+            redis_client = AsyncRedisAdapter()
+        return AsyncElasticsearchSearchCache(
+            ttl_seconds=configs.SEARCH_CACHE_TTL_SECONDS,
+            local_ttl_seconds=configs.SEARCH_CACHE_LOCAL_TTL_SECONDS,
+            local_maxsize=configs.SEARCH_CACHE_LOCAL_MAXSIZE,
+            refresh_interval_seconds=configs.SEARCH_CACHE_REFRESH_INTERVAL_SECONDS,
+            redis_client=redis_client,
+            key_prefix=configs.SEARCH_CACHE_KEY_PREFIX,
+            metrics=_get_metrics(configs),
+        )
+
+    async def _invalidate_search_cache(self, indices: Iterable[str], refreshed: bool) -> None:
+        """Drop the cached search results of written indices.
+
+        Args:
+            indices (Iterable[str]): The written indices.
+            refreshed (bool): Whether the writes are already visible to searches.
+        """
+        if self.search_cache is not None:
+            await self.search_cache.invalidate(*indices, refreshed=refreshed)
+
     @override
     async def ping(self) -> ElasticsearchResponseType:
         """Test the connection to the Elasticsearch server.
@@ -361,7 +1322,10 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return await self.client.index(index=index, document=document, id=doc_id, **kwargs)
+        try:
+            return await self.client.index(index=index, document=document, id=doc_id, **kwargs)
+        finally:
+            await self._invalidate_search_cache([index], kwargs.get("refresh") in _REFRESHED_VALUES)
 
     @override
     async def get(
@@ -391,6 +1355,11 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
     ) -> ElasticsearchResponseType:
         """Search for documents in Elasticsearch.
 
+        When ``SEARCH_COALESCING_WINDOW_MS`` is set, searches without keyword arguments issued
+        concurrently are sent together in one msearch request, and each gets its own response or error
+        as if it was sent alone. When ``SEARCH_CACHE_ENABLED`` is set, results are served from the
+        search cache when an equal search of the index was cached, and the response body is returned.
+
         Args:
             index (ElasticsearchIndexType): The index name.
             query (ElasticsearchQueryType): The search query.
@@ -399,8 +1368,52 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The search results.
         """
+        if self.search_cache is None:
+            return await self._send_search(index, query, kwargs)
+        return await self.search_cache.fetch(index, query, kwargs, lambda: self._send_search(index, query, kwargs))
+
+    async def _send_search(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType,
+        kwargs: dict[str, object],
+    ) -> ElasticsearchResponseType:
+        """Send a search to the cluster, through the coalescer when it is enabled.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType): The search query.
+            kwargs (dict[str, object]): Additional keyword arguments passed to the Elasticsearch client.
+
+        Returns:
+            ElasticsearchResponseType: The search results.
+        """
+        if self._search_coalescer is not None and not kwargs:
+            return await self._search_coalescer.search(index, query)
         return await self.client.search(index=index, body=query, **kwargs)
 
+    @override
+    async def msearch(
+        self,
+        searches: Sequence[ElasticsearchSearchRequestType],
+        **kwargs: object,
+    ) -> ElasticsearchResponseType:
+        """Run several searches in one request.
+
+        Sending searches together saves a round trip per search, and the cluster runs them
+        concurrently, up to ``max_concurrent_searches``. A failed search does not fail the others.
+
+        Args:
+            searches (Sequence[ElasticsearchSearchRequestType]): (index, query) of every search.
+            kwargs: Additional keyword arguments passed to the Elasticsearch client, such as
+                ``max_concurrent_searches``.
+
+        Returns:
+            ElasticsearchResponseType: The results, whose ``responses`` hold the response of every search in
+                order, or its ``error`` and ``status`` if it failed.
+        """
+        return await self.client.msearch(searches=_msearch_body(searches), **kwargs)
+
     @override
     async def update(
         self,
@@ -420,7 +1433,10 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return await self.client.update(index=index, id=doc_id, doc=doc, **kwargs)
+        try:
+            return await self.client.update(index=index, id=doc_id, doc=doc, **kwargs)
+        finally:
+            await self._invalidate_search_cache([index], kwargs.get("refresh") in _REFRESHED_VALUES)
 
     @override
     async def delete(
@@ -439,7 +1455,10 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return await self.client.delete(index=index, id=doc_id, **kwargs)
+        try:
+            return await self.client.delete(index=index, id=doc_id, **kwargs)
+        finally:
+            await self._invalidate_search_cache([index], kwargs.get("refresh") in _REFRESHED_VALUES)
 
     @override
     async def bulk(
@@ -456,7 +1475,581 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return await self.client.bulk(operations=actions, **kwargs)
+        try:
+            return await self.client.bulk(operations=actions, **kwargs)
+        finally:
+            await self._invalidate_search_cache(
+                _bulk_indices(actions, kwargs),
+                kwargs.get("refresh") in _REFRESHED_VALUES,
+            )
+
+    @override
+    async def streaming_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchBulkResultType]:
+        """Stream bulk actions to Elasticsearch in chunks, yielding the result of every action.
+
+        Actions are read lazily and sent in requests of at most ``chunk_size`` actions and
+        ``max_chunk_bytes`` bytes, so memory stays bounded however many actions there are. Actions
+        rejected with a 429 status are retried with exponential backoff.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType]): The
+                actions, consumed lazily, such as a generator or an async generator.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            kwargs: Additional keyword arguments passed to the bulk requests, such as ``index`` or ``refresh``.
+
+        Yields:
+            ElasticsearchBulkResultType: (success, item) for every action, chunk by chunk; actions retried
+                after a 429 status come after the other actions of their chunk.
+
+        Raises:
+            BulkIndexError: If raise_on_error is True and actions fail.
+        """
+        indices = _bulk_indices((), kwargs)
+        try:
+            async for result in helpers.async_streaming_bulk(
+                self.client,
+                _async_tracked_actions(actions, indices),
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                max_retries=max_retries,
+                initial_backoff=initial_backoff,
+                max_backoff=max_backoff,
+                raise_on_error=raise_on_error,
+                **kwargs,
+            ):
+                yield result
+        finally:
+            await self._invalidate_search_cache(indices, kwargs.get("refresh") in _REFRESHED_VALUES)
+
+    @override
+    async def parallel_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType],
+        concurrency: int = 4,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchBulkResultType]:
+        """Send bulk actions to Elasticsearch in chunks sent concurrently, yielding the result of every action.
+
+        Chunks of ``chunk_size`` actions are sent by up to ``concurrency`` tasks, each retrying the
+        actions of its chunk rejected with a 429 status with exponential backoff. Actions are read only
+        as tasks complete, so at most ``concurrency`` chunks are held in memory.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType]): The
+                actions, consumed lazily, such as a generator or an async generator.
+            concurrency (int): Maximum number of chunks sent at once. Defaults to 4.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            kwargs: Additional keyword arguments passed to the bulk requests, such as ``index`` or ``refresh``.
+
+        Yields:
+            ElasticsearchBulkResultType: (success, item) for every action, chunk by chunk; actions retried
+                after a 429 status come after the other actions of their chunk.
+
+        Raises:
+            BulkIndexError: If raise_on_error is True and actions fail.
+        """
+
+        async def send(chunk: list[ElasticsearchBulkActionType]) -> list[ElasticsearchBulkResultType]:
+            return [
+                result
+                async for result in self.streaming_bulk(
+                    chunk,
+                    len(chunk),
+                    max_chunk_bytes,
+                    max_retries,
+                    initial_backoff,
+                    max_backoff,
+                    raise_on_error,
+                    **kwargs,
+                )
+            ]
+
+        pending: deque[asyncio.Task[list[ElasticsearchBulkResultType]]] = deque()
+        try:
+            async for chunk in _batched(actions, chunk_size):
+                pending.append(asyncio.create_task(send(chunk)))
+                if len(pending) >= concurrency:
+                    for result in await pending.popleft():
+                        yield result
+            while pending:
+                for result in await pending.popleft():
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @override
+    async def iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a point in time and search_after.
+
+        Unlike search, the number of hits is not limited by ``index.max_result_window``. The point in
+        time freezes the index as of the first request, so documents changed while iterating are seen
+        as they were, and it is closed when the iteration ends or the iterator is closed. Pages are
+        sorted by ``_shard_doc`` unless the search body has a sort, to which ``_shard_doc`` is added as
+        a tiebreaker.
+
+        When the cluster does not support points in time, falls back to scroll_hits.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the point in time is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            kwargs: Additional keyword arguments passed to the search requests.
+
+        Yields:
+            ElasticsearchHitType: Every hit of the search.
+
+        Raises:
+            InvalidArgumentError: If page_size is not positive or the slice is out of range.
+        """
+        body = _page_body(query, page_size, "_shard_doc", slice_id, max_slices)
+        pit_id = await self._open_point_in_time(index, keep_alive)
+        if pit_id is None:
+            async for hit in self.scroll_hits(index, query, page_size, keep_alive, slice_id, max_slices, **kwargs):
+                yield hit
+            return
+        try:
+            async for hits in self._point_in_time_pages(pit_id, body, keep_alive, kwargs):
+                for hit in hits:
+                    yield hit
+        finally:
+            await self._close_point_in_time(pit_id)
+
+    @override
+    async def scroll_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a scroll.
+
+        Prefer iterate_hits, whose point in time is cheaper for the cluster to keep. The scroll is
+        cleared when the iteration ends or the iterator is closed. Pages are sorted by ``_doc`` unless
+        the search body has a sort.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the scroll is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            kwargs: Additional keyword arguments passed to the search requests.
+
+        Yields:
+            ElasticsearchHitType: Every hit of the search.
+
+        Raises:
+            InvalidArgumentError: If page_size is not positive or the slice is out of range.
+        """
+        body = _page_body(query, page_size, "_doc", slice_id, max_slices)
+        async with contextlib.aclosing(self._scroll_pages(index, body, keep_alive, kwargs)) as pages:
+            async for hits in pages:
+                for hit in hits:
+                    yield hit
+
+    @override
+    async def parallel_iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        slices: int = 4,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search, fetching slices of the hits concurrently.
+
+        The hits are split in ``slices`` slices sharing one point in time, or scrolled slice by slice
+        when the cluster does not support points in time. One task per slice fetches its next page
+        while the previous one is consumed, so at most one page per slice is held in memory. The point
+        in time or scrolls are released when the iteration ends or the iterator is closed.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query and _source. Defaults to
+                all documents.
+            slices (int): Number of slices fetched concurrently. Defaults to 4.
+            page_size (int): Number of hits fetched per request of a slice. Defaults to 1000.
+            keep_alive (str): How long the point in time or scroll is kept between requests. Defaults to "1m".
+            kwargs: Additional keyword arguments passed to the search requests.
+
+        Yields:
+            ElasticsearchHitType: Every hit of the search, in no particular order.
+
+        Raises:
+            InvalidArgumentError: If slices or page_size is not positive.
+        """
+        if slices < 1:
+            raise InvalidArgumentError(argument_name="slices")
+        if page_size < 1:
+            raise InvalidArgumentError(argument_name="page_size")
+        pit_id = await self._open_point_in_time(index, keep_alive)
+        page_iterators: list[AsyncGenerator[list[ElasticsearchHitType]]]
+        if pit_id is None:
+            page_iterators = [
+                self._scroll_pages(index, _page_body(query, page_size, "_doc", slice_id, slices), keep_alive, kwargs)
+                for slice_id in range(slices)
+            ]
+        else:
+            page_iterators = [
+                self._point_in_time_pages(
+                    pit_id,
+                    _page_body(query, page_size, "_shard_doc", slice_id, slices),
+                    keep_alive,
+                    kwargs,
+                )
+                for slice_id in range(slices)
+            ]
+
+        async def next_page(
+            pages: AsyncGenerator[list[ElasticsearchHitType]],
+        ) -> list[ElasticsearchHitType] | None:
+            return await anext(pages, None)
+
+        pending = {asyncio.create_task(next_page(pages)): pages for pages in page_iterators}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pages = pending.pop(task)
+                    if (hits := task.result()) is not None:
+                        pending[asyncio.create_task(next_page(pages))] = pages
+                        for hit in hits:
+                            yield hit
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for pages in page_iterators:
+                await pages.aclose()
+            if pit_id is not None:
+                await self._close_point_in_time(pit_id)
+
+    async def _open_point_in_time(self, index: ElasticsearchIndexType, keep_alive: str) -> str | None:
+        """Opens a point in time on an index.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            keep_alive (str): How long the point in time is kept between requests.
+
+        Returns:
+            str | None: The id of the point in time, or None if the cluster does not support them.
+        """
+        try:
+            response = await self.client.open_point_in_time(index=index, keep_alive=keep_alive)
+        except ApiError as e:
+            if not _point_in_time_unsupported(e):
+                raise
+            logger.info("Points in time are not supported for %s, falling back to scroll: %s", index, e)
+            return None
+        return str(response["id"])
+
+    async def _close_point_in_time(self, pit_id: str) -> None:
+        """Closes a point in time, logging failures since it expires on its own anyway."""
+        try:
+            await self.client.close_point_in_time(id=pit_id)
+        except (ApiError, TransportError) as e:
+            logger.warning("Failed to close Elasticsearch point in time: %s", e)
+
+    async def _point_in_time_pages(
+        self,
+        pit_id: str,
+        body: dict[str, Any],
+        keep_alive: str,
+        kwargs: dict[str, object],
+    ) -> AsyncGenerator[list[ElasticsearchHitType]]:
+        """Yields the pages of hits of a search over a point in time, following them with search_after.
+
+        Args:
+            pit_id (str): The id of the point in time.
+            body (dict[str, Any]): The search body.
+            keep_alive (str): How long the point in time is kept between requests.
+            kwargs (dict[str, object]): Additional keyword arguments passed to the search requests.
+
+        Yields:
+            list[ElasticsearchHitType]: The hits of every non-empty page.
+        """
+        body = {**body}
+        while True:
+            body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+            response = await self.client.search(body=body, **kwargs)
+            # The point in time id may change between requests, and the latest one must be used
+            pit_id = response.get("pit_id", pit_id)
+            hits = response["hits"]["hits"]
+            if hits:
+                yield hits
+            if len(hits) < body["size"]:
+                return
+            body["search_after"] = hits[-1]["sort"]
+
+    async def _scroll_pages(
+        self,
+        index: ElasticsearchIndexType,
+        body: dict[str, Any],
+        keep_alive: str,
+        kwargs: dict[str, object],
+    ) -> AsyncGenerator[list[ElasticsearchHitType]]:
+        """Yields the pages of hits of a scrolled search, clearing the scroll when closed.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            body (dict[str, Any]): The search body.
+            keep_alive (str): How long the scroll is kept between requests.
+            kwargs (dict[str, object]): Additional keyword arguments passed to the search requests.
+
+        Yields:
+            list[ElasticsearchHitType]: The hits of every non-empty page.
+        """
+        response = await self.client.search(index=index, body=body, scroll=keep_alive, **kwargs)
+        scroll_id = response.get("_scroll_id")
+        try:
+            while hits := response["hits"]["hits"]:
+                yield hits
+                if len(hits) < body["size"]:
+                    return
+                response = await self.client.scroll(scroll_id=scroll_id, scroll=keep_alive)
+                scroll_id = response.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id is not None:
+                try:
+                    await self.client.clear_scroll(scroll_id=scroll_id)
+                except (ApiError, TransportError) as e:
+                    logger.warning("Failed to clear Elasticsearch scroll: %s", e)
+
+    @override
+    async def reindex_alias(
+        self,
+        alias: str,
+        body: dict[str, Any] | None = None,
+        source_index: ElasticsearchIndexType | None = None,
+        query: ElasticsearchQueryType | None = None,
+        method: ElasticsearchReindexMethodType = "reindex",
+        slices: int | Literal["auto"] = "auto",
+        requests_per_second: float | None = None,
+        batch_size: int = 1000,
+        max_num_segments: int | None = 1,
+        poll_interval: float = 5.0,
+        delete_source: bool = False,
+    ) -> ElasticsearchReindexResultType:
+        """Copy the documents behind an alias into a new versioned index and point the alias to it.
+
+        The new index, named ``{alias}-v{n}``, is created from ``body`` with refreshes disabled and no
+        replicas, so documents are written once and never searched while they are loaded. They are
+        copied by a sliced reindex task running on the cluster, or with ``method="bulk"`` by reading
+        them through a point in time and streaming them to bulk requests from this process. The index
+        is then force-merged, its refresh interval and replicas are restored from ``body``, or else from
+        the source index, and the alias is moved to it in one atomic request, so searches through the
+        alias switch from the old documents to the new ones at once. If anything fails before the
+        swap, the new index is deleted and the alias is left untouched.
+
+        Progress is logged, and with ``METRICS_ENABLED`` exported as the phase of the reindex, the
+        duration of every phase and the documents copied out of those to copy.
+
+        Args:
+            alias (str): The alias the new index is published under.
+            body (dict[str, Any] | None): Settings and mappings of the new index. Defaults to None.
+            source_index (ElasticsearchIndexType | None): Index to copy from instead of the indices of the
+                alias, such as for the first index published under the alias. Defaults to None.
+            query (ElasticsearchQueryType | None): Query selecting the documents to copy, such as
+                ``{"term": {"active": True}}``. Defaults to all documents.
+            method (ElasticsearchReindexMethodType): "reindex" to copy with a reindex task on the cluster,
+                "bulk" to stream the documents through bulk requests. Defaults to "reindex".
+            slices (int | Literal["auto"]): Slices of the reindex task copied in parallel, "auto" for one
+                per shard. Defaults to "auto".
+            requests_per_second (float | None): Maximum documents copied per second, to leave capacity to
+                the searches and writes of the cluster. Defaults to None, for no limit.
+            batch_size (int): Documents read and written per request. Defaults to 1000.
+            max_num_segments (int | None): Segments per shard the new index is force-merged to, None to skip
+                the force-merge. Defaults to 1.
+            poll_interval (float): Seconds between two checks of the reindex task. Defaults to 5.0.
+            delete_source (bool): Whether to delete the indices the alias pointed to once it is swapped.
+                Required when ``alias`` is a concrete index, which is then replaced by the alias in the
+                same atomic request. Defaults to False.
+
+        Returns:
+            ElasticsearchReindexResultType: ``index`` the alias points to, ``previous_indices`` it pointed to
+                and the number of ``documents`` copied.
+
+        Raises:
+            InvalidArgumentError: If the alias does not exist and no source index is given.
+            FailedPreconditionError: If ``alias`` is a concrete index and ``delete_source`` is False.
+            InternalError: If documents could not be copied.
+        """
+        previous = await self._alias_indices(alias)
+        replaced = not previous and bool(await self.client.indices.exists(index=alias))
+        if replaced and not delete_source:
+            raise FailedPreconditionError(
+                precondition=f"{alias} is an index, which can only be replaced by an alias with delete_source",
+            )
+        previous = previous or ([alias] if replaced else [])
+        sources = [source_index] if source_index else previous
+        if not sources:
+            raise InvalidArgumentError(
+                argument_name="source_index",
+                additional_data={"reason": f"Alias {alias} does not exist and no source index was given"},
+            )
+        target = f"{alias}-v{_next_version(alias, previous)}"
+        while await self.client.indices.exists(index=target):
+            target = f"{alias}-v{_next_version(alias, [target])}"
+        progress = _ReindexProgress(alias, target, self._metrics)
+        settings: dict[str, Any] = (await self.client.indices.get_settings(index=sources[0], flat_settings=True)).body
+        source_settings: dict[str, Any] = next(iter(settings.values()), {"settings": {}})["settings"]
+        create_body, restored = _ingest_body(body, source_settings)
+        await self.client.indices.create(index=target, **create_body)
+        try:
+            progress.phase("copying")
+            if method == "bulk":
+                documents = await self._bulk_copy(sources, target, query, requests_per_second, batch_size, progress)
+            else:
+                documents = await self._reindex_copy(
+                    sources,
+                    target,
+                    query,
+                    slices,
+                    requests_per_second,
+                    batch_size,
+                    poll_interval,
+                    progress,
+                )
+            progress.phase("merging")
+            if max_num_segments is not None:
+                await self.client.indices.forcemerge(index=target, max_num_segments=max_num_segments)
+            # Replicas copy the merged segments instead of merging them again
+            await self.client.indices.put_settings(index=target, settings={"index": restored})
+            await self.client.indices.refresh(index=target)
+            progress.phase("swapping")
+            await self.client.indices.update_aliases(actions=_alias_swap_actions(alias, target, previous, replaced))
+        except BaseException:
+            progress.phase("failed")
+            try:
+                await self.client.indices.delete(index=target)
+            except (ApiError, TransportError) as e:
+                logger.warning("Failed to delete index %s of the failed reindex: %s", target, e)
+            raise
+        if delete_source and previous and not replaced:
+            await self.client.indices.delete(index=",".join(previous))
+        await self._invalidate_search_cache([alias, *previous], refreshed=True)
+        progress.phase("completed")
+        return {"index": target, "previous_indices": previous, "documents": documents}
+
+    async def _alias_indices(self, alias: str) -> list[str]:
+        """Return the indices an alias points to, none if the alias does not exist."""
+        try:
+            response = await self.client.indices.get_alias(name=alias)
+        except ApiError as e:
+            if e.status_code == 404:
+                return []
+            raise
+        return sorted(response.body)
+
+    async def _reindex_copy(
+        self,
+        sources: list[str],
+        target: str,
+        query: ElasticsearchQueryType | None,
+        slices: int | Literal["auto"],
+        requests_per_second: float | None,
+        batch_size: int,
+        poll_interval: float,
+        progress: "_ReindexProgress",
+    ) -> int:
+        """Copy documents with a reindex task, polling it until it completes, and return the number copied."""
+        source: dict[str, Any] = {"index": sources, "size": batch_size}
+        if query is not None:
+            source["query"] = query
+        response = await self.client.reindex(
+            source=source,
+            dest={"index": target},
+            slices=slices,
+            requests_per_second=requests_per_second or -1,
+            wait_for_completion=False,
+        )
+        task_id = response["task"]
+        try:
+            while not (task := await self.client.tasks.get(task_id=task_id))["completed"]:
+                progress.copied_status(task["task"]["status"])
+                await asyncio.sleep(poll_interval)
+        except BaseException:
+            with contextlib.suppress(ApiError, TransportError):
+                await self.client.tasks.cancel(task_id=task_id)
+            raise
+        return progress.completed_task(task.body)
+
+    async def _bulk_copy(
+        self,
+        sources: list[str],
+        target: str,
+        query: ElasticsearchQueryType | None,
+        requests_per_second: float | None,
+        batch_size: int,
+        progress: "_ReindexProgress",
+    ) -> int:
+        """Copy documents through a point in time and bulk requests, and return the number copied."""
+        index = ",".join(sources)
+        total = int((await self.client.count(index=index, query=query))["count"])
+        progress.copied(0, total)
+
+        async def actions() -> AsyncIterator[ElasticsearchBulkActionType]:
+            started = time.monotonic()
+            hits = self.iterate_hits(index, None if query is None else {"query": query}, page_size=batch_size)
+            number = 0
+            async for hit in hits:
+                number += 1
+                yield _copy_action(target, hit)
+                if requests_per_second and number % batch_size == 0:
+                    await asyncio.sleep(max(0.0, started + number / requests_per_second - time.monotonic()))
+
+        async for ok, item in self.streaming_bulk(actions(), chunk_size=batch_size):
+            progress.result(ok, item, total)
+        return progress.completed_copy(total)
 
     @override
     async def create_index(
@@ -492,7 +2085,10 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
         Returns:
             ElasticsearchResponseType: The response from Elasticsearch.
         """
-        return await self.client.indices.delete(index=index, **kwargs)
+        try:
+            return await self.client.indices.delete(index=index, **kwargs)
+        finally:
+            await self._invalidate_search_cache([index], refreshed=True)
 
     @override
     async def exists(
@@ -529,3 +2125,187 @@ class AsyncElasticsearchAdapter(AsyncElasticsearchPort):
             ElasticsearchResponseType: True if the index exists, False otherwise.
         """
         return await self.client.indices.exists(index=index, **kwargs)
+
+
+class _SearchCoalescer:
+    """Sends the searches issued within a window in one msearch request and hands each its response.
+
+    The window opens with the first pending search, so a lone search waits at most one window. A
+    batch reaching ``max_batch`` searches is sent right away, and a batch of one search is sent as a
+    plain search.
+
+    Args:
+        adapter (AsyncElasticsearchAdapter): The adapter whose client sends the requests.
+        window (float): Seconds searches are collected after the first one.
+        max_batch (int): Maximum number of searches per request.
+    """
+
+    def __init__(self, adapter: AsyncElasticsearchAdapter, window: float, max_batch: int) -> None:
+        self._adapter = adapter
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: list[tuple[ElasticsearchSearchRequestType, asyncio.Future[Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Requests in flight, referenced so they are not garbage collected before completing
+        self._requests: set[asyncio.Task[None]] = set()
+
+    async def search(self, index: ElasticsearchIndexType, query: ElasticsearchQueryType) -> ElasticsearchResponseType:
+        """Queues a search for the next msearch request and waits for its response.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType): The search query.
+
+        Returns:
+            ElasticsearchResponseType: The search results.
+
+        Raises:
+            ApiError: The error the search would have raised if sent alone.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append(((index, query), future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Sends the pending searches."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        request = asyncio.create_task(self._send(batch))
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _send(self, batch: list[tuple[ElasticsearchSearchRequestType, asyncio.Future[Any]]]) -> None:
+        """Sends a batch of searches and resolves their futures.
+
+        Args:
+            batch (list[tuple[ElasticsearchSearchRequestType, asyncio.Future[Any]]]): The searches and the
+                futures of their callers.
+        """
+        # Searches whose caller was cancelled while waiting are not sent
+        batch = [(search, future) for search, future in batch if not future.done()]
+        if not batch:
+            return
+        try:
+            if len(batch) == 1:
+                (((index, query), _),) = batch
+                results: list[Any] = [await self._adapter.client.search(index=index, body=query)]
+            else:
+                response = await self._adapter.client.msearch(searches=_msearch_body([search for search, _ in batch]))
+                results = [_msearch_item(item, response.meta) for item in response["responses"]]
+                logger.debug("Coalesced %d Elasticsearch searches in one msearch request", len(batch))
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, ApiError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class _ReindexProgress:
+    """Logs and exports the phase and the documents copied of the reindex of an alias.
+
+    Args:
+        alias (str): The alias being reindexed.
+        target (str): The new index.
+        metrics (ElasticsearchMetrics | None): Metrics the progress is exported to.
+    """
+
+    def __init__(self, alias: str, target: str, metrics: "ElasticsearchMetrics | None") -> None:
+        self.alias = alias
+        self.target = target
+        self.metrics = metrics
+        self.documents = 0
+        self.failed = 0
+        self.failures: list[Any] = []
+        self._phase = "creating"
+        self._phase_started = time.monotonic()
+        self._next_report = 0.0
+        logger.info("Reindexing alias %s into %s", alias, target)
+        if metrics is not None:
+            metrics.reindex_phase.labels(alias).state(self._phase)
+
+    def phase(self, phase: str) -> None:
+        """Ends the current phase and starts the next one."""
+        now = time.monotonic()
+        logger.info(
+            "Reindex of alias %s into %s: %s took %.1fs, %s",
+            self.alias,
+            self.target,
+            self._phase,
+            now - self._phase_started,
+            phase,
+        )
+        if self.metrics is not None:
+            self.metrics.reindex_phase_seconds.labels(self.alias, self._phase).set(now - self._phase_started)
+            self.metrics.reindex_phase.labels(self.alias).state(phase)
+        self._phase, self._phase_started = phase, now
+
+    def copied(self, documents: int, total: int) -> None:
+        """Reports the documents copied so far out of those to copy."""
+        logger.info("Reindex of alias %s into %s: %d of %d documents copied", self.alias, self.target, documents, total)
+        if self.metrics is not None:
+            self.metrics.reindex_source_documents.labels(self.alias).set(total)
+            self.metrics.reindex_copied_documents.labels(self.alias).set(documents)
+
+    def copied_status(self, status: dict[str, Any]) -> None:
+        """Reports the status of a running reindex task."""
+        self.copied(int(status.get("created", 0)) + int(status.get("updated", 0)), int(status.get("total", 0)))
+
+    def result(self, ok: bool, item: dict[str, Any], total: int) -> None:
+        """Counts the result of a bulk action, reporting the progress at most every second."""
+        if ok:
+            self.documents += 1
+        else:
+            self.failed += 1
+            if len(self.failures) < 10:
+                self.failures.append(item)
+        if (now := time.monotonic()) >= self._next_report:
+            self._next_report = now + _REINDEX_PROGRESS_INTERVAL
+            self.copied(self.documents, total)
+
+    def completed_task(self, task: dict[str, Any]) -> int:
+        """Reports a completed reindex task and returns the documents it copied.
+
+        Raises:
+            InternalError: If the task failed or documents could not be copied.
+        """
+        response = task.get("response", {})
+        failures = [*response.get("failures", []), *([task["error"]] if "error" in task else [])]
+        self.documents = int(response.get("created", 0)) + int(response.get("updated", 0))
+        self.failed, self.failures = len(failures), failures[:10]
+        return self.completed_copy(int(response.get("total", self.documents)))
+
+    def completed_copy(self, total: int) -> int:
+        """Reports the end of the copy and returns the documents copied.
+
+        Raises:
+            InternalError: If documents could not be copied.
+        """
+        self.copied(self.documents, total)
+        if self.failed:
+            raise InternalError(
+                additional_data={
+                    "component": "Elasticsearch",
+                    "index": self.target,
+                    "failed_documents": self.failed,
+                    "failures": self.failures,
+                },
+            )
+        return self.documents
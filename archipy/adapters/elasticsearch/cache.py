@@ -0,0 +1,551 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Literal
+
+from archipy.adapters.elasticsearch.ports import (
+    ElasticsearchIndexType,
+    ElasticsearchQueryType,
+    ElasticsearchResponseType,
+)
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
+
+if TYPE_CHECKING:
+    from archipy.adapters.elasticsearch.metrics import ElasticsearchMetrics
+
+logger = logging.getLogger(__name__)
+
+# Search options whose results depend on server-side search contexts, never cached
+_UNCACHEABLE_OPTIONS = frozenset(("pit", "scroll"))
+
+CacheLookupResult = Literal["local_hit", "redis_hit", "miss"]
+
+
+def _index_names(index: ElasticsearchIndexType) -> frozenset[str]:
+    """Returns the names of a comma-separated index expression."""
+    return frozenset(name.strip() for name in index.split(",") if name.strip())
+
+
+def _response_body(response: ElasticsearchResponseType) -> Any:
+    """Returns the body of a client response, or the response itself if it is already a body."""
+    return getattr(response, "body", response)
+
+
+class _BaseSearchCache:
+    """State shared by the sync and async search result caches: keys, the L1 tier and statistics.
+
+    Results are stored serialized, so every hit returns a fresh copy callers may modify.
+
+    Args:
+        ttl_seconds (float): Seconds a result is cached.
+        local_ttl_seconds (float): Seconds a result is kept in process memory, at most ``ttl_seconds``.
+        local_maxsize (int): Maximum number of results kept in process memory, 0 to keep none.
+        refresh_interval_seconds (float): Seconds writes take to become visible to searches.
+        key_prefix (str): Prefix of the Redis keys.
+        metrics (ElasticsearchMetrics | None): Metrics the lookups and invalidations are counted in.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        local_ttl_seconds: float,
+        local_maxsize: int,
+        refresh_interval_seconds: float,
+        key_prefix: str,
+        metrics: "ElasticsearchMetrics | None",
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = min(local_ttl_seconds, ttl_seconds)
+        self.local_maxsize = local_maxsize
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.key_prefix = key_prefix
+        self.metrics = metrics
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[bytes | str, frozenset[str], float]] = OrderedDict()
+        # Unix timestamp from which the results of searches of an index may be cached again
+        self._cacheable_from: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the lookups of this process served from the cache, 0.0 before any lookup."""
+        hits = self.local_hits + self.redis_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def build_key(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Returns the cache key of a search, or None if its results must not be cached.
+
+        The key hashes the query and the client options with sorted keys, so equal searches written
+        with their keys in a different order share a key. Searches of wildcard expressions and
+        searches over points in time or scrolls are not cached.
+
+        Args:
+            index (ElasticsearchIndexType): The index expression of the search.
+            query (ElasticsearchQueryType): The search body.
+            kwargs (dict[str, Any]): The client options of the search.
+
+        Returns:
+            str | None: The cache key, or None if the search is not cacheable.
+        """
+        names = _index_names(index)
+        if (
+            not names
+            or "*" in index
+            or "_all" in names
+            or not _UNCACHEABLE_OPTIONS.isdisjoint(query)
+            or not _UNCACHEABLE_OPTIONS.isdisjoint(kwargs)
+        ):
+            return None
+        normalized = json.dumps({"query": query, "options": kwargs}, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+        return f"{self.key_prefix}:result:{','.join(sorted(names))}:{digest}"
+
+    def lookup_local(self, key: str, index: ElasticsearchIndexType) -> Any | None:
+        """Returns the result cached in process memory for a key, counting a hit if found.
+
+        Args:
+            key (str): The cache key.
+            index (ElasticsearchIndexType): The index expression of the search.
+
+        Returns:
+            Any | None: The response body, or None if it is not cached locally.
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[2] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        self.record(index, "local_hit")
+        return json.loads(item[0])
+
+    def store_local(self, key: str, names: frozenset[str], data: bytes | str) -> None:
+        """Keeps a serialized result in process memory, evicting the least recently used ones.
+
+        Args:
+            key (str): The cache key.
+            names (frozenset[str]): The indices the result was read from.
+            data (bytes | str): The serialized response body.
+        """
+        if self.local_maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (data, names, time.monotonic() + self.local_ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.local_maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_local(self, key: str) -> None:
+        """Removes a result from process memory."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def cacheable_since(self, names: frozenset[str], started: float) -> bool:
+        """Tells whether a search started at the given time may be cached, as far as this process knows.
+
+        A search is not cacheable if an index it read was written after it started, or if the writes
+        are not yet visible to searches because the index has not been refreshed since.
+
+        Args:
+            names (frozenset[str]): The indices the search read.
+            started (float): Unix timestamp at which the search was sent.
+
+        Returns:
+            bool: True if the result may be cached.
+        """
+        with self._lock:
+            return all(self._cacheable_from.get(name, 0.0) <= started for name in names)
+
+    def invalidate_local(self, names: frozenset[str], refreshed: bool) -> float:
+        """Drops the results of indices from process memory and defers caching until writes are visible.
+
+        Args:
+            names (frozenset[str]): The written indices.
+            refreshed (bool): Whether the writes are already visible to searches.
+
+        Returns:
+            float: Unix timestamp from which the results of the indices may be cached again.
+        """
+        cacheable_from = time.time() + (0.0 if refreshed else self.refresh_interval_seconds)
+        with self._lock:
+            for key in [key for key, (_, entry_names, _) in self._entries.items() if entry_names & names]:
+                del self._entries[key]
+            for name in names:
+                self._cacheable_from[name] = max(self._cacheable_from.get(name, 0.0), cacheable_from)
+        if self.metrics is not None:
+            for name in names:
+                self.metrics.search_cache_invalidations.labels(name).inc()
+        return cacheable_from
+
+    def record(self, index: ElasticsearchIndexType, result: CacheLookupResult) -> None:
+        """Counts a lookup in the statistics and metrics of the cache.
+
+        Args:
+            index (ElasticsearchIndexType): The index expression of the search.
+            result (CacheLookupResult): Where the result came from.
+        """
+        with self._lock:
+            if result == "local_hit":
+                self.local_hits += 1
+            elif result == "redis_hit":
+                self.redis_hits += 1
+            else:
+                self.misses += 1
+        if self.metrics is not None:
+            self.metrics.search_cache_lookups.labels(index, result).inc()
+
+    def tag_key(self, name: str) -> str:
+        """Returns the Redis key of the set indexing the cached results of an index."""
+        return f"{self.key_prefix}:index:{name}"
+
+    def cacheable_from_key(self, name: str) -> str:
+        """Returns the Redis key holding the Unix timestamp from which results of an index may be cached."""
+        return f"{self.key_prefix}:cacheable-from:{name}"
+
+    def queue_lookup(self, pipeline: Any, key: str, names: frozenset[str]) -> None:
+        """Queues the reads of a cached result and of the timestamps from which its indices are cacheable."""
+        pipeline.get(key)
+        for name in sorted(names):
+            pipeline.get(self.cacheable_from_key(name))
+
+    def queue_write(self, pipeline: Any, key: str, names: frozenset[str], data: bytes) -> None:
+        """Queues the commands storing a result, indexing it under its indices and rereading their timestamps.
+
+        Args:
+            pipeline (Any): A non-transactional Redis pipeline.
+            key (str): The cache key.
+            names (frozenset[str]): The indices the result was read from.
+            data (bytes): The serialized response body.
+        """
+        ttl_ms = int(self.ttl_seconds * 1000)
+        pipeline.set(key, data, px=ttl_ms)
+        for name in names:
+            pipeline.sadd(self.tag_key(name), key)
+            # Keep the index set alive as long as its longest-lived member
+            pipeline.pexpire(self.tag_key(name), ttl_ms, nx=True)
+            pipeline.pexpire(self.tag_key(name), ttl_ms, gt=True)
+        for name in sorted(names):
+            pipeline.get(self.cacheable_from_key(name))
+
+    def queue_invalidation(self, pipeline: Any, names: frozenset[str], cacheable_from: float) -> None:
+        """Queues the commands deferring caching of indices and listing their cached results."""
+        # The timestamp must outlive the searches in flight when the indices were written
+        ttl_ms = int((self.ttl_seconds + self.refresh_interval_seconds) * 1000)
+        for name in sorted(names):
+            pipeline.set(self.cacheable_from_key(name), repr(cacheable_from), px=ttl_ms)
+            pipeline.smembers(self.tag_key(name))
+
+    @staticmethod
+    def latest(timestamps: Iterable[Any]) -> float:
+        """Returns the latest of the timestamps read from Redis, 0.0 if none is set."""
+        return max((float(timestamp) for timestamp in timestamps if timestamp is not None), default=0.0)
+
+
+class ElasticsearchSearchCache(_BaseSearchCache):
+    """Cache of search results, in process memory and optionally in Redis, invalidated by writes.
+
+    Results are kept in a small LRU in process memory (L1) and, with a Redis adapter, in Redis
+    (L2) where every process of the application shares them. Writes through the adapter drop the
+    cached results of the written indices from both tiers, and results of searches sent before the
+    writes became visible, one refresh interval later, are not cached. Other processes drop their
+    L1 copies within ``local_ttl_seconds``. Redis errors are logged and treated as misses.
+
+    Args:
+        ttl_seconds (float): Seconds a result is cached. Defaults to 60.
+        local_ttl_seconds (float): Seconds a result is kept in process memory, at most ``ttl_seconds``.
+            Defaults to 5.
+        local_maxsize (int): Maximum number of results kept in process memory, 0 to keep none.
+            Defaults to 1000.
+        refresh_interval_seconds (float): Seconds writes take to become visible to searches, the
+            ``index.refresh_interval`` of the indices. Defaults to 1.
+        redis_client (RedisPort | None): Redis adapter holding the L2 tier, or None for an L1 cache
+            only. Defaults to None.
+        key_prefix (str): Prefix of the Redis keys. Defaults to "elasticsearch:search".
+        metrics (ElasticsearchMetrics | None): Metrics the lookups and invalidations are counted in.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60,
+        local_ttl_seconds: float = 5,
+        local_maxsize: int = 1000,
+        refresh_interval_seconds: float = 1,
+        redis_client: RedisPort | None = None,
+        key_prefix: str = "elasticsearch:search",
+        metrics: "ElasticsearchMetrics | None" = None,
+    ) -> None:
+        super().__init__(ttl_seconds, local_ttl_seconds, local_maxsize, refresh_interval_seconds, key_prefix, metrics)
+        self.redis_client = redis_client
+
+    def fetch(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType,
+        kwargs: dict[str, Any],
+        search: Callable[[], ElasticsearchResponseType],
+    ) -> Any:
+        """Returns the cached result of a search, sending it on a miss.
+
+        Args:
+            index (ElasticsearchIndexType): The index expression of the search.
+            query (ElasticsearchQueryType): The search body.
+            kwargs (dict[str, Any]): The client options of the search.
+            search (Callable[[], ElasticsearchResponseType]): Sends the search to the cluster.
+
+        Returns:
+            Any: The response body.
+        """
+        key = self.build_key(index, query, kwargs)
+        if key is None:
+            return _response_body(search())
+        if (body := self.lookup_local(key, index)) is not None:
+            return body
+        names = _index_names(index)
+        started = time.time()
+        data, cacheable_from = self.read_remote(key, names)
+        if data is not None:
+            self.store_local(key, names, data)
+            self.record(index, "redis_hit")
+            return json.loads(data)
+        self.record(index, "miss")
+        body = _response_body(search())
+        if cacheable_from <= started and self.cacheable_since(names, started):
+            self.store(key, names, json.dumps(body, separators=(",", ":")).encode(), started)
+        return body
+
+    def read_remote(self, key: str, names: frozenset[str]) -> tuple[bytes | str | None, float]:
+        """Reads a result from Redis with the timestamp from which its indices may be cached.
+
+        Args:
+            key (str): The cache key.
+            names (frozenset[str]): The indices of the search.
+
+        Returns:
+            tuple[bytes | str | None, float]: The serialized result, or None on a miss, and the timestamp.
+        """
+        if self.redis_client is None:
+            return None, 0.0
+        try:
+            pipeline = self.redis_client.get_pipeline(transaction=False)
+            self.queue_lookup(pipeline, key, names)
+            data, *timestamps = pipeline.execute()
+        except Exception as exception:
+            logger.warning(f"Reading search cache key {key} from Redis failed: {exception}")
+            return None, 0.0
+        return data, self.latest(timestamps)
+
+    def store(self, key: str, names: frozenset[str], data: bytes, started: float) -> None:
+        """Stores a result in both tiers, unless its indices were written while it was stored.
+
+        Args:
+            key (str): The cache key.
+            names (frozenset[str]): The indices the result was read from.
+            data (bytes): The serialized response body.
+            started (float): Unix timestamp at which the search was sent.
+        """
+        self.store_local(key, names, data)
+        if self.redis_client is None:
+            return
+        try:
+            pipeline = self.redis_client.get_pipeline(transaction=False)
+            self.queue_write(pipeline, key, names, data)
+            replies = pipeline.execute()
+            # A write that invalidated the indices meanwhile may have missed the new key
+            if self.latest(replies[-len(names) :]) > started:
+                self.discard_local(key)
+                self.redis_client.delete(key)
+        except Exception as exception:
+            logger.warning(f"Writing search cache key {key} to Redis failed: {exception}")
+
+    def invalidate(self, *indices: ElasticsearchIndexType, refreshed: bool = False) -> None:
+        """Drops the cached results of searches of the given indices.
+
+        Call it after writing to an index other than through the adapter, which invalidates its
+        own writes.
+
+        Args:
+            *indices (ElasticsearchIndexType): The written indices, or comma-separated index expressions.
+            refreshed (bool): Whether the writes are already visible to searches, as after a refresh or
+                a write with ``refresh="wait_for"``. Otherwise results are not cached for the refresh
+                interval. Defaults to False.
+        """
+        names = frozenset().union(*(_index_names(index) for index in indices))
+        if not names:
+            return
+        cacheable_from = self.invalidate_local(names, refreshed)
+        if self.redis_client is None:
+            return
+        try:
+            pipeline = self.redis_client.get_pipeline(transaction=False)
+            self.queue_invalidation(pipeline, names, cacheable_from)
+            members_by_tag = dict(zip(sorted(names), pipeline.execute()[1::2], strict=True))
+            keys: set[str] = set().union(*members_by_tag.values())
+            if keys:
+                self.redis_client.delete(*keys)
+                # Only remove the members we saw, so results cached concurrently stay indexed
+                for name, members in members_by_tag.items():
+                    if members:
+                        self.redis_client.srem(self.tag_key(name), *members)
+        except Exception as exception:
+            logger.warning(f"Invalidating the search cache of {sorted(names)} in Redis failed: {exception}")
+
+
+class AsyncElasticsearchSearchCache(_BaseSearchCache):
+    """Async cache of search results, in process memory and optionally in Redis, invalidated by writes.
+
+    Behaves like ElasticsearchSearchCache with an async Redis adapter.
+
+    Args:
+        ttl_seconds (float): Seconds a result is cached. Defaults to 60.
+        local_ttl_seconds (float): Seconds a result is kept in process memory, at most ``ttl_seconds``.
+            Defaults to 5.
+        local_maxsize (int): Maximum number of results kept in process memory, 0 to keep none.
+            Defaults to 1000.
+        refresh_interval_seconds (float): Seconds writes take to become visible to searches, the
+            ``index.refresh_interval`` of the indices. Defaults to 1.
+        redis_client (AsyncRedisPort | None): Async Redis adapter holding the L2 tier, or None for an
+            L1 cache only. Defaults to None.
+        key_prefix (str): Prefix of the Redis keys. Defaults to "elasticsearch:search".
+        metrics (ElasticsearchMetrics | None): Metrics the lookups and invalidations are counted in.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60,
+        local_ttl_seconds: float = 5,
+        local_maxsize: int = 1000,
+        refresh_interval_seconds: float = 1,
+        redis_client: AsyncRedisPort | None = None,
+        key_prefix: str = "elasticsearch:search",
+        metrics: "ElasticsearchMetrics | None" = None,
+    ) -> None:
+        super().__init__(ttl_seconds, local_ttl_seconds, local_maxsize, refresh_interval_seconds, key_prefix, metrics)
+        self.redis_client = redis_client
+
+    async def fetch(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType,
+        kwargs: dict[str, Any],
+        search: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Returns the cached result of a search, sending it on a miss.
+
+        Args:
+            index (ElasticsearchIndexType): The index expression of the search.
+            query (ElasticsearchQueryType): The search body.
+            kwargs (dict[str, Any]): The client options of the search.
+            search (Callable[[], Awaitable[Any]]): Sends the search to the cluster.
+
+        Returns:
+            Any: The response body.
+        """
+        key = self.build_key(index, query, kwargs)
+        if key is None:
+            return _response_body(await search())
+        if (body := self.lookup_local(key, index)) is not None:
+            return body
+        names = _index_names(index)
+        started = time.time()
+        data, cacheable_from = await self.read_remote(key, names)
+        if data is not None:
+            self.store_local(key, names, data)
+            self.record(index, "redis_hit")
+            return json.loads(data)
+        self.record(index, "miss")
+        body = _response_body(await search())
+        if cacheable_from <= started and self.cacheable_since(names, started):
+            await self.store(key, names, json.dumps(body, separators=(",", ":")).encode(), started)
+        return body
+
+    async def read_remote(self, key: str, names: frozenset[str]) -> tuple[bytes | str | None, float]:
+        """Reads a result from Redis with the timestamp from which its indices may be cached.
+
+        Args:
+            key (str): The cache key.
+            names (frozenset[str]): The indices of the search.
+
+        Returns:
+            tuple[bytes | str | None, float]: The serialized result, or None on a miss, and the timestamp.
+        """
+        if self.redis_client is None:
+            return None, 0.0
+        try:
+            pipeline = await self.redis_client.get_pipeline(transaction=False)
+            self.queue_lookup(pipeline, key, names)
+            data, *timestamps = await pipeline.execute()
+        except Exception as exception:
+            logger.warning(f"Reading search cache key {key} from Redis failed: {exception}")
+            return None, 0.0
+        return data, self.latest(timestamps)
+
+    async def store(self, key: str, names: frozenset[str], data: bytes, started: float) -> None:
+        """Stores a result in both tiers, unless its indices were written while it was stored.
+
+        Args:
+            key (str): The cache key.
+            names (frozenset[str]): The indices the result was read from.
+            data (bytes): The serialized response body.
+            started (float): Unix timestamp at which the search was sent.
+        """
+        self.store_local(key, names, data)
+        if self.redis_client is None:
+            return
+        try:
+            pipeline = await self.redis_client.get_pipeline(transaction=False)
+            self.queue_write(pipeline, key, names, data)
+            replies = await pipeline.execute()
+            # A write that invalidated the indices meanwhile may have missed the new key
+            if self.latest(replies[-len(names) :]) > started:
+                self.discard_local(key)
+                await self.redis_client.delete(key)
+        except Exception as exception:
+            logger.warning(f"Writing search cache key {key} to Redis failed: {exception}")
+
+    async def invalidate(self, *indices: ElasticsearchIndexType, refreshed: bool = False) -> None:
+        """Drops the cached results of searches of the given indices.
+
+        Call it after writing to an index other than through the adapter, which invalidates its
+        own writes.
+
+        Args:
+            *indices (ElasticsearchIndexType): The written indices, or comma-separated index expressions.
+            refreshed (bool): Whether the writes are already visible to searches, as after a refresh or
+                a write with ``refresh="wait_for"``. Otherwise results are not cached for the refresh
+                interval. Defaults to False.
+        """
+        names = frozenset().union(*(_index_names(index) for index in indices))
+        if not names:
+            return
+        cacheable_from = self.invalidate_local(names, refreshed)
+        if self.redis_client is None:
+            return
+        try:
+            pipeline = await self.redis_client.get_pipeline(transaction=False)
+            self.queue_invalidation(pipeline, names, cacheable_from)
+            members_by_tag = dict(zip(sorted(names), (await pipeline.execute())[1::2], strict=True))
+            keys: set[str] = set().union(*members_by_tag.values())
+            if keys:
+                await self.redis_client.delete(*keys)
+                # Only remove the members we saw, so results cached concurrently stay indexed
+                for name, members in members_by_tag.items():
+                    if members:
+                        await self.redis_client.srem(self.tag_key(name), *members)
+        except Exception as exception:
+            logger.warning(f"Invalidating the search cache of {sorted(names)} in Redis failed: {exception}")
@@ -0,0 +1,71 @@
+import functools
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Enum, Gauge
+
+# Phases of the reindex of an alias, in order, then its outcome
+REINDEX_PHASES = ("creating", "copying", "merging", "swapping", "completed", "failed")
+
+
+class ElasticsearchMetrics:
+    """Prometheus metrics of the Elasticsearch adapters.
+
+    The search result cache counts its lookups by index and result: ``local_hit`` when the result
+    came from process memory, ``redis_hit`` when it came from Redis and ``miss`` when the search was
+    sent to the cluster. The hit ratio of an index is the rate of both hits over the rate of all
+    lookups. Invalidations count the writes that dropped the cached results of an index.
+
+    The reindex of an alias exports its current phase, the seconds each phase of the last run took,
+    and the documents to copy and copied so far; the progress of a copy is the ratio of the two.
+
+    Args:
+        registry (CollectorRegistry): Registry the metrics are registered in. Defaults to the global registry.
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY) -> None:
+        self.search_cache_lookups = Counter(
+            "elasticsearch_search_cache_lookups",
+            "Lookups of the search result cache",
+            ("index", "result"),
+            registry=registry,
+        )
+        self.search_cache_invalidations = Counter(
+            "elasticsearch_search_cache_invalidations",
+            "Invalidations of the cached search results of an index",
+            ("index",),
+            registry=registry,
+        )
+        self.reindex_phase = Enum(
+            "elasticsearch_reindex_phase",
+            "Phase of the reindex of an alias",
+            ("alias",),
+            states=list(REINDEX_PHASES),
+            registry=registry,
+        )
+        self.reindex_phase_seconds = Gauge(
+            "elasticsearch_reindex_phase_seconds",
+            "Seconds the phases of the last reindex of an alias took",
+            ("alias", "phase"),
+            registry=registry,
+        )
+        self.reindex_source_documents = Gauge(
+            "elasticsearch_reindex_source_documents",
+            "Documents to copy by the reindex of an alias",
+            ("alias",),
+            registry=registry,
+        )
+        self.reindex_copied_documents = Gauge(
+            "elasticsearch_reindex_copied_documents",
+            "Documents copied so far by the reindex of an alias",
+            ("alias",),
+            registry=registry,
+        )
+
+
+@functools.cache
+def get_elasticsearch_metrics() -> ElasticsearchMetrics:
+    """Returns the process-wide Elasticsearch metrics, registering them in the global registry on first use.
+
+    Returns:
+        ElasticsearchMetrics: The Elasticsearch metrics.
+    """
+    return ElasticsearchMetrics()
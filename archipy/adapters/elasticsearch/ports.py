@@ -1,12 +1,21 @@
 from abc import abstractmethod
-from collections.abc import Awaitable
-from typing import Any
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable, Iterator, Sequence
+from typing import Any, Literal
 
 ElasticsearchResponseType = Awaitable[Any] | Any
 ElasticsearchDocumentType = dict[str, Any]
 ElasticsearchQueryType = dict[str, Any]
 ElasticsearchIndexType = str
 ElasticsearchIdType = str
+ElasticsearchBulkActionType = dict[str, Any]
+ElasticsearchBulkResultType = tuple[bool, dict[str, Any]]
+ElasticsearchHitType = dict[str, Any]
+ElasticsearchSearchRequestType = tuple[ElasticsearchIndexType, ElasticsearchQueryType]
+ElasticsearchReindexMethodType = Literal["reindex", "bulk"]
+ElasticsearchReindexResultType = dict[str, Any]
+
+# Default maximum size of one bulk request body, as in elasticsearch-py helpers
+BULK_MAX_CHUNK_BYTES = 100 * 1024 * 1024
 
 
 class ElasticsearchPort:
@@ -98,6 +107,27 @@ class ElasticsearchPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def msearch(
+        self,
+        searches: Sequence[ElasticsearchSearchRequestType],
+        **kwargs: object,
+    ) -> ElasticsearchResponseType:
+        """Run several searches in one request.
+
+        Args:
+            searches (Sequence[ElasticsearchSearchRequestType]): (index, query) of every search.
+            **kwargs (object): Additional keyword arguments passed to the Elasticsearch client.
+
+        Returns:
+            ElasticsearchResponseType: The results, whose ``responses`` hold the response or error of every
+                search in order.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update(
         self,
@@ -164,6 +194,167 @@ class ElasticsearchPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def streaming_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchBulkResultType]:
+        """Stream bulk actions to Elasticsearch in chunks, yielding the result of every action.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType]): The actions, consumed lazily, such as a generator.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            **kwargs (object): Additional keyword arguments passed to the bulk requests.
+
+        Returns:
+            Iterator[ElasticsearchBulkResultType]: (success, item) for every action, chunk by chunk.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def parallel_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType],
+        thread_count: int = 4,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchBulkResultType]:
+        """Send bulk actions to Elasticsearch in chunks sent concurrently, yielding the result of every action.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType]): The actions, consumed lazily, such as a generator.
+            thread_count (int): Maximum number of chunks sent at once. Defaults to 4.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            **kwargs (object): Additional keyword arguments passed to the bulk requests.
+
+        Returns:
+            Iterator[ElasticsearchBulkResultType]: (success, item) for every action, chunk by chunk.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a point in time and search_after.
+
+        Falls back to scroll_hits when the cluster does not support points in time.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the point in time is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            **kwargs (object): Additional keyword arguments passed to the search requests.
+
+        Returns:
+            Iterator[ElasticsearchHitType]: Every hit of the search.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def scroll_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a scroll.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the scroll is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            **kwargs (object): Additional keyword arguments passed to the search requests.
+
+        Returns:
+            Iterator[ElasticsearchHitType]: Every hit of the search.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def parallel_iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        slices: int = 4,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        **kwargs: object,
+    ) -> Iterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search, fetching slices of the hits concurrently.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query and _source. Defaults to
+                all documents.
+            slices (int): Number of slices fetched concurrently. Defaults to 4.
+            page_size (int): Number of hits fetched per request of a slice. Defaults to 1000.
+            keep_alive (str): How long the point in time or scroll is kept between requests. Defaults to "1m".
+            **kwargs (object): Additional keyword arguments passed to the search requests.
+
+        Returns:
+            Iterator[ElasticsearchHitType]: Every hit of the search, in no particular order.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def create_index(
         self,
@@ -248,6 +439,49 @@ class ElasticsearchPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def reindex_alias(
+        self,
+        alias: str,
+        body: dict[str, Any] | None = None,
+        source_index: ElasticsearchIndexType | None = None,
+        query: ElasticsearchQueryType | None = None,
+        method: ElasticsearchReindexMethodType = "reindex",
+        slices: int | Literal["auto"] = "auto",
+        requests_per_second: float | None = None,
+        batch_size: int = 1000,
+        max_num_segments: int | None = 1,
+        poll_interval: float = 5.0,
+        delete_source: bool = False,
+    ) -> ElasticsearchReindexResultType:
+        """Copies the documents behind an alias into a new versioned index and points the alias to it.
+
+        Args:
+            alias (str): The alias the new index is published under.
+            body (dict[str, Any] | None): Settings and mappings of the new index. Defaults to None.
+            source_index (ElasticsearchIndexType | None): Index to copy from instead of the indices of the
+                alias. Defaults to None.
+            query (ElasticsearchQueryType | None): Query selecting the documents to copy. Defaults to all.
+            method (ElasticsearchReindexMethodType): "reindex" to copy with a sliced reindex task on the
+                cluster, "bulk" to stream the documents through bulk requests. Defaults to "reindex".
+            slices (int | Literal["auto"]): Slices of the reindex task copied in parallel. Defaults to "auto".
+            requests_per_second (float | None): Maximum documents copied per second, None for no limit.
+            batch_size (int): Documents read and written per request. Defaults to 1000.
+            max_num_segments (int | None): Segments per shard the new index is force-merged to, None to skip
+                the force-merge. Defaults to 1.
+            poll_interval (float): Seconds between two checks of the reindex task. Defaults to 5.0.
+            delete_source (bool): Whether to delete the indices the alias pointed to once it is swapped.
+                Defaults to False.
+
+        Returns:
+            ElasticsearchReindexResultType: The new index, the indices the alias pointed to and the
+                number of documents copied.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
 
 class AsyncElasticsearchPort:
     """Async interface for Elasticsearch operations providing a standardized access pattern.
@@ -338,6 +572,27 @@ class AsyncElasticsearchPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def msearch(
+        self,
+        searches: Sequence[ElasticsearchSearchRequestType],
+        **kwargs: object,
+    ) -> ElasticsearchResponseType:
+        """Run several searches in one request.
+
+        Args:
+            searches (Sequence[ElasticsearchSearchRequestType]): (index, query) of every search.
+            **kwargs (object): Additional keyword arguments passed to the Elasticsearch client.
+
+        Returns:
+            ElasticsearchResponseType: The results, whose ``responses`` hold the response or error of every
+                search in order.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(
         self,
@@ -404,6 +659,169 @@ class AsyncElasticsearchPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def streaming_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType],
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchBulkResultType]:
+        """Stream bulk actions to Elasticsearch in chunks, yielding the result of every action.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType]): The
+                actions, consumed lazily, such as a generator or an async generator.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            **kwargs (object): Additional keyword arguments passed to the bulk requests.
+
+        Returns:
+            AsyncIterator[ElasticsearchBulkResultType]: (success, item) for every action, chunk by chunk.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def parallel_bulk(
+        self,
+        actions: Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType],
+        concurrency: int = 4,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        max_retries: int = 3,
+        initial_backoff: float = 2.0,
+        max_backoff: float = 600.0,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchBulkResultType]:
+        """Send bulk actions to Elasticsearch in chunks sent concurrently, yielding the result of every action.
+
+        Args:
+            actions (Iterable[ElasticsearchBulkActionType] | AsyncIterable[ElasticsearchBulkActionType]): The
+                actions, consumed lazily, such as a generator or an async generator.
+            concurrency (int): Maximum number of chunks sent at once. Defaults to 4.
+            chunk_size (int): Maximum number of actions per bulk request. Defaults to 500.
+            max_chunk_bytes (int): Maximum size in bytes of a bulk request. Defaults to 100 MiB.
+            max_retries (int): Times an action rejected with a 429 status is retried. Defaults to 3.
+            initial_backoff (float): Seconds before the first retry, doubled on each retry. Defaults to 2.0.
+            max_backoff (float): Maximum seconds between two retries. Defaults to 600.0.
+            raise_on_error (bool): Whether to raise BulkIndexError when actions fail instead of yielding
+                them. Defaults to False.
+            **kwargs (object): Additional keyword arguments passed to the bulk requests.
+
+        Returns:
+            AsyncIterator[ElasticsearchBulkResultType]: (success, item) for every action, chunk by chunk.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a point in time and search_after.
+
+        Falls back to scroll_hits when the cluster does not support points in time.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the point in time is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            **kwargs (object): Additional keyword arguments passed to the search requests.
+
+        Returns:
+            AsyncIterator[ElasticsearchHitType]: Every hit of the search.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def scroll_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search with a scroll.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query, sort and _source.
+                Defaults to all documents in index order.
+            page_size (int): Number of hits fetched per request. Defaults to 1000.
+            keep_alive (str): How long the scroll is kept between requests. Defaults to "1m".
+            slice_id (int | None): The slice to iterate, for splitting the hits across workers. Defaults to None.
+            max_slices (int | None): The number of slices, required with slice_id. Defaults to None.
+            **kwargs (object): Additional keyword arguments passed to the search requests.
+
+        Returns:
+            AsyncIterator[ElasticsearchHitType]: Every hit of the search.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def parallel_iterate_hits(
+        self,
+        index: ElasticsearchIndexType,
+        query: ElasticsearchQueryType | None = None,
+        slices: int = 4,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        **kwargs: object,
+    ) -> AsyncIterator[ElasticsearchHitType]:
+        """Iterate over all hits of a search, fetching slices of the hits concurrently.
+
+        Args:
+            index (ElasticsearchIndexType): The index name.
+            query (ElasticsearchQueryType | None): The search body, such as query and _source. Defaults to
+                all documents.
+            slices (int): Number of slices fetched concurrently. Defaults to 4.
+            page_size (int): Number of hits fetched per request of a slice. Defaults to 1000.
+            keep_alive (str): How long the point in time or scroll is kept between requests. Defaults to "1m".
+            **kwargs (object): Additional keyword arguments passed to the search requests.
+
+        Returns:
+            AsyncIterator[ElasticsearchHitType]: Every hit of the search, in no particular order.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def create_index(
         self,
@@ -487,3 +905,46 @@ class AsyncElasticsearchPort:
             NotImplementedError: If not implemented by the subclass.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def reindex_alias(
+        self,
+        alias: str,
+        body: dict[str, Any] | None = None,
+        source_index: ElasticsearchIndexType | None = None,
+        query: ElasticsearchQueryType | None = None,
+        method: ElasticsearchReindexMethodType = "reindex",
+        slices: int | Literal["auto"] = "auto",
+        requests_per_second: float | None = None,
+        batch_size: int = 1000,
+        max_num_segments: int | None = 1,
+        poll_interval: float = 5.0,
+        delete_source: bool = False,
+    ) -> ElasticsearchReindexResultType:
+        """Copies the documents behind an alias into a new versioned index and points the alias to it.
+
+        Args:
+            alias (str): The alias the new index is published under.
+            body (dict[str, Any] | None): Settings and mappings of the new index. Defaults to None.
+            source_index (ElasticsearchIndexType | None): Index to copy from instead of the indices of the
+                alias. Defaults to None.
+            query (ElasticsearchQueryType | None): Query selecting the documents to copy. Defaults to all.
+            method (ElasticsearchReindexMethodType): "reindex" to copy with a sliced reindex task on the
+                cluster, "bulk" to stream the documents through bulk requests. Defaults to "reindex".
+            slices (int | Literal["auto"]): Slices of the reindex task copied in parallel. Defaults to "auto".
+            requests_per_second (float | None): Maximum documents copied per second, None for no limit.
+            batch_size (int): Documents read and written per request. Defaults to 1000.
+            max_num_segments (int | None): Segments per shard the new index is force-merged to, None to skip
+                the force-merge. Defaults to 1.
+            poll_interval (float): Seconds between two checks of the reindex task. Defaults to 5.0.
+            delete_source (bool): Whether to delete the indices the alias pointed to once it is swapped.
+                Defaults to False.
+
+        Returns:
+            ElasticsearchReindexResultType: The new index, the indices the alias pointed to and the
+                number of documents copied.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
@@ -1,13 +1,35 @@
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import override
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast, override
 
-from confluent_kafka import Consumer, KafkaError, Message, Producer, TopicPartition
+from confluent_kafka import Consumer, KafkaError, KafkaException, Message, Producer, TopicPartition
 from confluent_kafka.admin import AdminClient, ClusterMetadata, NewTopic
 
-from archipy.adapters.kafka.ports import KafkaAdminPort, KafkaConsumerPort, KafkaProducerPort
+from archipy.adapters.kafka.ports import (
+    AsyncKafkaConsumerPort,
+    AsyncKafkaProducerPort,
+    KafkaAdminPort,
+    KafkaBatchResult,
+    KafkaConsumedBatch,
+    KafkaConsumerPort,
+    KafkaConsumeStats,
+    KafkaDecodedMessage,
+    KafkaHeadersType,
+    KafkaProducerPort,
+    KafkaRebalanceCallback,
+    KafkaRecord,
+)
+from archipy.adapters.kafka.serializers import KafkaSerializer, deserialize_payloads
 from archipy.configs.base_config import BaseConfig
 from archipy.configs.config_template import KafkaConfig
 from archipy.models.errors import (
+    AbortedError,
     ConfigurationError,
     ConnectionTimeoutError,
     InternalError,
@@ -18,9 +40,28 @@ from archipy.models.errors import (
     UnavailableError,
 )
 
+if TYPE_CHECKING:
+    from archipy.adapters.kafka.metrics import KafkaMetrics
+
 logger = logging.getLogger(__name__)
 
 
+def _get_metrics(configs: KafkaConfig) -> "KafkaMetrics | None":
+    """Returns the process-wide Kafka metrics when the configuration enables them.
+
+    Args:
+        configs (KafkaConfig): Kafka configuration.
+
+    Returns:
+        KafkaMetrics | None: The metrics, or None when metrics are disabled.
+    """
+    if not configs.METRICS_ENABLED:
+        return None
+    from archipy.adapters.kafka.metrics import get_kafka_metrics
+
+    return get_kafka_metrics()
+
+
 class KafkaExceptionHandlerMixin:
     """Mixin class to handle Kafka exceptions in a consistent way."""
 
@@ -65,6 +106,25 @@ class KafkaExceptionHandlerMixin:
             raise ServiceUnavailableError(service="Kafka") from exception
         raise InternalError(additional_data={"operation": operation}) from exception
 
+    @classmethod
+    def _handle_transaction_exception(cls, exception: Exception, operation: str) -> None:
+        """Handle exceptions of transactional operations.
+
+        Args:
+            exception: The original exception
+            operation: The name of the operation that failed
+
+        Raises:
+            AbortedError: If the transaction failed and must be aborted before a new one begins
+            Various other errors from _handle_kafka_exception
+        """
+        error = exception.args[0] if isinstance(exception, KafkaException) and exception.args else None
+        if isinstance(error, KafkaError) and error.txn_requires_abort():
+            raise AbortedError(service="Kafka", reason=error.str()) from exception
+
+        # Fatal errors, such as a producer fenced by a newer instance, need a new producer
+        cls._handle_kafka_exception(exception, operation)
+
     @classmethod
     def _handle_producer_exception(cls, exception: Exception, operation: str) -> None:
         """Handle producer-specific exceptions.
@@ -200,6 +260,9 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
         topic_list: list[str] | None = None,
         partition_list: list[TopicPartition] | None = None,
         kafka_configs: KafkaConfig | None = None,
+        value_serializer: KafkaSerializer | None = None,
+        key_serializer: KafkaSerializer | None = None,
+        deserialize_executor: Executor | None = None,
     ) -> None:
         """Initializes the consumer adapter with Kafka configuration and subscription.
 
@@ -211,6 +274,13 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
                 to assign. Defaults to None.
             kafka_configs (KafkaConfig | None, optional): Kafka configuration. If None,
                 uses global config. Defaults to None.
+            value_serializer (KafkaSerializer | None, optional): Deserializes message values in
+                decode, or None to return them as bytes. Defaults to None.
+            key_serializer (KafkaSerializer | None, optional): Deserializes message keys in
+                decode, or None to return them as bytes. Defaults to None.
+            deserialize_executor (Executor | None, optional): Executor deserializing chunks of a
+                batch in parallel, such as a ProcessPoolExecutor for CPU-heavy formats, or None to
+                deserialize in the calling thread. Defaults to None.
 
         Raises:
             InvalidArgumentError: If both topic_list and partition_list are provided or
@@ -219,6 +289,11 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
         """
         configs: KafkaConfig = kafka_configs or BaseConfig.global_config().KAFKA
         self._adapter: Consumer = self._get_adapter(group_id, configs)
+        self._client_id = configs.CLIENT_ID
+        self._metrics = _get_metrics(configs)
+        self._value_serializer = value_serializer
+        self._key_serializer = key_serializer
+        self._deserialize_executor = deserialize_executor
         if topic_list and not partition_list:
             self.subscribe(topic_list)
         elif not topic_list and partition_list:
@@ -249,6 +324,7 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
             broker_list_csv = ",".join(configs.BROKERS_LIST)
             config = {
                 "bootstrap.servers": broker_list_csv,
+                "client.id": configs.CLIENT_ID,
                 "group.id": group_id,
                 "session.timeout.ms": configs.SESSION_TIMEOUT_MS,
                 "auto.offset.reset": configs.AUTO_OFFSET_RESET,
@@ -260,7 +336,10 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
                 "partition.assignment.strategy": configs.PARTITION_ASSIGNMENT_STRATEGY,
                 "fetch.max.bytes": configs.FETCH_MAX_BYTES,
                 "max.partition.fetch.bytes": configs.MAX_PARTITION_FETCH_BYTES,
+                "statistics.interval.ms": configs.STATISTICS_INTERVAL_MS,
             }
+            if metrics := _get_metrics(configs):
+                config["stats_cb"] = metrics.observe_statistics
             if configs.USERNAME and configs.PASSWORD and configs.SSL_CA_FILE:
                 config |= {
                     "sasl.username": configs.USERNAME,
@@ -279,13 +358,13 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
             return consumer
 
     @override
-    def batch_consume(self, messages_number: int = 500, timeout: int = 1) -> list[Message]:
+    def batch_consume(self, messages_number: int = 500, timeout: float = 1) -> list[Message]:
         """Consumes a batch of messages from subscribed topics.
 
         Args:
             messages_number (int, optional): Maximum number of messages to consume.
                 Defaults to 500.
-            timeout (int, optional): Timeout in seconds for the operation. Defaults to 1.
+            timeout (float, optional): Timeout in seconds for the operation. Defaults to 1.
 
         Returns:
             list[Message]: List of consumed messages.
@@ -298,13 +377,16 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
         try:
             result_list: list[Message] = []
             messages: list[Message] = self._adapter.consume(num_messages=messages_number, timeout=timeout)
+            debug = logger.isEnabledFor(logging.DEBUG)
             for message in messages:
                 if message.error():
                     logger.error("Consumer error: %s", message.error())
                     continue
-                logger.debug("Message consumed: %s", message)
-                message.set_value(message.value())
+                if debug:
+                    logger.debug("Message consumed: %s", message)
                 result_list.append(message)
+            if self._metrics is not None:
+                self._metrics.observe_consumed_batch(self._client_id, len(result_list))
         except Exception as e:
             self._handle_kafka_exception(e, "batch_consume")
         else:
@@ -334,12 +416,152 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
                 logger.error("Consumer error: %s", message.error())
                 return None
             logger.debug("Message consumed: %s", message)
-            message.set_value(message.value())
         except Exception as e:
             self._handle_kafka_exception(e, "poll")
         else:
             return message
 
+    @override
+    def fast_consume(self, messages_number: int = 500, timeout: float = 1) -> KafkaConsumedBatch:
+        """Consumes a batch of messages without per-message processing.
+
+        Messages are returned as delivered by the client, without per-message logging. Error events
+        are dropped and logged once per batch, and the batch statistics are computed in a single pass;
+        the lag is read from the watermarks the consumer caches with every fetch, so it costs no
+        broker round-trip.
+
+        Args:
+            messages_number (int, optional): Maximum number of messages to consume.
+                Defaults to 500.
+            timeout (float, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            KafkaConsumedBatch: The consumed messages and their aggregate statistics.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error consuming messages.
+        """
+        try:
+            messages: list[Message] = self._adapter.consume(num_messages=messages_number, timeout=timeout)
+            valid = [message for message in messages if message.error() is None]
+            errors = len(messages) - len(valid)
+            if errors:
+                first_error = next(message.error() for message in messages if message.error() is not None)
+                logger.error("Consumer returned %d errors, first: %s", errors, first_error)
+            stats = self._batch_stats(valid, errors)
+            if self._metrics is not None:
+                self._metrics.observe_consumed_batch(self._client_id, stats.message_count)
+        except Exception as e:
+            self._handle_kafka_exception(e, "fast_consume")
+        else:
+            logger.debug(
+                "Consumed %d messages, %d bytes, lag %d",
+                stats.message_count,
+                stats.payload_bytes,
+                stats.lag,
+            )
+            return KafkaConsumedBatch(valid, stats)
+
+    def _batch_stats(self, messages: list[Message], errors: int) -> KafkaConsumeStats:
+        """Computes the aggregate statistics of a consumed batch.
+
+        Args:
+            messages (list[Message]): The valid messages of the batch.
+            errors (int): Number of error events dropped from the batch.
+
+        Returns:
+            KafkaConsumeStats: The batch statistics.
+        """
+        payload_bytes = 0
+        last_offsets: dict[tuple[str, int], int] = {}
+        for message in messages:
+            payload_bytes += len(message)
+            last_offsets[cast(str, message.topic()), cast(int, message.partition())] = cast(int, message.offset())
+        partition_lag: dict[tuple[str, int], int] = {}
+        for (topic, partition), offset in last_offsets.items():
+            watermarks = self._adapter.get_watermark_offsets(TopicPartition(topic, partition), cached=True)
+            if watermarks is not None and watermarks[1] >= 0:
+                partition_lag[topic, partition] = max(watermarks[1] - offset - 1, 0)
+        return KafkaConsumeStats(len(messages), payload_bytes, errors, sum(partition_lag.values()), partition_lag)
+
+    @override
+    def consume_decoded(self, messages_number: int = 500, timeout: float = 1) -> list[KafkaDecodedMessage]:
+        """Consumes a batch of messages on the fast path and deserializes their keys and values.
+
+        Args:
+            messages_number (int, optional): Maximum number of messages to consume.
+                Defaults to 500.
+            timeout (float, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            list[KafkaDecodedMessage]: The consumed messages with their deserialized keys and values.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error consuming messages.
+        """
+        return self.decode(self.fast_consume(messages_number, timeout).messages)
+
+    @override
+    def decode(self, messages: list[Message]) -> list[KafkaDecodedMessage]:
+        """Deserializes the keys and values of consumed messages in one batch.
+
+        Payloads are grouped by topic and handed to the serializers in chunks, in parallel when the
+        adapter has a deserialize executor. A message whose key or value cannot be deserialized is
+        returned with its error rather than failing the batch, so it can be skipped or dead-lettered.
+
+        Args:
+            messages (list[Message]): The consumed messages.
+
+        Returns:
+            list[KafkaDecodedMessage]: The messages with their deserialized keys and values.
+        """
+        values = self._deserialize(messages, [message.value() for message in messages], self._value_serializer)
+        keys = self._deserialize(messages, [message.key() for message in messages], self._key_serializer)
+        return [
+            KafkaDecodedMessage(value, key, message, value_error or key_error)
+            for message, (value, value_error), (key, key_error) in zip(messages, values, keys, strict=True)
+        ]
+
+    def _deserialize(
+        self,
+        messages: list[Message],
+        payloads: list[bytes | None],
+        serializer: KafkaSerializer | None,
+    ) -> list[tuple[Any, Exception | None]]:
+        """Deserializes payloads of messages, topic by topic.
+
+        Args:
+            messages (list[Message]): The consumed messages.
+            payloads (list[bytes | None]): The key or value of each message.
+            serializer (KafkaSerializer | None): The serializer, or None to keep the payloads as bytes.
+
+        Returns:
+            list[tuple[Any, Exception | None]]: Each deserialized payload with its error, or None.
+        """
+        if serializer is None:
+            return [(data, None) for data in payloads]
+        indexes_by_topic: dict[str, list[int]] = {}
+        for index, message in enumerate(messages):
+            indexes_by_topic.setdefault(cast(str, message.topic()), []).append(index)
+        if len(indexes_by_topic) == 1:
+            topic = next(iter(indexes_by_topic))
+            return deserialize_payloads(serializer, payloads, topic, self._deserialize_executor)
+        results: list[tuple[Any, Exception | None]] = [(None, None)] * len(payloads)
+        for topic, indexes in indexes_by_topic.items():
+            decoded = deserialize_payloads(
+                serializer,
+                [payloads[index] for index in indexes],
+                topic,
+                self._deserialize_executor,
+            )
+            for index, result in zip(indexes, decoded, strict=True):
+                results[index] = result
+        return results
+
     @override
     def commit(self, message: Message, asynchronous: bool = True) -> None | list[TopicPartition]:
         """Commits the offset for a message.
@@ -368,22 +590,83 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
             return result
 
     @override
-    def subscribe(self, topic_list: list[str]) -> None:
+    def commit_offsets(self, offsets: list[TopicPartition], asynchronous: bool = True) -> list[TopicPartition] | None:
+        """Commits explicit offsets, each being the next offset to consume from its partition.
+
+        Args:
+            offsets (list[TopicPartition]): The partitions and offsets to commit.
+            asynchronous (bool, optional): Whether to commit asynchronously. Defaults to True.
+
+        Returns:
+            list[TopicPartition] | None: None for async commits, list of TopicPartition for sync commits.
+
+        Raises:
+            InvalidArgumentError: If the offsets are invalid.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error committing the offsets.
+        """
+        try:
+            if asynchronous:
+                self._adapter.commit(offsets=offsets, asynchronous=True)
+                result = None
+            else:
+                result = self._adapter.commit(offsets=offsets, asynchronous=False)
+        except Exception as e:
+            self._handle_kafka_exception(e, "commit_offsets")
+        else:
+            return result
+
+    @override
+    def subscribe(
+        self,
+        topic_list: list[str],
+        on_assign: KafkaRebalanceCallback | None = None,
+        on_revoke: KafkaRebalanceCallback | None = None,
+        on_lost: KafkaRebalanceCallback | None = None,
+    ) -> None:
         """Subscribes to a list of topics.
 
+        Rebalance callbacks run inside poll, batch_consume or close, on the thread calling them.
+
         Args:
             topic_list (list[str]): List of topics to subscribe to.
+            on_assign (KafkaRebalanceCallback | None, optional): Called with the partitions assigned
+                by a rebalance. Defaults to None.
+            on_revoke (KafkaRebalanceCallback | None, optional): Called with the partitions revoked
+                by a rebalance, before they are handed to another consumer. Defaults to None.
+            on_lost (KafkaRebalanceCallback | None, optional): Called with the partitions lost without
+                a clean revocation. Defaults to None.
 
         Raises:
             InvalidArgumentError: If the topic list is invalid.
             ServiceUnavailableError: If Kafka is unavailable.
             InternalError: If there is an error subscribing to topics.
         """
+        callbacks = {}
+        for name, callback in (("on_assign", on_assign), ("on_revoke", on_revoke), ("on_lost", on_lost)):
+            if callback is not None:
+                callbacks[name] = self._rebalance_callback(callback)
         try:
-            self._adapter.subscribe(topic_list)
+            self._adapter.subscribe(topic_list, **callbacks)
         except Exception as e:
             self._handle_kafka_exception(e, "subscribe")
 
+    @staticmethod
+    def _rebalance_callback(callback: KafkaRebalanceCallback) -> Callable[[Consumer, list[TopicPartition]], None]:
+        """Adapts a rebalance callback to the (consumer, partitions) signature of librdkafka.
+
+        Args:
+            callback (KafkaRebalanceCallback): The callback receiving the partitions.
+
+        Returns:
+            Callable[[Consumer, list[TopicPartition]], None]: The adapted callback.
+        """
+
+        def on_rebalance(_consumer: Consumer, partitions: list[TopicPartition]) -> None:
+            callback(partitions)
+
+        return on_rebalance
+
     @override
     def assign(self, partition_list: list[TopicPartition]) -> None:
         """Assigns the consumer to a list of topic partitions.
@@ -401,29 +684,197 @@ class KafkaConsumerAdapter(KafkaConsumerPort, KafkaExceptionHandlerMixin):
         except Exception as e:
             self._handle_kafka_exception(e, "assign")
 
+    @override
+    def pause(self, partition_list: list[TopicPartition]) -> None:
+        """Stops fetching messages from partitions until they are resumed.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to pause.
+
+        Raises:
+            InvalidArgumentError: If the partition list is invalid.
+            InternalError: If there is an error pausing the partitions.
+        """
+        try:
+            self._adapter.pause(partition_list)
+        except Exception as e:
+            self._handle_kafka_exception(e, "pause")
+
+    @override
+    def resume(self, partition_list: list[TopicPartition]) -> None:
+        """Resumes fetching messages from paused partitions.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to resume.
+
+        Raises:
+            InvalidArgumentError: If the partition list is invalid.
+            InternalError: If there is an error resuming the partitions.
+        """
+        try:
+            self._adapter.resume(partition_list)
+        except Exception as e:
+            self._handle_kafka_exception(e, "resume")
+
+    @override
+    def seek(self, partition: TopicPartition) -> None:
+        """Moves the consume position of an assigned partition.
+
+        Args:
+            partition (TopicPartition): The partition and the offset of the next message to consume.
+
+        Raises:
+            InvalidArgumentError: If the partition is not assigned or the offset is invalid.
+            InternalError: If there is an error seeking the partition.
+        """
+        try:
+            self._adapter.seek(partition)
+        except Exception as e:
+            self._handle_kafka_exception(e, "seek")
+
+    @override
+    def consumer_group_metadata(self) -> object:
+        """Returns the consumer group metadata that transactional producers commit offsets with.
+
+        Returns:
+            object: The opaque group metadata of the consumer.
+
+        Raises:
+            InternalError: If there is an error reading the group metadata.
+        """
+        try:
+            metadata = self._adapter.consumer_group_metadata()
+        except Exception as e:
+            self._handle_kafka_exception(e, "consumer_group_metadata")
+        else:
+            return metadata
+
+    @override
+    def close(self) -> None:
+        """Leaves the consumer group and releases the consumer.
+
+        Raises:
+            InternalError: If there is an error closing the consumer.
+        """
+        try:
+            self._adapter.close()
+        except Exception as e:
+            self._handle_kafka_exception(e, "close")
+
+
+class _KafkaBatchTracker:
+    """Aggregates the delivery reports of a batch, which may arrive on the poll thread."""
+
+    __slots__ = ("_done", "_lock", "_on_done", "_sealed", "delivered", "failed", "pending", "total")
+
+    def __init__(self, on_done: Callable[[], None] | None = None) -> None:
+        self.total = 0
+        self.pending = 0
+        self.delivered = 0
+        self.failed: list[Message] = []
+        self._sealed = False
+        self._on_done = on_done
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def _finish(self) -> None:
+        """Signals that every record is reported; called with the lock held."""
+        self._done.set()
+        if self._on_done is not None:
+            self._on_done()
+
+    def add(self) -> None:
+        """Counts an enqueued record."""
+        with self._lock:
+            self.total += 1
+            self.pending += 1
+
+    def seal(self) -> None:
+        """Marks the end of the batch, after which no record is added."""
+        with self._lock:
+            self._sealed = True
+            if not self.pending:
+                self._finish()
+
+    def on_delivery(self, error: KafkaError | None, message: Message) -> None:
+        """Records the delivery report of one record."""
+        with self._lock:
+            self.pending -= 1
+            if error is None:
+                self.delivered += 1
+            else:
+                self.failed.append(message)
+            if self._sealed and not self.pending:
+                self._finish()
+
+    def done(self) -> bool:
+        """Returns whether every record of the sealed batch is reported."""
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None) -> None:
+        """Waits for the delivery reports served by another thread."""
+        self._done.wait(timeout)
+
+    def result(self) -> KafkaBatchResult:
+        """Returns the delivery results aggregated so far."""
+        with self._lock:
+            return KafkaBatchResult(self.delivered, list(self.failed), self.pending)
+
 
 class KafkaProducerAdapter(KafkaProducerPort, KafkaExceptionHandlerMixin):
     """Synchronous Kafka producer adapter.
 
     This adapter provides synchronous message production to Kafka topics.
     It implements the KafkaProducerPort interface and handles message production.
+
+    Delivery reports are served according to ``PRODUCER_POLL_MODE``: by a non-blocking poll after
+    each produce ("inline"), by a background poll thread ("thread"), or only on flush ("none").
+    When the local queue is full, produce waits up to ``PRODUCER_QUEUE_FULL_TIMEOUT_MS`` for
+    deliveries to free space before raising ResourceExhaustedError.
     """
 
-    def __init__(self, topic_name: str, kafka_configs: KafkaConfig | None = None) -> None:
+    def __init__(
+        self,
+        topic_name: str,
+        kafka_configs: KafkaConfig | None = None,
+        value_serializer: KafkaSerializer | None = None,
+        key_serializer: KafkaSerializer | None = None,
+    ) -> None:
         """Initializes the producer adapter with Kafka configuration.
 
         Args:
             topic_name (str): Default topic name to produce messages to.
             kafka_configs (KafkaConfig | None, optional): Kafka configuration. If None,
                 uses global config. Defaults to None.
+            value_serializer (KafkaSerializer | None, optional): Encodes message values, or None to
+                produce str and bytes values as is. Defaults to None.
+            key_serializer (KafkaSerializer | None, optional): Encodes message keys, or None to
+                produce str and bytes keys as is. Defaults to None.
 
         Raises:
             ConfigurationError: If there is an error in the Kafka configuration.
             InternalError: If there is an error initializing the producer.
         """
         self._topic_name = topic_name
+        self._value_serializer = value_serializer
+        self._key_serializer = key_serializer
         configs: KafkaConfig = kafka_configs or BaseConfig.global_config().KAFKA
         self._adapter: Producer = self._get_adapter(configs)
+        self._client_id = configs.CLIENT_ID
+        self._metrics = _get_metrics(configs)
+        self._poll_mode = configs.PRODUCER_POLL_MODE
+        self._queue_full_timeout = configs.PRODUCER_QUEUE_FULL_TIMEOUT_MS / 1000
+        self._transaction_timeout = configs.TRANSACTION_TIMEOUT_MS / 1000
+        self._closed = threading.Event()
+        self._poll_thread: threading.Thread | None = None
+        if self._poll_mode == "thread":
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop,
+                args=(configs.PRODUCER_POLL_INTERVAL_MS / 1000,),
+                name=f"kafka-producer-poll-{topic_name}",
+                daemon=True,
+            )
+            self._poll_thread.start()
 
     @classmethod
     def _get_adapter(cls, configs: KafkaConfig) -> Producer:
@@ -443,6 +894,7 @@ class KafkaProducerAdapter(KafkaProducerPort, KafkaExceptionHandlerMixin):
             broker_list_csv = ",".join(configs.BROKERS_LIST)
             config = {
                 "bootstrap.servers": broker_list_csv,
+                "client.id": configs.CLIENT_ID,
                 "linger.ms": configs.LINGER_MS,
                 "batch.size": configs.BATCH_SIZE,
                 "acks": configs.ACKS,
@@ -455,8 +907,11 @@ class KafkaProducerAdapter(KafkaProducerPort, KafkaExceptionHandlerMixin):
                 "queue.buffering.max.messages": configs.QUEUE_BUFFERING_MAX_MESSAGES,
                 "statistics.interval.ms": configs.STATISTICS_INTERVAL_MS,
             }
+            if metrics := _get_metrics(configs):
+                config["stats_cb"] = metrics.observe_statistics
             if configs.TRANSACTIONAL_ID:
                 config["transactional.id"] = configs.TRANSACTIONAL_ID
+                config["transaction.timeout.ms"] = configs.TRANSACTION_TIMEOUT_MS
             if configs.USERNAME and configs.PASSWORD and configs.SSL_CA_FILE:
                 config |= {
                     "sasl.username": configs.USERNAME,
@@ -475,19 +930,36 @@ class KafkaProducerAdapter(KafkaProducerPort, KafkaExceptionHandlerMixin):
             return producer
 
     @staticmethod
-    def _pre_process_message(message: str | bytes) -> bytes:
+    def _pre_process_message(message: str | bytes | None) -> bytes | None:
         """Pre-processes a message to ensure it's in the correct format.
 
         Args:
-            message (str | bytes): The message to pre-process.
+            message (str | bytes | None): The message or key to pre-process.
 
         Returns:
-            bytes: The pre-processed message as bytes.
+            bytes | None: The pre-processed message as bytes, or None for a missing key.
         """
         if isinstance(message, str):
             return message.encode("utf-8")
         return message
 
+    def _encode(self, topic: str, value: Any, key: Any) -> tuple[bytes | None, bytes | None]:
+        """Encodes the value and key of a message with the serializers, or as UTF-8 without them.
+
+        Args:
+            topic (str): The topic the message is produced to.
+            value (Any): The message value.
+            key (Any): The message key.
+
+        Returns:
+            tuple[bytes | None, bytes | None]: The encoded value and key; None values stay None.
+        """
+        if value is not None and self._value_serializer is not None:
+            value = self._value_serializer.serialize(value, topic)
+        if key is not None and self._key_serializer is not None:
+            key = self._key_serializer.serialize(key, topic)
+        return self._pre_process_message(value), self._pre_process_message(key)
+
     @staticmethod
     def _delivery_callback(error: KafkaError | None, message: Message) -> None:
         """Callback for message delivery confirmation.
@@ -506,82 +978,968 @@ class KafkaProducerAdapter(KafkaProducerPort, KafkaExceptionHandlerMixin):
                 message.offset(),
             )
 
+    @classmethod
+    def _delivery_error(cls, error: KafkaError) -> Exception:
+        """Maps a delivery error to the application error raised by a failed delivery future.
+
+        Args:
+            error (KafkaError): Error reported by the delivery callback.
+
+        Returns:
+            Exception: The application error.
+        """
+        try:
+            cls._handle_kafka_exception(KafkaException(error), "delivery")
+        except Exception as mapped_error:
+            return mapped_error
+        return InternalError(additional_data={"operation": "delivery"})
+
+    def _poll_loop(self, interval: float) -> None:
+        """Serves delivery reports until the producer is closed.
+
+        Args:
+            interval (float): Poll timeout in seconds.
+        """
+        while not self._closed.is_set():
+            try:
+                self._adapter.poll(interval)
+            except Exception:
+                logger.exception("Kafka producer poll failed")
+
+    def _enqueue(
+        self,
+        topic: str,
+        value: bytes | None,
+        key: bytes | None,
+        callback: Callable[[KafkaError | None, Message], None],
+        partition: int = -1,
+        timestamp: int = 0,
+        headers: KafkaHeadersType | None = None,
+    ) -> None:
+        """Enqueues a message, waiting for queue space up to the configured timeout.
+
+        Args:
+            topic (str): Target topic.
+            value (bytes | None): The message value.
+            key (bytes | None): The message key.
+            callback (Callable[[KafkaError | None, Message], None]): Delivery callback.
+            partition (int, optional): Target partition, -1 to let the partitioner choose. Defaults to -1.
+            timestamp (int, optional): Timestamp in milliseconds, 0 for the current time. Defaults to 0.
+            headers (KafkaHeadersType | None, optional): Message headers. Defaults to None.
+
+        Raises:
+            BufferError: If the queue stays full for longer than the timeout.
+        """
+        if self._metrics is not None:
+            callback = self._measured(callback)
+        deadline = time.monotonic() + self._queue_full_timeout
+        while True:
+            try:
+                self._adapter.produce(
+                    topic,
+                    value,
+                    key,
+                    partition,
+                    callback=callback,
+                    timestamp=timestamp,
+                    headers=headers,
+                )
+            except BufferError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise
+                # Serving delivery reports frees queue space
+                self._adapter.poll(min(remaining, 0.1))
+            else:
+                return
+
+    def _measured(
+        self,
+        callback: Callable[[KafkaError | None, Message], None],
+    ) -> Callable[[KafkaError | None, Message], None]:
+        """Wraps a delivery callback to record the delivery latency of the message.
+
+        Args:
+            callback (Callable[[KafkaError | None, Message], None]): The delivery callback.
+
+        Returns:
+            Callable[[KafkaError | None, Message], None]: The wrapped callback.
+        """
+        metrics = cast("KafkaMetrics", self._metrics)
+        client_id = self._client_id
+
+        def on_delivery(error: KafkaError | None, message: Message) -> None:
+            if error is None:
+                metrics.observe_delivery(client_id, message.latency())
+            callback(error, message)
+
+        return on_delivery
+
+    def _enqueue_record(self, record: KafkaRecord, callback: Callable[[KafkaError | None, Message], None]) -> None:
+        """Encodes a batch record and enqueues it to its own topic, or to the configured one.
+
+        Args:
+            record (KafkaRecord): The record to enqueue.
+            callback (Callable[[KafkaError | None, Message], None]): Delivery callback.
+
+        Raises:
+            BufferError: If the queue stays full for longer than the timeout.
+        """
+        topic = record.topic or self._topic_name
+        value, key = self._encode(topic, record.value, record.key)
+        self._enqueue(
+            topic,
+            value,
+            key,
+            callback,
+            -1 if record.partition is None else record.partition,
+            record.timestamp or 0,
+            record.headers,
+        )
+
+    def _produce(
+        self,
+        value: bytes | None,
+        key: bytes | None,
+        callback: Callable[[KafkaError | None, Message], None],
+    ) -> None:
+        """Enqueues a message to the configured topic and serves delivery reports in inline poll mode.
+
+        Args:
+            value (bytes | None): The message value.
+            key (bytes | None): The message key.
+            callback (Callable[[KafkaError | None, Message], None]): Delivery callback.
+
+        Raises:
+            BufferError: If the queue stays full for longer than the timeout.
+        """
+        self._enqueue(self._topic_name, value, key, callback)
+        if self._poll_mode == "inline":
+            self._adapter.poll(0)
+
     @override
-    def produce(self, message: str | bytes, key: str | None = None) -> None:
+    def produce(self, message: Any, key: Any = None) -> None:
         """Produces a message to the configured topic.
 
         Args:
-            message (str | bytes): The message to produce.
-            key (str | None, optional): The key for the message. Defaults to None.
+            message (Any): The message to produce, str or bytes unless the producer has a value serializer.
+            key (Any, optional): The key for the message, str or bytes unless the producer has a key
+                serializer. Defaults to None.
 
         Raises:
             NetworkError: If there is a network error producing the message.
-            ResourceExhaustedError: If the producer queue is full.
+            ResourceExhaustedError: If the producer queue stays full for longer than the configured timeout.
             InternalError: If there is an error producing the message.
         """
         try:
-            processed_message = self._pre_process_message(message)
-            processed_key = self._pre_process_message(key)
-            self._adapter.produce(
-                topic=self._topic_name,
-                value=processed_message,
-                callback=self._delivery_callback,
-                key=processed_key,
-            )
+            processed_message, processed_key = self._encode(self._topic_name, message, key)
+            self._produce(processed_message, processed_key, self._delivery_callback)
         except Exception as e:
             self._handle_producer_exception(e, "produce")
 
     @override
-    def flush(self, timeout: int | None = None) -> None:
-        """Flushes the producer queue.
+    def produce_batch(self, records: Iterable[KafkaRecord], timeout: float | None = None) -> KafkaBatchResult:
+        """Produces a batch of records and waits for their delivery reports.
+
+        Records are encoded and enqueued in one pass, each to its own topic, partition, headers and
+        timestamp, and share one delivery callback that aggregates the reports. Unlike flush, the wait
+        ends as soon as this batch is reported, regardless of other queued messages.
 
         Args:
-            timeout (int | None, optional): Timeout in seconds for the operation. Defaults to None.
+            records (Iterable[KafkaRecord]): The records to produce.
+            timeout (float | None, optional): Maximum time in seconds to wait for the delivery
+                reports. If None, wait until every record is reported. Defaults to None.
+
+        Returns:
+            KafkaBatchResult: Aggregated delivery results.
 
         Raises:
-            ConnectionTimeoutError: If the operation times out.
-            ServiceUnavailableError: If Kafka is unavailable.
-            InternalError: If there is an error flushing the queue.
+            NetworkError: If there is a network error producing the records.
+            ResourceExhaustedError: If the producer queue stays full for longer than the configured timeout.
+            InternalError: If there is an error producing the records.
         """
+        tracker = _KafkaBatchTracker()
         try:
-            remaining_messages = self._adapter.flush(timeout=timeout)
-            if remaining_messages > 0:
-                logger.warning("%d messages left in the queue after flush", remaining_messages)
+            for record in records:
+                tracker.add()
+                self._enqueue_record(record, tracker.on_delivery)
         except Exception as e:
-            self._handle_kafka_exception(e, "flush")
+            self._handle_producer_exception(e, "produce_batch")
+        tracker.seal()
+        if self._poll_thread is not None:
+            tracker.wait(timeout)
+        else:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not tracker.done():
+                remaining = 0.1 if deadline is None else min(deadline - time.monotonic(), 0.1)
+                if remaining <= 0:
+                    break
+                self._adapter.poll(remaining)
+        result = tracker.result()
+        if result.failed:
+            logger.error("%d of %d messages in the batch failed delivery", len(result.failed), tracker.total)
+        return result
 
     @override
-    def validate_healthiness(self) -> None:
-        """Validates the health of the Kafka connection.
+    def send(self, message: Any, key: Any = None) -> Future[Message]:
+        """Produces a message and returns a future resolved when the broker acknowledges it.
+
+        Waiting on the future does not flush the rest of the queue. The future only completes
+        while delivery reports are served, by the poll mode, by flush or by close.
+
+        Args:
+            message (Any): The message to produce, str or bytes unless the producer has a value serializer.
+            key (Any, optional): The key for the message, str or bytes unless the producer has a key
+                serializer. Defaults to None.
+
+        Returns:
+            Future[Message]: Future resolved with the delivered message, or failed with the delivery error.
 
         Raises:
-            UnavailableError: If the Kafka service is unavailable.
+            NetworkError: If there is a network error producing the message.
+            ResourceExhaustedError: If the producer queue stays full for longer than the configured timeout.
+            InternalError: If there is an error producing the message.
         """
+        future: Future[Message] = Future()
+        future.set_running_or_notify_cancel()
+
+        def on_delivery(error: KafkaError | None, delivered: Message) -> None:
+            self._delivery_callback(error, delivered)
+            if error is None:
+                future.set_result(delivered)
+            else:
+                future.set_exception(self._delivery_error(error))
+
         try:
-            self.list_topics(timeout=1)
+            self._produce(*self._encode(self._topic_name, message, key), on_delivery)
         except Exception as e:
-            raise UnavailableError(service="Kafka") from e
+            self._handle_producer_exception(e, "send")
+        return future
 
     @override
-    def list_topics(self, topic: str | None = None, timeout: int = 1) -> ClusterMetadata:
-        """Lists Kafka topics.
+    def enqueue(self, record: KafkaRecord) -> None:
+        """Enqueues a record without waiting for its delivery report.
 
-        Args:
-            topic (str | None, optional): Specific topic to list. If None, lists all topics.
-                Defaults to None.
-            timeout (int, optional): Timeout in seconds for the operation. Defaults to 1.
+        The record goes to its own topic, partition, headers and timestamp, or to the configured
+        topic. Its delivery report is logged when served, by the poll mode, by flush or by the
+        commit of a transaction.
 
-        Returns:
-            ClusterMetadata: Metadata about the Kafka cluster and topics.
+        Args:
+            record (KafkaRecord): The record to enqueue.
 
         Raises:
-            ConnectionTimeoutError: If the operation times out.
-            ServiceUnavailableError: If the Kafka service is unavailable.
-            UnavailableError: If there is an unknown issue accessing Kafka.
+            NetworkError: If there is a network error producing the record.
+            ResourceExhaustedError: If the producer queue stays full for longer than the configured timeout.
+            InternalError: If there is an error producing the record.
         """
         try:
-            result = self._adapter.list_topics(topic=topic, timeout=timeout)
+            self._enqueue_record(record, self._delivery_callback)
+            if self._poll_mode == "inline":
+                self._adapter.poll(0)
+        except Exception as e:
+            self._handle_producer_exception(e, "enqueue")
+
+    def _transaction_call(self, operation: str, call: Callable[[float], None], timeout: float | None) -> None:
+        """Runs a transactional operation, calling it again on retriable errors until the timeout.
+
+        Args:
+            operation (str): The name of the operation.
+            call (Callable[[float], None]): Runs the operation with the seconds left.
+            timeout (float | None): Seconds to wait, or None for the transaction timeout.
+
+        Raises:
+            AbortedError: If the transaction failed and must be aborted.
+            ConnectionTimeoutError: If the operation does not complete in time.
+            InternalError: If the operation fails, including fatal errors of the producer.
+        """
+        deadline = time.monotonic() + (self._transaction_timeout if timeout is None else timeout)
+        while True:
+            try:
+                call(max(deadline - time.monotonic(), 0.0))
+            except KafkaException as e:
+                error = e.args[0] if e.args else None
+                if isinstance(error, KafkaError) and error.retriable() and time.monotonic() < deadline:
+                    logger.warning("Retrying Kafka %s after a retriable error: %s", operation, error)
+                    continue
+                self._handle_transaction_exception(e, operation)
+            except Exception as e:
+                self._handle_transaction_exception(e, operation)
+            else:
+                return
+
+    @override
+    def init_transactions(self, timeout: float | None = None) -> None:
+        """Registers the transactional id of the producer and fences its previous instances.
+
+        Must be called once, before the first transaction, on a producer configured with a
+        ``TRANSACTIONAL_ID``.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait, or None for ``TRANSACTION_TIMEOUT_MS``.
+                Defaults to None.
+
+        Raises:
+            ConnectionTimeoutError: If the transaction coordinator does not answer in time.
+            InternalError: If the producer is not transactional or the registration fails.
+        """
+        self._transaction_call("init_transactions", self._adapter.init_transactions, timeout)
+
+    @override
+    def begin_transaction(self) -> None:
+        """Begins a transaction that the following messages are produced in.
+
+        Raises:
+            InternalError: If a transaction is already in progress or transactions are not initialized.
+        """
+        try:
+            self._adapter.begin_transaction()
+        except Exception as e:
+            self._handle_transaction_exception(e, "begin_transaction")
+
+    @override
+    def send_offsets_to_transaction(
+        self,
+        offsets: list[TopicPartition],
+        group_metadata: object,
+        timeout: float | None = None,
+    ) -> None:
+        """Adds consumer offsets to the current transaction, to be committed only if it commits.
+
+        Args:
+            offsets (list[TopicPartition]): The next offset to consume from each partition.
+            group_metadata (object): The group metadata of the consumer, from consumer_group_metadata().
+            timeout (float | None, optional): Seconds to wait, or None for ``TRANSACTION_TIMEOUT_MS``.
+                Defaults to None.
+
+        Raises:
+            AbortedError: If the transaction failed and must be aborted.
+            ConnectionTimeoutError: If the group coordinator does not answer in time.
+            InternalError: If there is an error sending the offsets.
+        """
+        self._transaction_call(
+            "send_offsets_to_transaction",
+            lambda remaining: self._adapter.send_offsets_to_transaction(offsets, group_metadata, remaining),
+            timeout,
+        )
+
+    @override
+    def commit_transaction(self, timeout: float | None = None) -> None:
+        """Delivers the messages of the current transaction and commits it.
+
+        Delivery reports of the transaction are served before this method returns.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait, or None for ``TRANSACTION_TIMEOUT_MS``.
+                Defaults to None.
+
+        Raises:
+            AbortedError: If a message of the transaction failed and the transaction must be aborted.
+            ConnectionTimeoutError: If the commit does not complete in time.
+            InternalError: If there is an error committing the transaction.
+        """
+        self._transaction_call("commit_transaction", self._adapter.commit_transaction, timeout)
+
+    @override
+    def abort_transaction(self, timeout: float | None = None) -> None:
+        """Aborts the current transaction, discarding its messages and offsets.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait, or None for ``TRANSACTION_TIMEOUT_MS``.
+                Defaults to None.
+
+        Raises:
+            ConnectionTimeoutError: If the abort does not complete in time.
+            InternalError: If there is an error aborting the transaction.
+        """
+        self._transaction_call("abort_transaction", self._adapter.abort_transaction, timeout)
+
+    @override
+    def flush(self, timeout: int | None = None) -> None:
+        """Flushes the producer queue.
+
+        Args:
+            timeout (int | None, optional): Timeout in seconds for the operation. Defaults to None.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error flushing the queue.
+        """
+        try:
+            remaining_messages = self._adapter.flush(timeout=timeout)
+            if remaining_messages > 0:
+                logger.warning("%d messages left in the queue after flush", remaining_messages)
+        except Exception as e:
+            self._handle_kafka_exception(e, "flush")
+
+    @override
+    def close(self, timeout: int | None = None) -> None:
+        """Stops the poll thread and flushes pending messages.
+
+        Args:
+            timeout (int | None, optional): Timeout in seconds for the flush. Defaults to None.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error flushing the queue.
+        """
+        self._closed.set()
+        if self._poll_thread is not None:
+            self._poll_thread.join()
+            self._poll_thread = None
+        self.flush(timeout)
+
+    @override
+    def validate_healthiness(self) -> None:
+        """Validates the health of the Kafka connection.
+
+        Raises:
+            UnavailableError: If the Kafka service is unavailable.
+        """
+        try:
+            self.list_topics(timeout=1)
+        except Exception as e:
+            raise UnavailableError(service="Kafka") from e
+
+    @override
+    def list_topics(self, topic: str | None = None, timeout: int = 1) -> ClusterMetadata:
+        """Lists Kafka topics.
+
+        Args:
+            topic (str | None, optional): Specific topic to list. If None, lists all topics.
+                Defaults to None.
+            timeout (int, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            ClusterMetadata: Metadata about the Kafka cluster and topics.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If the Kafka service is unavailable.
+            UnavailableError: If there is an unknown issue accessing Kafka.
+        """
+        try:
+            result = self._adapter.list_topics(topic=topic, timeout=timeout)
         except Exception as e:
             self._handle_kafka_exception(e, "list_topics")
         else:
             return result
+
+
+def _resolve_future[T](future: asyncio.Future[T], result: T | None = None, error: Exception | None = None) -> None:
+    """Completes an asyncio future on its loop unless it was cancelled or already completed."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(cast(T, result))
+    else:
+        future.set_exception(error)
+
+
+class AsyncKafkaProducerAdapter(AsyncKafkaProducerPort, KafkaExceptionHandlerMixin):
+    """Asynchronous Kafka producer adapter.
+
+    Messages are enqueued on the event loop, which librdkafka never blocks: a dedicated poll thread
+    serves the delivery reports and hands them back to the loop as completed asyncio futures, while
+    flush, close and metadata requests run in worker threads. When the local queue is full, produce
+    awaits up to ``PRODUCER_QUEUE_FULL_TIMEOUT_MS`` for space before raising ResourceExhaustedError.
+    """
+
+    def __init__(
+        self,
+        topic_name: str,
+        kafka_configs: KafkaConfig | None = None,
+        value_serializer: KafkaSerializer | None = None,
+        key_serializer: KafkaSerializer | None = None,
+    ) -> None:
+        """Initializes the producer adapter and starts its poll thread.
+
+        Args:
+            topic_name (str): Default topic name to produce messages to.
+            kafka_configs (KafkaConfig | None, optional): Kafka configuration. If None,
+                uses global config. Defaults to None.
+            value_serializer (KafkaSerializer | None, optional): Encodes message values, or None to
+                produce str and bytes values as is. Defaults to None.
+            key_serializer (KafkaSerializer | None, optional): Encodes message keys, or None to
+                produce str and bytes keys as is. Defaults to None.
+
+        Raises:
+            ConfigurationError: If there is an error in the Kafka configuration.
+            InternalError: If there is an error initializing the producer.
+        """
+        configs: KafkaConfig = kafka_configs or BaseConfig.global_config().KAFKA
+        self._queue_full_timeout = configs.PRODUCER_QUEUE_FULL_TIMEOUT_MS / 1000
+        # Waiting for queue space is done here with asyncio.sleep, so the wrapped producer raises at once
+        self._producer = KafkaProducerAdapter(
+            topic_name,
+            configs.model_copy(update={"PRODUCER_POLL_MODE": "thread", "PRODUCER_QUEUE_FULL_TIMEOUT_MS": 0}),
+            value_serializer,
+            key_serializer,
+        )
+
+    async def _enqueue(self, enqueue: Callable[[], None]) -> None:
+        """Runs an enqueue, awaiting queue space up to the configured timeout without blocking the loop.
+
+        Args:
+            enqueue (Callable[[], None]): Enqueues one message and raises BufferError if the queue is full.
+
+        Raises:
+            BufferError: If the queue stays full for longer than the timeout.
+        """
+        deadline = time.monotonic() + self._queue_full_timeout
+        while True:
+            try:
+                enqueue()
+            except BufferError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise
+                # The poll thread frees queue space as it serves delivery reports
+                await asyncio.sleep(min(remaining, 0.05))
+            else:
+                return
+
+    @override
+    async def produce(self, message: Any, key: Any = None) -> Message:
+        """Produces a message to the configured topic and waits for the broker to acknowledge it.
+
+        Concurrent calls are batched together by librdkafka, so gather them rather than awaiting
+        each one in turn for throughput.
+
+        Args:
+            message (Any): The message to produce, str or bytes unless the producer has a value serializer.
+            key (Any, optional): The key for the message, str or bytes unless the producer has a key
+                serializer. Defaults to None.
+
+        Returns:
+            Message: The delivered message, with its partition and offset.
+
+        Raises:
+            NetworkError: If there is a network error producing the message.
+            ResourceExhaustedError: If the producer queue stays full for longer than the configured timeout.
+            InternalError: If there is an error producing or delivering the message.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Message] = loop.create_future()
+
+        def on_delivery(error: KafkaError | None, delivered: Message) -> None:
+            KafkaProducerAdapter._delivery_callback(error, delivered)
+            delivery_error = None if error is None else KafkaProducerAdapter._delivery_error(error)
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve_future, future, delivered, delivery_error)
+
+        try:
+            value, processed_key = self._producer._encode(self._producer._topic_name, message, key)
+            await self._enqueue(functools.partial(self._producer._produce, value, processed_key, on_delivery))
+        except Exception as e:
+            self._handle_producer_exception(e, "produce")
+        return await future
+
+    @override
+    async def produce_batch(self, records: Iterable[KafkaRecord], timeout: float | None = None) -> KafkaBatchResult:
+        """Produces a batch of records and waits for their delivery reports.
+
+        Args:
+            records (Iterable[KafkaRecord]): The records to produce.
+            timeout (float | None, optional): Maximum time in seconds to wait for the delivery
+                reports. If None, wait until every record is reported. Defaults to None.
+
+        Returns:
+            KafkaBatchResult: Aggregated delivery results.
+
+        Raises:
+            NetworkError: If there is a network error producing the records.
+            ResourceExhaustedError: If the producer queue stays full for longer than the configured timeout.
+            InternalError: If there is an error producing the records.
+        """
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[None] = loop.create_future()
+
+        def on_done() -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve_future, done)
+
+        tracker = _KafkaBatchTracker(on_done)
+        try:
+            for record in records:
+                tracker.add()
+                await self._enqueue(functools.partial(self._producer._enqueue_record, record, tracker.on_delivery))
+        except Exception as e:
+            self._handle_producer_exception(e, "produce_batch")
+        tracker.seal()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(done, timeout)
+        result = tracker.result()
+        if result.failed:
+            logger.error("%d of %d messages in the batch failed delivery", len(result.failed), tracker.total)
+        return result
+
+    @override
+    async def flush(self, timeout: int | None = None) -> None:
+        """Flushes the producer queue in a worker thread.
+
+        Args:
+            timeout (int | None, optional): Timeout in seconds for the operation. Defaults to None.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error flushing the queue.
+        """
+        await asyncio.to_thread(self._producer.flush, timeout)
+
+    @override
+    async def close(self, timeout: int | None = None) -> None:
+        """Stops the poll thread and flushes pending messages in a worker thread.
+
+        Args:
+            timeout (int | None, optional): Timeout in seconds for the flush. Defaults to None.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error flushing the queue.
+        """
+        await asyncio.to_thread(self._producer.close, timeout)
+
+    @override
+    async def validate_healthiness(self) -> None:
+        """Validates the health of the Kafka connection.
+
+        Raises:
+            UnavailableError: If the Kafka service is unavailable.
+        """
+        await asyncio.to_thread(self._producer.validate_healthiness)
+
+    @override
+    async def list_topics(self, topic: str | None = None, timeout: int = 1) -> ClusterMetadata:
+        """Lists Kafka topics.
+
+        Args:
+            topic (str | None, optional): Specific topic to list. If None, lists all topics.
+                Defaults to None.
+            timeout (int, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            ClusterMetadata: Metadata about the Kafka cluster and topics.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If the Kafka service is unavailable.
+            UnavailableError: If there is an unknown issue accessing Kafka.
+        """
+        return await asyncio.to_thread(self._producer.list_topics, topic, timeout)
+
+
+class AsyncKafkaConsumerAdapter(AsyncKafkaConsumerPort, KafkaExceptionHandlerMixin):
+    """Asynchronous Kafka consumer adapter.
+
+    Every call to the underlying consumer runs on one dedicated thread, so polls waiting for
+    messages never block the event loop and the consumer, which must not be used concurrently,
+    is driven by a single thread. Iterate over the adapter to receive messages as they arrive:
+
+        >>> async for message in AsyncKafkaConsumerAdapter("billing", topic_list=["invoices"]):
+        ...     await handle(message)
+    """
+
+    def __init__(
+        self,
+        group_id: str,
+        topic_list: list[str] | None = None,
+        partition_list: list[TopicPartition] | None = None,
+        kafka_configs: KafkaConfig | None = None,
+        value_serializer: KafkaSerializer | None = None,
+        key_serializer: KafkaSerializer | None = None,
+        deserialize_executor: Executor | None = None,
+    ) -> None:
+        """Initializes the consumer adapter with Kafka configuration and subscription.
+
+        Args:
+            group_id (str): Consumer group ID.
+            topic_list (list[str] | None, optional): List of topics to subscribe to.
+                Defaults to None.
+            partition_list (list[TopicPartition] | None, optional): List of partitions
+                to assign. Defaults to None.
+            kafka_configs (KafkaConfig | None, optional): Kafka configuration. If None,
+                uses global config. Defaults to None.
+            value_serializer (KafkaSerializer | None, optional): Deserializes message values in
+                decode, or None to return them as bytes. Defaults to None.
+            key_serializer (KafkaSerializer | None, optional): Deserializes message keys in
+                decode, or None to return them as bytes. Defaults to None.
+            deserialize_executor (Executor | None, optional): Executor deserializing chunks of a
+                batch in parallel, such as a ProcessPoolExecutor for CPU-heavy formats, or None to
+                deserialize in the calling thread. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: If both topic_list and partition_list are provided or
+                neither is provided.
+            InternalError: If there is an error initializing the consumer.
+        """
+        self._consumer = KafkaConsumerAdapter(
+            group_id,
+            topic_list,
+            partition_list,
+            kafka_configs,
+            value_serializer,
+            key_serializer,
+            deserialize_executor,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"kafka-consumer-{group_id}")
+        self._closed = False
+
+    async def _run[T](self, function: Callable[..., T], *args: Any) -> T:
+        """Runs a consumer call on the dedicated consumer thread.
+
+        Args:
+            function (Callable[..., T]): The call to run.
+            *args (Any): Positional arguments of the call.
+
+        Returns:
+            T: The result of the call.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    @override
+    async def batch_consume(self, messages_number: int = 500, timeout: float = 1) -> list[Message]:
+        """Consumes a batch of messages from subscribed topics.
+
+        Args:
+            messages_number (int, optional): Maximum number of messages to consume.
+                Defaults to 500.
+            timeout (float, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            list[Message]: List of consumed messages.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error consuming messages.
+        """
+        return await self._run(self._consumer.batch_consume, messages_number, timeout)
+
+    @override
+    async def fast_consume(self, messages_number: int = 500, timeout: float = 1) -> KafkaConsumedBatch:
+        """Consumes a batch of messages without per-message processing.
+
+        Args:
+            messages_number (int, optional): Maximum number of messages to consume.
+                Defaults to 500.
+            timeout (float, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            KafkaConsumedBatch: The consumed messages and their aggregate statistics.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error consuming messages.
+        """
+        return await self._run(self._consumer.fast_consume, messages_number, timeout)
+
+    @override
+    async def consume_decoded(self, messages_number: int = 500, timeout: float = 1) -> list[KafkaDecodedMessage]:
+        """Consumes a batch of messages on the fast path and deserializes their keys and values.
+
+        Deserialization runs off the consumer thread, so the next poll is not held up by it.
+
+        Args:
+            messages_number (int, optional): Maximum number of messages to consume.
+                Defaults to 500.
+            timeout (float, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            list[KafkaDecodedMessage]: The consumed messages with their deserialized keys and values.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error consuming messages.
+        """
+        batch = await self.fast_consume(messages_number, timeout)
+        return await self.decode(batch.messages)
+
+    @override
+    async def decode(self, messages: list[Message]) -> list[KafkaDecodedMessage]:
+        """Deserializes the keys and values of consumed messages in one batch, in a worker thread.
+
+        Args:
+            messages (list[Message]): The consumed messages.
+
+        Returns:
+            list[KafkaDecodedMessage]: The messages with their deserialized keys and values.
+        """
+        if not messages:
+            return []
+        return await asyncio.to_thread(self._consumer.decode, messages)
+
+    @override
+    async def poll(self, timeout: int = 1) -> Message | None:
+        """Polls for a single message from subscribed topics.
+
+        Args:
+            timeout (int, optional): Timeout in seconds for the operation. Defaults to 1.
+
+        Returns:
+            Message | None: The consumed message or None if no message was received.
+
+        Raises:
+            ConnectionTimeoutError: If the operation times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error polling for messages.
+        """
+        return await self._run(self._consumer.poll, timeout)
+
+    @override
+    async def commit(self, message: Message, asynchronous: bool = True) -> list[TopicPartition] | None:
+        """Commits the offset for a message.
+
+        Args:
+            message (Message): The message to commit.
+            asynchronous (bool, optional): Whether to commit asynchronously. Defaults to True.
+
+        Returns:
+            list[TopicPartition] | None: None for async commits, list of TopicPartition for sync commits.
+
+        Raises:
+            InvalidArgumentError: If the message is invalid.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error committing the offset.
+        """
+        return await self._run(self._consumer.commit, message, asynchronous)
+
+    @override
+    async def commit_offsets(
+        self,
+        offsets: list[TopicPartition],
+        asynchronous: bool = True,
+    ) -> list[TopicPartition] | None:
+        """Commits explicit offsets, each being the next offset to consume from its partition.
+
+        Args:
+            offsets (list[TopicPartition]): The partitions and offsets to commit.
+            asynchronous (bool, optional): Whether to commit asynchronously. Defaults to True.
+
+        Returns:
+            list[TopicPartition] | None: None for async commits, list of TopicPartition for sync commits.
+
+        Raises:
+            InvalidArgumentError: If the offsets are invalid.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error committing the offsets.
+        """
+        return await self._run(self._consumer.commit_offsets, offsets, asynchronous)
+
+    @override
+    async def subscribe(
+        self,
+        topic_list: list[str],
+        on_assign: KafkaRebalanceCallback | None = None,
+        on_revoke: KafkaRebalanceCallback | None = None,
+        on_lost: KafkaRebalanceCallback | None = None,
+    ) -> None:
+        """Subscribes to a list of topics.
+
+        Rebalance callbacks run on the consumer thread, not on the event loop.
+
+        Args:
+            topic_list (list[str]): List of topics to subscribe to.
+            on_assign (KafkaRebalanceCallback | None, optional): Called with the partitions assigned
+                by a rebalance. Defaults to None.
+            on_revoke (KafkaRebalanceCallback | None, optional): Called with the partitions revoked
+                by a rebalance. Defaults to None.
+            on_lost (KafkaRebalanceCallback | None, optional): Called with the partitions lost without
+                a clean revocation. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: If the topic list is invalid.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error subscribing to topics.
+        """
+        await self._run(self._consumer.subscribe, topic_list, on_assign, on_revoke, on_lost)
+
+    @override
+    async def assign(self, partition_list: list[TopicPartition]) -> None:
+        """Assigns the consumer to a list of topic partitions.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to assign.
+
+        Raises:
+            InvalidArgumentError: If the partition list is invalid.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error assigning partitions.
+        """
+        await self._run(self._consumer.assign, partition_list)
+
+    @override
+    async def pause(self, partition_list: list[TopicPartition]) -> None:
+        """Stops fetching messages from partitions until they are resumed.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to pause.
+
+        Raises:
+            InvalidArgumentError: If the partition list is invalid.
+            InternalError: If there is an error pausing the partitions.
+        """
+        await self._run(self._consumer.pause, partition_list)
+
+    @override
+    async def resume(self, partition_list: list[TopicPartition]) -> None:
+        """Resumes fetching messages from paused partitions.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to resume.
+
+        Raises:
+            InvalidArgumentError: If the partition list is invalid.
+            InternalError: If there is an error resuming the partitions.
+        """
+        await self._run(self._consumer.resume, partition_list)
+
+    @override
+    async def messages(self, batch_size: int = 100, timeout: int = 1) -> AsyncIterator[Message]:
+        """Iterates over consumed messages until the consumer is closed.
+
+        Messages are fetched in batches, so a close takes effect once the current fetch returns.
+
+        Args:
+            batch_size (int, optional): Maximum number of messages fetched at once. Defaults to 100.
+            timeout (int, optional): Timeout in seconds of each fetch. Defaults to 1.
+
+        Yields:
+            Message: The consumed messages.
+
+        Raises:
+            ConnectionTimeoutError: If a fetch times out.
+            ServiceUnavailableError: If Kafka is unavailable.
+            InternalError: If there is an error consuming messages.
+        """
+        while not self._closed:
+            for message in await self.batch_consume(batch_size, timeout):
+                yield message
+
+    def __aiter__(self) -> AsyncIterator[Message]:
+        """Iterates over consumed messages with the default batch size and timeout.
+
+        Returns:
+            AsyncIterator[Message]: The consumed messages.
+        """
+        return self.messages()
+
+    @override
+    async def close(self) -> None:
+        """Leaves the consumer group and stops the consumer thread.
+
+        Raises:
+            InternalError: If there is an error closing the consumer.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._run(self._consumer.close)
+        finally:
+            self._executor.shutdown(wait=False)
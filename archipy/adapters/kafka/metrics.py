@@ -0,0 +1,231 @@
+import functools
+import json
+import logging
+import threading
+from typing import Any
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Quantiles of the librdkafka window statistics exported as gauge labels
+_WINDOW_QUANTILES = (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99"))
+
+DELIVERY_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf"))
+BATCH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+
+class KafkaMetrics:
+    """Prometheus metrics of Kafka producers and consumers.
+
+    Client-level metrics are parsed from the statistics librdkafka emits every
+    ``STATISTICS_INTERVAL_MS``: per-partition consumer lag and fetch queue depth, message and byte
+    counters (rate them in PromQL for fetch and produce throughput), queue depth, producer batch
+    sizes, broker round-trip times and consumer group rebalances. The adapters add the delivery
+    latency of every produced message and the size of every consumed batch.
+
+    Metrics are labelled with the ``client_id`` of the client, so give each application its own
+    ``CLIENT_ID``. Gauges of partitions a client no longer reports, for instance after a rebalance,
+    are removed.
+
+    Args:
+        registry (CollectorRegistry): Registry the metrics are registered in. Defaults to the global registry.
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY) -> None:
+        self.consumer_lag = Gauge(
+            "kafka_consumer_lag_messages",
+            "Messages between the consumer position and the high watermark of a partition",
+            ("client_id", "topic", "partition"),
+            registry=registry,
+        )
+        self.consumer_fetch_queue = Gauge(
+            "kafka_consumer_fetch_queue_messages",
+            "Messages fetched for a partition and waiting to be consumed",
+            ("client_id", "topic", "partition"),
+            registry=registry,
+        )
+        self.consumer_assigned_partitions = Gauge(
+            "kafka_consumer_assigned_partitions",
+            "Partitions assigned to the consumer",
+            ("client_id",),
+            registry=registry,
+        )
+        self.consumer_rebalances = Counter(
+            "kafka_consumer_rebalances",
+            "Consumer group rebalances",
+            ("client_id",),
+            registry=registry,
+        )
+        self.consumer_batch_messages = Histogram(
+            "kafka_consumer_batch_messages",
+            "Messages per consumed batch",
+            ("client_id",),
+            buckets=BATCH_SIZE_BUCKETS,
+            registry=registry,
+        )
+        self.queue_messages = Gauge(
+            "kafka_client_queue_messages",
+            "Messages waiting in the client queues",
+            ("client_id", "type"),
+            registry=registry,
+        )
+        self.queue_bytes = Gauge(
+            "kafka_client_queue_bytes",
+            "Size of the messages waiting in the client queues",
+            ("client_id", "type"),
+            registry=registry,
+        )
+        self.messages = Counter(
+            "kafka_client_messages",
+            "Messages produced to or consumed from the brokers",
+            ("client_id", "type"),
+            registry=registry,
+        )
+        self.bytes = Counter(
+            "kafka_client_bytes",
+            "Message bytes produced to or consumed from the brokers",
+            ("client_id", "type"),
+            registry=registry,
+        )
+        self.broker_rtt = Gauge(
+            "kafka_broker_rtt_seconds",
+            "Broker round-trip time over the last statistics window",
+            ("client_id", "type", "broker", "quantile"),
+            registry=registry,
+        )
+        self.producer_batch_bytes = Gauge(
+            "kafka_producer_batch_size_bytes",
+            "Size of the batches produced to a topic over the last statistics window",
+            ("client_id", "topic", "quantile"),
+            registry=registry,
+        )
+        self.producer_batch_messages = Gauge(
+            "kafka_producer_batch_messages",
+            "Messages per batch produced to a topic over the last statistics window",
+            ("client_id", "topic", "quantile"),
+            registry=registry,
+        )
+        self.producer_delivery_latency = Histogram(
+            "kafka_producer_delivery_latency_seconds",
+            "Time from produce to the broker acknowledgement",
+            ("client_id",),
+            buckets=DELIVERY_LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self._lock = threading.Lock()
+        # Last cumulative totals per client instance, to increment counters by their difference
+        self._totals: dict[tuple[str, str], float] = {}
+        # Partition label sets reported by each client instance, to remove the ones it stops reporting
+        self._partitions: dict[str, set[tuple[str, str, str]]] = {}
+
+    def observe_statistics(self, stats_json: str) -> None:
+        """Updates the metrics from a librdkafka statistics report.
+
+        Used as the ``stats_cb`` of the clients. Failures are logged rather than raised, since they
+        would otherwise surface from the poll that served the report.
+
+        Args:
+            stats_json (str): The statistics, as emitted by librdkafka.
+        """
+        try:
+            stats = json.loads(stats_json)
+            with self._lock:
+                self._observe(stats)
+        except Exception:
+            logger.exception("Failed to export Kafka statistics")
+
+    def observe_delivery(self, client_id: str, latency: float | None) -> None:
+        """Records the delivery latency of a produced message.
+
+        Args:
+            client_id (str): The client id of the producer.
+            latency (float | None): Seconds from produce to acknowledgement, or None for failed deliveries.
+        """
+        if latency is not None:
+            self.producer_delivery_latency.labels(client_id).observe(latency)
+
+    def observe_consumed_batch(self, client_id: str, message_count: int) -> None:
+        """Records the size of a consumed batch.
+
+        Args:
+            client_id (str): The client id of the consumer.
+            message_count (int): Number of messages in the batch.
+        """
+        self.consumer_batch_messages.labels(client_id).observe(message_count)
+
+    def _observe(self, stats: dict[str, Any]) -> None:
+        """Updates the metrics from parsed statistics.
+
+        Args:
+            stats (dict[str, Any]): The statistics of one client.
+        """
+        name, client_id, client_type = stats["name"], stats["client_id"], stats["type"]
+        self.queue_messages.labels(client_id, client_type).set(stats.get("msg_cnt", 0))
+        self.queue_bytes.labels(client_id, client_type).set(stats.get("msg_size", 0))
+        direction = "tx" if client_type == "producer" else "rx"
+        self._increment(self.messages.labels(client_id, client_type), name, "messages", stats.get(f"{direction}msgs"))
+        self._increment(self.bytes.labels(client_id, client_type), name, "bytes", stats.get(f"{direction}msg_bytes"))
+
+        for broker_name, broker in stats.get("brokers", {}).items():
+            rtt = broker.get("rtt", {})
+            if not rtt.get("cnt"):
+                continue
+            for quantile, key in _WINDOW_QUANTILES:
+                self.broker_rtt.labels(client_id, client_type, broker_name, quantile).set(rtt[key] / 1_000_000)
+
+        partitions: set[tuple[str, str, str]] = set()
+        for topic_name, topic in stats.get("topics", {}).items():
+            if client_type == "producer":
+                for gauge, key in (
+                    (self.producer_batch_bytes, "batchsize"),
+                    (self.producer_batch_messages, "batchcnt"),
+                ):
+                    window = topic.get(key, {})
+                    if window.get("cnt"):
+                        for quantile, window_key in _WINDOW_QUANTILES:
+                            gauge.labels(client_id, topic_name, quantile).set(window[window_key])
+                continue
+            for partition_id, partition in topic.get("partitions", {}).items():
+                # Partition -1 holds the messages not yet assigned to a partition
+                if partition_id == "-1" or partition.get("consumer_lag", -1) < 0:
+                    continue
+                labels = (client_id, topic_name, partition_id)
+                partitions.add(labels)
+                self.consumer_lag.labels(*labels).set(partition["consumer_lag"])
+                self.consumer_fetch_queue.labels(*labels).set(partition.get("fetchq_cnt", 0))
+        for labels in self._partitions.get(name, set()) - partitions:
+            self.consumer_lag.remove(*labels)
+            self.consumer_fetch_queue.remove(*labels)
+        self._partitions[name] = partitions
+
+        group = stats.get("cgrp")
+        if group is not None:
+            self.consumer_assigned_partitions.labels(client_id).set(group.get("assignment_size", 0))
+            self._increment(self.consumer_rebalances.labels(client_id), name, "rebalances", group.get("rebalance_cnt"))
+
+    def _increment(self, counter: Counter, name: str, key: str, total: float | None) -> None:
+        """Increments a counter by the growth of a cumulative total since the last report.
+
+        Args:
+            counter (Counter): The labelled counter.
+            name (str): The name of the client instance.
+            key (str): The total being tracked.
+            total (float | None): The cumulative total, or None when the report lacks it.
+        """
+        if total is None:
+            return
+        previous = self._totals.get((name, key), 0)
+        # A total lower than the previous one belongs to a new client reusing the name
+        counter.inc(total - previous if total >= previous else total)
+        self._totals[name, key] = total
+
+
+@functools.cache
+def get_kafka_metrics() -> KafkaMetrics:
+    """Returns the process-wide Kafka metrics, registering them in the global registry on first use.
+
+    Returns:
+        KafkaMetrics: The Kafka metrics.
+    """
+    return KafkaMetrics()
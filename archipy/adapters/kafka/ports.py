@@ -1,8 +1,106 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Future
+from typing import Any, NamedTuple
 
 from confluent_kafka import Message, TopicPartition
 from confluent_kafka.admin import ClusterMetadata
 
+type KafkaHeadersType = dict[str, str | bytes | None] | list[tuple[str, str | bytes | None]]
+type KafkaRebalanceCallback = Callable[[list[TopicPartition]], None]
+
+
+class KafkaRecord(NamedTuple):
+    """A message to produce in a batch.
+
+    Attributes:
+        value (Any): The message value, encoded by the producer's value serializer when it has one,
+            otherwise str, bytes or None.
+        key (Any): The message key, encoded by the producer's key serializer when it has one,
+            otherwise str, bytes or None. Defaults to None.
+        topic (str | None): Target topic, or None for the producer's topic. Defaults to None.
+        headers (KafkaHeadersType | None): Message headers. Defaults to None.
+        partition (int | None): Target partition, or None to let the partitioner choose. Defaults to None.
+        timestamp (int | None): Timestamp in milliseconds since the epoch, or None for the current time.
+            Defaults to None.
+    """
+
+    value: Any
+    key: Any = None
+    topic: str | None = None
+    headers: KafkaHeadersType | None = None
+    partition: int | None = None
+    timestamp: int | None = None
+
+
+class KafkaBatchResult(NamedTuple):
+    """Aggregated delivery results of a produced batch.
+
+    Attributes:
+        delivered (int): Number of messages acknowledged by the brokers.
+        failed (list[Message]): Messages whose delivery failed; ``error()`` returns the reason.
+        pending (int): Number of messages still awaiting a delivery report when the wait timed out.
+    """
+
+    delivered: int
+    failed: list[Message]
+    pending: int
+
+
+class KafkaConsumeStats(NamedTuple):
+    """Aggregate statistics of a consumed batch.
+
+    Attributes:
+        message_count (int): Number of messages in the batch.
+        payload_bytes (int): Total size of the message values.
+        errors (int): Number of error events the consumer returned with the batch and that were dropped.
+        lag (int): Messages left to consume after the batch, summed over the partitions it came from.
+        partition_lag (dict[tuple[str, int], int]): Lag per (topic, partition), from the high watermarks
+            the consumer caches with every fetch; partitions whose watermark is not known yet are left out.
+    """
+
+    message_count: int
+    payload_bytes: int
+    errors: int
+    lag: int
+    partition_lag: dict[tuple[str, int], int]
+
+
+class KafkaConsumedBatch(NamedTuple):
+    """Messages returned by the fast consume path, with their aggregate statistics.
+
+    Attributes:
+        messages (list[Message]): The consumed messages, as returned by the client.
+        stats (KafkaConsumeStats): Aggregate statistics of the batch.
+    """
+
+    messages: list[Message]
+    stats: KafkaConsumeStats
+
+    def payloads(self) -> list[memoryview | None]:
+        """Returns zero-copy views of the message values.
+
+        Returns:
+            list[memoryview | None]: One view per message, or None for messages without a value.
+        """
+        return [None if (value := message.value()) is None else memoryview(value) for message in self.messages]
+
+
+class KafkaDecodedMessage(NamedTuple):
+    """A consumed message with its deserialized key and value.
+
+    Attributes:
+        value (Any): The deserialized value, or None for a message without a value or whose decoding failed.
+        key (Any): The deserialized key, or None for a message without a key or whose decoding failed.
+        message (Message): The consumed message, for its topic, partition, offset and headers.
+        error (Exception | None): Why the key or value could not be deserialized, or None. Defaults to None.
+    """
+
+    value: Any
+    key: Any
+    message: Message
+    error: Exception | None = None
+
 
 class KafkaAdminPort:
     """Interface for Kafka admin operations.
@@ -61,12 +159,12 @@ class KafkaConsumerPort:
     """
 
     @abstractmethod
-    def batch_consume(self, messages_number: int, timeout: int) -> list[Message]:
+    def batch_consume(self, messages_number: int, timeout: float) -> list[Message]:
         """Consumes a batch of messages from subscribed topics.
 
         Args:
             messages_number (int): Maximum number of messages to consume.
-            timeout (int): Timeout in seconds for the operation.
+            timeout (float): Timeout in seconds for the operation.
 
         Returns:
             list[Message]: List of consumed messages.
@@ -76,6 +174,56 @@ class KafkaConsumerPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def fast_consume(self, messages_number: int, timeout: float) -> KafkaConsumedBatch:
+        """Consumes a batch of messages without per-message processing.
+
+        Messages are returned as delivered by the client and statistics are reported per batch,
+        for high-throughput consumers that do not need per-message logging.
+
+        Args:
+            messages_number (int): Maximum number of messages to consume.
+            timeout (float): Timeout in seconds for the operation.
+
+        Returns:
+            KafkaConsumedBatch: The consumed messages and their aggregate statistics.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def consume_decoded(self, messages_number: int, timeout: float) -> list[KafkaDecodedMessage]:
+        """Consumes a batch of messages and deserializes their keys and values.
+
+        Args:
+            messages_number (int): Maximum number of messages to consume.
+            timeout (float): Timeout in seconds for the operation.
+
+        Returns:
+            list[KafkaDecodedMessage]: The consumed messages with their deserialized keys and values.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, messages: list[Message]) -> list[KafkaDecodedMessage]:
+        """Deserializes the keys and values of consumed messages in one batch.
+
+        Args:
+            messages (list[Message]): The consumed messages.
+
+        Returns:
+            list[KafkaDecodedMessage]: The messages with their deserialized keys and values.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def poll(self, timeout: int) -> Message | None:
         """Polls for a single message from subscribed topics.
@@ -109,11 +257,40 @@ class KafkaConsumerPort:
         raise NotImplementedError
 
     @abstractmethod
-    def subscribe(self, topic_list: list[str]) -> None:
+    def commit_offsets(self, offsets: list[TopicPartition], asynchronous: bool) -> list[TopicPartition] | None:
+        """Commits explicit offsets, each being the next offset to consume from its partition.
+
+        Args:
+            offsets (list[TopicPartition]): The partitions and offsets to commit.
+            asynchronous (bool): Whether to commit asynchronously.
+
+        Returns:
+            list[TopicPartition] | None: None for asynchronous commits, or list of committed
+                partitions for synchronous commits.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def subscribe(
+        self,
+        topic_list: list[str],
+        on_assign: KafkaRebalanceCallback | None = None,
+        on_revoke: KafkaRebalanceCallback | None = None,
+        on_lost: KafkaRebalanceCallback | None = None,
+    ) -> None:
         """Subscribes to a list of topics.
 
         Args:
             topic_list (list[str]): List of topic names to subscribe to.
+            on_assign (KafkaRebalanceCallback | None, optional): Called with the partitions assigned
+                by a rebalance. Defaults to None.
+            on_revoke (KafkaRebalanceCallback | None, optional): Called with the partitions revoked
+                by a rebalance, before they are handed to another consumer. Defaults to None.
+            on_lost (KafkaRebalanceCallback | None, optional): Called with the partitions lost without
+                a clean revocation, whose offsets can no longer be committed. Defaults to None.
 
         Raises:
             NotImplementedError: If the method is not implemented by the concrete class.
@@ -132,6 +309,63 @@ class KafkaConsumerPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def pause(self, partition_list: list[TopicPartition]) -> None:
+        """Stops fetching messages from partitions until they are resumed.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to pause.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def resume(self, partition_list: list[TopicPartition]) -> None:
+        """Resumes fetching messages from paused partitions.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to resume.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def seek(self, partition: TopicPartition) -> None:
+        """Moves the consume position of an assigned partition.
+
+        Args:
+            partition (TopicPartition): The partition and the offset of the next message to consume.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def consumer_group_metadata(self) -> object:
+        """Returns the consumer group metadata that transactional producers commit offsets with.
+
+        Returns:
+            object: The opaque group metadata of the consumer.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        """Leaves the consumer group and releases the consumer.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
 
 class KafkaProducerPort:
     """Interface for Kafka producer operations.
@@ -140,12 +374,127 @@ class KafkaProducerPort:
     """
 
     @abstractmethod
-    def produce(self, message: str | bytes, key: str | None = None) -> None:
+    def produce(self, message: Any, key: Any = None) -> None:
         """Produces a message to the configured topic.
 
         Args:
-            message (str | bytes): The message to produce.
-            key (str | None, optional): The key for the message. Defaults to None.
+            message (Any): The message to produce, str or bytes unless the producer has a value serializer.
+            key (Any, optional): The key for the message, str or bytes unless the producer has a key
+                serializer. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def produce_batch(self, records: Iterable[KafkaRecord], timeout: float | None = None) -> KafkaBatchResult:
+        """Produces a batch of records and waits for their delivery reports.
+
+        Args:
+            records (Iterable[KafkaRecord]): The records to produce.
+            timeout (float | None, optional): Maximum time in seconds to wait for the delivery
+                reports. If None, wait until every record is reported. Defaults to None.
+
+        Returns:
+            KafkaBatchResult: Aggregated delivery results.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def send(self, message: Any, key: Any = None) -> Future[Message]:
+        """Produces a message and returns a future resolved when the broker acknowledges it.
+
+        Args:
+            message (Any): The message to produce, str or bytes unless the producer has a value serializer.
+            key (Any, optional): The key for the message, str or bytes unless the producer has a key
+                serializer. Defaults to None.
+
+        Returns:
+            Future[Message]: Future resolved with the delivered message, or failed with the delivery error.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def enqueue(self, record: KafkaRecord) -> None:
+        """Enqueues a record without waiting for its delivery report.
+
+        Args:
+            record (KafkaRecord): The record to enqueue.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def init_transactions(self, timeout: float | None = None) -> None:
+        """Registers the transactional id of the producer and fences its previous instances.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait, or None for the transaction timeout
+                of the configuration. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def begin_transaction(self) -> None:
+        """Begins a transaction that the following messages are produced in.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def send_offsets_to_transaction(
+        self,
+        offsets: list[TopicPartition],
+        group_metadata: object,
+        timeout: float | None = None,
+    ) -> None:
+        """Adds consumer offsets to the current transaction, to be committed only if it commits.
+
+        Args:
+            offsets (list[TopicPartition]): The next offset to consume from each partition.
+            group_metadata (object): The group metadata of the consumer the offsets belong to.
+            timeout (float | None, optional): Seconds to wait, or None for the transaction timeout
+                of the configuration. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit_transaction(self, timeout: float | None = None) -> None:
+        """Delivers the messages of the current transaction and commits it.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait, or None for the transaction timeout
+                of the configuration. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def abort_transaction(self, timeout: float | None = None) -> None:
+        """Aborts the current transaction, discarding its messages and offsets.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait, or None for the transaction timeout
+                of the configuration. Defaults to None.
 
         Raises:
             NotImplementedError: If the method is not implemented by the concrete class.
@@ -165,6 +514,19 @@ class KafkaProducerPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def close(self, timeout: int | None = None) -> None:
+        """Stops background polling and flushes pending messages.
+
+        Args:
+            timeout (int | None, optional): Maximum time to wait for messages to be delivered.
+                If None, wait indefinitely. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def validate_healthiness(self) -> None:
         """Validates the health of the producer connection.
@@ -189,3 +551,304 @@ class KafkaProducerPort:
             NotImplementedError: If the method is not implemented by the concrete class.
         """
         raise NotImplementedError
+
+
+class AsyncKafkaConsumerPort:
+    """Interface for asynchronous Kafka consumer operations.
+
+    This interface defines the contract for consuming messages from Kafka topics without
+    blocking the event loop.
+    """
+
+    @abstractmethod
+    async def batch_consume(self, messages_number: int, timeout: float) -> list[Message]:
+        """Consumes a batch of messages from subscribed topics.
+
+        Args:
+            messages_number (int): Maximum number of messages to consume.
+            timeout (float): Timeout in seconds for the operation.
+
+        Returns:
+            list[Message]: List of consumed messages.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fast_consume(self, messages_number: int, timeout: float) -> KafkaConsumedBatch:
+        """Consumes a batch of messages without per-message processing.
+
+        Messages are returned as delivered by the client and statistics are reported per batch,
+        for high-throughput consumers that do not need per-message logging.
+
+        Args:
+            messages_number (int): Maximum number of messages to consume.
+            timeout (float): Timeout in seconds for the operation.
+
+        Returns:
+            KafkaConsumedBatch: The consumed messages and their aggregate statistics.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def consume_decoded(self, messages_number: int, timeout: float) -> list[KafkaDecodedMessage]:
+        """Consumes a batch of messages and deserializes their keys and values.
+
+        Args:
+            messages_number (int): Maximum number of messages to consume.
+            timeout (float): Timeout in seconds for the operation.
+
+        Returns:
+            list[KafkaDecodedMessage]: The consumed messages with their deserialized keys and values.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def decode(self, messages: list[Message]) -> list[KafkaDecodedMessage]:
+        """Deserializes the keys and values of consumed messages in one batch.
+
+        Args:
+            messages (list[Message]): The consumed messages.
+
+        Returns:
+            list[KafkaDecodedMessage]: The messages with their deserialized keys and values.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def poll(self, timeout: int) -> Message | None:
+        """Polls for a single message from subscribed topics.
+
+        Args:
+            timeout (int): Timeout in seconds for the operation.
+
+        Returns:
+            Message | None: The consumed message or None if no message was received.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self, message: Message, asynchronous: bool) -> list[TopicPartition] | None:
+        """Commits the offset of a consumed message.
+
+        Args:
+            message (Message): The message whose offset should be committed.
+            asynchronous (bool): Whether to commit asynchronously.
+
+        Returns:
+            list[TopicPartition] | None: None for asynchronous commits, or list of committed
+                partitions for synchronous commits.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit_offsets(self, offsets: list[TopicPartition], asynchronous: bool) -> list[TopicPartition] | None:
+        """Commits explicit offsets, each being the next offset to consume from its partition.
+
+        Args:
+            offsets (list[TopicPartition]): The partitions and offsets to commit.
+            asynchronous (bool): Whether to commit asynchronously.
+
+        Returns:
+            list[TopicPartition] | None: None for asynchronous commits, or list of committed
+                partitions for synchronous commits.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def subscribe(
+        self,
+        topic_list: list[str],
+        on_assign: KafkaRebalanceCallback | None = None,
+        on_revoke: KafkaRebalanceCallback | None = None,
+        on_lost: KafkaRebalanceCallback | None = None,
+    ) -> None:
+        """Subscribes to a list of topics.
+
+        Args:
+            topic_list (list[str]): List of topic names to subscribe to.
+            on_assign (KafkaRebalanceCallback | None, optional): Called with the partitions assigned
+                by a rebalance. Defaults to None.
+            on_revoke (KafkaRebalanceCallback | None, optional): Called with the partitions revoked
+                by a rebalance. Defaults to None.
+            on_lost (KafkaRebalanceCallback | None, optional): Called with the partitions lost without
+                a clean revocation. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def assign(self, partition_list: list[TopicPartition]) -> None:
+        """Assigns specific partitions to the consumer.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to assign.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pause(self, partition_list: list[TopicPartition]) -> None:
+        """Stops fetching messages from partitions until they are resumed.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to pause.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def resume(self, partition_list: list[TopicPartition]) -> None:
+        """Resumes fetching messages from paused partitions.
+
+        Args:
+            partition_list (list[TopicPartition]): List of partitions to resume.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def messages(self, batch_size: int = 100, timeout: int = 1) -> AsyncIterator[Message]:
+        """Iterates over consumed messages until the consumer is closed.
+
+        Args:
+            batch_size (int, optional): Maximum number of messages fetched at once. Defaults to 100.
+            timeout (int, optional): Timeout in seconds of each fetch. Defaults to 1.
+
+        Returns:
+            AsyncIterator[Message]: The consumed messages.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Leaves the consumer group and releases the consumer.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+
+class AsyncKafkaProducerPort:
+    """Interface for asynchronous Kafka producer operations.
+
+    This interface defines the contract for producing messages to Kafka topics without
+    blocking the event loop.
+    """
+
+    @abstractmethod
+    async def produce(self, message: Any, key: Any = None) -> Message:
+        """Produces a message to the configured topic and waits for the broker to acknowledge it.
+
+        Args:
+            message (Any): The message to produce, str or bytes unless the producer has a value serializer.
+            key (Any, optional): The key for the message, str or bytes unless the producer has a key
+                serializer. Defaults to None.
+
+        Returns:
+            Message: The delivered message, with its partition and offset.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def produce_batch(self, records: Iterable[KafkaRecord], timeout: float | None = None) -> KafkaBatchResult:
+        """Produces a batch of records and waits for their delivery reports.
+
+        Args:
+            records (Iterable[KafkaRecord]): The records to produce.
+            timeout (float | None, optional): Maximum time in seconds to wait for the delivery
+                reports. If None, wait until every record is reported. Defaults to None.
+
+        Returns:
+            KafkaBatchResult: Aggregated delivery results.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def flush(self, timeout: int | None) -> None:
+        """Flushes any pending messages to the broker.
+
+        Args:
+            timeout (int | None): Maximum time to wait for messages to be delivered.
+                If None, wait indefinitely.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self, timeout: int | None = None) -> None:
+        """Stops serving delivery reports and flushes pending messages.
+
+        Args:
+            timeout (int | None, optional): Maximum time to wait for messages to be delivered.
+                If None, wait indefinitely. Defaults to None.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def validate_healthiness(self) -> None:
+        """Validates the health of the producer connection.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_topics(self, topic: str | None, timeout: int) -> ClusterMetadata:
+        """Lists Kafka topics.
+
+        Args:
+            topic (str | None): Specific topic to list. If None, lists all topics.
+            timeout (int): Timeout in seconds for the operation.
+
+        Returns:
+            ClusterMetadata: Metadata about the Kafka cluster and topics.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by the concrete class.
+        """
+        raise NotImplementedError
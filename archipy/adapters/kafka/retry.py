@@ -0,0 +1,200 @@
+import logging
+import time
+from collections.abc import Sequence
+from typing import NamedTuple, cast
+
+from confluent_kafka import Message
+
+from archipy.adapters.kafka.ports import KafkaProducerPort, KafkaRecord
+from archipy.models.errors import InvalidArgumentError, ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+RETRY_ATTEMPT_HEADER = "x-retry-attempt"
+RETRY_DUE_HEADER = "x-retry-due-ms"
+ORIGINAL_TOPIC_HEADER = "x-original-topic"
+ORIGINAL_PARTITION_HEADER = "x-original-partition"
+ORIGINAL_OFFSET_HEADER = "x-original-offset"
+ERROR_TYPE_HEADER = "x-error-type"
+ERROR_MESSAGE_HEADER = "x-error-message"
+FAILED_AT_HEADER = "x-failed-at-ms"
+
+_ROUTING_HEADERS = frozenset(
+    (
+        RETRY_ATTEMPT_HEADER,
+        RETRY_DUE_HEADER,
+        ORIGINAL_TOPIC_HEADER,
+        ORIGINAL_PARTITION_HEADER,
+        ORIGINAL_OFFSET_HEADER,
+        ERROR_TYPE_HEADER,
+        ERROR_MESSAGE_HEADER,
+        FAILED_AT_HEADER,
+    ),
+)
+# Error messages are truncated so a verbose error cannot bloat the forwarded message
+_MAX_ERROR_MESSAGE_LENGTH = 1000
+
+
+class KafkaRetryTier(NamedTuple):
+    """A retry topic and the delay before its messages are processed again.
+
+    Attributes:
+        name (str): Suffix of the retry topic, appended to the original topic after a dot.
+        delay_ms (int): Milliseconds between the failure and the next attempt.
+    """
+
+    name: str
+    delay_ms: int
+
+
+DEFAULT_RETRY_TIERS = (KafkaRetryTier("retry-5s", 5_000), KafkaRetryTier("retry-1m", 60_000))
+
+
+class KafkaRetryPolicy:
+    """Forwards messages whose processing failed to retry topics, then to a dead-letter topic.
+
+    A message of ``orders`` that fails is produced to ``orders.retry-5s``, then to ``orders.retry-1m``
+    if it fails again, and finally to ``orders.dlq``. Forwarded messages keep their key, value and
+    headers, and gain headers recording the original topic, partition and offset, the attempt, the
+    error and, for retry topics, the time from which they are due. The partition of the failed
+    message is thus free to move on, while the message is retried asynchronously.
+
+    The consumer runners take a policy: they subscribe to the retry topics as well and hold back each
+    retry message until it is due, without occupying a worker. Since every message of a tier has the
+    same delay, messages are due in the order of their partition.
+
+    Args:
+        producer (KafkaProducerPort): Producer of the forwarded messages, without serializers since
+            messages are forwarded as consumed, and without a ``TRANSACTIONAL_ID``.
+        tiers (Sequence[KafkaRetryTier]): Retry tiers in the order they are tried; empty to forward
+            failed messages straight to the dead-letter topic. Defaults to DEFAULT_RETRY_TIERS.
+        dead_letter_suffix (str): Suffix of the dead-letter topic. Defaults to "dlq".
+        delivery_timeout (float): Seconds to wait for a forwarded message to be delivered. Defaults to 30.0.
+
+    Example:
+        >>> policy = KafkaRetryPolicy(KafkaProducerAdapter("orders.dlq"))
+        >>> runner = KafkaConsumerRunner(consumer, ["orders"], handle_order, retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        producer: KafkaProducerPort,
+        tiers: Sequence[KafkaRetryTier] = DEFAULT_RETRY_TIERS,
+        dead_letter_suffix: str = "dlq",
+        delivery_timeout: float = 30.0,
+    ) -> None:
+        if any(tier.delay_ms < 0 for tier in tiers):
+            raise InvalidArgumentError(argument_name="tiers")
+        if len({tier.name for tier in tiers} | {dead_letter_suffix}) != len(tiers) + 1:
+            raise InvalidArgumentError(argument_name="tiers")
+        self.producer = producer
+        self.tiers = tuple(tiers)
+        self.dead_letter_suffix = dead_letter_suffix
+        self.delivery_timeout = delivery_timeout
+
+    def retry_topics(self, topic_list: list[str]) -> list[str]:
+        """Returns the retry topics of topics.
+
+        Args:
+            topic_list (list[str]): The original topics.
+
+        Returns:
+            list[str]: The retry topics, tier by tier.
+        """
+        return [f"{topic}.{tier.name}" for tier in self.tiers for topic in topic_list]
+
+    def dead_letter_topic(self, topic: str) -> str:
+        """Returns the dead-letter topic of a topic.
+
+        Args:
+            topic (str): The original topic.
+
+        Returns:
+            str: The dead-letter topic.
+        """
+        return f"{topic}.{self.dead_letter_suffix}"
+
+    def delay(self, message: Message) -> float:
+        """Returns the seconds until a message is due, 0 for messages not consumed from a retry topic.
+
+        Args:
+            message (Message): The consumed message.
+
+        Returns:
+            float: Seconds to wait before processing the message.
+        """
+        due = self._headers(message).get(RETRY_DUE_HEADER)
+        if due is None:
+            return 0.0
+        return max(int(due) / 1000 - time.time(), 0.0)
+
+    def forward(self, message: Message, error: BaseException) -> str:
+        """Produces a failed message to its next retry topic, or to the dead-letter topic.
+
+        Args:
+            message (Message): The message whose processing failed.
+            error (BaseException): The error raised by the processing.
+
+        Returns:
+            str: The topic the message was forwarded to.
+
+        Raises:
+            ServiceUnavailableError: If the forwarded message was not delivered.
+            ResourceExhaustedError: If the producer queue stays full.
+            InternalError: If there is an error producing the message.
+        """
+        headers = self._headers(message)
+        attempt = int(headers.get(RETRY_ATTEMPT_HEADER, 0))
+        original_topic = headers.get(ORIGINAL_TOPIC_HEADER) or cast(str, message.topic())
+        now_ms = int(time.time() * 1000)
+        routing = {
+            ORIGINAL_TOPIC_HEADER: original_topic,
+            ORIGINAL_PARTITION_HEADER: headers.get(ORIGINAL_PARTITION_HEADER, str(message.partition())),
+            ORIGINAL_OFFSET_HEADER: headers.get(ORIGINAL_OFFSET_HEADER, str(message.offset())),
+            RETRY_ATTEMPT_HEADER: str(attempt + 1),
+            ERROR_TYPE_HEADER: type(error).__qualname__,
+            ERROR_MESSAGE_HEADER: str(error)[:_MAX_ERROR_MESSAGE_LENGTH],
+            FAILED_AT_HEADER: str(now_ms),
+        }
+        if attempt < len(self.tiers):
+            tier = self.tiers[attempt]
+            topic = f"{original_topic}.{tier.name}"
+            routing[RETRY_DUE_HEADER] = str(now_ms + tier.delay_ms)
+        else:
+            topic = self.dead_letter_topic(original_topic)
+        kept = [(name, value) for name, value in self._header_items(message) if name not in _ROUTING_HEADERS]
+        record = KafkaRecord(
+            value=message.value(),
+            key=message.key(),
+            topic=topic,
+            headers=[*kept, *((name, value.encode()) for name, value in routing.items())],
+        )
+        result = self.producer.produce_batch([record], self.delivery_timeout)
+        if result.delivered != 1:
+            raise ServiceUnavailableError(service="Kafka", additional_data={"topic": topic})
+        logger.info(
+            "Forwarded message %s [%d] at offset %d to %s after attempt %d",
+            message.topic(),
+            message.partition(),
+            message.offset(),
+            topic,
+            attempt + 1,
+        )
+        return topic
+
+    @classmethod
+    def _headers(cls, message: Message) -> dict[str, str]:
+        """Returns the routing headers of a message, decoded."""
+        return {
+            name: value.decode() if isinstance(value, bytes) else value
+            for name, value in cls._header_items(message)
+            if name in _ROUTING_HEADERS and value is not None
+        }
+
+    @staticmethod
+    def _header_items(message: Message) -> list[tuple[str, str | bytes | None]]:
+        """Returns the headers of a message as (name, value) pairs."""
+        headers = message.headers() or []
+        if isinstance(headers, dict):
+            return list(headers.items())
+        return headers
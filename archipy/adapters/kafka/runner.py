@@ -0,0 +1,785 @@
+import asyncio
+import contextlib
+import functools
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal, cast
+
+from confluent_kafka import Message, TopicPartition
+
+from archipy.adapters.kafka.ports import KafkaConsumerPort
+from archipy.adapters.kafka.retry import KafkaRetryPolicy
+from archipy.models.errors import BaseError, InvalidArgumentError
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying after Kafka errors in the consume loop
+_ERROR_BACKOFF_SECONDS = 1.0
+# Poll timeout while partitions are paused, so they resume soon after their backlog drains
+_PAUSED_POLL_TIMEOUT_SECONDS = 0.1
+
+type KafkaOrdering = Literal["partition", "key"]
+type KafkaWorkers = Literal["thread", "process"]
+type _PartitionKey = tuple[str, int]
+type _LaneKey = tuple[str, int] | tuple[str, int, str | bytes | None]
+
+
+class _PartitionState:
+    """Offsets of one partition, from dispatch to commit."""
+
+    __slots__ = ("active_lanes", "completed", "dispatched", "paused")
+
+    def __init__(self) -> None:
+        self.dispatched: deque[int] = deque()
+        self.completed: set[int] = set()
+        self.active_lanes = 0
+        self.paused = False
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of dispatched messages not processed yet."""
+        return len(self.dispatched) - len(self.completed)
+
+    def commit_position(self) -> int | None:
+        """Pops the processed prefix of the dispatched offsets.
+
+        Returns:
+            int | None: The offset following the highest contiguous processed offset, which is the
+                offset to commit, or None if the prefix did not move since the previous call.
+        """
+        position = None
+        while self.dispatched and self.dispatched[0] in self.completed:
+            offset = self.dispatched.popleft()
+            self.completed.remove(offset)
+            position = offset + 1
+        return position
+
+
+class _BaseKafkaConsumerRunner:
+    """Ordering, backpressure and offset bookkeeping shared by the sync and async consumer runners.
+
+    Messages are queued in lanes, one per partition or per key of a partition, and each lane hands
+    one message at a time to the workers, which preserves the order within a lane while lanes run in
+    parallel. Offsets are committed only up to the highest offset below which every message of the
+    partition was processed.
+
+    Args:
+        topic_list (list[str]): The topics to consume.
+        ordering (KafkaOrdering): "partition" processes the messages of a partition one at a time;
+            "key" only orders messages sharing a key, running different keys in parallel. Messages
+            without a key share one lane per partition. Defaults to "partition".
+        concurrency (int): Maximum number of messages processed at the same time. Defaults to 16.
+        batch_size (int): Maximum number of messages consumed per poll. Defaults to 500.
+        poll_timeout (float): Seconds a poll waits for messages. Defaults to 1.0.
+        max_pending_per_partition (int): A partition with that many messages awaiting processing is
+            paused until half of them are processed. Defaults to 1000.
+        commit_interval_ms (int): Milliseconds between two offset commits. Defaults to 5000.
+        revoke_timeout (float): Seconds a rebalance waits for the messages of revoked partitions being
+            processed before committing their offsets. Defaults to 30.0.
+        retry_policy (KafkaRetryPolicy | None): Forwards the messages whose handler raises to retry
+            topics and a dead-letter topic, which are consumed as well. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        topic_list: list[str],
+        ordering: KafkaOrdering = "partition",
+        concurrency: int = 16,
+        batch_size: int = 500,
+        poll_timeout: float = 1.0,
+        max_pending_per_partition: int = 1000,
+        commit_interval_ms: int = 5000,
+        revoke_timeout: float = 30.0,
+        retry_policy: KafkaRetryPolicy | None = None,
+    ) -> None:
+        if ordering not in ("partition", "key"):
+            raise InvalidArgumentError(argument_name="ordering")
+        self.topic_list = topic_list
+        self.ordering = ordering
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
+        self.max_pending_per_partition = max_pending_per_partition
+        self.commit_interval_ms = commit_interval_ms
+        self.revoke_timeout = revoke_timeout
+        self.retry_policy = retry_policy
+        self._partitions: dict[_PartitionKey, _PartitionState] = {}
+        self._lanes: dict[_LaneKey, deque[Message]] = {}
+        self._next_commit_at = 0.0
+
+    def _subscribed_topics(self) -> list[str]:
+        """Returns the topics to consume, with the retry topics of the retry policy."""
+        if self.retry_policy is None:
+            return self.topic_list
+        return [*self.topic_list, *self.retry_policy.retry_topics(self.topic_list)]
+
+    def _delay(self, message: Message) -> float:
+        """Returns the seconds until a message consumed from a retry topic is due."""
+        if self.retry_policy is None:
+            return 0.0
+        return self.retry_policy.delay(message)
+
+    @staticmethod
+    def _partition_of(message: Message) -> _PartitionKey:
+        """Returns the key tracking the partition of a consumed message."""
+        return cast(str, message.topic()), cast(int, message.partition())
+
+    def _lane_key(self, message: Message) -> _LaneKey:
+        """Returns the lane whose order a message must keep."""
+        if self.ordering == "key":
+            return (*self._partition_of(message), message.key())
+        return self._partition_of(message)
+
+    def _enqueue(self, message: Message) -> bool:
+        """Tracks a consumed message and queues it behind the messages of its lane.
+
+        Args:
+            message (Message): The consumed message.
+
+        Returns:
+            bool: True if the lane was idle and the message must be handled now.
+        """
+        state = self._partitions.setdefault(self._partition_of(message), _PartitionState())
+        state.dispatched.append(cast(int, message.offset()))
+        lane_key = self._lane_key(message)
+        lane = self._lanes.get(lane_key)
+        if lane is not None:
+            lane.append(message)
+            return False
+        self._lanes[lane_key] = deque()
+        state.active_lanes += 1
+        return True
+
+    def _complete(self, message: Message) -> Message | None:
+        """Marks a message processed.
+
+        Args:
+            message (Message): The processed message.
+
+        Returns:
+            Message | None: The next message of its lane, or None if the lane is now idle.
+        """
+        lane_key = self._lane_key(message)
+        lane = self._lanes.get(lane_key)
+        if lane is None:
+            # The partition was revoked or lost while the message was processed
+            return None
+        state = self._partitions[self._partition_of(message)]
+        state.completed.add(cast(int, message.offset()))
+        if lane:
+            return lane.popleft()
+        del self._lanes[lane_key]
+        state.active_lanes -= 1
+        return None
+
+    def _abandon(self, message: Message) -> None:
+        """Frees the lane of a message that will not be processed, leaving its offset uncommitted."""
+        lane_key = self._lane_key(message)
+        if self._lanes.pop(lane_key, None) is not None:
+            self._partitions[self._partition_of(message)].active_lanes -= 1
+
+    def _drop_queued(self, partitions: set[_PartitionKey] | None) -> None:
+        """Drops the queued messages of partitions, or of every partition if None.
+
+        Dropped messages are never committed, so they are consumed again after a restart or a rebalance.
+        """
+        for lane_key, lane in self._lanes.items():
+            if partitions is None or lane_key[:2] in partitions:
+                lane.clear()
+
+    def _active(self, partitions: set[_PartitionKey] | None) -> bool:
+        """Returns whether messages of partitions, or of any partition if None, are being processed."""
+        return any(
+            state.active_lanes
+            for partition, state in self._partitions.items()
+            if partitions is None or partition in partitions
+        )
+
+    def _release(self, partitions: set[_PartitionKey]) -> list[TopicPartition]:
+        """Stops tracking partitions.
+
+        Args:
+            partitions (set[_PartitionKey]): The revoked or lost partitions.
+
+        Returns:
+            list[TopicPartition]: The offsets to commit for the partitions that advanced.
+        """
+        for lane_key in [lane_key for lane_key in self._lanes if lane_key[:2] in partitions]:
+            del self._lanes[lane_key]
+        offsets = []
+        for topic, partition in partitions:
+            state = self._partitions.pop((topic, partition), None)
+            if state is not None and (position := state.commit_position()) is not None:
+                offsets.append(TopicPartition(topic, partition, position))
+        return offsets
+
+    def _take_commit_offsets(self) -> list[TopicPartition]:
+        """Returns the offsets to commit for every partition that advanced since the last commit."""
+        return [
+            TopicPartition(topic, partition, position)
+            for (topic, partition), state in self._partitions.items()
+            if (position := state.commit_position()) is not None
+        ]
+
+    def _backpressure(self) -> tuple[list[TopicPartition], list[TopicPartition]]:
+        """Returns the partitions to pause, whose backlog is full, and to resume, whose backlog drained."""
+        pause, resume = [], []
+        for (topic, partition), state in self._partitions.items():
+            if not state.paused and state.pending >= self.max_pending_per_partition:
+                state.paused = True
+                pause.append(TopicPartition(topic, partition))
+            elif state.paused and state.pending <= self.max_pending_per_partition // 2:
+                state.paused = False
+                resume.append(TopicPartition(topic, partition))
+        return pause, resume
+
+    def _next_poll_timeout(self) -> float:
+        """Returns the poll timeout, shortened while partitions are paused."""
+        if any(state.paused for state in self._partitions.values()):
+            return min(self.poll_timeout, _PAUSED_POLL_TIMEOUT_SECONDS)
+        return self.poll_timeout
+
+    def _commit_due(self) -> bool:
+        """Returns whether the next commit is due and schedules the following one."""
+        now = time.monotonic()
+        if now < self._next_commit_at:
+            return False
+        self._next_commit_at = now + self.commit_interval_ms / 1000
+        return True
+
+    @staticmethod
+    def _partition_keys(partitions: list[TopicPartition]) -> set[_PartitionKey]:
+        """Converts partitions to the keys tracking them."""
+        return {(topic_partition.topic, topic_partition.partition) for topic_partition in partitions}
+
+
+class KafkaConsumerRunner(_BaseKafkaConsumerRunner):
+    """Consumes Kafka topics with a pool of worker threads or processes.
+
+    Messages are consumed in batches and dispatched to the workers while the order is kept per
+    partition, or per key with ``ordering="key"``. A partition whose backlog reaches
+    ``max_pending_per_partition`` is paused and resumed once half of it is processed, so memory stays
+    bounded while the consumer keeps polling and stays in the group. Instead of one commit per message,
+    the highest contiguous processed offset of each partition is committed every
+    ``commit_interval_ms``. When partitions are revoked, their queued messages are dropped, the messages
+    being processed are awaited and their offsets committed before the partitions change owner.
+
+    Messages whose handler raises are logged and committed like the others, unless a ``retry_policy``
+    forwards them to a retry or dead-letter topic first; if forwarding fails, the message is handled
+    again. Retry messages wait for their delay without occupying a worker. Delivery is at least once,
+    so handlers must be idempotent. With ``workers="process"``, the handler must be picklable, such as
+    a module-level function, and messages are pickled to the worker processes.
+
+    Args:
+        consumer (KafkaConsumerPort): The consumer, which the runner subscribes and must have
+            ``ENABLE_AUTO_COMMIT`` disabled.
+        topic_list (list[str]): The topics to consume.
+        handler (Callable[[Message], None]): Processes one message.
+        ordering (KafkaOrdering): "partition" or "key". Defaults to "partition".
+        workers (KafkaWorkers): "thread" or "process". Defaults to "thread".
+        concurrency (int): Number of workers. Defaults to 16.
+        batch_size (int): Maximum number of messages consumed per poll. Defaults to 500.
+        poll_timeout (float): Seconds a poll waits for messages. Defaults to 1.0.
+        max_pending_per_partition (int): Backlog at which a partition is paused. Defaults to 1000.
+        commit_interval_ms (int): Milliseconds between two offset commits. Defaults to 5000.
+        revoke_timeout (float): Seconds a rebalance waits for the messages being processed. Defaults to 30.0.
+        retry_policy (KafkaRetryPolicy | None): Forwards failed messages to retry and dead-letter topics.
+            Defaults to None.
+
+    Example:
+        >>> consumer = KafkaConsumerAdapter("billing", topic_list=["invoices"])
+        >>> runner = KafkaConsumerRunner(consumer, ["invoices"], handle_invoice, ordering="key")
+        >>> threading.Thread(target=runner.run, daemon=True).start()
+        >>> ...
+        >>> runner.stop()
+    """
+
+    def __init__(
+        self,
+        consumer: KafkaConsumerPort,
+        topic_list: list[str],
+        handler: Callable[[Message], None],
+        ordering: KafkaOrdering = "partition",
+        workers: KafkaWorkers = "thread",
+        concurrency: int = 16,
+        batch_size: int = 500,
+        poll_timeout: float = 1.0,
+        max_pending_per_partition: int = 1000,
+        commit_interval_ms: int = 5000,
+        revoke_timeout: float = 30.0,
+        retry_policy: KafkaRetryPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            topic_list,
+            ordering,
+            concurrency,
+            batch_size,
+            poll_timeout,
+            max_pending_per_partition,
+            commit_interval_ms,
+            revoke_timeout,
+            retry_policy,
+        )
+        if workers not in ("thread", "process"):
+            raise InvalidArgumentError(argument_name="workers")
+        self.consumer = consumer
+        self.handler = handler
+        self.workers = workers
+        self._executor: Executor | None = None
+        # Messages waiting to be handled, as (due time, sequence, message), the sequence breaking ties
+        self._deferred: list[tuple[float, int, Message]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Consumes the topics until stop() is called, then waits for the messages being processed."""
+        self._stop_event.clear()
+        self.consumer.subscribe(
+            self._subscribed_topics(),
+            on_assign=self._on_assign,
+            on_revoke=self._on_revoke,
+            on_lost=self._on_lost,
+        )
+        with self._create_executor() as pool:
+            self._executor = pool
+            try:
+                while not self._stop_event.is_set():
+                    try:
+                        self.poll()
+                        if self._commit_due():
+                            self.commit()
+                    except BaseError as exception:
+                        logger.warning("Consuming topics %s failed: %s", self.topic_list, exception)
+                        self._stop_event.wait(_ERROR_BACKOFF_SECONDS)
+            finally:
+                with self._lock:
+                    self._drop_queued(None)
+                    self._drop_deferred(None)
+                    self._idle.wait_for(lambda: not self._active(None))
+                self._executor = None
+        self.commit(asynchronous=False)
+
+    def stop(self) -> None:
+        """Asks run() to return after the current iteration."""
+        self._stop_event.set()
+
+    def poll(self) -> int:
+        """Consumes one batch, dispatches it to the workers and pauses or resumes partitions.
+
+        Must be called from the thread running run(), which owns the consumer.
+
+        Returns:
+            int: The number of messages consumed.
+        """
+        messages = self.consumer.batch_consume(self.batch_size, self._poll_timeout())
+        with self._lock:
+            ready = [message for message in messages if self._enqueue(message)]
+            due = self._take_due()
+        for message in ready:
+            self._dispatch(message)
+        for message in due:
+            self._submit(message)
+        with self._lock:
+            pause, resume = self._backpressure()
+        if pause:
+            logger.debug("Pausing partitions with a full backlog: %s", pause)
+            self.consumer.pause(pause)
+        if resume:
+            logger.debug("Resuming partitions: %s", resume)
+            self.consumer.resume(resume)
+        return len(messages)
+
+    def commit(self, asynchronous: bool = True) -> int:
+        """Commits the highest contiguous processed offset of every partition that advanced.
+
+        Must be called from the thread running run(), which owns the consumer.
+
+        Args:
+            asynchronous (bool, optional): Whether to commit asynchronously. Defaults to True.
+
+        Returns:
+            int: The number of partitions committed.
+        """
+        with self._lock:
+            offsets = self._take_commit_offsets()
+        if offsets:
+            self.consumer.commit_offsets(offsets, asynchronous)
+        return len(offsets)
+
+    def _create_executor(self) -> Executor:
+        """Creates the worker pool."""
+        if self.workers == "process":
+            return ProcessPoolExecutor(max_workers=self.concurrency)
+        return ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="kafka-runner")
+
+    def _poll_timeout(self) -> float:
+        """Returns the poll timeout, shortened to wake up when the next deferred message is due."""
+        timeout = self._next_poll_timeout()
+        with self._lock:
+            if self._deferred:
+                timeout = min(timeout, max(self._deferred[0][0] - time.monotonic(), 0.0))
+        return timeout
+
+    def _defer(self, message: Message, delay: float) -> None:
+        """Holds a message back from the workers for a delay; the lock must be held."""
+        heapq.heappush(self._deferred, (time.monotonic() + delay, next(self._sequence), message))
+
+    def _take_due(self) -> list[Message]:
+        """Removes the deferred messages that are due; the lock must be held."""
+        now = time.monotonic()
+        due = []
+        while self._deferred and self._deferred[0][0] <= now:
+            due.append(heapq.heappop(self._deferred)[2])
+        return due
+
+    def _drop_deferred(self, partitions: set[_PartitionKey] | None) -> None:
+        """Drops the deferred messages of partitions, or of every partition if None; the lock must be held."""
+        kept = []
+        for entry in self._deferred:
+            if partitions is None or self._partition_of(entry[2]) in partitions:
+                self._abandon(entry[2])
+            else:
+                kept.append(entry)
+        heapq.heapify(kept)
+        self._deferred = kept
+
+    def _dispatch(self, message: Message) -> None:
+        """Hands a message to the workers, or defers it until it is due."""
+        delay = self._delay(message)
+        if delay > 0:
+            with self._lock:
+                self._defer(message, delay)
+        else:
+            self._submit(message)
+
+    def _forward(self, message: Message, error: BaseException) -> bool:
+        """Forwards a failed message with the retry policy.
+
+        Returns:
+            bool: Whether the message was forwarded, or True when there is no retry policy.
+        """
+        if self.retry_policy is None:
+            return True
+        try:
+            self.retry_policy.forward(message, error)
+        except BaseError:
+            logger.exception("Forwarding a failed message, handling it again in %.1fs", _ERROR_BACKOFF_SECONDS)
+            return False
+        return True
+
+    def _submit(self, message: Message) -> None:
+        """Hands a message to the workers."""
+        executor = self._executor
+        if executor is None:
+            return
+        try:
+            future = executor.submit(self.handler, message)
+        except RuntimeError:
+            # The pool is shutting down: the message stays uncommitted and is consumed again
+            return
+        future.add_done_callback(functools.partial(self._on_done, message))
+
+    def _on_done(self, message: Message, future: Future[None]) -> None:
+        """Records a processed message and hands the next message of its lane to the workers."""
+        error = future.exception()
+        if error is not None:
+            logger.error(
+                "Handling message %s [%d] at offset %d failed",
+                message.topic(),
+                message.partition(),
+                message.offset(),
+                exc_info=error,
+            )
+            if not self._forward(message, error):
+                with self._lock:
+                    self._defer(message, _ERROR_BACKOFF_SECONDS)
+                return
+        with self._lock:
+            next_message = self._complete(message)
+            self._idle.notify_all()
+        if next_message is not None:
+            self._dispatch(next_message)
+
+    def _on_assign(self, partitions: list[TopicPartition]) -> None:
+        """Starts tracking assigned partitions."""
+        logger.info("Assigned partitions: %s", partitions)
+        with self._lock:
+            for partition in self._partition_keys(partitions):
+                self._partitions.setdefault(partition, _PartitionState())
+
+    def _on_revoke(self, partitions: list[TopicPartition]) -> None:
+        """Waits for the messages of revoked partitions being processed and commits their offsets."""
+        logger.info("Revoked partitions: %s", partitions)
+        revoked = self._partition_keys(partitions)
+        with self._lock:
+            self._drop_queued(revoked)
+            self._drop_deferred(revoked)
+            if not self._idle.wait_for(lambda: not self._active(revoked), self.revoke_timeout):
+                logger.warning("Messages of revoked partitions still in process after %.1fs", self.revoke_timeout)
+            offsets = self._release(revoked)
+        if offsets:
+            self.consumer.commit_offsets(offsets, asynchronous=False)
+
+    def _on_lost(self, partitions: list[TopicPartition]) -> None:
+        """Stops tracking lost partitions, whose offsets can no longer be committed."""
+        logger.warning("Lost partitions: %s", partitions)
+        lost = self._partition_keys(partitions)
+        with self._lock:
+            self._drop_queued(lost)
+            self._drop_deferred(lost)
+            self._release(lost)
+
+
+class AsyncKafkaConsumerRunner(_BaseKafkaConsumerRunner):
+    """Consumes Kafka topics with asyncio tasks.
+
+    Async counterpart of KafkaConsumerRunner: each busy lane is drained by its own task and an
+    ``asyncio.Semaphore`` caps the number of handlers running at once. The synchronous consumer is
+    driven from one dedicated thread, so polls never block the event loop, and rebalances wait on
+    that thread for the event loop to finish the messages of revoked partitions. Lanes waiting for
+    a retry message to be due are cancelled when their partition is revoked or the runner stops.
+
+    Args:
+        consumer (KafkaConsumerPort): The consumer, which the runner subscribes and must have
+            ``ENABLE_AUTO_COMMIT`` disabled.
+        topic_list (list[str]): The topics to consume.
+        handler (Callable[[Message], Awaitable[None]]): Processes one message.
+        ordering (KafkaOrdering): "partition" or "key". Defaults to "partition".
+        concurrency (int): Maximum number of handlers running at once. Defaults to 16.
+        batch_size (int): Maximum number of messages consumed per poll. Defaults to 500.
+        poll_timeout (float): Seconds a poll waits for messages. Defaults to 1.0.
+        max_pending_per_partition (int): Backlog at which a partition is paused. Defaults to 1000.
+        commit_interval_ms (int): Milliseconds between two offset commits. Defaults to 5000.
+        revoke_timeout (float): Seconds a rebalance waits for the messages being processed. Defaults to 30.0.
+        retry_policy (KafkaRetryPolicy | None): Forwards failed messages to retry and dead-letter topics.
+            Defaults to None.
+
+    Example:
+        >>> runner = AsyncKafkaConsumerRunner(KafkaConsumerAdapter("billing", topic_list=["invoices"]),
+        ...                                   ["invoices"], handle_invoice)
+        >>> task = asyncio.create_task(runner.run())
+        >>> ...
+        >>> runner.stop()
+        >>> await task
+    """
+
+    def __init__(
+        self,
+        consumer: KafkaConsumerPort,
+        topic_list: list[str],
+        handler: Callable[[Message], Awaitable[None]],
+        ordering: KafkaOrdering = "partition",
+        concurrency: int = 16,
+        batch_size: int = 500,
+        poll_timeout: float = 1.0,
+        max_pending_per_partition: int = 1000,
+        commit_interval_ms: int = 5000,
+        revoke_timeout: float = 30.0,
+        retry_policy: KafkaRetryPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            topic_list,
+            ordering,
+            concurrency,
+            batch_size,
+            poll_timeout,
+            max_pending_per_partition,
+            commit_interval_ms,
+            revoke_timeout,
+            retry_policy,
+        )
+        self.consumer = consumer
+        self.handler = handler
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._tasks: dict[asyncio.Task[None], _PartitionKey] = {}
+        # Lane tasks waiting for a retry message to be due
+        self._waiting: set[asyncio.Task[None]] = set()
+        self._stop_event = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._consumer_thread: ThreadPoolExecutor | None = None
+
+    async def run(self) -> None:
+        """Consumes the topics until stop() is called, then waits for the messages being processed."""
+        self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
+        self._consumer_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kafka-runner-consumer")
+        try:
+            await self._call(
+                self.consumer.subscribe,
+                self._subscribed_topics(),
+                self._on_assign,
+                self._on_revoke,
+                self._on_lost,
+            )
+            try:
+                while not self._stop_event.is_set():
+                    try:
+                        await self.poll()
+                        if self._commit_due():
+                            await self.commit()
+                    except BaseError as exception:
+                        logger.warning("Consuming topics %s failed: %s", self.topic_list, exception)
+                        with contextlib.suppress(TimeoutError):
+                            await asyncio.wait_for(self._stop_event.wait(), _ERROR_BACKOFF_SECONDS)
+            finally:
+                self._drop_queued(None)
+                for task in self._waiting:
+                    task.cancel()
+                if self._tasks:
+                    await asyncio.wait(list(self._tasks))
+            await self.commit(asynchronous=False)
+        finally:
+            self._loop = None
+            self._consumer_thread.shutdown(wait=False)
+            self._consumer_thread = None
+
+    def stop(self) -> None:
+        """Asks run() to return after the current iteration."""
+        self._stop_event.set()
+
+    async def poll(self) -> int:
+        """Consumes one batch, starts tasks for the idle lanes and pauses or resumes partitions.
+
+        Must be awaited while run() is active.
+
+        Returns:
+            int: The number of messages consumed.
+        """
+        messages = await self._call(self.consumer.batch_consume, self.batch_size, self._next_poll_timeout())
+        for message in messages:
+            if self._enqueue(message):
+                task = asyncio.create_task(self._drain_lane(message))
+                self._tasks[task] = self._partition_of(message)
+                task.add_done_callback(self._forget)
+        pause, resume = self._backpressure()
+        if pause:
+            logger.debug("Pausing partitions with a full backlog: %s", pause)
+            await self._call(self.consumer.pause, pause)
+        if resume:
+            logger.debug("Resuming partitions: %s", resume)
+            await self._call(self.consumer.resume, resume)
+        return len(messages)
+
+    async def commit(self, asynchronous: bool = True) -> int:
+        """Commits the highest contiguous processed offset of every partition that advanced.
+
+        Must be awaited while run() is active.
+
+        Args:
+            asynchronous (bool, optional): Whether to commit asynchronously. Defaults to True.
+
+        Returns:
+            int: The number of partitions committed.
+        """
+        offsets = self._take_commit_offsets()
+        if offsets:
+            await self._call(self.consumer.commit_offsets, offsets, asynchronous)
+        return len(offsets)
+
+    async def _call[T](self, function: Callable[..., T], *args: object) -> T:
+        """Runs a consumer call on the consumer thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._consumer_thread, functools.partial(function, *args))
+
+    async def _drain_lane(self, message: Message) -> None:
+        """Processes the messages of a lane in order until it is idle."""
+        next_message: Message | None = message
+        while next_message is not None:
+            if (delay := self._delay(next_message)) > 0:
+                await self._wait(delay)
+            async with self._semaphore:
+                handled = await self._handle(next_message)
+            if not handled:
+                await self._wait(_ERROR_BACKOFF_SECONDS)
+                continue
+            next_message = self._complete(next_message)
+
+    async def _handle(self, message: Message) -> bool:
+        """Runs the handler on a message and forwards the message with the retry policy if it fails.
+
+        Returns:
+            bool: False if the message failed and could not be forwarded, so it must be handled again.
+        """
+        try:
+            await self.handler(message)
+        except Exception as error:
+            logger.exception(
+                "Handling message %s [%d] at offset %d failed",
+                message.topic(),
+                message.partition(),
+                message.offset(),
+            )
+            if self.retry_policy is not None:
+                try:
+                    await asyncio.to_thread(self.retry_policy.forward, message, error)
+                except BaseError:
+                    logger.exception("Forwarding a failed message, handling it again in %.1fs", _ERROR_BACKOFF_SECONDS)
+                    return False
+        return True
+
+    async def _wait(self, delay: float) -> None:
+        """Sleeps in a lane task, which revocations and stop() may cancel meanwhile."""
+        task = cast(asyncio.Task[None], asyncio.current_task())
+        self._waiting.add(task)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._waiting.discard(task)
+
+    def _forget(self, task: asyncio.Task[None]) -> None:
+        """Stops tracking a finished lane task."""
+        self._tasks.pop(task, None)
+
+    async def _revoke(self, partitions: list[TopicPartition]) -> list[TopicPartition]:
+        """Waits for the messages of revoked partitions being processed and returns their offsets."""
+        revoked = self._partition_keys(partitions)
+        self._drop_queued(revoked)
+        tasks = [task for task, partition in self._tasks.items() if partition in revoked]
+        for task in tasks:
+            if task in self._waiting:
+                task.cancel()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.revoke_timeout)
+            if pending:
+                logger.warning("Messages of revoked partitions still in process after %.1fs", self.revoke_timeout)
+        return self._release(revoked)
+
+    def _assign(self, partitions: list[TopicPartition]) -> None:
+        """Starts tracking assigned partitions."""
+        for partition in self._partition_keys(partitions):
+            self._partitions.setdefault(partition, _PartitionState())
+
+    def _lose(self, partitions: list[TopicPartition]) -> None:
+        """Stops tracking lost partitions."""
+        lost = self._partition_keys(partitions)
+        self._drop_queued(lost)
+        self._release(lost)
+
+    def _on_assign(self, partitions: list[TopicPartition]) -> None:
+        """Hands assigned partitions to the event loop; runs on the consumer thread."""
+        logger.info("Assigned partitions: %s", partitions)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._assign, partitions)
+
+    def _on_revoke(self, partitions: list[TopicPartition]) -> None:
+        """Waits for the event loop to finish revoked partitions and commits them; runs on the consumer thread."""
+        logger.info("Revoked partitions: %s", partitions)
+        if self._loop is None:
+            return
+        offsets = asyncio.run_coroutine_threadsafe(self._revoke(partitions), self._loop).result()
+        if offsets:
+            self.consumer.commit_offsets(offsets, asynchronous=False)
+
+    def _on_lost(self, partitions: list[TopicPartition]) -> None:
+        """Hands lost partitions to the event loop; runs on the consumer thread."""
+        logger.warning("Lost partitions: %s", partitions)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._lose, partitions)
@@ -0,0 +1,588 @@
+import io
+import json
+import struct
+import threading
+from abc import abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Any, Literal, cast
+
+import pydantic_core
+import requests
+from pydantic import BaseModel
+
+from archipy.models.dtos.base_protobuf_dto import BaseProtobufDTO
+from archipy.models.errors import (
+    InvalidArgumentError,
+    InvalidFormatError,
+    NotFoundError,
+    ServiceUnavailableError,
+)
+
+type KafkaSchemaType = Literal["AVRO", "JSON"]
+
+# Confluent wire format: a zero magic byte and the big-endian schema id precede the payload
+_MAGIC_BYTE = 0
+_WIRE_HEADER = struct.Struct(">bI")
+
+
+class KafkaSerializer:
+    """Interface for converting message keys and values to and from the bytes stored in Kafka.
+
+    Serializers receive the topic, so schema-aware formats can resolve the subject of their schema.
+    Batched deserialization may pickle a serializer to a process pool, so implementations hold only
+    picklable state.
+    """
+
+    @abstractmethod
+    def serialize(self, value: Any, topic: str) -> bytes:
+        """Serializes a key or value.
+
+        Args:
+            value (Any): The value to serialize.
+            topic (str): The topic the message is produced to.
+
+        Returns:
+            bytes: The serialized value.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def deserialize(self, data: bytes, topic: str) -> Any:
+        """Deserializes a key or value.
+
+        Args:
+            data (bytes): The serialized value.
+            topic (str): The topic the message was consumed from.
+
+        Returns:
+            Any: The deserialized value.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    def deserialize_batch(self, payloads: Sequence[bytes], topic: str) -> list[Any]:
+        """Deserializes the payloads of a consumed batch.
+
+        Subclasses override it to resolve imports, schemas and validators once per batch.
+
+        Args:
+            payloads (Sequence[bytes]): The serialized values.
+            topic (str): The topic the messages were consumed from.
+
+        Returns:
+            list[Any]: The deserialized values, in the order of the payloads.
+        """
+        return [self.deserialize(data, topic) for data in payloads]
+
+
+class StringSerializer(KafkaSerializer):
+    """Encodes strings as UTF-8."""
+
+    def serialize(self, value: Any, topic: str) -> bytes:
+        """Encodes a string, passing bytes through."""
+        return value if isinstance(value, bytes) else str(value).encode("utf-8")
+
+    def deserialize(self, data: bytes, topic: str) -> str:
+        """Decodes a UTF-8 string."""
+        return data.decode("utf-8")
+
+
+class OrjsonSerializer(KafkaSerializer):
+    """Serializes JSON-compatible values and pydantic models, such as BaseDTOs, with orjson.
+
+    Datetimes, UUIDs, enums and dataclasses are encoded natively by orjson, and other pydantic types
+    through pydantic-core. Requires the ``orjson`` package.
+
+    Args:
+        dto_type (type[BaseModel] | None): Model that deserialized values are validated into, or None
+            to return plain JSON values. Defaults to None.
+    """
+
+    def __init__(self, dto_type: type[BaseModel] | None = None) -> None:
+        import orjson  # noqa: F401 - fail at construction when the package is missing
+
+        self.dto_type = dto_type
+
+    def serialize(self, value: Any, topic: str) -> bytes:
+        """Serializes a value or model to JSON bytes."""
+        import orjson
+
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        return orjson.dumps(value, default=pydantic_core.to_jsonable_python)
+
+    def deserialize(self, data: bytes, topic: str) -> Any:
+        """Deserializes JSON bytes, validating them into the model when one is set."""
+        import orjson
+
+        value = orjson.loads(data)
+        return value if self.dto_type is None else self.dto_type.model_validate(value)
+
+    def deserialize_batch(self, payloads: Sequence[bytes], topic: str) -> list[Any]:
+        """Deserializes a batch of JSON payloads."""
+        import orjson
+
+        loads = orjson.loads
+        if self.dto_type is None:
+            return [loads(data) for data in payloads]
+        validate = self.dto_type.model_validate
+        return [validate(loads(data)) for data in payloads]
+
+
+class ProtobufSerializer(KafkaSerializer):
+    """Serializes BaseProtobufDTOs as the binary encoding of their ``_proto_class``.
+
+    Protobuf messages of that class are accepted as is. Requires the ``protobuf`` package.
+
+    Args:
+        dto_type (type[BaseProtobufDTO]): The DTO, mapped to a protobuf message class.
+
+    Raises:
+        InvalidArgumentError: If the DTO is not mapped to a protobuf message class.
+    """
+
+    def __init__(self, dto_type: type[BaseProtobufDTO]) -> None:
+        if dto_type._proto_class is None:
+            raise InvalidArgumentError(
+                argument_name="dto_type",
+                additional_data={"reason": f"{dto_type.__name__} is not mapped to a proto class"},
+            )
+        self.dto_type = dto_type
+        self.proto_class = dto_type._proto_class
+
+    def serialize(self, value: Any, topic: str) -> bytes:
+        """Serializes a DTO or protobuf message to protobuf bytes."""
+        message = value.to_proto() if isinstance(value, BaseProtobufDTO) else value
+        return message.SerializeToString()
+
+    def deserialize(self, data: bytes, topic: str) -> BaseProtobufDTO:
+        """Parses protobuf bytes into the DTO."""
+        return self.dto_type.from_proto(self.proto_class.FromString(data))
+
+
+class KafkaSchemaRegistry:
+    """Resolves schema ids through a Confluent-compatible schema registry, caching every lookup locally.
+
+    Each schema is fetched or registered once per process; afterwards, ids and schemas come from the
+    local cache. Without a URL, schemas are registered in memory only, which suits tests and
+    pipelines whose producers and consumers share the registry instance.
+
+    Args:
+        url (str | None): Base URL of the registry, or None for an in-memory registry. Defaults to None.
+        username (str | None): Basic-auth user name. Defaults to None.
+        password (str | None): Basic-auth password. Defaults to None.
+        timeout (float): Timeout in seconds of registry requests. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        timeout: float = 5,
+    ) -> None:
+        self.url = url.rstrip("/") if url else None
+        self.auth = (username, password) if username and password else None
+        self.timeout = timeout
+        self._ids: dict[tuple[str, str], int] = {}
+        self._schemas: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drops the lock and HTTP session, so the registry and its cache can be sent to worker processes."""
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_session"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the registry with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def register(self, subject: str, schema: str, schema_type: KafkaSchemaType = "AVRO") -> int:
+        """Registers a schema under a subject, or looks up its id when already registered.
+
+        Args:
+            subject (str): The subject, such as "<topic>-value".
+            schema (str): The schema definition.
+            schema_type (KafkaSchemaType): "AVRO" or "JSON". Defaults to "AVRO".
+
+        Returns:
+            int: The schema id.
+
+        Raises:
+            ServiceUnavailableError: If the registry cannot be reached.
+        """
+        schema_id = self._ids.get((subject, schema))
+        if schema_id is not None:
+            return schema_id
+        with self._lock:
+            schema_id = self._ids.get((subject, schema))
+            if schema_id is not None:
+                return schema_id
+            if self.url is None:
+                schema_id = next((known for known, text in self._schemas.items() if text == schema), None)
+                if schema_id is None:
+                    schema_id = len(self._schemas) + 1
+            else:
+                response = self._request(
+                    "POST",
+                    f"/subjects/{subject}/versions",
+                    {"schema": schema, "schemaType": schema_type},
+                )
+                schema_id = int(response["id"])
+            self._schemas[schema_id] = schema
+            self._ids[subject, schema] = schema_id
+        return schema_id
+
+    def get_schema(self, schema_id: int) -> str:
+        """Returns the schema registered under an id.
+
+        Args:
+            schema_id (int): The schema id.
+
+        Returns:
+            str: The schema definition.
+
+        Raises:
+            NotFoundError: If no schema is registered under the id.
+            ServiceUnavailableError: If the registry cannot be reached.
+        """
+        schema = self._schemas.get(schema_id)
+        if schema is not None:
+            return schema
+        if self.url is None:
+            raise NotFoundError(resource_type="schema", additional_data={"schema_id": schema_id})
+        schema = str(self._request("GET", f"/schemas/ids/{schema_id}")["schema"])
+        self._schemas[schema_id] = schema
+        return schema
+
+    def _request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Sends a request to the registry.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path under the registry URL.
+            payload (dict[str, Any] | None): The JSON body. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The JSON response.
+
+        Raises:
+            NotFoundError: If the registry answers 404.
+            ServiceUnavailableError: If the registry cannot be reached or fails the request.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+        try:
+            response = self._session.request(
+                method,
+                f"{self.url}{path}",
+                json=payload,
+                auth=self.auth,
+                headers={"Content-Type": "application/vnd.schemaregistry.v1+json"},
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            raise ServiceUnavailableError(service="Schema Registry") from e
+        if response.status_code == requests.codes.not_found:
+            raise NotFoundError(resource_type="schema", additional_data={"path": path})
+        if not response.ok:
+            raise ServiceUnavailableError(
+                service="Schema Registry",
+                additional_data={"status_code": response.status_code, "reason": response.text},
+            )
+        return cast(dict[str, Any], response.json())
+
+
+class _SchemaSerializer(KafkaSerializer):
+    """Base of the serializers whose payloads follow a registered schema.
+
+    With a registry, payloads use the Confluent wire format: a magic byte and the schema id precede
+    the encoded value, and the schema is registered under "<topic>-value" or "<topic>-key".
+    Without one, payloads are the bare encoded values.
+    """
+
+    schema_type: KafkaSchemaType
+
+    def __init__(
+        self,
+        schema: str,
+        dto_type: type[BaseModel] | None,
+        registry: KafkaSchemaRegistry | None,
+        is_key: bool,
+    ) -> None:
+        self.schema = schema
+        self.dto_type = dto_type
+        self.registry = registry
+        self.is_key = is_key
+        self._schema_ids: dict[str, int] = {}
+
+    def _frame(self, payload: bytes, topic: str) -> bytes:
+        """Prefixes a payload with the wire format header of the topic's schema."""
+        if self.registry is None:
+            return payload
+        schema_id = self._schema_ids.get(topic)
+        if schema_id is None:
+            subject = f"{topic}-{'key' if self.is_key else 'value'}"
+            schema_id = self._schema_ids[topic] = self.registry.register(subject, self.schema, self.schema_type)
+        return _WIRE_HEADER.pack(_MAGIC_BYTE, schema_id) + payload
+
+    def _unframe(self, data: bytes) -> tuple[int | None, bytes]:
+        """Splits a payload into its schema id, None without a registry, and its encoded value.
+
+        Raises:
+            InvalidFormatError: If the payload does not start with a wire format header.
+        """
+        if self.registry is None:
+            return None, data
+        if len(data) < _WIRE_HEADER.size or data[0] != _MAGIC_BYTE:
+            raise InvalidFormatError(format_type="kafka_payload", expected_format="Confluent wire format")
+        return _WIRE_HEADER.unpack_from(data)[1], data[_WIRE_HEADER.size :]
+
+    def _to_record(self, value: Any) -> Any:
+        """Converts a model to plain values for the encoder."""
+        return value.model_dump(mode="json") if isinstance(value, BaseModel) else value
+
+    def _from_record(self, record: Any) -> Any:
+        """Validates a decoded record into the model when one is set."""
+        return record if self.dto_type is None else self.dto_type.model_validate(record)
+
+
+class AvroSerializer(_SchemaSerializer):
+    """Serializes records and pydantic models with an Avro schema.
+
+    Writer schemas of consumed payloads are resolved through the registry and parsed once, then
+    records are read into this serializer's schema, following Avro schema evolution. Requires the
+    ``fastavro`` package.
+
+    Args:
+        schema (dict[str, Any] | str): The Avro schema, as a dict or JSON string.
+        dto_type (type[BaseModel] | None): Model that deserialized records are validated into, or None
+            to return dicts. Defaults to None.
+        registry (KafkaSchemaRegistry | None): Registry of the schemas, or None to write bare Avro
+            payloads. Defaults to None.
+        is_key (bool): Whether the serializer encodes message keys. Defaults to False.
+
+    Example:
+        >>> registry = KafkaSchemaRegistry("http://schema-registry:8081")
+        >>> serializer = AvroSerializer(ORDER_SCHEMA, dto_type=OrderDTO, registry=registry)
+    """
+
+    schema_type: KafkaSchemaType = "AVRO"
+
+    def __init__(
+        self,
+        schema: dict[str, Any] | str,
+        dto_type: type[BaseModel] | None = None,
+        registry: KafkaSchemaRegistry | None = None,
+        is_key: bool = False,
+    ) -> None:
+        import fastavro
+
+        definition = json.loads(schema) if isinstance(schema, str) else schema
+        super().__init__(json.dumps(definition, separators=(",", ":")), dto_type, registry, is_key)
+        self._parsed_schema = fastavro.parse_schema(definition)
+        self._writer_schemas: dict[int, Any] = {}
+
+    def serialize(self, value: Any, topic: str) -> bytes:
+        """Encodes a record or model with the schema."""
+        import fastavro
+
+        buffer = io.BytesIO()
+        fastavro.schemaless_writer(buffer, self._parsed_schema, self._to_record(value))
+        return self._frame(buffer.getvalue(), topic)
+
+    def deserialize(self, data: bytes, topic: str) -> Any:
+        """Decodes a record written with any registered version of the schema."""
+        return self.deserialize_batch([data], topic)[0]
+
+    def deserialize_batch(self, payloads: Sequence[bytes], topic: str) -> list[Any]:
+        """Decodes a batch of records, resolving each writer schema once."""
+        import fastavro
+
+        reader = fastavro.schemaless_reader
+        results = []
+        for data in payloads:
+            schema_id, payload = self._unframe(data)
+            writer_schema = self._writer_schema(schema_id)
+            reader_schema = None if writer_schema is self._parsed_schema else self._parsed_schema
+            results.append(self._from_record(reader(io.BytesIO(payload), writer_schema, reader_schema)))
+        return results
+
+    def _writer_schema(self, schema_id: int | None) -> Any:
+        """Returns the parsed schema a payload was written with."""
+        if schema_id is None or self.registry is None:
+            return self._parsed_schema
+        writer_schema = self._writer_schemas.get(schema_id)
+        if writer_schema is None:
+            import fastavro
+
+            schema = self.registry.get_schema(schema_id)
+            writer_schema = self._parsed_schema if schema == self.schema else fastavro.parse_schema(json.loads(schema))
+            self._writer_schemas[schema_id] = writer_schema
+        return writer_schema
+
+
+class JsonSchemaSerializer(_SchemaSerializer):
+    """Serializes values and pydantic models as JSON described by a JSON schema.
+
+    The schema defaults to the JSON schema of the model. Values are encoded and decoded by
+    pydantic-core; validating them against the schema as well requires the ``jsonschema`` package.
+
+    Args:
+        dto_type (type[BaseModel] | None): Model that deserialized values are validated into, or None
+            to return plain JSON values. Defaults to None.
+        schema (dict[str, Any] | None): The JSON schema, or None to use the schema of the model.
+            Defaults to None.
+        registry (KafkaSchemaRegistry | None): Registry of the schemas, or None to write bare JSON
+            payloads. Defaults to None.
+        is_key (bool): Whether the serializer encodes message keys. Defaults to False.
+        validate (bool): Whether to validate values against the schema, raising InvalidFormatError for values
+            that do not match it. Defaults to False.
+
+    Raises:
+        InvalidArgumentError: If neither a model nor a schema is given.
+    """
+
+    schema_type: KafkaSchemaType = "JSON"
+
+    def __init__(
+        self,
+        dto_type: type[BaseModel] | None = None,
+        schema: dict[str, Any] | None = None,
+        registry: KafkaSchemaRegistry | None = None,
+        is_key: bool = False,
+        validate: bool = False,
+    ) -> None:
+        if schema is None:
+            if dto_type is None:
+                raise InvalidArgumentError(
+                    argument_name="schema",
+                    additional_data={"reason": "Either dto_type or schema must be provided"},
+                )
+            schema = dto_type.model_json_schema()
+        super().__init__(json.dumps(schema, separators=(",", ":")), dto_type, registry, is_key)
+        self.schema_definition = schema
+        self.validate = validate
+        self._validator: Any = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drops the compiled validator, which worker processes rebuild on first use."""
+        state = self.__dict__.copy()
+        state["_validator"] = None
+        return state
+
+    def serialize(self, value: Any, topic: str) -> bytes:
+        """Encodes a value or model as JSON."""
+        if self.validate:
+            self._check(pydantic_core.to_jsonable_python(value))
+        return self._frame(pydantic_core.to_json(value), topic)
+
+    def deserialize(self, data: bytes, topic: str) -> Any:
+        """Decodes JSON, validating it into the model when one is set."""
+        _, payload = self._unframe(data)
+        if self.validate:
+            value = pydantic_core.from_json(payload)
+            self._check(value)
+            return self._from_record(value)
+        if self.dto_type is None:
+            return pydantic_core.from_json(payload)
+        return self.dto_type.model_validate_json(payload)
+
+    def _check(self, value: Any) -> None:
+        """Validates a JSON value against the schema.
+
+        Raises:
+            InvalidFormatError: If the value does not match the schema.
+        """
+        import jsonschema
+
+        if self._validator is None:
+            self._validator = jsonschema.validators.validator_for(self.schema_definition)(self.schema_definition)
+        try:
+            self._validator.validate(value)
+        except jsonschema.ValidationError as e:
+            raise InvalidFormatError(
+                format_type="kafka_payload",
+                expected_format="JSON schema",
+                additional_data={"reason": e.message, "path": list(e.absolute_path)},
+            ) from e
+
+
+def _deserialize_chunk(
+    serializer: KafkaSerializer,
+    payloads: Sequence[bytes],
+    topic: str,
+) -> list[tuple[Any, str | None]]:
+    """Deserializes payloads in one batch, retrying them one by one to isolate failures.
+
+    Args:
+        serializer (KafkaSerializer): The serializer.
+        payloads (Sequence[bytes]): The serialized values.
+        topic (str): The topic the messages were consumed from.
+
+    Returns:
+        list[tuple[Any, str | None]]: Each value with None, or None with the reason it failed.
+    """
+    try:
+        return [(value, None) for value in serializer.deserialize_batch(payloads, topic)]
+    except Exception:
+        results: list[tuple[Any, str | None]] = []
+        for data in payloads:
+            try:
+                results.append((serializer.deserialize(data, topic), None))
+            except Exception as e:
+                results.append((None, f"{type(e).__name__}: {e}"))
+        return results
+
+
+def deserialize_payloads(
+    serializer: KafkaSerializer,
+    payloads: Sequence[bytes | None],
+    topic: str,
+    executor: Executor | None = None,
+    chunk_size: int = 256,
+) -> list[tuple[Any, Exception | None]]:
+    """Deserializes the payloads of a consumed batch, optionally in parallel.
+
+    Payloads are deserialized in chunks of ``chunk_size``; with an executor, such as a
+    ProcessPoolExecutor for CPU-heavy formats, the chunks run in parallel, while a single chunk is
+    deserialized in the calling thread to spare the round-trip. A payload that fails is
+    reported with its error instead of failing the batch. Missing payloads, such as tombstones,
+    stay None.
+
+    Args:
+        serializer (KafkaSerializer): The serializer.
+        payloads (Sequence[bytes | None]): The serialized values.
+        topic (str): The topic the messages were consumed from.
+        executor (Executor | None): Executor running the chunks, or None to run them in the calling
+            thread. Defaults to None.
+        chunk_size (int): Number of payloads per chunk. Defaults to 256.
+
+    Returns:
+        list[tuple[Any, Exception | None]]: Each value with None, or None with an InvalidFormatError.
+    """
+    results: list[tuple[Any, Exception | None]] = [(None, None)] * len(payloads)
+    indexes = [index for index, data in enumerate(payloads) if data is not None]
+    present = [data for data in payloads if data is not None]
+    chunks = [present[start : start + chunk_size] for start in range(0, len(present), chunk_size)]
+    if executor is None or len(chunks) < 2:
+        decoded = [_deserialize_chunk(serializer, chunk, topic) for chunk in chunks]
+    else:
+        futures = [executor.submit(_deserialize_chunk, serializer, chunk, topic) for chunk in chunks]
+        decoded = [future.result() for future in futures]
+    for index, (value, reason) in zip(indexes, (result for chunk in decoded for result in chunk), strict=True):
+        error = None
+        if reason is not None:
+            error = InvalidFormatError(format_type="kafka_message", additional_data={"topic": topic, "reason": reason})
+        results[index] = (value, error)
+    return results
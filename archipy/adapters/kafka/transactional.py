@@ -0,0 +1,224 @@
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import cast
+
+from confluent_kafka import Message, TopicPartition
+
+from archipy.adapters.kafka.ports import KafkaConsumerPort, KafkaProducerPort, KafkaRecord
+from archipy.models.errors import (
+    AbortedError,
+    BaseError,
+    ConnectionTimeoutError,
+    InvalidArgumentError,
+    NetworkError,
+    ServiceUnavailableError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying after transient Kafka errors in the processing loop
+_ERROR_BACKOFF_SECONDS = 1.0
+
+type KafkaTransform = Callable[[Message], Iterable[KafkaRecord]]
+type _PartitionKey = tuple[str, int]
+
+
+class KafkaTransactionalPipeline:
+    """Consumes, transforms and produces messages exactly once with Kafka transactions.
+
+    Each transaction covers up to ``batch_size`` consumed messages, collected for at most
+    ``transaction_interval_ms`` after the first one arrives. The records the transform returns for
+    these messages and the offsets following them are committed in the same transaction, so either
+    both become visible or neither does. Committing a batch rather than every message amortizes the
+    round trips to the transaction coordinator, at the cost of the output becoming visible once per
+    transaction.
+
+    When a transaction fails and must be aborted, the consumer is rewound to the first message of the
+    batch of every partition it still owns, so the batch is processed again in a new transaction. If
+    the transform raises, the transaction is aborted and rewound the same way and the error is
+    re-raised. Before partitions are revoked by a rebalance, the open transaction is committed.
+
+    Args:
+        consumer (KafkaConsumerPort): The consumer, which the pipeline subscribes and must have
+            ``ENABLE_AUTO_COMMIT`` disabled.
+        producer (KafkaProducerPort): The producer, configured with a ``TRANSACTIONAL_ID`` unique to
+            the pipeline instance and stable across its restarts.
+        topic_list (list[str]): The topics to consume.
+        transform (KafkaTransform): Returns the records to produce for one message, or none to drop it.
+        batch_size (int): Maximum number of messages per transaction. Defaults to 500.
+        poll_timeout (float): Seconds a poll waits for the first message of a batch. Defaults to 1.0.
+        transaction_interval_ms (int): Milliseconds a transaction keeps collecting messages after the
+            first one arrives. Defaults to 100.
+
+    Note:
+        Consumers of the output topics must use ``ISOLATION_LEVEL="read_committed"`` to skip the
+        records of aborted transactions.
+
+    Example:
+        >>> consumer = KafkaConsumerAdapter("enricher", topic_list=["orders"])
+        >>> producer = KafkaProducerAdapter("enriched-orders", kafka_configs=transactional_configs)
+        >>> pipeline = KafkaTransactionalPipeline(consumer, producer, ["orders"], enrich_order)
+        >>> threading.Thread(target=pipeline.run, daemon=True).start()
+        >>> ...
+        >>> pipeline.stop()
+    """
+
+    def __init__(
+        self,
+        consumer: KafkaConsumerPort,
+        producer: KafkaProducerPort,
+        topic_list: list[str],
+        transform: KafkaTransform,
+        batch_size: int = 500,
+        poll_timeout: float = 1.0,
+        transaction_interval_ms: int = 100,
+    ) -> None:
+        if batch_size < 1:
+            raise InvalidArgumentError(argument_name="batch_size")
+        if transaction_interval_ms < 0:
+            raise InvalidArgumentError(argument_name="transaction_interval_ms")
+        self.consumer = consumer
+        self.producer = producer
+        self.topic_list = topic_list
+        self.transform = transform
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
+        self.transaction_interval = transaction_interval_ms / 1000
+        self._initialized = False
+        self._in_transaction = False
+        self._message_count = 0
+        # Offset of the first message of the open transaction in each partition, to rewind to on abort
+        self._first_offsets: dict[_PartitionKey, int] = {}
+        # Offset following the last message of the open transaction in each partition, to commit
+        self._next_offsets: dict[_PartitionKey, int] = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Processes the topics in transactions until stop() is called."""
+        self._stop_event.clear()
+        self.consumer.subscribe(self.topic_list, on_revoke=self._on_revoke, on_lost=self._on_lost)
+        while not self._stop_event.is_set():
+            try:
+                self.process()
+            except (ConnectionTimeoutError, NetworkError, ServiceUnavailableError) as exception:
+                logger.warning("Processing topics %s failed: %s", self.topic_list, exception)
+                self._stop_event.wait(_ERROR_BACKOFF_SECONDS)
+
+    def stop(self) -> None:
+        """Asks run() to return once the current transaction is committed."""
+        self._stop_event.set()
+
+    def process(self) -> int:
+        """Consumes one batch and commits its output and offsets in one transaction.
+
+        Must be called from the thread that owns the consumer, once the consumer is subscribed or
+        assigned. The producer transactions are initialized on the first call.
+
+        Returns:
+            int: The number of messages committed, 0 when none arrived or the transaction was aborted.
+
+        Raises:
+            ConnectionTimeoutError: If Kafka does not answer in time; the transaction is aborted.
+            InternalError: If the producer failed fatally, for instance when fenced by a newer instance.
+            Exception: Any error of the transform, after the transaction is aborted.
+        """
+        if not self._initialized:
+            self.producer.init_transactions()
+            self._initialized = True
+        messages = self.consumer.batch_consume(self.batch_size, self.poll_timeout)
+        if not messages:
+            return 0
+        deadline = time.monotonic() + self.transaction_interval
+        try:
+            self._produce(messages)
+            while self._message_count < self.batch_size and (remaining := deadline - time.monotonic()) > 0:
+                messages = self.consumer.batch_consume(self.batch_size - self._message_count, remaining)
+                if not messages:
+                    break
+                self._produce(messages)
+            return self._commit()
+        except AbortedError as exception:
+            logger.warning("Aborting a Kafka transaction of %d messages: %s", self._message_count, exception)
+            self._abort()
+            return 0
+        except BaseException:
+            # The producer may have failed fatally, in which case aborting fails as well
+            with contextlib.suppress(BaseError):
+                self._abort()
+            raise
+
+    def _produce(self, messages: list[Message]) -> None:
+        """Produces the records of consumed messages in the open transaction, beginning one if needed.
+
+        Args:
+            messages (list[Message]): The consumed messages.
+
+        Raises:
+            ResourceExhaustedError: If the producer queue stays full.
+            NetworkError: If there is a network error producing a record.
+            InternalError: If producing a record fails.
+        """
+        if not self._in_transaction:
+            self.producer.begin_transaction()
+            self._in_transaction = True
+        for message in messages:
+            partition = (cast(str, message.topic()), cast(int, message.partition()))
+            offset = cast(int, message.offset())
+            self._first_offsets.setdefault(partition, offset)
+            for record in self.transform(message):
+                self.producer.enqueue(record)
+            self._next_offsets[partition] = offset + 1
+            self._message_count += 1
+
+    def _commit(self) -> int:
+        """Sends the offsets of the open transaction to it and commits it.
+
+        Returns:
+            int: The number of messages committed.
+        """
+        if not self._in_transaction:
+            return 0
+        offsets = [
+            TopicPartition(topic, partition, offset) for (topic, partition), offset in self._next_offsets.items()
+        ]
+        self.producer.send_offsets_to_transaction(offsets, self.consumer.consumer_group_metadata())
+        self.producer.commit_transaction()
+        message_count = self._message_count
+        logger.debug("Committed a Kafka transaction of %d messages", message_count)
+        self._reset()
+        return message_count
+
+    def _abort(self) -> None:
+        """Aborts the open transaction and rewinds the consumer to its first messages."""
+        if not self._in_transaction:
+            return
+        try:
+            self.producer.abort_transaction()
+        finally:
+            for (topic, partition), offset in self._first_offsets.items():
+                try:
+                    self.consumer.seek(TopicPartition(topic, partition, offset))
+                except BaseError:
+                    # The partition was revoked; its new owner resumes from the committed offset
+                    logger.debug("Not rewinding %s [%d], which is no longer assigned", topic, partition)
+            self._reset()
+
+    def _reset(self) -> None:
+        """Forgets the messages of the finished transaction."""
+        self._in_transaction = False
+        self._message_count = 0
+        self._first_offsets.clear()
+        self._next_offsets.clear()
+
+    def _on_revoke(self, partitions: list[TopicPartition]) -> None:
+        """Commits the open transaction while the consumer still owns its partitions."""
+        logger.info("Revoked partitions: %s", partitions)
+        self._commit()
+
+    def _on_lost(self, partitions: list[TopicPartition]) -> None:
+        """Aborts the open transaction, whose offsets can no longer be committed."""
+        logger.warning("Lost partitions: %s", partitions)
+        self._abort()
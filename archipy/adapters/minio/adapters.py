@@ -1,15 +1,32 @@
+import asyncio
+import functools
+import io
+import itertools
 import logging
-from collections.abc import Callable
+import os
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, TypeVar, cast, override
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar, cast, override
 
 from minio import Minio
+from minio.datatypes import Part
 from minio.error import S3Error
-
-from archipy.adapters.minio.ports import MinioBucketType, MinioObjectType, MinioPolicyType, MinioPort
+from minio.helpers import MAX_MULTIPART_COUNT, MAX_PART_SIZE, MIN_PART_SIZE
+
+from archipy.adapters.minio.cache import MinioCacheKeyType, MinioMetadataCache
+from archipy.adapters.minio.client import AsyncS3Client
+from archipy.adapters.minio.ports import (
+    AsyncMinioPort,
+    MinioBucketType,
+    MinioObjectType,
+    MinioPolicyType,
+    MinioPort,
+    MinioStreamSourceType,
+)
 from archipy.configs.base_config import BaseConfig
 from archipy.configs.config_template import MinioConfig
-from archipy.helpers.decorators import ttl_cache_decorator
 from archipy.models.errors import (
     AlreadyExistsError,
     ConfigurationError,
@@ -24,12 +41,196 @@ from archipy.models.errors import (
     StorageError,
 )
 
+if TYPE_CHECKING:
+    from archipy.adapters.minio.metrics import MinioMetrics
+
 # Type variables for decorators
 T = TypeVar("T")  # Return type
 F = TypeVar("F", bound=Callable[..., Any])  # Function type
 
 logger = logging.getLogger(__name__)
 
+# Most objects a multi-object delete request may name
+_DELETE_BATCH_SIZE = 1000
+
+# Longest validity of a presigned URL, 7 days
+_MAX_PRESIGNED_EXPIRY = 7 * 24 * 3600
+
+
+def _get_metrics(configs: MinioConfig) -> "MinioMetrics | None":
+    """Returns the process-wide MinIO metrics when the configuration enables them.
+
+    Args:
+        configs (MinioConfig): MinIO configuration.
+
+    Returns:
+        MinioMetrics | None: The metrics, or None when metrics are disabled.
+    """
+    if not configs.METRICS_ENABLED:
+        return None
+    from archipy.adapters.minio.metrics import get_minio_metrics
+
+    return get_minio_metrics()
+
+
+def _create_cache(configs: MinioConfig) -> MinioMetadataCache | None:
+    """Returns a metadata cache for one adapter, or None when the configuration disables caching.
+
+    Args:
+        configs (MinioConfig): MinIO configuration.
+
+    Returns:
+        MinioMetadataCache | None: The cache, or None when caching is disabled.
+    """
+    if not configs.CACHE_ENABLED:
+        return None
+    return MinioMetadataCache(
+        ttl_seconds=configs.CACHE_TTL_SECONDS,
+        maxsize=configs.CACHE_MAXSIZE,
+        metrics=_get_metrics(configs),
+    )
+
+
+def _read_part(data: BinaryIO, part_size: int) -> bytes:
+    """Read ``part_size`` bytes from a file-like object, fewer only at its end."""
+    part = data.read(part_size)
+    if not part or len(part) == part_size:
+        return part
+    buffer = bytearray(part)
+    while len(buffer) < part_size and (chunk := data.read(part_size - len(buffer))):
+        buffer += chunk
+    return bytes(buffer)
+
+
+def _iterate_async(chunks: AsyncIterable[bytes]) -> Iterator[bytes]:
+    """Iterate over an async iterable on an event loop of its own."""
+    iterator = aiter(chunks)
+
+    async def next_chunk() -> bytes | None:
+        return await anext(iterator, None)
+
+    with asyncio.Runner() as runner:
+        while (chunk := runner.run(next_chunk())) is not None:
+            yield chunk
+
+
+def _read_parts(data: MinioStreamSourceType, part_size: int) -> Iterator[bytes]:
+    """Read a stream in parts of ``part_size`` bytes, the last one possibly shorter."""
+    if hasattr(data, "read"):
+        while part := _read_part(cast(BinaryIO, data), part_size):
+            yield part
+        return
+    chunks = _iterate_async(data) if isinstance(data, AsyncIterable) else data
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _transfer_options(
+    configs: MinioConfig,
+    part_size: int | None,
+    concurrency: int | None,
+    min_part_size: int,
+) -> tuple[int, int]:
+    """Return the part size and concurrency of a streamed transfer, the configured ones if None.
+
+    Raises:
+        InvalidArgumentError: If the part size or the concurrency is out of range.
+    """
+    part_size = configs.PART_SIZE if part_size is None else part_size
+    concurrency = configs.PART_CONCURRENCY if concurrency is None else concurrency
+    if not min_part_size <= part_size <= MAX_PART_SIZE:
+        raise InvalidArgumentError(
+            argument_name="part_size",
+            additional_data={"minimum": min_part_size, "maximum": MAX_PART_SIZE},
+        )
+    if concurrency < 1:
+        raise InvalidArgumentError(argument_name="concurrency")
+    return part_size, concurrency
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the event loop running in the current thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _drain(head: list[bytes], rest: Iterator[bytes]) -> Iterator[bytes]:
+    """Yield the parts read ahead, releasing each one, then the remaining parts."""
+    while head:
+        yield head.pop(0)
+    yield from rest
+
+
+async def _aiterate(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _aread_parts(data: MinioStreamSourceType, part_size: int) -> AsyncIterator[bytes]:
+    """Read a stream in parts of ``part_size`` bytes, reading file-like objects in worker threads."""
+    if hasattr(data, "read"):
+        while part := await asyncio.to_thread(_read_part, cast(BinaryIO, data), part_size):
+            yield part
+        return
+    chunks = data if isinstance(data, AsyncIterable) else _aiterate(data)
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _aslice(parts: AsyncIterator[bytes], count: int) -> AsyncIterator[bytes]:
+    """Yield the next ``count`` parts at most."""
+    for _ in range(count):
+        part = await anext(parts, None)
+        if part is None:
+            return
+        yield part
+
+
+async def _adrain(head: list[bytes], rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield the parts read ahead, releasing each one, then the remaining parts."""
+    while head:
+        yield head.pop(0)
+    async for part in rest:
+        yield part
+
+
+async def _gather_bounded[R](calls: list[Callable[[], Awaitable[R]]], concurrency: int) -> list[R]:
+    """Run calls with at most ``concurrency`` of them at once, cancelling the others if one fails."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], Awaitable[R]]) -> R:
+        async with semaphore:
+            return await call()
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        await _cancel(tasks)
+        raise
+
+
+async def _cancel(tasks: Iterable["asyncio.Future[Any]"]) -> None:
+    """Cancel tasks and wait for them to finish, so no request outlives the transfer that sent it."""
+    tasks = list(tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class MinioExceptionHandlerMixin:
     """Mixin class to handle MinIO/S3 exceptions in a consistent way."""
@@ -131,6 +332,7 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
                 secure=self.configs.SECURE,
                 region=self.configs.REGION,
             )
+            self.cache = _create_cache(self.configs)
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -147,13 +349,16 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
 
     def clear_all_caches(self) -> None:
         """Clear all cached values."""
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if hasattr(attr, "clear_cache"):
-                attr.clear_cache()
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _cached(self, key: MinioCacheKeyType, load: Callable[[], T]) -> T:
+        """Returns a read from the metadata cache of the adapter, loading it on a miss."""
+        if self.cache is None:
+            return load()
+        return self.cache.fetch(key, load)
 
     @override
-    @ttl_cache_decorator(ttl_seconds=300, maxsize=100)  # Cache for 5 minutes
     def bucket_exists(self, bucket_name: str) -> bool:
         """Check if a bucket exists.
 
@@ -171,7 +376,7 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
         try:
             if not bucket_name:
                 raise InvalidArgumentError(argument_name="bucket_name")
-            result = self._adapter.bucket_exists(bucket_name)
+            result = self._cached(("bucket_exists", bucket_name), lambda: self._adapter.bucket_exists(bucket_name))
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -202,7 +407,6 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             if not bucket_name:
                 raise InvalidArgumentError(argument_name="bucket_name")
             self._adapter.make_bucket(bucket_name)
-            self.clear_all_caches()  # Clear cache since bucket list changed
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -210,6 +414,9 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             self._handle_s3_exception(e, "make_bucket")
         except Exception as e:
             self._handle_general_exception(e, "make_bucket")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_bucket(bucket_name)
 
     @override
     def remove_bucket(self, bucket_name: str) -> None:
@@ -229,7 +436,6 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             if not bucket_name:
                 raise InvalidArgumentError(argument_name="bucket_name")
             self._adapter.remove_bucket(bucket_name)
-            self.clear_all_caches()  # Clear cache since bucket list changed
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -237,9 +443,11 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             self._handle_s3_exception(e, "remove_bucket")
         except Exception as e:
             self._handle_general_exception(e, "remove_bucket")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_bucket(bucket_name)
 
     @override
-    @ttl_cache_decorator(ttl_seconds=300, maxsize=1)  # Cache for 5 minutes
     def list_buckets(self) -> list[MinioBucketType]:
         """List all buckets.
 
@@ -252,13 +460,16 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             StorageError: If there's a storage-related error.
         """
         try:
-            buckets = self._adapter.list_buckets()
+            buckets = self._cached(
+                ("list_buckets", ""),
+                lambda: [{"name": b.name, "creation_date": b.creation_date} for b in self._adapter.list_buckets()],
+            )
         except S3Error as e:
             self._handle_s3_exception(e, "list_buckets")
         except Exception as e:
             self._handle_general_exception(e, "list_buckets")
         else:
-            return [{"name": b.name, "creation_date": b.creation_date} for b in buckets]
+            return buckets
 
     @override
     def put_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
@@ -287,8 +498,6 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
                     ),
                 )
             self._adapter.fput_object(bucket_name, object_name, file_path)
-            if hasattr(self.list_objects, "clear_cache"):
-                self.list_objects.clear_cache()  # Clear object list cache
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -296,6 +505,9 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             self._handle_s3_exception(e, "put_object")
         except Exception as e:
             self._handle_general_exception(e, "put_object")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_object(bucket_name, object_name)
 
     @override
     def get_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
@@ -331,6 +543,212 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
         except Exception as e:
             self._handle_general_exception(e, "get_object")
 
+    @override
+    def put_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: MinioStreamSourceType,
+        content_type: str = "application/octet-stream",
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> MinioObjectType:
+        """Upload a stream of unknown length to a bucket in parts uploaded concurrently.
+
+        The stream is read one part at a time and every part is handed to a pool of ``concurrency``
+        threads. Reading pauses while that many parts are in flight, so memory stays bounded to a few
+        parts whatever the size of the stream. A stream no longer than one part is uploaded in a single
+        request. If a part fails, the multipart upload is aborted so no orphaned parts are left behind.
+
+        Async iterables are read on an event loop of their own in the calling thread, so they cannot be
+        given from a running event loop.
+
+        Args:
+            bucket_name: Destination bucket name.
+            object_name: Object name in the bucket.
+            data: A binary file-like object, or an iterable or async iterable of bytes chunks.
+            content_type: Content type of the object.
+            part_size: Size in bytes of the uploaded parts, between 5 MiB and 5 GiB. Defaults to PART_SIZE.
+            concurrency: Parts uploaded at once. Defaults to PART_CONCURRENCY.
+
+        Returns:
+            dict: The object name, size in bytes and ETag of the uploaded object.
+
+        Raises:
+            InvalidArgumentError: If a required parameter is empty, part_size or concurrency is out of range,
+                the stream needs more than 10,000 parts, or an async iterable is given from a running event loop.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to upload is denied.
+            ResourceExhaustedError: If storage limits are exceeded.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not object_name:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name or object_name"
+                        if not all([bucket_name, object_name])
+                        else "bucket_name" if not bucket_name else "object_name"
+                    ),
+                )
+            if isinstance(data, AsyncIterable) and _running_loop() is not None:
+                raise InvalidArgumentError(
+                    argument_name="data",
+                    additional_data={"reason": "Async iterables cannot be read from a running event loop"},
+                )
+            part_size, concurrency = _transfer_options(self.configs, part_size, concurrency, MIN_PART_SIZE)
+            parts = _read_parts(data, part_size)
+            head = list(itertools.islice(parts, 2))
+            if len(head) < 2:
+                part = head[0] if head else b""
+                etag = self._adapter.put_object(
+                    bucket_name,
+                    object_name,
+                    io.BytesIO(part),
+                    len(part),
+                    content_type=content_type,
+                ).etag
+                size = len(part)
+            else:
+                etag, size = self._put_parts(bucket_name, object_name, _drain(head, parts), content_type, concurrency)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "put_stream")
+        except Exception as e:
+            self._handle_general_exception(e, "put_stream")
+        else:
+            return {"object_name": object_name, "size": size, "etag": etag}
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_object(bucket_name, object_name)
+
+    def _put_parts(
+        self,
+        bucket_name: str,
+        object_name: str,
+        parts: Iterator[bytes],
+        content_type: str,
+        concurrency: int,
+    ) -> tuple[str, int]:
+        """Upload parts through a multipart upload, aborting it on failure, and return its ETag and size."""
+        # The public put_object of the minio client queues every part read for its upload threads, so
+        # the multipart requests are sent directly to keep the parts in memory bounded
+        upload_id = self._adapter._create_multipart_upload(bucket_name, object_name, {"Content-Type": content_type})
+        completed: list[Part] = []
+        size = 0
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="minio-upload") as pool:
+                pending: deque[Future[str]] = deque()
+                try:
+                    for number, part in enumerate(parts, 1):
+                        if number > MAX_MULTIPART_COUNT:
+                            raise InvalidArgumentError(
+                                argument_name="part_size",
+                                additional_data={"reason": f"The stream needs more than {MAX_MULTIPART_COUNT} parts"},
+                            )
+                        size += len(part)
+                        pending.append(
+                            pool.submit(
+                                self._adapter._upload_part, bucket_name, object_name, part, None, upload_id, number
+                            ),
+                        )
+                        if len(pending) >= concurrency:
+                            completed.append(Part(len(completed) + 1, pending.popleft().result()))
+                    while pending:
+                        completed.append(Part(len(completed) + 1, pending.popleft().result()))
+                finally:
+                    for future in pending:
+                        future.cancel()
+            result = self._adapter._complete_multipart_upload(bucket_name, object_name, upload_id, completed)
+        except BaseException:
+            try:
+                self._adapter._abort_multipart_upload(bucket_name, object_name, upload_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to abort multipart upload %s of %s/%s: %s", upload_id, bucket_name, object_name, e
+                )
+            raise
+        return cast(str, result.etag), size
+
+    @override
+    def get_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> Iterator[bytes]:
+        """Download an object as chunks fetched with concurrent ranged requests.
+
+        The object is split in ranges of ``part_size`` bytes fetched by ``concurrency`` threads and
+        yielded in order. Ranges are requested only as chunks are consumed, so at most ``concurrency``
+        chunks are held in memory. Every range is requested with the ETag of the object, so an object
+        overwritten during the download fails it rather than yielding parts of both versions.
+
+        Args:
+            bucket_name: Source bucket name.
+            object_name: Object name in the bucket.
+            part_size: Size in bytes of the ranges requested. Defaults to PART_SIZE.
+            concurrency: Ranges downloaded at once. Defaults to PART_CONCURRENCY.
+
+        Yields:
+            bytes: The chunks of the object, in order.
+
+        Raises:
+            InvalidArgumentError: If a required parameter is empty, or part_size or concurrency is out of range.
+            NotFoundError: If the bucket or object does not exist.
+            PermissionDeniedError: If permission to download is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error, such as the object being overwritten.
+        """
+        if not bucket_name or not object_name:
+            raise InvalidArgumentError(
+                argument_name=(
+                    "bucket_name or object_name"
+                    if not all([bucket_name, object_name])
+                    else "bucket_name" if not bucket_name else "object_name"
+                ),
+            )
+        part_size, concurrency = _transfer_options(self.configs, part_size, concurrency, 1)
+        try:
+            stat = self._adapter.stat_object(bucket_name, object_name)
+            size, etag = stat.size or 0, cast(str, stat.etag)
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="minio-download") as pool:
+                pending: deque[Future[bytes]] = deque()
+                try:
+                    for offset in range(0, size, part_size):
+                        length = min(part_size, size - offset)
+                        pending.append(pool.submit(self._get_range, bucket_name, object_name, offset, length, etag))
+                        if len(pending) >= concurrency:
+                            yield pending.popleft().result()
+                    while pending:
+                        yield pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+        except S3Error as e:
+            self._handle_s3_exception(e, "get_stream")
+        except Exception as e:
+            self._handle_general_exception(e, "get_stream")
+
+    def _get_range(self, bucket_name: str, object_name: str, offset: int, length: int, etag: str) -> bytes:
+        """Download a range of an object, provided the object still has the given ETag."""
+        response = self._adapter.get_object(
+            bucket_name,
+            object_name,
+            offset=offset,
+            length=length,
+            request_headers={"If-Match": f'"{etag}"'},
+        )
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
     @override
     def remove_object(self, bucket_name: str, object_name: str) -> None:
         """Remove an object from a bucket.
@@ -356,8 +774,6 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
                     ),
                 )
             self._adapter.remove_object(bucket_name, object_name)
-            if hasattr(self.list_objects, "clear_cache"):
-                self.list_objects.clear_cache()  # Clear object list cache
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -365,9 +781,11 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             self._handle_s3_exception(e, "remove_object")
         except Exception as e:
             self._handle_general_exception(e, "remove_object")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_object(bucket_name, object_name)
 
     @override
-    @ttl_cache_decorator(ttl_seconds=300, maxsize=100)  # Cache for 5 minutes
     def list_objects(
         self,
         bucket_name: str,
@@ -395,7 +813,14 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
         try:
             if not bucket_name:
                 raise InvalidArgumentError(argument_name="bucket_name")
-            objects = self._adapter.list_objects(bucket_name, prefix=prefix, recursive=recursive)
+            # The client lists lazily, so the listing is read inside the loader for its errors to be handled here
+            objects = self._cached(
+                ("list_objects", bucket_name, prefix, recursive),
+                lambda: [
+                    {"object_name": obj.object_name, "size": obj.size, "last_modified": obj.last_modified}
+                    for obj in self._adapter.list_objects(bucket_name, prefix=prefix, recursive=recursive)
+                ],
+            )
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -404,13 +829,9 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
         except Exception as e:
             self._handle_general_exception(e, "list_objects")
         else:
-            return [
-                {"object_name": obj.object_name, "size": obj.size, "last_modified": obj.last_modified}
-                for obj in objects
-            ]
+            return objects
 
     @override
-    @ttl_cache_decorator(ttl_seconds=300, maxsize=100)  # Cache for 5 minutes
     def stat_object(self, bucket_name: str, object_name: str) -> MinioObjectType:
         """Get object metadata.
 
@@ -437,7 +858,10 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
                         else "bucket_name" if not bucket_name else "object_name"
                     ),
                 )
-            obj = self._adapter.stat_object(bucket_name, object_name)
+            metadata = self._cached(
+                ("stat_object", bucket_name, object_name),
+                lambda: self._stat(bucket_name, object_name),
+            )
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -446,13 +870,18 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
         except Exception as e:
             self._handle_general_exception(e, "stat_object")
         else:
-            return {
-                "object_name": obj.object_name,
-                "size": obj.size,
-                "last_modified": obj.last_modified,
-                "content_type": obj.content_type,
-                "etag": obj.etag,
-            }
+            return metadata
+
+    def _stat(self, bucket_name: str, object_name: str) -> MinioObjectType:
+        """Reads the metadata of an object from the server."""
+        obj = self._adapter.stat_object(bucket_name, object_name)
+        return {
+            "object_name": obj.object_name,
+            "size": obj.size,
+            "last_modified": obj.last_modified,
+            "content_type": obj.content_type,
+            "etag": obj.etag,
+        }
 
     @override
     def presigned_get_object(self, bucket_name: str, object_name: str, expires: int = 3600) -> str:
@@ -572,9 +1001,11 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
             self._handle_s3_exception(e, "set_bucket_policy")
         except Exception as e:
             self._handle_general_exception(e, "set_bucket_policy")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_policy(bucket_name)
 
     @override
-    @ttl_cache_decorator(ttl_seconds=300, maxsize=100)  # Cache for 5 minutes
     def get_bucket_policy(self, bucket_name: str) -> MinioPolicyType:
         """Get bucket policy.
 
@@ -594,7 +1025,956 @@ class MinioAdapter(MinioPort, MinioExceptionHandlerMixin):
         try:
             if not bucket_name:
                 raise InvalidArgumentError(argument_name="bucket_name")
-            policy = self._adapter.get_bucket_policy(bucket_name)
+            policy = self._cached(
+                ("get_bucket_policy", bucket_name),
+                lambda: self._adapter.get_bucket_policy(bucket_name),
+            )
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "get_bucket_policy")
+        except Exception as e:
+            self._handle_general_exception(e, "get_bucket_policy")
+        else:
+            return {"policy": policy}
+
+
+class AsyncMinioAdapter(AsyncMinioPort, MinioExceptionHandlerMixin):
+    """Concrete implementation of the AsyncMinioPort interface over a pooled aiohttp session.
+
+    Requests are signed and parsed by the minio library but sent through aiohttp, so no call blocks
+    the event loop. Connections are pooled up to CONNECTION_POOL_SIZE and reused across requests;
+    call close to release them. Metadata reads are cached and invalidated like those of MinioAdapter.
+    """
+
+    def __init__(self, minio_configs: MinioConfig | None = None) -> None:
+        """Initialize AsyncMinioAdapter with configuration.
+
+        Args:
+            minio_configs: Optional MinIO configuration. If None, global config is used.
+
+        Raises:
+            InvalidArgumentError: If required parameters are missing.
+            InternalError: If the adapter cannot be initialized.
+        """
+        try:
+            # Determine config source (explicit or from global config)
+            if minio_configs is not None:
+                self.configs = minio_configs
+            else:
+                # First get global config, then extract MINIO config
+                global_config: Any = BaseConfig.global_config()
+                if not hasattr(global_config, "MINIO"):
+                    raise InvalidArgumentError(argument_name="MINIO")
+                self.configs = cast(MinioConfig, global_config.MINIO)
+
+            # Ensure we have a valid endpoint value
+            endpoint = str(self.configs.ENDPOINT or "")
+            if not endpoint:
+                raise InvalidArgumentError(argument_name="endpoint")
+
+            self._adapter = AsyncS3Client(
+                endpoint,
+                access_key=self.configs.ACCESS_KEY,
+                secret_key=self.configs.SECRET_KEY,
+                session_token=self.configs.SESSION_TOKEN,
+                secure=self.configs.SECURE,
+                region=self.configs.REGION,
+                pool_size=self.configs.CONNECTION_POOL_SIZE,
+            )
+            self.cache = _create_cache(self.configs)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except Exception as e:
+            raise InternalError(additional_data={"component": "MinIO"}) from e
+
+    async def close(self) -> None:
+        """Close the pooled connections of the adapter."""
+        await self._adapter.close()
+
+    def clear_all_caches(self) -> None:
+        """Clear all cached values."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    async def _cached(self, key: MinioCacheKeyType, load: Callable[[], Awaitable[T]]) -> T:
+        """Returns a read from the metadata cache of the adapter, loading it on a miss."""
+        if self.cache is None:
+            return await load()
+        found, value = self.cache.lookup(key)
+        if found:
+            return cast(T, value)
+        generation = self.cache.generation(key)
+        value = await load()
+        self.cache.store(key, value, generation)
+        return value
+
+    def _batch_concurrency(self, concurrency: int | None) -> int:
+        """Return the concurrency of a batch operation, the configured one if None.
+
+        Raises:
+            InvalidArgumentError: If the concurrency is below 1.
+        """
+        concurrency = self.configs.BATCH_CONCURRENCY if concurrency is None else concurrency
+        if concurrency < 1:
+            raise InvalidArgumentError(argument_name="concurrency")
+        return concurrency
+
+    @override
+    async def bucket_exists(self, bucket_name: str) -> bool:
+        """Check if a bucket exists.
+
+        Args:
+            bucket_name: Name of the bucket to check.
+
+        Returns:
+            bool: True if bucket exists, False otherwise.
+
+        Raises:
+            InvalidArgumentError: If bucket_name is empty.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name:
+                raise InvalidArgumentError(argument_name="bucket_name")
+            result = await self._cached(
+                ("bucket_exists", bucket_name), lambda: self._adapter.bucket_exists(bucket_name)
+            )
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "bucket_exists")
+        except Exception as e:
+            self._handle_general_exception(e, "bucket_exists")
+        else:
+            return result
+
+    @override
+    async def make_bucket(self, bucket_name: str) -> None:
+        """Create a new bucket.
+
+        Args:
+            bucket_name: Name of the bucket to create.
+
+        Raises:
+            InvalidArgumentError: If bucket_name is empty.
+            AlreadyExistsError: If the bucket already exists.
+            PermissionDeniedError: If permission to create bucket is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name:
+                raise InvalidArgumentError(argument_name="bucket_name")
+            await self._adapter.make_bucket(bucket_name)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "make_bucket")
+        except Exception as e:
+            self._handle_general_exception(e, "make_bucket")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_bucket(bucket_name)
+
+    @override
+    async def remove_bucket(self, bucket_name: str) -> None:
+        """Remove a bucket.
+
+        Args:
+            bucket_name: Name of the bucket to remove.
+
+        Raises:
+            InvalidArgumentError: If bucket_name is empty.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to delete bucket is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name:
+                raise InvalidArgumentError(argument_name="bucket_name")
+            await self._adapter.remove_bucket(bucket_name)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "remove_bucket")
+        except Exception as e:
+            self._handle_general_exception(e, "remove_bucket")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_bucket(bucket_name)
+
+    @override
+    async def list_buckets(self) -> list[MinioBucketType]:
+        """List all buckets.
+
+        Returns:
+            list: List of buckets and their creation dates.
+
+        Raises:
+            PermissionDeniedError: If permission to list buckets is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+
+        async def load() -> list[MinioBucketType]:
+            return [{"name": b.name, "creation_date": b.creation_date} for b in await self._adapter.list_buckets()]
+
+        try:
+            buckets = await self._cached(("list_buckets", ""), load)
+        except S3Error as e:
+            self._handle_s3_exception(e, "list_buckets")
+        except Exception as e:
+            self._handle_general_exception(e, "list_buckets")
+        else:
+            return buckets
+
+    @override
+    async def put_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
+        """Upload a file to a bucket.
+
+        The file is read in PART_SIZE parts in worker threads, and files larger than a part are
+        uploaded in up to PART_CONCURRENCY parts at once.
+
+        Args:
+            bucket_name: Destination bucket name.
+            object_name: Object name in the bucket.
+            file_path: Local file path to upload.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to upload is denied.
+            ResourceExhaustedError: If storage limits are exceeded.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not object_name or not file_path:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name, object_name or file_path"
+                        if not all([bucket_name, object_name, file_path])
+                        else "bucket_name" if not bucket_name else "object_name" if not object_name else "file_path"
+                    ),
+                )
+            file = await asyncio.to_thread(open, file_path, "rb")
+            try:
+                await self._put(bucket_name, object_name, file, "application/octet-stream", None, None)
+            finally:
+                await asyncio.to_thread(file.close)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "put_object")
+        except Exception as e:
+            self._handle_general_exception(e, "put_object")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_object(bucket_name, object_name)
+
+    @override
+    async def get_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
+        """Download an object to a file.
+
+        The object is downloaded in PART_SIZE ranges, up to PART_CONCURRENCY at once, to a temporary
+        file written in worker threads and moved to file_path once complete.
+
+        Args:
+            bucket_name: Source bucket name.
+            object_name: Object name in the bucket.
+            file_path: Local file path to save the object.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty.
+            NotFoundError: If the bucket or object does not exist.
+            PermissionDeniedError: If permission to download is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not object_name or not file_path:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name, object_name or file_path"
+                        if not all([bucket_name, object_name, file_path])
+                        else "bucket_name" if not bucket_name else "object_name" if not object_name else "file_path"
+                    ),
+                )
+            part_size, concurrency = _transfer_options(self.configs, None, None, 1)
+            if directory := os.path.dirname(file_path):
+                await asyncio.to_thread(os.makedirs, directory, exist_ok=True)
+            part_path = f"{file_path}.part.minio"
+            file = await asyncio.to_thread(open, part_path, "wb")
+            try:
+                async for chunk in self._get_chunks(bucket_name, object_name, part_size, concurrency):
+                    await asyncio.to_thread(file.write, chunk)
+            except BaseException:
+                await asyncio.to_thread(file.close)
+                await asyncio.to_thread(os.remove, part_path)
+                raise
+            await asyncio.to_thread(file.close)
+            await asyncio.to_thread(os.replace, part_path, file_path)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "get_object")
+        except Exception as e:
+            self._handle_general_exception(e, "get_object")
+
+    @override
+    async def put_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: MinioStreamSourceType,
+        content_type: str = "application/octet-stream",
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> MinioObjectType:
+        """Upload a stream of unknown length to a bucket in parts uploaded concurrently.
+
+        The stream is read one part at a time, file-like objects in worker threads, and up to
+        ``concurrency`` parts are uploaded at once. Reading pauses while that many parts are in flight,
+        so memory stays bounded to a few parts whatever the size of the stream. A stream no longer than
+        one part is uploaded in a single request. If a part fails, the multipart upload is aborted so no
+        orphaned parts are left behind.
+
+        Args:
+            bucket_name: Destination bucket name.
+            object_name: Object name in the bucket.
+            data: A binary file-like object, or an iterable or async iterable of bytes chunks.
+            content_type: Content type of the object.
+            part_size: Size in bytes of the uploaded parts, between 5 MiB and 5 GiB. Defaults to PART_SIZE.
+            concurrency: Parts uploaded at once. Defaults to PART_CONCURRENCY.
+
+        Returns:
+            dict: The object name, size in bytes and ETag of the uploaded object.
+
+        Raises:
+            InvalidArgumentError: If a required parameter is empty, part_size or concurrency is out of range,
+                or the stream needs more than 10,000 parts.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to upload is denied.
+            ResourceExhaustedError: If storage limits are exceeded.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not object_name:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name or object_name"
+                        if not all([bucket_name, object_name])
+                        else "bucket_name" if not bucket_name else "object_name"
+                    ),
+                )
+            etag, size = await self._put(bucket_name, object_name, data, content_type, part_size, concurrency)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "put_stream")
+        except Exception as e:
+            self._handle_general_exception(e, "put_stream")
+        else:
+            return {"object_name": object_name, "size": size, "etag": etag}
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_object(bucket_name, object_name)
+
+    async def _put(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: MinioStreamSourceType,
+        content_type: str,
+        part_size: int | None,
+        concurrency: int | None,
+    ) -> tuple[str, int]:
+        """Upload a stream in one request if it fits in a part, in a multipart upload otherwise."""
+        part_size, concurrency = _transfer_options(self.configs, part_size, concurrency, MIN_PART_SIZE)
+        parts = _aread_parts(data, part_size)
+        head = [part async for part in _aslice(parts, 2)]
+        if len(head) < 2:
+            part = head[0] if head else b""
+            return await self._adapter.put_object(bucket_name, object_name, part, content_type), len(part)
+        return await self._put_parts(bucket_name, object_name, _adrain(head, parts), content_type, concurrency)
+
+    async def _put_parts(
+        self,
+        bucket_name: str,
+        object_name: str,
+        parts: AsyncIterator[bytes],
+        content_type: str,
+        concurrency: int,
+    ) -> tuple[str, int]:
+        """Upload parts through a multipart upload, aborting it on failure, and return its ETag and size."""
+        upload_id = await self._adapter.create_multipart_upload(bucket_name, object_name, content_type)
+        completed: list[Part] = []
+        size = 0
+        try:
+            pending: deque[asyncio.Task[str]] = deque()
+            try:
+                number = 0
+                async for part in parts:
+                    number += 1
+                    if number > MAX_MULTIPART_COUNT:
+                        raise InvalidArgumentError(
+                            argument_name="part_size",
+                            additional_data={"reason": f"The stream needs more than {MAX_MULTIPART_COUNT} parts"},
+                        )
+                    size += len(part)
+                    pending.append(
+                        asyncio.create_task(
+                            self._adapter.upload_part(bucket_name, object_name, part, upload_id, number),
+                        ),
+                    )
+                    if len(pending) >= concurrency:
+                        completed.append(Part(len(completed) + 1, await pending.popleft()))
+                while pending:
+                    completed.append(Part(len(completed) + 1, await pending.popleft()))
+            finally:
+                await _cancel(pending)
+            etag = await self._adapter.complete_multipart_upload(bucket_name, object_name, upload_id, completed)
+        except BaseException:
+            try:
+                await self._adapter.abort_multipart_upload(bucket_name, object_name, upload_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to abort multipart upload %s of %s/%s: %s", upload_id, bucket_name, object_name, e
+                )
+            raise
+        return etag, size
+
+    @override
+    async def get_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Download an object as chunks fetched with concurrent ranged requests.
+
+        The object is split in ranges of ``part_size`` bytes, up to ``concurrency`` of them requested at
+        once, and yielded in order. Ranges are requested only as chunks are consumed, so at most
+        ``concurrency`` chunks are held in memory. Every range is requested with the ETag of the object,
+        so an object overwritten during the download fails it rather than yielding parts of both versions.
+
+        Args:
+            bucket_name: Source bucket name.
+            object_name: Object name in the bucket.
+            part_size: Size in bytes of the ranges requested. Defaults to PART_SIZE.
+            concurrency: Ranges downloaded at once. Defaults to PART_CONCURRENCY.
+
+        Yields:
+            bytes: The chunks of the object, in order.
+
+        Raises:
+            InvalidArgumentError: If a required parameter is empty, or part_size or concurrency is out of range.
+            NotFoundError: If the bucket or object does not exist.
+            PermissionDeniedError: If permission to download is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error, such as the object being overwritten.
+        """
+        if not bucket_name or not object_name:
+            raise InvalidArgumentError(
+                argument_name=(
+                    "bucket_name or object_name"
+                    if not all([bucket_name, object_name])
+                    else "bucket_name" if not bucket_name else "object_name"
+                ),
+            )
+        part_size, concurrency = _transfer_options(self.configs, part_size, concurrency, 1)
+        try:
+            async for chunk in self._get_chunks(bucket_name, object_name, part_size, concurrency):
+                yield chunk
+        except S3Error as e:
+            self._handle_s3_exception(e, "get_stream")
+        except Exception as e:
+            self._handle_general_exception(e, "get_stream")
+
+    async def _get_chunks(
+        self,
+        bucket_name: str,
+        object_name: str,
+        part_size: int,
+        concurrency: int,
+    ) -> AsyncIterator[bytes]:
+        """Download an object in ranges requested concurrently, provided its ETag does not change."""
+        stat = await self._adapter.stat_object(bucket_name, object_name)
+        size, etag = stat.size or 0, cast(str, stat.etag)
+        pending: deque[asyncio.Task[bytes]] = deque()
+        try:
+            for offset in range(0, size, part_size):
+                length = min(part_size, size - offset)
+                pending.append(
+                    asyncio.create_task(self._adapter.get_object(bucket_name, object_name, offset, length, etag)),
+                )
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            await _cancel(pending)
+
+    @override
+    async def remove_object(self, bucket_name: str, object_name: str) -> None:
+        """Remove an object from a bucket.
+
+        Args:
+            bucket_name: Bucket name.
+            object_name: Object name to remove.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty.
+            NotFoundError: If the bucket or object does not exist.
+            PermissionDeniedError: If permission to remove is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not object_name:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name or object_name"
+                        if not all([bucket_name, object_name])
+                        else "bucket_name" if not bucket_name else "object_name"
+                    ),
+                )
+            await self._adapter.remove_object(bucket_name, object_name)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "remove_object")
+        except Exception as e:
+            self._handle_general_exception(e, "remove_object")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_object(bucket_name, object_name)
+
+    @override
+    async def list_objects(
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        *,
+        recursive: bool = False,
+    ) -> list[MinioObjectType]:
+        """List objects in a bucket.
+
+        Args:
+            bucket_name: Bucket name.
+            prefix: Optional prefix to filter objects.
+            recursive: Whether to list objects recursively.
+
+        Returns:
+            list: List of objects with metadata.
+
+        Raises:
+            InvalidArgumentError: If bucket_name is empty.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to list objects is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+
+        async def load() -> list[MinioObjectType]:
+            return [
+                {"object_name": obj.object_name, "size": obj.size, "last_modified": obj.last_modified}
+                for obj in await self._adapter.list_objects(bucket_name, prefix, recursive)
+            ]
+
+        try:
+            if not bucket_name:
+                raise InvalidArgumentError(argument_name="bucket_name")
+            objects = await self._cached(("list_objects", bucket_name, prefix, recursive), load)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "list_objects")
+        except Exception as e:
+            self._handle_general_exception(e, "list_objects")
+        else:
+            return objects
+
+    @override
+    async def stat_object(self, bucket_name: str, object_name: str) -> MinioObjectType:
+        """Get object metadata.
+
+        Args:
+            bucket_name: Bucket name.
+            object_name: Object name to get stats for.
+
+        Returns:
+            dict: Object metadata including name, size, last modified date, etc.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty.
+            NotFoundError: If the bucket or object does not exist.
+            PermissionDeniedError: If permission to get stats is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not object_name:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name or object_name"
+                        if not all([bucket_name, object_name])
+                        else "bucket_name" if not bucket_name else "object_name"
+                    ),
+                )
+            metadata = await self._stat(bucket_name, object_name)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "stat_object")
+        except Exception as e:
+            self._handle_general_exception(e, "stat_object")
+        else:
+            return metadata
+
+    async def _stat(self, bucket_name: str, object_name: str) -> MinioObjectType:
+        """Reads the metadata of an object through the metadata cache."""
+
+        async def load() -> MinioObjectType:
+            obj = await self._adapter.stat_object(bucket_name, object_name)
+            return {
+                "object_name": obj.object_name,
+                "size": obj.size,
+                "last_modified": obj.last_modified,
+                "content_type": obj.content_type,
+                "etag": obj.etag,
+            }
+
+        return await self._cached(("stat_object", bucket_name, object_name), load)
+
+    @override
+    async def stat_objects(
+        self,
+        bucket_name: str,
+        object_names: Iterable[str],
+        concurrency: int | None = None,
+    ) -> dict[str, MinioObjectType | None]:
+        """Get the metadata of many objects with concurrent requests.
+
+        Metadata already cached is returned without a request. The others are requested up to
+        ``concurrency`` at a time over the pooled connections.
+
+        Args:
+            bucket_name: Bucket name.
+            object_names: Names of the objects.
+            concurrency: Requests sent at once. Defaults to BATCH_CONCURRENCY.
+
+        Returns:
+            dict: The metadata of every object by name, None for the objects that do not exist.
+
+        Raises:
+            InvalidArgumentError: If bucket_name or an object name is empty, or concurrency is below 1.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to get stats is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+
+        async def stat(object_name: str) -> MinioObjectType | None:
+            try:
+                return await self._stat(bucket_name, object_name)
+            except S3Error as e:
+                if e.code != "NoSuchKey":
+                    raise
+                return None
+
+        try:
+            names = list(dict.fromkeys(object_names))
+            if not bucket_name or not all(names):
+                raise InvalidArgumentError(argument_name="bucket_name" if not bucket_name else "object_names")
+            concurrency = self._batch_concurrency(concurrency)
+            results = await _gather_bounded([functools.partial(stat, name) for name in names], concurrency)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "stat_objects")
+        except Exception as e:
+            self._handle_general_exception(e, "stat_objects")
+        else:
+            return dict(zip(names, results, strict=True))
+
+    @override
+    async def remove_objects(
+        self,
+        bucket_name: str,
+        object_names: Iterable[str],
+        concurrency: int | None = None,
+    ) -> list[MinioObjectType]:
+        """Remove many objects with multi-object delete requests of up to 1000 objects sent concurrently.
+
+        Objects that do not exist count as removed, as S3 reports them. Objects the server fails to
+        remove are returned rather than raised, so one failure does not hide the outcome of the others.
+
+        Args:
+            bucket_name: Bucket name.
+            object_names: Names of the objects to remove.
+            concurrency: Requests sent at once. Defaults to BATCH_CONCURRENCY.
+
+        Returns:
+            list: The name, error code and message of every object that could not be removed.
+
+        Raises:
+            InvalidArgumentError: If bucket_name or an object name is empty, or concurrency is below 1.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to remove is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        names = list(dict.fromkeys(object_names))
+        try:
+            if not bucket_name or not all(names):
+                raise InvalidArgumentError(argument_name="bucket_name" if not bucket_name else "object_names")
+            concurrency = self._batch_concurrency(concurrency)
+            batches = [names[start : start + _DELETE_BATCH_SIZE] for start in range(0, len(names), _DELETE_BATCH_SIZE)]
+            results = await _gather_bounded(
+                [functools.partial(self._adapter.remove_objects, bucket_name, batch) for batch in batches],
+                concurrency,
+            )
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "remove_objects")
+        except Exception as e:
+            self._handle_general_exception(e, "remove_objects")
+        else:
+            return [
+                {"object_name": error.name, "code": error.code, "message": error.message}
+                for errors in results
+                for error in errors
+            ]
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_objects(bucket_name, names)
+
+    @override
+    async def copy_objects(
+        self,
+        source_bucket_name: str,
+        destination_bucket_name: str,
+        object_names: Iterable[str] | Mapping[str, str],
+        concurrency: int | None = None,
+    ) -> list[MinioObjectType]:
+        """Copy many objects on the server with concurrent requests.
+
+        The data never leaves the server: every object is copied by a CopyObject request, so each
+        object may be up to 5 GiB. Up to ``concurrency`` copies run at once.
+
+        Args:
+            source_bucket_name: Bucket the objects are copied from.
+            destination_bucket_name: Bucket the objects are copied to.
+            object_names: Names of the objects, kept by the copies, or a mapping of source to destination names.
+            concurrency: Requests sent at once. Defaults to BATCH_CONCURRENCY.
+
+        Returns:
+            list: The name, ETag and modification time of every copy, in the order given.
+
+        Raises:
+            InvalidArgumentError: If a bucket name or an object name is empty, or concurrency is below 1.
+            NotFoundError: If a bucket or a source object does not exist.
+            PermissionDeniedError: If permission to copy is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        copies = list(object_names.items()) if isinstance(object_names, Mapping) else [(n, n) for n in object_names]
+
+        async def copy(source_name: str, destination_name: str) -> MinioObjectType:
+            etag, last_modified = await self._adapter.copy_object(
+                destination_bucket_name,
+                destination_name,
+                source_bucket_name,
+                source_name,
+            )
+            return {"object_name": destination_name, "etag": etag, "last_modified": last_modified}
+
+        try:
+            if not source_bucket_name or not destination_bucket_name:
+                raise InvalidArgumentError(
+                    argument_name="source_bucket_name" if not source_bucket_name else "destination_bucket_name",
+                )
+            if not all(source and destination for source, destination in copies):
+                raise InvalidArgumentError(argument_name="object_names")
+            concurrency = self._batch_concurrency(concurrency)
+            results = await _gather_bounded(
+                [functools.partial(copy, source, destination) for source, destination in copies],
+                concurrency,
+            )
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "copy_objects")
+        except Exception as e:
+            self._handle_general_exception(e, "copy_objects")
+        else:
+            return results
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_objects(destination_bucket_name, [destination for _, destination in copies])
+
+    @override
+    async def presigned_get_object(self, bucket_name: str, object_name: str, expires: int = 3600) -> str:
+        """Generate a presigned URL for downloading an object.
+
+        The URL is signed locally; only the region of the bucket may be requested, once, when no
+        REGION is configured.
+
+        Args:
+            bucket_name: Bucket name.
+            object_name: Object name to generate URL for.
+            expires: URL expiry time in seconds, up to 7 days.
+
+        Returns:
+            str: Presigned URL for downloading the object.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty or expires is out of range.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to generate URL is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        return await self._presigned_url("GET", bucket_name, object_name, expires, "presigned_get_object")
+
+    @override
+    async def presigned_put_object(self, bucket_name: str, object_name: str, expires: int = 3600) -> str:
+        """Generate a presigned URL for uploading an object.
+
+        The URL is signed locally; only the region of the bucket may be requested, once, when no
+        REGION is configured.
+
+        Args:
+            bucket_name: Bucket name.
+            object_name: Object name to generate URL for.
+            expires: URL expiry time in seconds, up to 7 days.
+
+        Returns:
+            str: Presigned URL for uploading the object.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty or expires is out of range.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to generate URL is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        return await self._presigned_url("PUT", bucket_name, object_name, expires, "presigned_put_object")
+
+    async def _presigned_url(
+        self,
+        method: str,
+        bucket_name: str,
+        object_name: str,
+        expires: int,
+        operation: str,
+    ) -> str:
+        try:
+            if not bucket_name or not object_name:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name or object_name"
+                        if not all([bucket_name, object_name])
+                        else "bucket_name" if not bucket_name else "object_name"
+                    ),
+                )
+            if not 1 <= expires <= _MAX_PRESIGNED_EXPIRY:
+                raise InvalidArgumentError(
+                    argument_name="expires",
+                    additional_data={"minimum": 1, "maximum": _MAX_PRESIGNED_EXPIRY},
+                )
+            url = await self._adapter.presigned_url(method, bucket_name, object_name, timedelta(seconds=expires))
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, operation)
+        except Exception as e:
+            self._handle_general_exception(e, operation)
+        else:
+            return url
+
+    @override
+    async def set_bucket_policy(self, bucket_name: str, policy: str) -> None:
+        """Set bucket policy.
+
+        Args:
+            bucket_name: Bucket name.
+            policy: JSON policy string.
+
+        Raises:
+            InvalidArgumentError: If any required parameter is empty.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to set policy is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name or not policy:
+                raise InvalidArgumentError(
+                    argument_name=(
+                        "bucket_name or policy"
+                        if not all([bucket_name, policy])
+                        else "bucket_name" if not bucket_name else "policy"
+                    ),
+                )
+            await self._adapter.set_bucket_policy(bucket_name, policy)
+        except InvalidArgumentError:
+            # Pass through our custom errors
+            raise
+        except S3Error as e:
+            self._handle_s3_exception(e, "set_bucket_policy")
+        except Exception as e:
+            self._handle_general_exception(e, "set_bucket_policy")
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate_policy(bucket_name)
+
+    @override
+    async def get_bucket_policy(self, bucket_name: str) -> MinioPolicyType:
+        """Get bucket policy.
+
+        Args:
+            bucket_name: Bucket name.
+
+        Returns:
+            dict: Bucket policy information.
+
+        Raises:
+            InvalidArgumentError: If bucket_name is empty.
+            NotFoundError: If the bucket does not exist.
+            PermissionDeniedError: If permission to get policy is denied.
+            ServiceUnavailableError: If the MinIO service is unavailable.
+            StorageError: If there's a storage-related error.
+        """
+        try:
+            if not bucket_name:
+                raise InvalidArgumentError(argument_name="bucket_name")
+            policy = await self._cached(
+                ("get_bucket_policy", bucket_name),
+                lambda: self._adapter.get_bucket_policy(bucket_name),
+            )
         except InvalidArgumentError:
             # Pass through our custom errors
             raise
@@ -0,0 +1,164 @@
+import copy
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from typing import TYPE_CHECKING, TypeVar
+
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from archipy.adapters.minio.metrics import MinioMetrics
+
+T = TypeVar("T")
+
+# Cache keys are (operation, bucket name, *arguments); bucket-wide operations use an empty bucket name
+MinioCacheKeyType = tuple[Hashable, ...]
+
+
+class MinioMetadataCache:
+    """Cache of the bucket and object metadata read by one MinIO adapter, invalidated by its writes.
+
+    Each adapter owns its cache, so adapters pointing at different endpoints never share entries.
+    Writes drop only the entries they affect: uploading or removing an object drops its metadata
+    and the listings whose prefix covers it, changing a policy drops that policy, and creating or
+    removing a bucket drops everything cached about it and the bucket list. A read that was in
+    flight while its bucket was written is returned but not cached, so it cannot bring back a
+    result predating the write. Hits return copies, so callers may modify the results.
+
+    Args:
+        ttl_seconds (float): Seconds an entry is cached. Defaults to 300.
+        maxsize (int): Maximum number of entries, the least recently used being evicted first.
+            Defaults to 1000.
+        metrics (MinioMetrics | None): Metrics the lookups and invalidations are counted in.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        maxsize: int = 1000,
+        metrics: "MinioMetrics | None" = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.metrics = metrics
+        self.hits = 0
+        self.misses = 0
+        self._entries: TTLCache[MinioCacheKeyType, object] = TTLCache(maxsize=max(maxsize, 1), ttl=ttl_seconds)
+        # Invalidations of every bucket, telling reads that overlapped a write not to cache their result
+        self._generations: dict[str, int] = {}
+        self._cleared = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the lookups served from the cache, 0.0 before any lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def fetch(self, key: MinioCacheKeyType, load: Callable[[], T]) -> T:
+        """Returns the cached value of a key, loading and caching it on a miss.
+
+        Args:
+            key (MinioCacheKeyType): The operation, the bucket name and the arguments of the read.
+            load (Callable[[], T]): Reads the value from the server.
+
+        Returns:
+            T: The value.
+        """
+        found, value = self.lookup(key)
+        if found:
+            return value  # type: ignore[return-value]
+        generation = self.generation(key)
+        value = load()
+        self.store(key, value, generation)
+        return value
+
+    def lookup(self, key: MinioCacheKeyType) -> tuple[bool, object]:
+        """Returns a copy of the cached value of a key, counting the hit or the miss.
+
+        Args:
+            key (MinioCacheKeyType): The cache key.
+
+        Returns:
+            tuple[bool, object]: Whether the key is cached, and its value if it is.
+        """
+        with self._lock:
+            found = key in self._entries
+            value = self._entries.get(key)
+        self._record(str(key[0]), "hit" if found else "miss")
+        return found, copy.deepcopy(value) if found else None
+
+    def generation(self, key: MinioCacheKeyType) -> int:
+        """Returns the invalidation count of the bucket of a key, to be given back to store."""
+        with self._lock:
+            return self._cleared + self._generations.get(str(key[1]), 0)
+
+    def store(self, key: MinioCacheKeyType, value: object, generation: int) -> None:
+        """Caches a value read from the server, unless its bucket was written since the read began.
+
+        Args:
+            key (MinioCacheKeyType): The cache key.
+            value (object): The value read.
+            generation (int): The generation of the bucket when the read began.
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if self._cleared + self._generations.get(str(key[1]), 0) == generation:
+                self._entries[key] = copy.deepcopy(value)
+
+    def invalidate_object(self, bucket_name: str, object_name: str) -> None:
+        """Drops the metadata of an object and the listings of its bucket whose prefix covers it.
+
+        Args:
+            bucket_name (str): The bucket of the object.
+            object_name (str): The name of the object written or removed.
+        """
+        self.invalidate_objects(bucket_name, [object_name])
+
+    def invalidate_objects(self, bucket_name: str, object_names: Iterable[str]) -> None:
+        """Drops the metadata of objects and the listings of their bucket whose prefix covers any of them.
+
+        Args:
+            bucket_name (str): The bucket of the objects.
+            object_names (Iterable[str]): The names of the objects written or removed.
+        """
+        names = set(object_names)
+        self._invalidate(
+            bucket_name,
+            lambda key: (key[0] == "stat_object" and key[2] in names)
+            or (key[0] == "list_objects" and any(name.startswith(str(key[2])) for name in names)),
+        )
+
+    def invalidate_policy(self, bucket_name: str) -> None:
+        """Drops the cached policy of a bucket."""
+        self._invalidate(bucket_name, lambda key: key[0] == "get_bucket_policy")
+
+    def invalidate_bucket(self, bucket_name: str) -> None:
+        """Drops everything cached about a bucket, and the bucket list."""
+        self._invalidate(bucket_name, lambda _: True)
+        self._invalidate("", lambda key: key[0] == "list_buckets")
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        with self._lock:
+            self._cleared += 1
+            self._entries.clear()
+
+    def _invalidate(self, bucket_name: str, matches: Callable[[MinioCacheKeyType], bool]) -> None:
+        with self._lock:
+            self._generations[bucket_name] = self._generations.get(bucket_name, 0) + 1
+            dropped = [key for key in list(self._entries) if key[1] == bucket_name and matches(key)]
+            for key in dropped:
+                self._entries.pop(key, None)
+        if self.metrics is not None:
+            for key in dropped:
+                self.metrics.cache_invalidations.labels(str(key[0])).inc()
+
+    def _record(self, operation: str, result: str) -> None:
+        if result == "hit":
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.metrics is not None:
+            self.metrics.cache_lookups.labels(operation, result).inc()
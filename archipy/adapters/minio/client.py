@@ -0,0 +1,419 @@
+"""Asynchronous S3 client used by the async MinIO adapter.
+
+The minio library only ships a blocking client, so this client sends the same S3 requests over a
+pooled aiohttp session. Request signing, URL building and response parsing are delegated to the
+minio library, so both adapters address, sign and read S3 responses the same way.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, cast
+from urllib.parse import urlunsplit
+from xml.etree import ElementTree as ET
+
+from minio.credentials.credentials import Credentials
+from minio.credentials.providers import StaticProvider
+from minio.datatypes import (
+    Bucket,
+    CompleteMultipartUploadResult,
+    ListAllMyBucketsResult,
+    Object,
+    Part,
+    parse_copy_object,
+    parse_list_objects,
+)
+from minio.deleteobjects import DeleteError, DeleteObject, DeleteRequest, DeleteResult
+from minio.error import S3Error, ServerError
+from minio.helpers import BaseURL, DictType, md5sum_hash, quote, sha256_hash
+from minio.signer import presign_v4, sign_v4_s3
+from minio.time import from_http_header, to_amz_date, utcnow
+from minio.xml import Element, SubElement, findtext, getbytes, marshal, unmarshal
+from urllib3 import HTTPResponse
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_DEFAULT_REGION = "us-east-1"
+
+# Status codes of the error responses that carry no XML body, as minio maps them
+_STATUS_ERRORS = {
+    403: ("AccessDenied", "Access denied"),
+    405: ("MethodNotAllowed", "The specified method is not allowed against this resource"),
+    501: ("MethodNotAllowed", "The specified method is not allowed against this resource"),
+}
+
+
+class AsyncS3Client:
+    """Sends S3 requests over a pooled aiohttp session.
+
+    The session is created on first use in the running event loop and holds up to ``pool_size``
+    connections, reused across requests. A client used from another event loop opens a session of
+    its own there, since aiohttp sessions are bound to the loop they were created in.
+
+    Args:
+        endpoint (str): Host and optional port of the S3 service.
+        access_key (str | None): Access key, None for anonymous requests.
+        secret_key (str | None): Secret key.
+        session_token (str | None): Session token of temporary credentials.
+        secure (bool): Whether to use HTTPS.
+        region (str | None): Region of the service, looked up per bucket if None.
+        pool_size (int): Maximum number of open connections.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        access_key: str | None,
+        secret_key: str | None,
+        session_token: str | None,
+        secure: bool,
+        region: str | None,
+        pool_size: int,
+    ) -> None:
+        self._base_url = BaseURL(f"{'https' if secure else 'http'}://{endpoint}", region)
+        self._provider = StaticProvider(access_key, secret_key, session_token) if access_key and secret_key else None
+        self._pool_size = pool_size
+        self._regions: dict[str, str] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def close(self) -> None:
+        """Closes the session and its pooled connections."""
+        if self._session is not None:
+            session, self._session, self._session_loop = self._session, None, None
+            await session.close()
+
+    async def bucket_exists(self, bucket_name: str) -> bool:
+        """Returns whether a bucket exists."""
+        try:
+            await self._execute("HEAD", bucket_name)
+        except S3Error as e:
+            if e.code != "NoSuchBucket":
+                raise
+            return False
+        return True
+
+    async def make_bucket(self, bucket_name: str) -> None:
+        """Creates a bucket in the configured region."""
+        region = self._base_url.region or _DEFAULT_REGION
+        body = b""
+        if region != _DEFAULT_REGION:
+            element = Element("CreateBucketConfiguration")
+            SubElement(element, "LocationConstraint", region)
+            body = getbytes(element)
+        await self._execute("PUT", bucket_name, body=body, region=region)
+        self._regions[bucket_name] = region
+
+    async def remove_bucket(self, bucket_name: str) -> None:
+        """Removes an empty bucket."""
+        await self._execute("DELETE", bucket_name)
+        self._regions.pop(bucket_name, None)
+
+    async def list_buckets(self) -> list[Bucket]:
+        """Lists the buckets of the account."""
+        _, data = await self._execute("GET")
+        return unmarshal(ListAllMyBucketsResult, data.decode()).buckets
+
+    async def list_objects(self, bucket_name: str, prefix: str, recursive: bool) -> list[Object]:
+        """Lists the objects of a bucket under a prefix, reading every page of the listing."""
+        objects: list[Object] = []
+        continuation_token = None
+        while True:
+            query = {
+                "list-type": "2",
+                "delimiter": "" if recursive else "/",
+                "encoding-type": "url",
+                "max-keys": "1000",
+                "prefix": prefix,
+            }
+            if continuation_token:
+                query["continuation-token"] = continuation_token
+            response, _ = await self._execute("GET", bucket_name, query=query)
+            page, is_truncated, continuation_token, _ = parse_list_objects(response)
+            objects += page
+            if not is_truncated or not continuation_token:
+                return objects
+
+    async def stat_object(self, bucket_name: str, object_name: str) -> Object:
+        """Reads the metadata of an object."""
+        response, _ = await self._execute("HEAD", bucket_name, object_name)
+        last_modified = response.headers.get("Last-Modified")
+        return Object(
+            bucket_name,
+            object_name,
+            last_modified=from_http_header(last_modified) if last_modified else None,
+            etag=(response.headers.get("ETag") or "").replace('"', ""),
+            size=int(response.headers.get("Content-Length") or 0),
+            content_type=response.headers.get("Content-Type"),
+        )
+
+    async def put_object(self, bucket_name: str, object_name: str, data: bytes, content_type: str) -> str:
+        """Uploads an object in a single request and returns its ETag."""
+        response, _ = await self._execute(
+            "PUT",
+            bucket_name,
+            object_name,
+            body=data,
+            headers={"Content-Type": content_type},
+        )
+        return (response.headers.get("ETag") or "").replace('"', "")
+
+    async def get_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        etag: str | None = None,
+    ) -> bytes:
+        """Downloads an object, or a range of it, provided it still has the given ETag."""
+        headers = {}
+        if offset or length:
+            headers["Range"] = f"bytes={offset}-{offset + length - 1 if length else ''}"
+        if etag:
+            headers["If-Match"] = f'"{etag}"'
+        _, data = await self._execute("GET", bucket_name, object_name, headers=headers)
+        return data
+
+    async def remove_object(self, bucket_name: str, object_name: str) -> None:
+        """Removes an object."""
+        await self._execute("DELETE", bucket_name, object_name)
+
+    async def remove_objects(self, bucket_name: str, object_names: list[str]) -> list[DeleteError]:
+        """Removes up to 1000 objects in one request and returns the objects that could not be removed."""
+        body = marshal(DeleteRequest([DeleteObject(name) for name in object_names], quiet=True))
+        headers = {"Content-Type": "application/xml", "Content-MD5": cast(str, md5sum_hash(body))}
+        _, data = await self._execute("POST", bucket_name, query={"delete": ""}, body=body, headers=headers)
+        element = _parse(data)
+        if element.tag.endswith("Error"):
+            raise S3Error.fromxml(_response(200, {}, data))
+        return DeleteResult.fromxml(element).error_list
+
+    async def copy_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        source_bucket_name: str,
+        source_object_name: str,
+    ) -> tuple[str, datetime | None]:
+        """Copies an object of up to 5 GiB on the server and returns the ETag and modification time of the copy."""
+        response, data = await self._execute(
+            "PUT",
+            bucket_name,
+            object_name,
+            headers={"x-amz-copy-source": quote(f"/{source_bucket_name}/{source_object_name}")},
+        )
+        # S3 may report a failed copy in the body of a successful response
+        if _parse(data).tag.endswith("Error"):
+            raise S3Error.fromxml(response)
+        return parse_copy_object(response)
+
+    async def create_multipart_upload(self, bucket_name: str, object_name: str, content_type: str) -> str:
+        """Starts a multipart upload and returns its id."""
+        _, data = await self._execute(
+            "POST",
+            bucket_name,
+            object_name,
+            query={"uploads": ""},
+            headers={"Content-Type": content_type},
+        )
+        return cast(str, findtext(_parse(data), "UploadId", True))
+
+    async def upload_part(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: bytes,
+        upload_id: str,
+        part_number: int,
+    ) -> str:
+        """Uploads a part of a multipart upload and returns its ETag."""
+        response, _ = await self._execute(
+            "PUT",
+            bucket_name,
+            object_name,
+            query={"partNumber": str(part_number), "uploadId": upload_id},
+            body=data,
+        )
+        return (response.headers.get("ETag") or "").replace('"', "")
+
+    async def complete_multipart_upload(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        parts: list[Part],
+    ) -> str:
+        """Completes a multipart upload and returns the ETag of the object."""
+        element = Element("CompleteMultipartUpload")
+        for part in parts:
+            tag = SubElement(element, "Part")
+            SubElement(tag, "PartNumber", str(part.part_number))
+            SubElement(tag, "ETag", f'"{part.etag}"')
+        body = getbytes(element)
+        response, data = await self._execute(
+            "POST",
+            bucket_name,
+            object_name,
+            query={"uploadId": upload_id},
+            body=body,
+            headers={"Content-Type": "application/xml", "Content-MD5": cast(str, md5sum_hash(body))},
+        )
+        # S3 may report a failed completion in the body of a successful response
+        if _parse(data).tag.endswith("Error"):
+            raise S3Error.fromxml(response)
+        return cast(str, CompleteMultipartUploadResult(response).etag)
+
+    async def abort_multipart_upload(self, bucket_name: str, object_name: str, upload_id: str) -> None:
+        """Aborts a multipart upload, releasing its parts."""
+        await self._execute("DELETE", bucket_name, object_name, query={"uploadId": upload_id})
+
+    async def get_bucket_policy(self, bucket_name: str) -> str:
+        """Reads the policy of a bucket."""
+        _, data = await self._execute("GET", bucket_name, query={"policy": ""})
+        return data.decode()
+
+    async def set_bucket_policy(self, bucket_name: str, policy: str) -> None:
+        """Sets the policy of a bucket."""
+        body = policy.encode()
+        await self._execute(
+            "PUT",
+            bucket_name,
+            query={"policy": ""},
+            body=body,
+            headers={"Content-MD5": cast(str, md5sum_hash(body))},
+        )
+
+    async def presigned_url(self, method: str, bucket_name: str, object_name: str, expires: timedelta) -> str:
+        """Returns a URL granting a request on an object without credentials until it expires."""
+        region = await self._region(bucket_name)
+        url = self._base_url.build(method=method, region=region, bucket_name=bucket_name, object_name=object_name)
+        credentials = self._credentials()
+        if credentials is not None:
+            url = presign_v4(
+                method=method,
+                url=url,
+                region=region,
+                credentials=credentials,
+                date=utcnow(),
+                expires=int(expires.total_seconds()),
+            )
+        return urlunsplit(url)
+
+    def _credentials(self) -> Credentials | None:
+        return self._provider.retrieve() if self._provider else None
+
+    async def _region(self, bucket_name: str | None) -> str:
+        """Returns the region of a bucket, looking it up once per bucket when no region is configured."""
+        if self._base_url.region:
+            return self._base_url.region
+        if not bucket_name or self._provider is None:
+            return _DEFAULT_REGION
+        if bucket_name not in self._regions:
+            _, data = await self._execute("GET", bucket_name, query={"location": ""}, region=_DEFAULT_REGION)
+            self._regions[bucket_name] = _parse(data).text or _DEFAULT_REGION
+        return self._regions[bucket_name]
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session_loop is not loop or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._pool_size))
+            self._session_loop = loop
+        return self._session
+
+    async def _execute(
+        self,
+        method: str,
+        bucket_name: str | None = None,
+        object_name: str | None = None,
+        *,
+        query: dict[str, str] | None = None,
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+        region: str | None = None,
+    ) -> tuple[HTTPResponse, bytes]:
+        """Sends a signed request and returns its response, raising S3Error on error responses."""
+        import yarl
+
+        region = region or await self._region(bucket_name)
+        url = self._base_url.build(
+            method=method,
+            region=region,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            query_params=cast(DictType, query or {}),
+        )
+        credentials = self._credentials()
+        date = utcnow()
+        request_headers: DictType = {**(headers or {}), "Host": url.netloc, "x-amz-date": to_amz_date(date)}
+        if body:
+            request_headers["Content-Length"] = str(len(body))
+        if credentials is not None:
+            content_sha256 = "UNSIGNED-PAYLOAD" if self._base_url.is_https else sha256_hash(body)
+            request_headers["x-amz-content-sha256"] = content_sha256
+            if credentials.session_token:
+                request_headers["X-Amz-Security-Token"] = credentials.session_token
+            request_headers = sign_v4_s3(
+                method=method,
+                url=url,
+                region=region,
+                headers=request_headers,
+                credentials=credentials,
+                content_sha256=content_sha256,
+                date=date,
+            )
+        async with self._get_session().request(
+            method,
+            yarl.URL(urlunsplit(url), encoded=True),
+            data=body or None,
+            headers=cast(dict[str, str], request_headers),
+        ) as http_response:
+            data = await http_response.read()
+            response = _response(http_response.status, dict(http_response.headers), data)
+        if response.status in (200, 204, 206):
+            return response, data
+        raise _error(response, data, url.path, bucket_name, object_name)
+
+
+def _parse(data: bytes) -> ET.Element:
+    """Parses an XML response of the configured S3 server, as the minio client does."""
+    return ET.fromstring(data.decode())  # noqa: S314
+
+
+def _response(status: int, headers: dict[str, str], data: bytes) -> HTTPResponse:
+    """Wraps a response read by aiohttp in the urllib3 response the minio parsers and errors expect."""
+    return HTTPResponse(body=data, headers=headers, status=status, preload_content=True)
+
+
+def _error(
+    response: HTTPResponse,
+    data: bytes,
+    resource: str,
+    bucket_name: str | None,
+    object_name: str | None,
+) -> S3Error | ServerError:
+    """Builds the error of an error response the way the minio client does."""
+    if data and "xml" in (response.headers.get("Content-Type") or ""):
+        return S3Error.fromxml(response)
+    if response.status == 404:
+        code, message = (
+            ("NoSuchKey", "Object does not exist")
+            if object_name
+            else ("NoSuchBucket", "Bucket does not exist") if bucket_name else ("ResourceNotFound", "Not found")
+        )
+    elif response.status in _STATUS_ERRORS:
+        code, message = _STATUS_ERRORS[response.status]
+    else:
+        return ServerError(f"server failed with HTTP status code {response.status}", response.status)
+    return S3Error(
+        response,
+        code,
+        message,
+        resource,
+        response.headers.get("x-amz-request-id"),
+        response.headers.get("x-amz-id-2"),
+        bucket_name,
+        object_name,
+    )
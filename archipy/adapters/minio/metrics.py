@@ -0,0 +1,39 @@
+import functools
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter
+
+
+class MinioMetrics:
+    """Prometheus metrics of the MinIO adapters.
+
+    The metadata cache counts its lookups by cached operation and result, ``hit`` or ``miss``; the
+    hit ratio of an operation is the rate of hits over the rate of all its lookups. Invalidations
+    count the cached entries dropped by writes, by cached operation.
+
+    Args:
+        registry (CollectorRegistry): Registry the metrics are registered in. Defaults to the global registry.
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY) -> None:
+        self.cache_lookups = Counter(
+            "minio_cache_lookups",
+            "Lookups of the metadata cache of the MinIO adapters",
+            ("operation", "result"),
+            registry=registry,
+        )
+        self.cache_invalidations = Counter(
+            "minio_cache_invalidations",
+            "Cached entries of the MinIO adapters dropped by writes",
+            ("operation",),
+            registry=registry,
+        )
+
+
+@functools.cache
+def get_minio_metrics() -> MinioMetrics:
+    """Returns the process-wide MinIO metrics, registering them in the global registry on first use.
+
+    Returns:
+        MinioMetrics: The MinIO metrics.
+    """
+    return MinioMetrics()
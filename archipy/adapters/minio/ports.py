@@ -1,12 +1,14 @@
 """MinIO port definitions for ArchiPy."""
 
 from abc import abstractmethod
-from typing import Any
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+from typing import Any, BinaryIO
 
 # Define type aliases for better type hinting
 MinioObjectType = dict[str, Any]
 MinioBucketType = dict[str, Any]
 MinioPolicyType = dict[str, Any]
+MinioStreamSourceType = BinaryIO | Iterable[bytes] | AsyncIterable[bytes]
 
 
 class MinioPort:
@@ -48,6 +50,52 @@ class MinioPort:
         """Download an object to a file."""
         raise NotImplementedError
 
+    @abstractmethod
+    def put_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: MinioStreamSourceType,
+        content_type: str = "application/octet-stream",
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> MinioObjectType:
+        """Upload a stream of unknown length to a bucket in parts uploaded concurrently.
+
+        Args:
+            bucket_name: Destination bucket name
+            object_name: Object name in the bucket
+            data: A binary file-like object, or an iterable or async iterable of bytes chunks
+            content_type: Content type of the object
+            part_size: Size in bytes of the uploaded parts, the configured PART_SIZE if None
+            concurrency: Parts uploaded at once, the configured PART_CONCURRENCY if None
+
+        Returns:
+            The name, size and ETag of the uploaded object
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> Iterator[bytes]:
+        """Download an object as chunks fetched with concurrent ranged requests.
+
+        Args:
+            bucket_name: Source bucket name
+            object_name: Object name in the bucket
+            part_size: Size in bytes of the ranges requested, the configured PART_SIZE if None
+            concurrency: Ranges downloaded at once, the configured PART_CONCURRENCY if None
+
+        Returns:
+            An iterator over the chunks of the object, in order
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def remove_object(self, bucket_name: str, object_name: str) -> None:
         """Remove an object from a bucket."""
@@ -99,3 +147,202 @@ class MinioPort:
     def get_bucket_policy(self, bucket_name: str) -> MinioPolicyType:
         """Get bucket policy."""
         raise NotImplementedError
+
+
+class AsyncMinioPort:
+    """Async interface for MinIO operations providing a standardized access pattern.
+
+    This interface defines the contract for async MinIO adapters, mirroring MinioPort and adding
+    operations on many objects at once, so services running an event loop never block it on
+    object storage.
+    """
+
+    # Bucket Operations
+    @abstractmethod
+    async def bucket_exists(self, bucket_name: str) -> bool:
+        """Check if a bucket exists."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def make_bucket(self, bucket_name: str) -> None:
+        """Create a new bucket."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_bucket(self, bucket_name: str) -> None:
+        """Remove a bucket."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_buckets(self) -> list[MinioBucketType]:
+        """List all buckets."""
+        raise NotImplementedError
+
+    # Object Operations
+    @abstractmethod
+    async def put_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
+        """Upload a file to a bucket."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
+        """Download an object to a file."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: MinioStreamSourceType,
+        content_type: str = "application/octet-stream",
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> MinioObjectType:
+        """Upload a stream of unknown length to a bucket in parts uploaded concurrently.
+
+        Args:
+            bucket_name: Destination bucket name
+            object_name: Object name in the bucket
+            data: A binary file-like object, or an iterable or async iterable of bytes chunks
+            content_type: Content type of the object
+            part_size: Size in bytes of the uploaded parts, the configured PART_SIZE if None
+            concurrency: Parts uploaded at once, the configured PART_CONCURRENCY if None
+
+        Returns:
+            The name, size and ETag of the uploaded object
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Download an object as chunks fetched with concurrent ranged requests.
+
+        Args:
+            bucket_name: Source bucket name
+            object_name: Object name in the bucket
+            part_size: Size in bytes of the ranges requested, the configured PART_SIZE if None
+            concurrency: Ranges downloaded at once, the configured PART_CONCURRENCY if None
+
+        Returns:
+            An async iterator over the chunks of the object, in order
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_object(self, bucket_name: str, object_name: str) -> None:
+        """Remove an object from a bucket."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_objects(
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        *,  # Force recursive to be keyword-only to avoid boolean flag issues
+        recursive: bool = False,
+    ) -> list[MinioObjectType]:
+        """List objects in a bucket.
+
+        Args:
+            bucket_name: The name of the bucket to list objects from
+            prefix: Optional prefix to filter objects by
+            recursive: Whether to list objects recursively (include sub-directories)
+
+        Returns:
+            A list of MinioObjectType objects
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stat_object(self, bucket_name: str, object_name: str) -> MinioObjectType:
+        """Get object metadata."""
+        raise NotImplementedError
+
+    # Batch Operations
+    @abstractmethod
+    async def stat_objects(
+        self,
+        bucket_name: str,
+        object_names: Iterable[str],
+        concurrency: int | None = None,
+    ) -> dict[str, MinioObjectType | None]:
+        """Get the metadata of many objects with concurrent requests.
+
+        Args:
+            bucket_name: Bucket name
+            object_names: Names of the objects
+            concurrency: Requests sent at once, the configured BATCH_CONCURRENCY if None
+
+        Returns:
+            The metadata of every object by name, None for the objects that do not exist
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_objects(
+        self,
+        bucket_name: str,
+        object_names: Iterable[str],
+        concurrency: int | None = None,
+    ) -> list[MinioObjectType]:
+        """Remove many objects with multi-object delete requests of up to 1000 objects sent concurrently.
+
+        Args:
+            bucket_name: Bucket name
+            object_names: Names of the objects to remove
+            concurrency: Requests sent at once, the configured BATCH_CONCURRENCY if None
+
+        Returns:
+            The name, error code and message of every object that could not be removed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def copy_objects(
+        self,
+        source_bucket_name: str,
+        destination_bucket_name: str,
+        object_names: Iterable[str] | Mapping[str, str],
+        concurrency: int | None = None,
+    ) -> list[MinioObjectType]:
+        """Copy many objects on the server with concurrent requests.
+
+        Args:
+            source_bucket_name: Bucket the objects are copied from
+            destination_bucket_name: Bucket the objects are copied to
+            object_names: Names of the objects, kept by the copies, or a mapping of source to destination names
+            concurrency: Requests sent at once, the configured BATCH_CONCURRENCY if None
+
+        Returns:
+            The name, ETag and modification time of every copy
+        """
+        raise NotImplementedError
+
+    # Presigned URL Operations
+    @abstractmethod
+    async def presigned_get_object(self, bucket_name: str, object_name: str, expires: int = 3600) -> str:
+        """Generate a presigned URL for downloading an object."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def presigned_put_object(self, bucket_name: str, object_name: str, expires: int = 3600) -> str:
+        """Generate a presigned URL for uploading an object."""
+        raise NotImplementedError
+
+    # Policy Operations
+    @abstractmethod
+    async def set_bucket_policy(self, bucket_name: str, policy: str) -> None:
+        """Set bucket policy."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bucket_policy(self, bucket_name: str) -> MinioPolicyType:
+        """Get bucket policy."""
+        raise NotImplementedError
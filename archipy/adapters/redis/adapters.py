@@ -1,10 +1,16 @@
-from collections.abc import Awaitable, Iterable, Iterator, Mapping
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, override
 
+from pydantic import BaseModel
 from redis import RedisCluster, Sentinel
 from redis.asyncio import RedisCluster as AsyncRedisCluster, Sentinel as AsyncSentinel
 from redis.asyncio.client import Pipeline as AsyncPipeline, PubSub as AsyncPubSub, Redis as AsyncRedis
-from redis.client import Pipeline, PubSub, Redis
+from redis.asyncio.cluster import ClusterNode as AsyncClusterNode
+from redis.client import NEVER_DECODE, Pipeline, PubSub, Redis
+from redis.cluster import ClusterNode
 
 from archipy.adapters.redis.ports import (
     AsyncRedisPort,
@@ -13,6 +19,7 @@ from archipy.adapters.redis.ports import (
     RedisIntegerResponseType,
     RedisKeyType,
     RedisListResponseType,
+    RedisModelType,
     RedisPatternType,
     RedisPort,
     RedisResponseType,
@@ -20,6 +27,7 @@ from archipy.adapters.redis.ports import (
     RedisSetResponseType,
     RedisSetType,
 )
+from archipy.adapters.redis.serializers import RedisCodec
 from archipy.configs.base_config import BaseConfig
 from archipy.configs.config_template import RedisConfig, RedisMode
 
@@ -48,6 +56,7 @@ class RedisAdapter(RedisPort):
                 If None, retrieves from global config. Defaults to None.
         """
         configs: RedisConfig = BaseConfig.global_config().REDIS if redis_config is None else redis_config
+        self.codec = RedisCodec.from_config(configs)
         self._set_clients(configs)
 
     def _set_clients(self, configs: RedisConfig) -> None:
@@ -314,6 +323,174 @@ class RedisAdapter(RedisPort):
         """
         return self.read_only_client.keys(pattern, **kwargs)
 
+    @override
+    def delete_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Delete all keys matching a pattern using SCAN and pipelined UNLINK.
+
+        Args:
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Per-node rate limit, or None for no limit.
+
+        Returns:
+            int: Number of keys deleted.
+        """
+
+        def unlink(pipeline: Any, key: RedisKeyType) -> None:
+            pipeline.unlink(key)
+
+        return self._run_on_primaries(
+            lambda node: self._pipeline_by_pattern(node, pattern, batch_size, max_keys_per_second, unlink),
+        )
+
+    @override
+    def expire_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        ttl: RedisExpiryType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Set the time to live of all keys matching a pattern using SCAN and pipelined EXPIRE.
+
+        Args:
+            pattern (RedisPatternType): Pattern to match keys against.
+            ttl (RedisExpiryType): Time to live in seconds or as a timedelta.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Per-node rate limit, or None for no limit.
+
+        Returns:
+            int: Number of keys updated.
+        """
+
+        def expire(pipeline: Any, key: RedisKeyType) -> None:
+            pipeline.expire(key, ttl)
+
+        return self._run_on_primaries(
+            lambda node: self._pipeline_by_pattern(node, pattern, batch_size, max_keys_per_second, expire),
+        )
+
+    @override
+    def count_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 1000,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Count the keys matching a pattern using SCAN.
+
+        Args:
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Per-node rate limit, or None for no limit.
+
+        Returns:
+            int: Number of matching keys.
+        """
+        return self._run_on_primaries(
+            lambda node: sum(
+                len(keys)
+                for keys in self._scan_batches(self.read_only_client, node, pattern, batch_size, max_keys_per_second)
+            ),
+        )
+
+    def _run_on_primaries(self, func: Callable[[ClusterNode | None], int]) -> int:
+        """Run a per-node operation on every cluster primary in parallel and sum the results.
+
+        Args:
+            func (Callable[[ClusterNode | None], int]): Operation receiving the node, or None for a single server.
+
+        Returns:
+            int: Sum of the results.
+        """
+        primaries = self._get_primaries()
+        if primaries is None:
+            return func(None)
+        with ThreadPoolExecutor(max_workers=len(primaries), thread_name_prefix="redis-scan") as executor:
+            return sum(executor.map(func, primaries))
+
+    def _get_primaries(self) -> list[ClusterNode] | None:
+        """Return the primaries of the cluster, or None when not connected to a cluster.
+
+        Returns:
+            list[ClusterNode] | None: The cluster primaries.
+        """
+        # The client attribute is typed as Redis, but is a RedisCluster in cluster mode
+        client: Any = self.client
+        return client.get_primaries() if isinstance(client, RedisCluster) else None
+
+    def _scan_batches(
+        self,
+        client: Any,
+        node: ClusterNode | None,
+        pattern: RedisPatternType,
+        batch_size: int,
+        max_keys_per_second: int | None,
+    ) -> Iterator[list]:
+        """Yield batches of keys matching a pattern on one node, paced to the rate limit.
+
+        Args:
+            client (Any): Client used to scan.
+            node (ClusterNode | None): Cluster node to scan, or None for a single server.
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): SCAN COUNT hint.
+            max_keys_per_second (int | None): Rate limit, or None for no limit.
+
+        Yields:
+            list: Keys returned by one SCAN call.
+        """
+        target = {} if node is None else {"target_nodes": node}
+        cursor: Any = 0
+        started = time.monotonic()
+        processed = 0
+        while True:
+            cursor, keys = client.scan(cursor=cursor, match=pattern, count=batch_size, **target)
+            if isinstance(cursor, dict):
+                cursor = cursor[node.name] if node is not None else 0
+            if keys:
+                yield keys
+                processed += len(keys)
+                if max_keys_per_second:
+                    delay = processed / max_keys_per_second - (time.monotonic() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+            if not cursor:
+                return
+
+    def _pipeline_by_pattern(
+        self,
+        node: ClusterNode | None,
+        pattern: RedisPatternType,
+        batch_size: int,
+        max_keys_per_second: int | None,
+        queue_command: Callable[[Any, RedisKeyType], None],
+    ) -> int:
+        """Apply a single-key command to every key matching a pattern on one node in pipelined batches.
+
+        Args:
+            node (ClusterNode | None): Cluster node to scan, or None for a single server.
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Rate limit, or None for no limit.
+            queue_command (Callable[[Any, RedisKeyType], None]): Queues the command for one key on a pipeline.
+
+        Returns:
+            int: Number of keys the command succeeded on.
+        """
+        affected = 0
+        for keys in self._scan_batches(self.client, node, pattern, batch_size, max_keys_per_second):
+            # Single-key commands keep the pipeline valid across cluster slots
+            pipeline = self.client.pipeline(transaction=False)
+            for key in keys:
+                queue_command(pipeline, key)
+            affected += sum(1 for result in pipeline.execute() if result)
+        return affected
+
     @override
     def getset(self, key: RedisKeyType, value: bytes | str | float) -> RedisResponseType:
         """Set the value of a key and return its old value.
@@ -1060,6 +1237,261 @@ class RedisAdapter(RedisPort):
         """
         return self.client.zincrby(name, amount, value)
 
+    @override
+    def xadd(
+        self,
+        name: RedisKeyType,
+        fields: Mapping[str, bytes | str | float],
+        id: str = "*",
+        maxlen: int | None = None,
+        approximate: bool = True,
+    ) -> RedisResponseType:
+        """Append an entry to a stream.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            fields (Mapping[str, bytes | str | float]): Field-value pairs of the entry.
+            id (str): Entry ID or "*" for a server-generated one.
+            maxlen (int | None): Maximum length to trim the stream to.
+            approximate (bool): Whether to trim approximately with "~".
+
+        Returns:
+            RedisResponseType: ID of the added entry.
+        """
+        return self.client.xadd(name, dict(fields), id=id, maxlen=maxlen, approximate=approximate)
+
+    @override
+    def xlen(self, name: RedisKeyType) -> RedisIntegerResponseType:
+        """Get the number of entries in a stream.
+
+        Args:
+            name (RedisKeyType): Stream key.
+
+        Returns:
+            RedisIntegerResponseType: Number of entries.
+        """
+        return self.read_only_client.xlen(name)
+
+    @override
+    def xgroup_create(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        id: str = "$",
+        mkstream: bool = False,
+    ) -> RedisResponseType:
+        """Create a consumer group on a stream.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+            id (str): Last delivered ID the group starts from.
+            mkstream (bool): Whether to create the stream if it doesn't exist.
+
+        Returns:
+            RedisResponseType: True if the group was created.
+        """
+        return self.client.xgroup_create(name, groupname, id=id, mkstream=mkstream)
+
+    @override
+    def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: Mapping[RedisKeyType, str],
+        count: int | None = None,
+        block: int | None = None,
+        noack: bool = False,
+    ) -> RedisResponseType:
+        """Read entries from streams as a consumer group member.
+
+        Args:
+            groupname (str): Consumer group name.
+            consumername (str): Consumer name within the group.
+            streams (Mapping[RedisKeyType, str]): Stream keys mapped to the ID to read after.
+            count (int | None): Maximum number of entries per stream.
+            block (int | None): Milliseconds to wait for new entries.
+            noack (bool): Whether to skip the pending entries list.
+
+        Returns:
+            RedisResponseType: List of [stream, [(id, fields), ...]] pairs.
+        """
+        return self.client.xreadgroup(groupname, consumername, dict(streams), count=count, block=block, noack=noack)
+
+    @override
+    def xack(self, name: RedisKeyType, groupname: str, *ids: str) -> RedisIntegerResponseType:
+        """Acknowledge entries of a consumer group.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+            *ids (str): IDs of the entries to acknowledge.
+
+        Returns:
+            RedisIntegerResponseType: Number of entries acknowledged.
+        """
+        return self.client.xack(name, groupname, *ids)
+
+    @override
+    def xpending(self, name: RedisKeyType, groupname: str) -> RedisResponseType:
+        """Get a summary of the pending entries of a consumer group.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+
+        Returns:
+            RedisResponseType: Pending count, ID range and per-consumer counts.
+        """
+        return self.read_only_client.xpending(name, groupname)
+
+    @override
+    def xautoclaim(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: int | None = None,
+        justid: bool = False,
+    ) -> RedisResponseType:
+        """Claim pending entries idle for too long.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+            consumername (str): Consumer that takes over the entries.
+            min_idle_time (int): Minimum idle time in milliseconds.
+            start_id (str): ID to start scanning the pending entries list from.
+            count (int | None): Maximum number of entries to claim.
+            justid (bool): Whether to return only the IDs.
+
+        Returns:
+            RedisResponseType: Next start ID, claimed entries and deleted IDs.
+        """
+        return self.client.xautoclaim(
+            name,
+            groupname,
+            consumername,
+            min_idle_time,
+            start_id=start_id,
+            count=count,
+            justid=justid,
+        )
+
+    @override
+    def get_bytes(self, key: str) -> RedisResponseType:
+        """Get the raw value of a key without decoding it.
+
+        Args:
+            key (str): The key name.
+
+        Returns:
+            RedisResponseType: Raw bytes stored at the key or None.
+        """
+        return self.read_only_client.execute_command("GET", key, **{NEVER_DECODE: True})
+
+    @override
+    def get_model[M: BaseModel](
+        self,
+        key: str,
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> M | None:
+        """Get a pydantic model stored with set_model.
+
+        Args:
+            key (str): The key name.
+            model_type (RedisModelType[M]): Model class to validate the value into.
+            codec (RedisCodec | None): Codec of the value, defaults to the adapter codec.
+
+        Returns:
+            M | None: The model or None.
+        """
+        data = self.get_bytes(key)
+        return None if data is None else (codec or self.codec).decode_model(data, model_type)
+
+    @override
+    def set_model(
+        self,
+        key: str,
+        model: BaseModel,
+        ex: RedisExpiryType | None = None,
+        px: RedisExpiryType | None = None,
+        nx: bool = False,
+        xx: bool = False,
+        codec: RedisCodec | None = None,
+    ) -> RedisResponseType:
+        """Store a pydantic model encoded with a codec.
+
+        Args:
+            key (str): The key name.
+            model (BaseModel): The model to store.
+            ex (RedisExpiryType | None): Expire time in seconds.
+            px (RedisExpiryType | None): Expire time in milliseconds.
+            nx (bool): Only set if key doesn't exist.
+            xx (bool): Only set if key exists.
+            codec (RedisCodec | None): Codec of the value, defaults to the adapter codec.
+
+        Returns:
+            RedisResponseType: True if set, None otherwise.
+        """
+        data = (codec or self.codec).encode_model(model)
+        return self.client.set(key, data, ex=ex, px=px, nx=nx, xx=xx)
+
+    @override
+    def mget_models[M: BaseModel](
+        self,
+        keys: Iterable[str],
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> list[M | None]:
+        """Get several pydantic models stored with set_model in one round trip.
+
+        Args:
+            keys (Iterable[str]): The key names.
+            model_type (RedisModelType[M]): Model class to validate the values into.
+            codec (RedisCodec | None): Codec of the values, defaults to the adapter codec.
+
+        Returns:
+            list[M | None]: The models in key order, None for missing keys.
+        """
+        codec = codec or self.codec
+        # Pipelined GETs instead of MGET so keys may live in different cluster slots
+        pipeline = self.read_only_client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.execute_command("GET", key, **{NEVER_DECODE: True})
+        return [None if data is None else codec.decode_model(data, model_type) for data in pipeline.execute()]
+
+    @override
+    def eval(self, script: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Execute a Lua script.
+
+        Args:
+            script (str): The Lua script to execute.
+            numkeys (int): Number of key names at the start of keys_and_args.
+            *keys_and_args (bytes | str | float): Key names followed by script arguments.
+
+        Returns:
+            RedisResponseType: Value returned by the script.
+        """
+        return self.client.eval(script, numkeys, *keys_and_args)
+
+    @override
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Execute a cached Lua script by its SHA1 digest.
+
+        Args:
+            sha (str): SHA1 digest of the cached script.
+            numkeys (int): Number of key names at the start of keys_and_args.
+            *keys_and_args (bytes | str | float): Key names followed by script arguments.
+
+        Returns:
+            RedisResponseType: Value returned by the script.
+        """
+        return self.client.evalsha(sha, numkeys, *keys_and_args)
+
     @override
     def pubsub(self, **kwargs: Any) -> PubSub:
         """Get a PubSub object for subscribing to channels.
@@ -1119,6 +1551,7 @@ class AsyncRedisAdapter(AsyncRedisPort):
                 If None, retrieves from global config. Defaults to None.
         """
         configs: RedisConfig = BaseConfig.global_config().REDIS if redis_config is None else redis_config
+        self.codec = RedisCodec.from_config(configs)
         self._set_clients(configs)
 
     def _set_clients(self, configs: RedisConfig) -> None:
@@ -1385,6 +1818,176 @@ class AsyncRedisAdapter(AsyncRedisPort):
         """
         return await self.read_only_client.keys(pattern, **kwargs)
 
+    @override
+    async def delete_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Delete all keys matching a pattern using SCAN and pipelined UNLINK asynchronously.
+
+        Args:
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Per-node rate limit, or None for no limit.
+
+        Returns:
+            int: Number of keys deleted.
+        """
+
+        def unlink(pipeline: Any, key: RedisKeyType) -> None:
+            pipeline.unlink(key)
+
+        return await self._run_on_primaries(
+            lambda node: self._pipeline_by_pattern(node, pattern, batch_size, max_keys_per_second, unlink),
+        )
+
+    @override
+    async def expire_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        ttl: RedisExpiryType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Set the time to live of all keys matching a pattern using SCAN and pipelined EXPIRE asynchronously.
+
+        Args:
+            pattern (RedisPatternType): Pattern to match keys against.
+            ttl (RedisExpiryType): Time to live in seconds or as a timedelta.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Per-node rate limit, or None for no limit.
+
+        Returns:
+            int: Number of keys updated.
+        """
+
+        def expire(pipeline: Any, key: RedisKeyType) -> None:
+            pipeline.expire(key, ttl)
+
+        return await self._run_on_primaries(
+            lambda node: self._pipeline_by_pattern(node, pattern, batch_size, max_keys_per_second, expire),
+        )
+
+    @override
+    async def count_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 1000,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Count the keys matching a pattern using SCAN asynchronously.
+
+        Args:
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Per-node rate limit, or None for no limit.
+
+        Returns:
+            int: Number of matching keys.
+        """
+
+        async def count(node: AsyncClusterNode | None) -> int:
+            counted = 0
+            async for keys in self._scan_batches(self.read_only_client, node, pattern, batch_size, max_keys_per_second):
+                counted += len(keys)
+            return counted
+
+        return await self._run_on_primaries(count)
+
+    async def _run_on_primaries(self, func: Callable[[AsyncClusterNode | None], Awaitable[int]]) -> int:
+        """Run a per-node operation on every cluster primary concurrently and sum the results.
+
+        Args:
+            func (Callable[[AsyncClusterNode | None], Awaitable[int]]): Operation receiving the node, or None
+                for a single server.
+
+        Returns:
+            int: Sum of the results.
+        """
+        primaries = self._get_primaries()
+        if primaries is None:
+            return await func(None)
+        return sum(await asyncio.gather(*(func(node) for node in primaries)))
+
+    def _get_primaries(self) -> list[AsyncClusterNode] | None:
+        """Return the primaries of the cluster, or None when not connected to a cluster.
+
+        Returns:
+            list[AsyncClusterNode] | None: The cluster primaries.
+        """
+        # The client attribute is typed as Redis, but is a RedisCluster in cluster mode
+        client: Any = self.client
+        return client.get_primaries() if isinstance(client, AsyncRedisCluster) else None
+
+    async def _scan_batches(
+        self,
+        client: Any,
+        node: AsyncClusterNode | None,
+        pattern: RedisPatternType,
+        batch_size: int,
+        max_keys_per_second: int | None,
+    ) -> AsyncIterator[list]:
+        """Yield batches of keys matching a pattern on one node, paced to the rate limit asynchronously.
+
+        Args:
+            client (Any): Client used to scan.
+            node (AsyncClusterNode | None): Cluster node to scan, or None for a single server.
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): SCAN COUNT hint.
+            max_keys_per_second (int | None): Rate limit, or None for no limit.
+
+        Yields:
+            list: Keys returned by one SCAN call.
+        """
+        target = {} if node is None else {"target_nodes": node}
+        cursor: Any = 0
+        started = time.monotonic()
+        processed = 0
+        while True:
+            cursor, keys = await client.scan(cursor=cursor, match=pattern, count=batch_size, **target)
+            if isinstance(cursor, dict):
+                cursor = cursor[node.name] if node is not None else 0
+            if keys:
+                yield keys
+                processed += len(keys)
+                if max_keys_per_second:
+                    delay = processed / max_keys_per_second - (time.monotonic() - started)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+            if not cursor:
+                return
+
+    async def _pipeline_by_pattern(
+        self,
+        node: AsyncClusterNode | None,
+        pattern: RedisPatternType,
+        batch_size: int,
+        max_keys_per_second: int | None,
+        queue_command: Callable[[Any, RedisKeyType], None],
+    ) -> int:
+        """Apply a single-key command to every key matching a pattern on one node in pipelined batches.
+
+        Args:
+            node (AsyncClusterNode | None): Cluster node to scan, or None for a single server.
+            pattern (RedisPatternType): Pattern to match keys against.
+            batch_size (int): Number of keys per round trip.
+            max_keys_per_second (int | None): Rate limit, or None for no limit.
+            queue_command (Callable[[Any, RedisKeyType], None]): Queues the command for one key on a pipeline.
+
+        Returns:
+            int: Number of keys the command succeeded on.
+        """
+        affected = 0
+        async for keys in self._scan_batches(self.client, node, pattern, batch_size, max_keys_per_second):
+            # Single-key commands keep the pipeline valid across cluster slots
+            pipeline = self.client.pipeline(transaction=False)
+            for key in keys:
+                queue_command(pipeline, key)
+            affected += sum(1 for result in await pipeline.execute() if result)
+        return affected
+
     @override
     async def getset(self, key: RedisKeyType, value: bytes | str | float) -> RedisResponseType:
         """Set a key's value and return its old value asynchronously.
@@ -2132,6 +2735,268 @@ class AsyncRedisAdapter(AsyncRedisPort):
         """
         return await self.client.zincrby(name, amount, value)
 
+    @override
+    async def xadd(
+        self,
+        name: RedisKeyType,
+        fields: Mapping[str, bytes | str | float],
+        id: str = "*",
+        maxlen: int | None = None,
+        approximate: bool = True,
+    ) -> RedisResponseType:
+        """Append an entry to a stream asynchronously.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            fields (Mapping[str, bytes | str | float]): Field-value pairs of the entry.
+            id (str): Entry ID or "*" for a server-generated one.
+            maxlen (int | None): Maximum length to trim the stream to.
+            approximate (bool): Whether to trim approximately with "~".
+
+        Returns:
+            RedisResponseType: ID of the added entry.
+        """
+        return await self.client.xadd(name, dict(fields), id=id, maxlen=maxlen, approximate=approximate)
+
+    @override
+    async def xlen(self, name: RedisKeyType) -> RedisIntegerResponseType:
+        """Get the number of entries in a stream asynchronously.
+
+        Args:
+            name (RedisKeyType): Stream key.
+
+        Returns:
+            RedisIntegerResponseType: Number of entries.
+        """
+        return await self.read_only_client.xlen(name)
+
+    @override
+    async def xgroup_create(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        id: str = "$",
+        mkstream: bool = False,
+    ) -> RedisResponseType:
+        """Create a consumer group on a stream asynchronously.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+            id (str): Last delivered ID the group starts from.
+            mkstream (bool): Whether to create the stream if it doesn't exist.
+
+        Returns:
+            RedisResponseType: True if the group was created.
+        """
+        return await self.client.xgroup_create(name, groupname, id=id, mkstream=mkstream)
+
+    @override
+    async def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: Mapping[RedisKeyType, str],
+        count: int | None = None,
+        block: int | None = None,
+        noack: bool = False,
+    ) -> RedisResponseType:
+        """Read entries from streams as a consumer group member asynchronously.
+
+        Args:
+            groupname (str): Consumer group name.
+            consumername (str): Consumer name within the group.
+            streams (Mapping[RedisKeyType, str]): Stream keys mapped to the ID to read after.
+            count (int | None): Maximum number of entries per stream.
+            block (int | None): Milliseconds to wait for new entries.
+            noack (bool): Whether to skip the pending entries list.
+
+        Returns:
+            RedisResponseType: List of [stream, [(id, fields), ...]] pairs.
+        """
+        return await self.client.xreadgroup(
+            groupname,
+            consumername,
+            dict(streams),
+            count=count,
+            block=block,
+            noack=noack,
+        )
+
+    @override
+    async def xack(self, name: RedisKeyType, groupname: str, *ids: str) -> RedisIntegerResponseType:
+        """Acknowledge entries of a consumer group asynchronously.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+            *ids (str): IDs of the entries to acknowledge.
+
+        Returns:
+            RedisIntegerResponseType: Number of entries acknowledged.
+        """
+        return await self.client.xack(name, groupname, *ids)
+
+    @override
+    async def xpending(self, name: RedisKeyType, groupname: str) -> RedisResponseType:
+        """Get a summary of the pending entries of a consumer group asynchronously.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+
+        Returns:
+            RedisResponseType: Pending count, ID range and per-consumer counts.
+        """
+        return await self.read_only_client.xpending(name, groupname)
+
+    @override
+    async def xautoclaim(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: int | None = None,
+        justid: bool = False,
+    ) -> RedisResponseType:
+        """Claim pending entries idle for too long asynchronously.
+
+        Args:
+            name (RedisKeyType): Stream key.
+            groupname (str): Consumer group name.
+            consumername (str): Consumer that takes over the entries.
+            min_idle_time (int): Minimum idle time in milliseconds.
+            start_id (str): ID to start scanning the pending entries list from.
+            count (int | None): Maximum number of entries to claim.
+            justid (bool): Whether to return only the IDs.
+
+        Returns:
+            RedisResponseType: Next start ID, claimed entries and deleted IDs.
+        """
+        return await self.client.xautoclaim(
+            name,
+            groupname,
+            consumername,
+            min_idle_time,
+            start_id=start_id,
+            count=count,
+            justid=justid,
+        )
+
+    @override
+    async def get_bytes(self, key: str) -> RedisResponseType:
+        """Get the raw value of a key without decoding it asynchronously.
+
+        Args:
+            key (str): The key name.
+
+        Returns:
+            RedisResponseType: Raw bytes stored at the key or None.
+        """
+        return await self.read_only_client.execute_command("GET", key, **{NEVER_DECODE: True})
+
+    @override
+    async def get_model[M: BaseModel](
+        self,
+        key: str,
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> M | None:
+        """Get a pydantic model stored with set_model asynchronously.
+
+        Args:
+            key (str): The key name.
+            model_type (RedisModelType[M]): Model class to validate the value into.
+            codec (RedisCodec | None): Codec of the value, defaults to the adapter codec.
+
+        Returns:
+            M | None: The model or None.
+        """
+        data = await self.get_bytes(key)
+        return None if data is None else (codec or self.codec).decode_model(data, model_type)
+
+    @override
+    async def set_model(
+        self,
+        key: str,
+        model: BaseModel,
+        ex: RedisExpiryType | None = None,
+        px: RedisExpiryType | None = None,
+        nx: bool = False,
+        xx: bool = False,
+        codec: RedisCodec | None = None,
+    ) -> RedisResponseType:
+        """Store a pydantic model encoded with a codec asynchronously.
+
+        Args:
+            key (str): The key name.
+            model (BaseModel): The model to store.
+            ex (RedisExpiryType | None): Expire time in seconds.
+            px (RedisExpiryType | None): Expire time in milliseconds.
+            nx (bool): Only set if key doesn't exist.
+            xx (bool): Only set if key exists.
+            codec (RedisCodec | None): Codec of the value, defaults to the adapter codec.
+
+        Returns:
+            RedisResponseType: True if set, None otherwise.
+        """
+        data = (codec or self.codec).encode_model(model)
+        return await self.client.set(key, data, ex=ex, px=px, nx=nx, xx=xx)
+
+    @override
+    async def mget_models[M: BaseModel](
+        self,
+        keys: Iterable[str],
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> list[M | None]:
+        """Get several pydantic models stored with set_model in one round trip asynchronously.
+
+        Args:
+            keys (Iterable[str]): The key names.
+            model_type (RedisModelType[M]): Model class to validate the values into.
+            codec (RedisCodec | None): Codec of the values, defaults to the adapter codec.
+
+        Returns:
+            list[M | None]: The models in key order, None for missing keys.
+        """
+        codec = codec or self.codec
+        # Pipelined GETs instead of MGET so keys may live in different cluster slots
+        pipeline = self.read_only_client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.execute_command("GET", key, **{NEVER_DECODE: True})
+        return [None if data is None else codec.decode_model(data, model_type) for data in await pipeline.execute()]
+
+    @override
+    async def eval(self, script: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Execute a Lua script asynchronously.
+
+        Args:
+            script (str): The Lua script to execute.
+            numkeys (int): Number of key names at the start of keys_and_args.
+            *keys_and_args (bytes | str | float): Key names followed by script arguments.
+
+        Returns:
+            RedisResponseType: Value returned by the script.
+        """
+        return await self.client.eval(script, numkeys, *keys_and_args)
+
+    @override
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Execute a cached Lua script by its SHA1 digest asynchronously.
+
+        Args:
+            sha (str): SHA1 digest of the cached script.
+            numkeys (int): Number of key names at the start of keys_and_args.
+            *keys_and_args (bytes | str | float): Key names followed by script arguments.
+
+        Returns:
+            RedisResponseType: Value returned by the script.
+        """
+        return await self.client.evalsha(sha, numkeys, *keys_and_args)
+
     @override
     async def pubsub(self, **kwargs: Any) -> AsyncPubSub:
         """Get PubSub object for channel subscription asynchronously.
@@ -0,0 +1,431 @@
+import asyncio
+import hashlib
+import logging
+import secrets
+import threading
+import time
+from types import TracebackType
+from typing import Self
+
+from redis.exceptions import NoScriptError
+
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
+from archipy.models.errors import ResourceLockedError
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = lock key, KEYS[2] = fencing counter key, ARGV[1] = owner token, ARGV[2] = lease in milliseconds
+_ACQUIRE_SCRIPT = """
+if redis.call('set', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return redis.call('incr', KEYS[2])
+end
+return 0
+"""
+
+# KEYS[1] = lock key, ARGV[1] = owner token
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# KEYS[1] = lock key, ARGV[1] = owner token, ARGV[2] = new lease in milliseconds
+_EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_SCRIPT_SHAS = {
+    script: hashlib.sha1(script.encode(), usedforsecurity=False).hexdigest()
+    for script in (_ACQUIRE_SCRIPT, _RELEASE_SCRIPT, _EXTEND_SCRIPT)
+}
+
+
+class _BaseRedisLock:
+    """State and key layout shared by the sync and async Redis locks.
+
+    The lock key and its fencing counter share a hash tag, so both scripts touch a single
+    slot and the lock works unchanged on Redis Cluster.
+
+    Args:
+        name (str): The name of the resource protected by the lock.
+        timeout_ms (int): Lease of the lock in milliseconds.
+        blocking_timeout_ms (int | None): Maximum time to wait for the lock. None waits forever.
+        retry_interval_ms (int): Base delay between acquisition attempts in milliseconds.
+        auto_extend (bool): Whether a watchdog renews the lease while the lock is held.
+        key_prefix (str): Prefix of the Redis keys used by the lock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout_ms: int = 30000,
+        blocking_timeout_ms: int | None = None,
+        retry_interval_ms: int = 50,
+        auto_extend: bool = False,
+        key_prefix: str = "lock",
+    ) -> None:
+        self.name = name
+        self.timeout_ms = timeout_ms
+        self.blocking_timeout_ms = blocking_timeout_ms
+        self.retry_interval_ms = retry_interval_ms
+        self.auto_extend = auto_extend
+        self.lock_key = f"{key_prefix}:{{{name}}}"
+        self.fencing_key = f"{key_prefix}:{{{name}}}:fencing"
+        self.token: str | None = None
+        self.fencing_token: int | None = None
+        self.lost = False
+
+    @property
+    def owned(self) -> bool:
+        """Whether this instance believes it holds the lock."""
+        return self.token is not None and not self.lost
+
+    def _retry_delay(self) -> float:
+        """Returns the jittered delay before the next acquisition attempt, in seconds."""
+        jitter_ms = secrets.randbelow(self.retry_interval_ms + 1)
+        return (self.retry_interval_ms + jitter_ms) / 1000
+
+    def _deadline(self, blocking: bool, blocking_timeout_ms: int | None) -> float | None:
+        """Computes the monotonic deadline of an acquisition.
+
+        Args:
+            blocking (bool): Whether the caller is willing to wait.
+            blocking_timeout_ms (int | None): Per-call override of the blocking timeout.
+
+        Returns:
+            float | None: The deadline, or None to wait forever.
+        """
+        if not blocking:
+            return time.monotonic()
+        timeout_ms = self.blocking_timeout_ms if blocking_timeout_ms is None else blocking_timeout_ms
+        return None if timeout_ms is None else time.monotonic() + timeout_ms / 1000
+
+
+class RedisLock(_BaseRedisLock):
+    """A distributed lock backed by a single Redis key.
+
+    The lock is taken with ``SET NX PX`` and released or extended only by its owner through
+    compare-and-delete Lua scripts, so an expired lease never deletes somebody else's lock.
+    Every successful acquisition returns a monotonically increasing fencing token; pass it
+    along with writes to downstream stores so they can reject writes from a stale owner.
+
+    With ``auto_extend=True`` a daemon thread renews the lease every third of ``timeout_ms``
+    while the lock is held, so long critical sections do not need a huge lease.
+
+    Args:
+        redis_client (RedisPort): The Redis adapter used to store the lock.
+        name (str): The name of the resource protected by the lock.
+        timeout_ms (int): Lease of the lock in milliseconds. Defaults to 30000.
+        blocking_timeout_ms (int | None): Maximum time to wait for the lock. None waits forever. Defaults to None.
+        retry_interval_ms (int): Base delay between acquisition attempts in milliseconds. Defaults to 50.
+        auto_extend (bool): Whether a watchdog renews the lease while the lock is held. Defaults to False.
+        key_prefix (str): Prefix of the Redis keys used by the lock. Defaults to "lock".
+
+    Example:
+        >>> lock = RedisLock(RedisAdapter(), "invoice:42", timeout_ms=10000, auto_extend=True)
+        >>> with lock:
+        ...     repository.save(invoice, fencing_token=lock.fencing_token)
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisPort,
+        name: str,
+        timeout_ms: int = 30000,
+        blocking_timeout_ms: int | None = None,
+        retry_interval_ms: int = 50,
+        auto_extend: bool = False,
+        key_prefix: str = "lock",
+    ) -> None:
+        super().__init__(name, timeout_ms, blocking_timeout_ms, retry_interval_ms, auto_extend, key_prefix)
+        self.redis_client = redis_client
+        self._stop_event = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    def acquire(self, blocking: bool = True, blocking_timeout_ms: int | None = None) -> bool:
+        """Acquires the lock.
+
+        Args:
+            blocking (bool): Whether to wait until the lock is available. Defaults to True.
+            blocking_timeout_ms (int | None): Overrides the blocking timeout of the lock for this call.
+
+        Returns:
+            bool: True if the lock was acquired, False if the wait timed out.
+        """
+        deadline = self._deadline(blocking, blocking_timeout_ms)
+        token = secrets.token_hex(16)
+        while True:
+            fencing_token = self._run_script(
+                _ACQUIRE_SCRIPT,
+                2,
+                self.lock_key,
+                self.fencing_key,
+                token,
+                self.timeout_ms,
+            )
+            if fencing_token:
+                self.token = token
+                self.fencing_token = fencing_token
+                self.lost = False
+                if self.auto_extend:
+                    self._start_watchdog()
+                return True
+            delay = self._retry_delay()
+            if deadline is not None and time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+
+    def release(self) -> bool:
+        """Releases the lock if it is still owned by this instance.
+
+        Returns:
+            bool: True if the lock was released, False if the lease had already expired.
+        """
+        self._stop_watchdog()
+        if self.token is None:
+            return False
+        token, self.token = self.token, None
+        released = bool(self._run_script(_RELEASE_SCRIPT, 1, self.lock_key, token))
+        if not released:
+            logger.warning(f"Lock {self.name} expired before it was released")
+        return released
+
+    def extend(self, timeout_ms: int | None = None) -> bool:
+        """Resets the lease of the lock if it is still owned by this instance.
+
+        Args:
+            timeout_ms (int | None): The new lease in milliseconds. Defaults to the lock timeout.
+
+        Returns:
+            bool: True if the lease was renewed, False if the lock is no longer owned.
+        """
+        if self.token is None:
+            return False
+        lease_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        extended = bool(self._run_script(_EXTEND_SCRIPT, 1, self.lock_key, self.token, lease_ms))
+        if not extended:
+            self.lost = True
+        return extended
+
+    def __enter__(self) -> Self:
+        """Acquires the lock, waiting up to the blocking timeout.
+
+        Raises:
+            ResourceLockedError: If the lock could not be acquired in time.
+        """
+        if not self.acquire():
+            raise ResourceLockedError(resource_id=self.name)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Releases the lock."""
+        self.release()
+
+    def _run_script(self, script: str, numkeys: int, *keys_and_args: str | int) -> int:
+        """Runs a lock script through its cached digest, loading it on first use.
+
+        Args:
+            script (str): The Lua script to run.
+            numkeys (int): Number of key names at the start of keys_and_args.
+            *keys_and_args (str | int): Key names followed by script arguments.
+
+        Returns:
+            int: The integer returned by the script.
+        """
+        try:
+            return int(self.redis_client.evalsha(_SCRIPT_SHAS[script], numkeys, *keys_and_args))
+        except NoScriptError:
+            return int(self.redis_client.eval(script, numkeys, *keys_and_args))
+
+    def _start_watchdog(self) -> None:
+        """Starts the daemon thread renewing the lease."""
+        self._stop_event.clear()
+        self._watchdog = threading.Thread(target=self._watchdog_loop, name=f"redis-lock-{self.name}", daemon=True)
+        self._watchdog.start()
+
+    def _stop_watchdog(self) -> None:
+        """Stops the lease renewal thread if it is running."""
+        if self._watchdog is not None:
+            self._stop_event.set()
+            if self._watchdog is not threading.current_thread():
+                self._watchdog.join()
+            self._watchdog = None
+
+    def _watchdog_loop(self) -> None:
+        """Renews the lease every third of the timeout until stopped or the lock is lost."""
+        interval = self.timeout_ms / 3000
+        while not self._stop_event.wait(interval):
+            try:
+                if not self.extend():
+                    logger.warning(f"Lock {self.name} was lost, stopping lease renewal")
+                    return
+            except Exception as exception:
+                logger.warning(f"Failed to renew the lease of lock {self.name}: {exception}")
+
+
+class AsyncRedisLock(_BaseRedisLock):
+    """An async distributed lock backed by a single Redis key.
+
+    Behaves like RedisLock; the lease watchdog runs as a task on the event loop that
+    acquired the lock.
+
+    Args:
+        redis_client (AsyncRedisPort): The async Redis adapter used to store the lock.
+        name (str): The name of the resource protected by the lock.
+        timeout_ms (int): Lease of the lock in milliseconds. Defaults to 30000.
+        blocking_timeout_ms (int | None): Maximum time to wait for the lock. None waits forever. Defaults to None.
+        retry_interval_ms (int): Base delay between acquisition attempts in milliseconds. Defaults to 50.
+        auto_extend (bool): Whether a watchdog renews the lease while the lock is held. Defaults to False.
+        key_prefix (str): Prefix of the Redis keys used by the lock. Defaults to "lock".
+
+    Example:
+        >>> lock = AsyncRedisLock(AsyncRedisAdapter(), "invoice:42", blocking_timeout_ms=2000)
+        >>> async with lock:
+        ...     await repository.save(invoice, fencing_token=lock.fencing_token)
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedisPort,
+        name: str,
+        timeout_ms: int = 30000,
+        blocking_timeout_ms: int | None = None,
+        retry_interval_ms: int = 50,
+        auto_extend: bool = False,
+        key_prefix: str = "lock",
+    ) -> None:
+        super().__init__(name, timeout_ms, blocking_timeout_ms, retry_interval_ms, auto_extend, key_prefix)
+        self.redis_client = redis_client
+        self._watchdog: asyncio.Task[None] | None = None
+
+    async def acquire(self, blocking: bool = True, blocking_timeout_ms: int | None = None) -> bool:
+        """Acquires the lock.
+
+        Args:
+            blocking (bool): Whether to wait until the lock is available. Defaults to True.
+            blocking_timeout_ms (int | None): Overrides the blocking timeout of the lock for this call.
+
+        Returns:
+            bool: True if the lock was acquired, False if the wait timed out.
+        """
+        deadline = self._deadline(blocking, blocking_timeout_ms)
+        token = secrets.token_hex(16)
+        while True:
+            fencing_token = await self._run_script(
+                _ACQUIRE_SCRIPT,
+                2,
+                self.lock_key,
+                self.fencing_key,
+                token,
+                self.timeout_ms,
+            )
+            if fencing_token:
+                self.token = token
+                self.fencing_token = fencing_token
+                self.lost = False
+                if self.auto_extend:
+                    self._watchdog = asyncio.get_running_loop().create_task(self._watchdog_loop())
+                return True
+            delay = self._retry_delay()
+            if deadline is not None and time.monotonic() + delay > deadline:
+                return False
+            await asyncio.sleep(delay)
+
+    async def release(self) -> bool:
+        """Releases the lock if it is still owned by this instance.
+
+        Returns:
+            bool: True if the lock was released, False if the lease had already expired.
+        """
+        await self._stop_watchdog()
+        if self.token is None:
+            return False
+        token, self.token = self.token, None
+        released = bool(await self._run_script(_RELEASE_SCRIPT, 1, self.lock_key, token))
+        if not released:
+            logger.warning(f"Lock {self.name} expired before it was released")
+        return released
+
+    async def extend(self, timeout_ms: int | None = None) -> bool:
+        """Resets the lease of the lock if it is still owned by this instance.
+
+        Args:
+            timeout_ms (int | None): The new lease in milliseconds. Defaults to the lock timeout.
+
+        Returns:
+            bool: True if the lease was renewed, False if the lock is no longer owned.
+        """
+        if self.token is None:
+            return False
+        lease_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        extended = bool(await self._run_script(_EXTEND_SCRIPT, 1, self.lock_key, self.token, lease_ms))
+        if not extended:
+            self.lost = True
+        return extended
+
+    async def __aenter__(self) -> Self:
+        """Acquires the lock, waiting up to the blocking timeout.
+
+        Raises:
+            ResourceLockedError: If the lock could not be acquired in time.
+        """
+        if not await self.acquire():
+            raise ResourceLockedError(resource_id=self.name)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Releases the lock."""
+        await self.release()
+
+    async def _run_script(self, script: str, numkeys: int, *keys_and_args: str | int) -> int:
+        """Runs a lock script through its cached digest, loading it on first use.
+
+        Args:
+            script (str): The Lua script to run.
+            numkeys (int): Number of key names at the start of keys_and_args.
+            *keys_and_args (str | int): Key names followed by script arguments.
+
+        Returns:
+            int: The integer returned by the script.
+        """
+        try:
+            return int(await self.redis_client.evalsha(_SCRIPT_SHAS[script], numkeys, *keys_and_args))
+        except NoScriptError:
+            return int(await self.redis_client.eval(script, numkeys, *keys_and_args))
+
+    async def _stop_watchdog(self) -> None:
+        """Cancels the lease renewal task if it is running."""
+        if self._watchdog is not None:
+            watchdog, self._watchdog = self._watchdog, None
+            if watchdog is not asyncio.current_task():
+                watchdog.cancel()
+                try:
+                    await watchdog
+                except asyncio.CancelledError:
+                    pass
+
+    async def _watchdog_loop(self) -> None:
+        """Renews the lease every third of the timeout until cancelled or the lock is lost."""
+        interval = self.timeout_ms / 3000
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.extend():
+                    logger.warning(f"Lock {self.name} was lost, stopping lease renewal")
+                    return
+            except Exception as exception:
+                logger.warning(f"Failed to renew the lease of lock {self.name}: {exception}")
@@ -1,56 +1,471 @@
-from collections.abc import Awaitable, Callable
+import asyncio
+import random
+import time
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from typing import Any, cast
 from unittest.mock import AsyncMock
 
 import fakeredis
 from redis.asyncio.client import Redis as AsyncRedis
-from redis.client import Redis
+from redis.asyncio.cluster import ClusterNode as AsyncClusterNode
+from redis.client import Pipeline, Redis
+from redis.cluster import PRIMARY, ClusterNode
+from redis.crc import REDIS_CLUSTER_HASH_SLOTS, key_slot
+from redis.exceptions import ConnectionError as RedisConnectionError, RedisClusterException
 
 from archipy.adapters.redis.adapters import AsyncRedisAdapter, RedisAdapter
 from archipy.adapters.redis.ports import (
     AsyncRedisPort,
     RedisResponseType,
 )
+from archipy.adapters.redis.serializers import RedisCodec
 from archipy.configs.config_template import RedisConfig, RedisMode
 
+# Commands whose arguments are all keys and must map to one slot
+_MULTI_KEY_COMMANDS = frozenset(
+    {"MGET", "SINTER", "SINTERSTORE", "SUNION", "SUNIONSTORE", "SDIFF", "SDIFFSTORE", "PFCOUNT", "PFMERGE", "WATCH"},
+)
+# Multi-key commands that redis-py splits by slot on a cluster, summing the results
+_SPLIT_KEY_COMMANDS = frozenset({"DEL", "UNLINK", "EXISTS", "TOUCH"})
+# Commands whose first two arguments are keys
+_TWO_KEY_COMMANDS = frozenset({"RENAME", "RENAMENX", "SMOVE", "RPOPLPUSH", "BRPOPLPUSH", "LMOVE", "BLMOVE", "COPY"})
+# Commands taking the number of keys before the keys
+_NUMKEYS_COMMANDS = frozenset({"EVAL", "EVALSHA", "EVAL_RO", "EVALSHA_RO", "FCALL", "FCALL_RO"})
+# Keyless commands sent to every primary
+_BROADCAST_COMMANDS = frozenset({"DBSIZE", "KEYS", "FLUSHDB", "FLUSHALL", "SCRIPT LOAD", "SCRIPT FLUSH"})
+
+
+class RedisFaultInjector:
+    """Injects latency and failures into the round trips of the Redis mocks.
+
+    Every command, and every executed pipeline, counts as one round trip to the server, which
+    makes the mocks usable for benchmarking pipelining, batching and cluster fan-out without a
+    real Redis. Round trips are counted per command in ``round_trips``.
+
+    Args:
+        latency_ms (float): Latency added to every round trip in milliseconds. Defaults to 0.
+        command_latency_ms (dict[str, float] | None): Latency per command name, such as "GET",
+            "EVALSHA" or "PIPELINE", overriding ``latency_ms``. Defaults to None.
+        failure_rate (float): Probability between 0 and 1 that a round trip fails. Defaults to 0.
+        failing_commands (Iterable[str]): Command names that always fail. Defaults to none.
+        seed (int | None): Seed of the failure sampling, for reproducible runs. Defaults to None.
+
+    Example:
+        >>> faults = RedisFaultInjector(latency_ms=1, command_latency_ms={"PIPELINE": 2})
+        >>> redis = RedisMock(faults=faults)
+        >>> redis.set("key", "value")
+        >>> faults.round_trips["SET"]
+        1
+    """
+
+    __slots__ = ("_random", "command_latency_ms", "failing_commands", "failure_rate", "latency_ms", "round_trips")
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        command_latency_ms: dict[str, float] | None = None,
+        failure_rate: float = 0,
+        failing_commands: Iterable[str] = (),
+        seed: int | None = None,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.command_latency_ms = {name.upper(): latency for name, latency in (command_latency_ms or {}).items()}
+        self.failure_rate = failure_rate
+        self.failing_commands = frozenset(name.upper() for name in failing_commands)
+        self.round_trips: Counter[str] = Counter()
+        self._random = random.Random(seed)
+
+    def before_round_trip(self, command: str) -> None:
+        """Counts a round trip, sleeps for its latency and raises if it should fail.
+
+        Args:
+            command (str): Name of the command, or "PIPELINE" or "MULTI" for pipelines.
+
+        Raises:
+            redis.exceptions.ConnectionError: If the round trip is chosen to fail.
+        """
+        delay = self._record(command)
+        if delay:
+            time.sleep(delay)
+        self._raise_if_failing(command)
+
+    async def async_before_round_trip(self, command: str) -> None:
+        """Counts a round trip, sleeps for its latency without blocking the event loop and raises if it should fail.
+
+        Args:
+            command (str): Name of the command, or "PIPELINE" or "MULTI" for pipelines.
+
+        Raises:
+            redis.exceptions.ConnectionError: If the round trip is chosen to fail.
+        """
+        delay = self._record(command)
+        if delay:
+            await asyncio.sleep(delay)
+        self._raise_if_failing(command)
+
+    def _record(self, command: str) -> float:
+        """Counts a round trip and returns its latency in seconds."""
+        command = command.upper()
+        self.round_trips[command] += 1
+        return self.command_latency_ms.get(command, self.latency_ms) / 1000
+
+    def _raise_if_failing(self, command: str) -> None:
+        """Raises a connection error for failing commands and sampled failures."""
+        command = command.upper()
+        if command in self.failing_commands or (self.failure_rate and self._random.random() < self.failure_rate):
+            raise RedisConnectionError(f"Injected failure on {command}")
+
+
+def _command_name(args: tuple[Any, ...]) -> str:
+    """Returns the upper-case name of a command from its arguments."""
+    return str(args[0]).upper()
+
+
+class _FaultInjectingPipeline(Pipeline):
+    """Fakeredis pipeline whose execution is one round trip of the fault injector."""
+
+    faults: RedisFaultInjector | None = None
+
+    def execute(self, raise_on_error: bool = True) -> list[Any]:
+        """Executes the queued commands after injecting the faults of one round trip."""
+        if self.faults is not None and self.command_stack:
+            self.faults.before_round_trip("MULTI" if cast(bool, self.transaction) else "PIPELINE")
+        return super().execute(raise_on_error)
+
+
+class _FaultInjectingRedis(fakeredis.FakeRedis):
+    """Fakeredis client injecting latency and failures into every command."""
+
+    def __init__(self, *args: Any, faults: RedisFaultInjector | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.faults = faults
+
+    def execute_command(self, *args: Any, **options: Any) -> Any:
+        """Executes a command after injecting the faults of one round trip."""
+        if self.faults is not None:
+            self.faults.before_round_trip(_command_name(args))
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        """Returns a pipeline executed as one round trip."""
+        pipeline = _FaultInjectingPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+        pipeline.faults = self.faults
+        return pipeline
+
+
+class FakeRedisCluster(_FaultInjectingRedis):
+    """In-process Redis cluster made of one fakeredis server per primary.
+
+    Keys are mapped to the 16384 hash slots with CRC16, honouring ``{hash tags}``, and every
+    primary owns a contiguous slot range, as on a real cluster. Commands are routed like
+    redis-py's ``RedisCluster`` does:
+
+    - Single-key commands go to the primary owning the key's slot.
+    - Multi-key commands, scripts and stream reads raise ``RedisClusterException`` when their
+      keys span several slots.
+    - DEL, UNLINK, EXISTS and TOUCH are split by slot.
+    - DBSIZE, KEYS, FLUSHDB, FLUSHALL and SCAN are sent to every primary, or to the
+      ``target_nodes`` given.
+
+    Args:
+        nodes (list[str]): Primary addresses as "host:port".
+        faults (RedisFaultInjector | None): Faults injected into every round trip to a primary. Defaults to None.
+        decode_responses (bool): Whether responses are decoded to strings. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        faults: RedisFaultInjector | None = None,
+        decode_responses: bool = True,
+    ) -> None:
+        super().__init__(decode_responses=decode_responses, faults=faults)
+        self.nodes: list[ClusterNode] = []
+        self.node_clients: dict[str, fakeredis.FakeRedis] = {}
+        for address in nodes:
+            host, port = address.rsplit(":", 1)
+            node = ClusterNode(host, int(port), server_type=PRIMARY)
+            self.nodes.append(node)
+            self.node_clients[node.name] = fakeredis.FakeRedis(
+                server=fakeredis.FakeServer(),
+                decode_responses=decode_responses,
+            )
+        # First slot of every node; node i owns the slots up to the first slot of node i + 1
+        self.slot_starts = [index * REDIS_CLUSTER_HASH_SLOTS // len(nodes) for index in range(len(nodes))]
+
+    def keyslot(self, key: Any) -> int:
+        """Returns the hash slot of a key.
+
+        Args:
+            key (Any): The key.
+
+        Returns:
+            int: The slot, between 0 and 16383.
+        """
+        if not isinstance(key, bytes):
+            key = str(key).encode()
+        return key_slot(key)
+
+    def get_primaries(self) -> list[ClusterNode]:
+        """Returns the primaries of the cluster."""
+        return list(self.nodes)
+
+    def get_nodes(self) -> list[ClusterNode]:
+        """Returns the nodes of the cluster."""
+        return list(self.nodes)
+
+    def get_node(self, node_name: str) -> ClusterNode | None:
+        """Returns the node with the given "host:port" name, if any."""
+        return next((node for node in self.nodes if node.name == node_name), None)
+
+    def get_node_from_key(self, key: Any) -> ClusterNode:
+        """Returns the primary owning the slot of a key."""
+        return self._node_for_slot(self.keyslot(key))
+
+    def cluster_keyslot(self, key: Any) -> int:
+        """Returns the hash slot of a key."""
+        return self.keyslot(key)
+
+    def cluster_info(self) -> dict[str, Any]:
+        """Returns the cluster state in the format of CLUSTER INFO."""
+        return {
+            "cluster_state": "ok",
+            "cluster_slots_assigned": REDIS_CLUSTER_HASH_SLOTS,
+            "cluster_slots_ok": REDIS_CLUSTER_HASH_SLOTS,
+            "cluster_slots_pfail": 0,
+            "cluster_slots_fail": 0,
+            "cluster_known_nodes": len(self.nodes),
+            "cluster_size": len(self.nodes),
+        }
+
+    def cluster_slots(self) -> list[tuple[int, int, list[Any]]]:
+        """Returns the slot range owned by every primary."""
+        return [
+            (start, end, [node.host, node.port])
+            for node, (start, end) in zip(self.nodes, self._slot_ranges(), strict=True)
+        ]
+
+    def cluster_nodes(self) -> str:
+        """Returns the nodes in the format of CLUSTER NODES."""
+        return "\n".join(
+            f"{index:040x} {node.name}@{node.port + 10000} master - 0 0 {index + 1} connected {start}-{end}"
+            for index, (node, (start, end)) in enumerate(zip(self.nodes, self._slot_ranges(), strict=True))
+        )
+
+    def cluster_countkeysinslot(self, slot: int) -> int:
+        """Returns the number of keys in a slot."""
+        return len(self._keys_in_slot(slot))
+
+    def cluster_getkeysinslot(self, slot: int, count: int) -> list[Any]:
+        """Returns up to count keys of a slot."""
+        return self._keys_in_slot(slot)[:count]
+
+    def pubsub(self, **kwargs: Any) -> Any:
+        """Returns a pub/sub object of the first primary, which receives every PUBLISH."""
+        return self.node_clients[self.nodes[0].name].pubsub(**kwargs)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> Pipeline:
+        """Returns a pipeline sending the commands of every primary in one round trip."""
+        return _FakeClusterPipeline(self, transaction)
+
+    def scan_iter(
+        self,
+        match: Any = None,
+        count: int | None = None,
+        _type: str | None = None,
+        **kwargs: Any,
+    ) -> Iterator:
+        """Iterates over the keys of every primary with SCAN."""
+        for node in self.nodes:
+            cursor = 0
+            while True:
+                cursors, keys = cast(
+                    tuple[dict[str, int], list],
+                    self.scan(cursor=cursor, match=match, count=count, _type=_type, target_nodes=node),
+                )
+                yield from keys
+                cursor = cursors[node.name]
+                if not cursor:
+                    break
+
+    def execute_command(self, *args: Any, **options: Any) -> Any:
+        """Routes a command to the primaries owning its keys, like redis-py's cluster client."""
+        command = _command_name(args)
+        target_nodes = options.pop("target_nodes", None)
+        if target_nodes is not None or command in _BROADCAST_COMMANDS or command == "SCAN":
+            if target_nodes is None:
+                nodes = self.nodes
+            else:
+                nodes = target_nodes if isinstance(target_nodes, list) else [target_nodes]
+            responses = {node.name: self._execute_on(node, args, options) for node in nodes}
+            return self._merge_responses(command, responses)
+        if command in _SPLIT_KEY_COMMANDS and len(args) > 2:
+            keys_by_slot: dict[int, list[Any]] = {}
+            for key in args[1:]:
+                keys_by_slot.setdefault(self.keyslot(key), []).append(key)
+            return sum(
+                self._execute_on(self._node_for_slot(slot), (args[0], *keys), options)
+                for slot, keys in keys_by_slot.items()
+            )
+        return self._execute_on(self.get_node_from_command(args), args, options)
+
+    def get_node_from_command(self, args: tuple[Any, ...]) -> ClusterNode:
+        """Returns the primary a command is routed to.
+
+        Args:
+            args (tuple[Any, ...]): The command name followed by its arguments.
+
+        Returns:
+            ClusterNode: The primary owning the slot of the command's keys, or the first primary for keyless commands.
+
+        Raises:
+            RedisClusterException: If the keys of the command span several slots.
+        """
+        keys = _command_keys(args)
+        if not keys:
+            return self.nodes[0]
+        slots = {self.keyslot(key) for key in keys}
+        if len(slots) > 1:
+            raise RedisClusterException(f"{_command_name(args)} - all keys must map to the same key slot")
+        return self._node_for_slot(slots.pop())
+
+    def _node_for_slot(self, slot: int) -> ClusterNode:
+        """Returns the primary owning a slot."""
+        return self.nodes[bisect_right(self.slot_starts, slot) - 1]
+
+    def _execute_on(self, node: ClusterNode, args: tuple[Any, ...], options: dict[str, Any]) -> Any:
+        """Executes a command on one primary as one round trip."""
+        if self.faults is not None:
+            self.faults.before_round_trip(_command_name(args))
+        return self.node_clients[node.name].execute_command(*args, **options)
+
+    def _merge_responses(self, command: str, responses: dict[str, Any]) -> Any:
+        """Merges the responses of a command sent to several primaries."""
+        match command:
+            case "SCAN":
+                cursors = {name: response[0] for name, response in responses.items()}
+                return cursors, [key for _, keys in responses.values() for key in keys]
+            case "DBSIZE":
+                return sum(responses.values())
+            case "KEYS":
+                return [key for keys in responses.values() for key in keys]
+            case _:
+                return next(iter(responses.values()))
+
+    def _slot_ranges(self) -> list[tuple[int, int]]:
+        """Returns the first and last slot owned by every primary."""
+        ends = [start - 1 for start in self.slot_starts[1:]] + [REDIS_CLUSTER_HASH_SLOTS - 1]
+        return list(zip(self.slot_starts, ends, strict=True))
+
+    def _keys_in_slot(self, slot: int) -> list[Any]:
+        """Returns the keys of a slot."""
+        node_client = self.node_clients[self._node_for_slot(slot).name]
+        return [key for key in node_client.scan_iter() if self.keyslot(key) == slot]
+
+
+def _command_keys(args: tuple[Any, ...]) -> list[Any]:
+    """Returns the keys a command operates on, for routing it to a cluster primary."""
+    command = _command_name(args)
+    arguments = list(args[1:])
+    if not arguments:
+        return []
+    if command in _MULTI_KEY_COMMANDS or command in _SPLIT_KEY_COMMANDS:
+        return arguments
+    if command in ("MSET", "MSETNX"):
+        return arguments[::2]
+    if command in _TWO_KEY_COMMANDS:
+        return arguments[:2]
+    if command in ("BLPOP", "BRPOP", "BZPOPMIN", "BZPOPMAX"):
+        return arguments[:-1]
+    if command in _NUMKEYS_COMMANDS:
+        return arguments[2 : 2 + int(arguments[1])]
+    if command in ("XREAD", "XREADGROUP"):
+        streams = [str(argument).upper() for argument in arguments].index("STREAMS")
+        names_and_ids = arguments[streams + 1 :]
+        return names_and_ids[: len(names_and_ids) // 2]
+    if command in ("PING", "INFO", "TIME", "PUBLISH", "RANDOMKEY") or " " in command:
+        return []
+    return arguments[:1]
+
+
+class _FakeClusterPipeline(Pipeline):
+    """Pipeline of a FakeRedisCluster, grouping the queued commands by primary.
+
+    The commands of every primary are sent together, in one round trip for the whole pipeline,
+    as redis-py writes to all primaries before reading the replies. Transactions must keep all
+    their keys in one slot.
+    """
+
+    def __init__(self, cluster: FakeRedisCluster, transaction: bool) -> None:
+        super().__init__(cluster.connection_pool, cluster.response_callbacks, transaction, None)
+        self.cluster = cluster
+
+    def execute(self, raise_on_error: bool = True) -> list[Any]:
+        """Executes the queued commands on their primaries and returns the replies in order.
+
+        Raises:
+            RedisClusterException: If a command, or a transaction, spans several slots.
+        """
+        if not self.command_stack:
+            return []
+        transaction = cast(bool, self.transaction)
+        if transaction:
+            slots = {self.cluster.keyslot(key) for args, _ in self.command_stack for key in _command_keys(args)}
+            if len(slots) > 1:
+                raise RedisClusterException("MULTI - all keys must map to the same key slot")
+        indexes_by_node: dict[str, list[int]] = {}
+        for index, (args, _) in enumerate(self.command_stack):
+            indexes_by_node.setdefault(self.cluster.get_node_from_command(args).name, []).append(index)
+        if self.cluster.faults is not None:
+            self.cluster.faults.before_round_trip("MULTI" if transaction else "PIPELINE")
+        replies: list[Any] = [None] * len(self.command_stack)
+        for name, indexes in indexes_by_node.items():
+            pipeline = self.cluster.node_clients[name].pipeline(transaction=transaction)
+            for index in indexes:
+                args, options = self.command_stack[index]
+                pipeline.execute_command(*args, **options)
+            for index, reply in zip(indexes, pipeline.execute(raise_on_error=False), strict=True):
+                replies[index] = reply
+        self.reset()
+        if raise_on_error:
+            for reply in replies:
+                if isinstance(reply, Exception):
+                    raise reply
+        return replies
+
 
 class RedisMock(RedisAdapter):
-    """A Redis adapter implementation using fakeredis for testing."""
+    """A Redis adapter implementation using fakeredis for testing.
+
+    In cluster mode every address of ``CLUSTER_NODES`` becomes a separate in-process primary
+    of a FakeRedisCluster, so slot routing and cluster fan-out behave as on a real cluster.
 
-    def __init__(self, redis_config: RedisConfig | None = None) -> None:
+    Args:
+        redis_config (RedisConfig | None): Configuration settings for Redis. If None, retrieves from
+            global config. Defaults to None.
+        faults (RedisFaultInjector | None): Latency and failures injected into every round trip.
+            Defaults to None.
+    """
+
+    def __init__(self, redis_config: RedisConfig | None = None, faults: RedisFaultInjector | None = None) -> None:
         # Skip the parent's __init__ which would create real Redis connections
         from archipy.configs.base_config import BaseConfig
 
         self.config = redis_config or BaseConfig.global_config().REDIS
+        self.codec = RedisCodec.from_config(self.config)
+        self.faults = faults
 
         # Create fake redis clients based on mode
         self._setup_fake_clients()
 
     def _setup_fake_clients(self) -> None:
         """Setup fake Redis clients that simulate different modes."""
-        self.client = fakeredis.FakeRedis(decode_responses=True)
-
-        # For testing purposes, we simulate different modes
         if self.config.MODE == RedisMode.CLUSTER:
-            # Add cluster-specific mock methods
-            self.client.cluster_info = lambda: {
-                "cluster_state": "ok",
-                "cluster_slots_assigned": 16384,
-                "cluster_slots_ok": 16384,
-                "cluster_slots_pfail": 0,
-                "cluster_slots_fail": 0,
-                "cluster_known_nodes": 6,
-                "cluster_size": 3,
-            }
-            self.client.cluster_nodes = lambda: "fake cluster nodes info"
-            self.client.cluster_slots = lambda: [
-                (0, 5460, ["127.0.0.1", 7000]),
-                (5461, 10922, ["127.0.0.1", 7001]),
-                (10923, 16383, ["127.0.0.1", 7002]),
-            ]
-            self.client.cluster_keyslot = lambda key: hash(key) % 16384
-            self.client.cluster_countkeysinslot = lambda slot: 0
-            self.client.cluster_getkeysinslot = lambda slot, count: []
+            self.client = FakeRedisCluster(self.config.CLUSTER_NODES, faults=self.faults)
+        else:
+            self.client = _FaultInjectingRedis(decode_responses=True, faults=self.faults)
 
         self.read_only_client = self.client
 
@@ -63,15 +478,54 @@ class RedisMock(RedisAdapter):
         # Override to return fakeredis instead
         return fakeredis.FakeRedis(decode_responses=configs.DECODE_RESPONSES)
 
+    def _get_primaries(self) -> list[ClusterNode] | None:
+        # The fake cluster exposes its primaries like RedisCluster does
+        return self.client.get_primaries() if isinstance(self.client, FakeRedisCluster) else None
+
+
+class AsyncFakePipeline:
+    """Async facade over a fakeredis pipeline.
+
+    Commands are queued synchronously like on ``redis.asyncio`` pipelines and only
+    ``execute`` has to be awaited.
+    """
+
+    def __init__(self, pipeline: Any, faults: RedisFaultInjector | None = None) -> None:
+        self._pipeline = pipeline
+        self._faults = faults
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward command methods to the wrapped pipeline."""
+        return getattr(self._pipeline, name)
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        """Execute the queued commands."""
+        if self._faults is not None and len(self._pipeline):
+            await self._faults.async_before_round_trip("MULTI" if self._pipeline.transaction else "PIPELINE")
+        return self._pipeline.execute(raise_on_error)
+
 
 class AsyncRedisMock(AsyncRedisAdapter):
-    """An async Redis adapter implementation using fakeredis for testing."""
+    """An async Redis adapter implementation using fakeredis for testing.
+
+    In cluster mode commands are routed over a FakeRedisCluster with one in-process primary
+    per address of ``CLUSTER_NODES``. Injected latency is awaited, so concurrent commands
+    overlap as they would over real connections.
+
+    Args:
+        redis_config (RedisConfig | None): Configuration settings for Redis. If None, retrieves from
+            global config. Defaults to None.
+        faults (RedisFaultInjector | None): Latency and failures injected into every round trip.
+            Defaults to None.
+    """
 
-    def __init__(self, redis_config: RedisConfig | None = None) -> None:
+    def __init__(self, redis_config: RedisConfig | None = None, faults: RedisFaultInjector | None = None) -> None:
         # Skip the parent's __init__ which would create real Redis connections
         from archipy.configs.base_config import BaseConfig
 
         self.config = redis_config or BaseConfig.global_config().REDIS
+        self.codec = RedisCodec.from_config(self.config)
+        self.faults = faults
 
         # Create fake async redis clients based on mode
         self._setup_async_fake_clients()
@@ -81,34 +535,17 @@ class AsyncRedisMock(AsyncRedisAdapter):
         self.client = AsyncMock()
         self.read_only_client = self.client
 
-        # Create a synchronous fakeredis instance to handle the actual operations
-        self._fake_redis = fakeredis.FakeRedis(decode_responses=True)
+        # Create a synchronous fakeredis instance to handle the actual operations; faults are
+        # injected by the async wrappers so that latency does not block the event loop
+        self._fake_redis: fakeredis.FakeRedis
+        if self.config.MODE == RedisMode.CLUSTER:
+            self._fake_redis = FakeRedisCluster(self.config.CLUSTER_NODES)
+        else:
+            self._fake_redis = fakeredis.FakeRedis(decode_responses=True)
 
-        # Set up basic async methods
+        # Set up basic async methods, including the cluster methods of the fake cluster
         self._setup_async_methods()
 
-        # Add mode-specific methods
-        if self.config.MODE == RedisMode.CLUSTER:
-            # Add cluster-specific async mock methods
-            self.client.cluster_info.side_effect = lambda: {
-                "cluster_state": "ok",
-                "cluster_slots_assigned": 16384,
-                "cluster_slots_ok": 16384,
-                "cluster_slots_pfail": 0,
-                "cluster_slots_fail": 0,
-                "cluster_known_nodes": 6,
-                "cluster_size": 3,
-            }
-            self.client.cluster_nodes.side_effect = lambda: "fake cluster nodes info"
-            self.client.cluster_slots.side_effect = lambda: [
-                (0, 5460, ["127.0.0.1", 7000]),
-                (5461, 10922, ["127.0.0.1", 7001]),
-                (10923, 16383, ["127.0.0.1", 7002]),
-            ]
-            self.client.cluster_keyslot.side_effect = lambda key: hash(key) % 16384
-            self.client.cluster_countkeysinslot.side_effect = lambda slot: 0
-            self.client.cluster_getkeysinslot.side_effect = lambda slot, count: []
-
     def _set_clients(self, configs: RedisConfig) -> None:
         # Override to prevent actual connection setup
         pass
@@ -118,6 +555,12 @@ class AsyncRedisMock(AsyncRedisAdapter):
         # Override to return a mocked async client
         return AsyncMock()
 
+    def _get_primaries(self) -> list[AsyncClusterNode] | None:
+        # Mirror the primaries of the fake cluster with the node type of the async cluster client
+        if not isinstance(self._fake_redis, FakeRedisCluster):
+            return None
+        return [AsyncClusterNode(node.host, node.port, node.server_type) for node in self._fake_redis.get_primaries()]
+
     def _setup_async_methods(self) -> None:
         """Set up all async methods to use a synchronous fakeredis under the hood."""
         # For each async method, implement it to use the synchronous fakeredis
@@ -129,6 +572,13 @@ class AsyncRedisMock(AsyncRedisAdapter):
                     setattr(self.client, method_name, async_method)
                     setattr(self.read_only_client, method_name, async_method)
 
+        # Commands sent with options such as NEVER_DECODE go through execute_command
+        self.client.execute_command = self._create_async_wrapper("execute_command", self._fake_redis.execute_command)
+        self.client.pipeline = lambda transaction=True, shard_hint=None: AsyncFakePipeline(
+            self._fake_redis.pipeline(transaction, shard_hint),
+            self.faults,
+        )
+
     def _create_async_wrapper(
         self,
         method_name: str,
@@ -140,6 +590,10 @@ class AsyncRedisMock(AsyncRedisAdapter):
             # Remove 'self' from args when calling the sync method
             if args and args[0] is self:
                 args = args[1:]
+            if self.faults is not None:
+                await self.faults.async_before_round_trip(
+                    _command_name(args) if method_name == "execute_command" else method_name,
+                )
             return cast(RedisResponseType, sync_method(*args, **kwargs))
 
         return wrapper
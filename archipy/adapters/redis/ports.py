@@ -3,6 +3,10 @@ from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
 from datetime import datetime, timedelta
 from typing import Any
 
+from pydantic import BaseModel
+
+from archipy.adapters.redis.serializers import RedisCodec
+
 # Define generic type variables for better type hinting
 RedisAbsExpiryType = int | datetime
 RedisExpiryType = int | timedelta
@@ -14,6 +18,8 @@ RedisPatternType = bytes | str
 RedisResponseType = Awaitable[Any] | Any
 RedisSetType = int | bytes | str | float
 RedisScoreCastType = type | Callable
+# Alias so annotations inside the ports are not shadowed by their type() method
+type RedisModelType[M: BaseModel] = type[M]
 
 
 class RedisPort:
@@ -161,6 +167,9 @@ class RedisPort:
     def keys(self, pattern: RedisPatternType = "*", **kwargs: Any) -> RedisResponseType:
         """Returns all keys matching a pattern.
 
+        KEYS blocks the server while it walks the whole keyspace; prefer ``scan_iter`` or the
+        ``*_by_pattern`` methods on large databases.
+
         Args:
             pattern (RedisPatternType): The pattern to match keys against. Defaults to "*".
             **kwargs (Any): Additional arguments for the underlying implementation.
@@ -173,6 +182,86 @@ class RedisPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Deletes all keys matching a pattern without blocking the server.
+
+        Keys are found with SCAN and removed with UNLINK in pipelined batches, so the server frees
+        memory in the background. In cluster mode every primary is processed in parallel.
+
+        Args:
+            pattern (RedisPatternType): The pattern to match keys against.
+            batch_size (int): Number of keys scanned and processed per round trip. Defaults to 500.
+            max_keys_per_second (int | None): Maximum number of keys processed per second on each node,
+                so maintenance does not starve production traffic. None disables the limit. Defaults to None.
+
+        Returns:
+            int: The number of keys deleted.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def expire_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        ttl: RedisExpiryType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Sets the time to live of all keys matching a pattern without blocking the server.
+
+        Keys are found with SCAN and updated with EXPIRE in pipelined batches. In cluster mode
+        every primary is processed in parallel.
+
+        Args:
+            pattern (RedisPatternType): The pattern to match keys against.
+            ttl (RedisExpiryType): The time to live, in seconds or as a timedelta.
+            batch_size (int): Number of keys scanned and processed per round trip. Defaults to 500.
+            max_keys_per_second (int | None): Maximum number of keys processed per second on each node,
+                so maintenance does not starve production traffic. None disables the limit. Defaults to None.
+
+        Returns:
+            int: The number of keys updated.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 1000,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Counts the keys matching a pattern without blocking the server.
+
+        Keys are counted with SCAN, so the result can miss or double-count keys changed while the
+        scan runs. In cluster mode every primary is scanned in parallel.
+
+        Args:
+            pattern (RedisPatternType): The pattern to match keys against.
+            batch_size (int): Number of keys scanned and processed per round trip. Defaults to 1000.
+            max_keys_per_second (int | None): Maximum number of keys processed per second on each node,
+                so maintenance does not starve production traffic. None disables the limit. Defaults to None.
+
+        Returns:
+            int: The number of matching keys.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def getset(self, key: RedisKeyType, value: bytes | str | float) -> RedisResponseType:
         """Sets a key to a value and returns its old value.
@@ -1053,6 +1142,296 @@ class RedisPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def xadd(
+        self,
+        name: RedisKeyType,
+        fields: Mapping[str, bytes | str | float],
+        id: str = "*",
+        maxlen: int | None = None,
+        approximate: bool = True,
+    ) -> RedisResponseType:
+        """Appends an entry to a stream, optionally trimming it to a maximum length.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            fields (Mapping[str, bytes | str | float]): The field-value pairs of the entry.
+            id (str): The entry ID, or "*" to let the server generate it. Defaults to "*".
+            maxlen (int | None): Trim the stream to about this many entries. Defaults to None.
+            approximate (bool): Trim with "~" so whole macro nodes are evicted, which is much cheaper
+                than exact trimming. Defaults to True.
+
+        Returns:
+            RedisResponseType: The ID of the added entry.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def xlen(self, name: RedisKeyType) -> RedisIntegerResponseType:
+        """Returns the number of entries in a stream.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+
+        Returns:
+            RedisIntegerResponseType: The number of entries.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def xgroup_create(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        id: str = "$",
+        mkstream: bool = False,
+    ) -> RedisResponseType:
+        """Creates a consumer group on a stream.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+            id (str): The last delivered ID the group starts from; "$" reads only new entries and
+                "0" reads the whole stream. Defaults to "$".
+            mkstream (bool): Create the stream if it doesn't exist. Defaults to False.
+
+        Returns:
+            RedisResponseType: True if the group was created.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: Mapping[RedisKeyType, str],
+        count: int | None = None,
+        block: int | None = None,
+        noack: bool = False,
+    ) -> RedisResponseType:
+        """Reads entries from streams as a member of a consumer group.
+
+        Args:
+            groupname (str): The name of the consumer group.
+            consumername (str): The name of the consumer within the group.
+            streams (Mapping[RedisKeyType, str]): Stream keys mapped to the ID to read after; ">" reads
+                entries never delivered to the group, other IDs re-read this consumer's pending entries.
+            count (int | None): The maximum number of entries per stream. Defaults to None.
+            block (int | None): Milliseconds to wait for new entries, or None to return immediately.
+                Defaults to None.
+            noack (bool): Skip adding the entries to the pending entries list. Defaults to False.
+
+        Returns:
+            RedisResponseType: A list of [stream, [(id, fields), ...]] pairs.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def xack(self, name: RedisKeyType, groupname: str, *ids: str) -> RedisIntegerResponseType:
+        """Acknowledges entries, removing them from the pending entries list of a group.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+            *ids (str): The IDs of the entries to acknowledge.
+
+        Returns:
+            RedisIntegerResponseType: The number of entries acknowledged.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def xpending(self, name: RedisKeyType, groupname: str) -> RedisResponseType:
+        """Returns a summary of the pending entries of a consumer group.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+
+        Returns:
+            RedisResponseType: A dict with the number of pending entries, the smallest and greatest
+                pending IDs and the number of pending entries per consumer.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def xautoclaim(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: int | None = None,
+        justid: bool = False,
+    ) -> RedisResponseType:
+        """Transfers pending entries idle for too long to another consumer.
+
+        Use it to recover entries delivered to consumers that crashed before acknowledging them.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+            consumername (str): The consumer that takes over the entries.
+            min_idle_time (int): The minimum idle time of the claimed entries in milliseconds.
+            start_id (str): The ID to start scanning the pending entries list from. Defaults to "0-0".
+            count (int | None): The maximum number of entries to claim. Defaults to None.
+            justid (bool): Return only the IDs and don't increment the delivery counters. Defaults to False.
+
+        Returns:
+            RedisResponseType: A list of the next start ID, the claimed entries and, on Redis 7+, the IDs
+                of pending entries that no longer exist in the stream.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_bytes(self, key: str) -> RedisResponseType:
+        """Retrieves the raw value of a key without decoding it.
+
+        Use it for binary payloads such as serialized or compressed values, which cannot be
+        decoded as text by clients configured with ``decode_responses``.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            RedisResponseType: The raw bytes stored at the key, or None if the key doesn't exist.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_model[M: BaseModel](
+        self,
+        key: str,
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> M | None:
+        """Retrieves a pydantic model, such as a BaseDTO, stored with set_model.
+
+        Args:
+            key (str): The key to retrieve.
+            model_type (RedisModelType[M]): The model class to validate the value into.
+            codec (RedisCodec | None): The codec of the value. Defaults to the adapter codec.
+
+        Returns:
+            M | None: The model, or None if the key doesn't exist.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_model(
+        self,
+        key: str,
+        model: BaseModel,
+        ex: RedisExpiryType | None = None,
+        px: RedisExpiryType | None = None,
+        nx: bool = False,
+        xx: bool = False,
+        codec: RedisCodec | None = None,
+    ) -> RedisResponseType:
+        """Stores a pydantic model, such as a BaseDTO, encoded with a codec.
+
+        Args:
+            key (str): The key to set.
+            model (BaseModel): The model to store.
+            ex (RedisExpiryType | None): Expiration time in seconds or timedelta. Defaults to None.
+            px (RedisExpiryType | None): Expiration time in milliseconds or timedelta. Defaults to None.
+            nx (bool): Only set if the key does not exist. Defaults to False.
+            xx (bool): Only set if the key exists. Defaults to False.
+            codec (RedisCodec | None): The codec of the value. Defaults to the adapter codec.
+
+        Returns:
+            RedisResponseType: True if the key was set, None otherwise.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def mget_models[M: BaseModel](
+        self,
+        keys: Iterable[str],
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> list[M | None]:
+        """Retrieves several pydantic models stored with set_model in one round trip.
+
+        Args:
+            keys (Iterable[str]): The keys to retrieve.
+            model_type (RedisModelType[M]): The model class to validate the values into.
+            codec (RedisCodec | None): The codec of the values. Defaults to the adapter codec.
+
+        Returns:
+            list[M | None]: The models in the order of the keys, with None for missing keys.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def eval(self, script: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Executes a Lua script on the server.
+
+        Args:
+            script (str): The Lua script to execute.
+            numkeys (int): The number of leading arguments in ``keys_and_args`` that are key names.
+            *keys_and_args (bytes | str | float): The key names followed by the script arguments.
+
+        Returns:
+            RedisResponseType: The value returned by the script.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Executes a Lua script cached on the server by its SHA1 digest.
+
+        Args:
+            sha (str): The SHA1 digest of the cached script.
+            numkeys (int): The number of leading arguments in ``keys_and_args`` that are key names.
+            *keys_and_args (bytes | str | float): The key names followed by the script arguments.
+
+        Returns:
+            RedisResponseType: The value returned by the script.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def pubsub(self, **kwargs: Any) -> Any:
         """Returns a pub/sub object for subscribing to channels.
@@ -1289,6 +1668,9 @@ class AsyncRedisPort:
     async def keys(self, pattern: RedisPatternType = "*", **kwargs: Any) -> RedisResponseType:
         """Returns all keys matching a pattern asynchronously.
 
+        KEYS blocks the server while it walks the whole keyspace; prefer ``scan_iter`` or the
+        ``*_by_pattern`` methods on large databases.
+
         Args:
             pattern (RedisPatternType): The pattern to match keys against. Defaults to "*".
             **kwargs (Any): Additional arguments for the underlying implementation.
@@ -1301,6 +1683,86 @@ class AsyncRedisPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Deletes all keys matching a pattern without blocking the server.
+
+        Keys are found with SCAN and removed with UNLINK in pipelined batches, so the server frees
+        memory in the background. In cluster mode every primary is processed in parallel.
+
+        Args:
+            pattern (RedisPatternType): The pattern to match keys against.
+            batch_size (int): Number of keys scanned and processed per round trip. Defaults to 500.
+            max_keys_per_second (int | None): Maximum number of keys processed per second on each node,
+                so maintenance does not starve production traffic. None disables the limit. Defaults to None.
+
+        Returns:
+            int: The number of keys deleted.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def expire_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        ttl: RedisExpiryType,
+        batch_size: int = 500,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Sets the time to live of all keys matching a pattern without blocking the server.
+
+        Keys are found with SCAN and updated with EXPIRE in pipelined batches. In cluster mode
+        every primary is processed in parallel.
+
+        Args:
+            pattern (RedisPatternType): The pattern to match keys against.
+            ttl (RedisExpiryType): The time to live, in seconds or as a timedelta.
+            batch_size (int): Number of keys scanned and processed per round trip. Defaults to 500.
+            max_keys_per_second (int | None): Maximum number of keys processed per second on each node,
+                so maintenance does not starve production traffic. None disables the limit. Defaults to None.
+
+        Returns:
+            int: The number of keys updated.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_by_pattern(
+        self,
+        pattern: RedisPatternType,
+        batch_size: int = 1000,
+        max_keys_per_second: int | None = None,
+    ) -> int:
+        """Counts the keys matching a pattern without blocking the server.
+
+        Keys are counted with SCAN, so the result can miss or double-count keys changed while the
+        scan runs. In cluster mode every primary is scanned in parallel.
+
+        Args:
+            pattern (RedisPatternType): The pattern to match keys against.
+            batch_size (int): Number of keys scanned and processed per round trip. Defaults to 1000.
+            max_keys_per_second (int | None): Maximum number of keys processed per second on each node,
+                so maintenance does not starve production traffic. None disables the limit. Defaults to None.
+
+        Returns:
+            int: The number of matching keys.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def getset(self, key: RedisKeyType, value: bytes | str | float) -> RedisResponseType:
         """Sets a key to a value and returns its old value asynchronously.
@@ -2181,6 +2643,296 @@ class AsyncRedisPort:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def xadd(
+        self,
+        name: RedisKeyType,
+        fields: Mapping[str, bytes | str | float],
+        id: str = "*",
+        maxlen: int | None = None,
+        approximate: bool = True,
+    ) -> RedisResponseType:
+        """Appends an entry to a stream, optionally trimming it to a maximum length.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            fields (Mapping[str, bytes | str | float]): The field-value pairs of the entry.
+            id (str): The entry ID, or "*" to let the server generate it. Defaults to "*".
+            maxlen (int | None): Trim the stream to about this many entries. Defaults to None.
+            approximate (bool): Trim with "~" so whole macro nodes are evicted, which is much cheaper
+                than exact trimming. Defaults to True.
+
+        Returns:
+            RedisResponseType: The ID of the added entry.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def xlen(self, name: RedisKeyType) -> RedisIntegerResponseType:
+        """Returns the number of entries in a stream.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+
+        Returns:
+            RedisIntegerResponseType: The number of entries.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def xgroup_create(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        id: str = "$",
+        mkstream: bool = False,
+    ) -> RedisResponseType:
+        """Creates a consumer group on a stream.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+            id (str): The last delivered ID the group starts from; "$" reads only new entries and
+                "0" reads the whole stream. Defaults to "$".
+            mkstream (bool): Create the stream if it doesn't exist. Defaults to False.
+
+        Returns:
+            RedisResponseType: True if the group was created.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: Mapping[RedisKeyType, str],
+        count: int | None = None,
+        block: int | None = None,
+        noack: bool = False,
+    ) -> RedisResponseType:
+        """Reads entries from streams as a member of a consumer group.
+
+        Args:
+            groupname (str): The name of the consumer group.
+            consumername (str): The name of the consumer within the group.
+            streams (Mapping[RedisKeyType, str]): Stream keys mapped to the ID to read after; ">" reads
+                entries never delivered to the group, other IDs re-read this consumer's pending entries.
+            count (int | None): The maximum number of entries per stream. Defaults to None.
+            block (int | None): Milliseconds to wait for new entries, or None to return immediately.
+                Defaults to None.
+            noack (bool): Skip adding the entries to the pending entries list. Defaults to False.
+
+        Returns:
+            RedisResponseType: A list of [stream, [(id, fields), ...]] pairs.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def xack(self, name: RedisKeyType, groupname: str, *ids: str) -> RedisIntegerResponseType:
+        """Acknowledges entries, removing them from the pending entries list of a group.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+            *ids (str): The IDs of the entries to acknowledge.
+
+        Returns:
+            RedisIntegerResponseType: The number of entries acknowledged.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def xpending(self, name: RedisKeyType, groupname: str) -> RedisResponseType:
+        """Returns a summary of the pending entries of a consumer group.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+
+        Returns:
+            RedisResponseType: A dict with the number of pending entries, the smallest and greatest
+                pending IDs and the number of pending entries per consumer.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def xautoclaim(
+        self,
+        name: RedisKeyType,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: int | None = None,
+        justid: bool = False,
+    ) -> RedisResponseType:
+        """Transfers pending entries idle for too long to another consumer.
+
+        Use it to recover entries delivered to consumers that crashed before acknowledging them.
+
+        Args:
+            name (RedisKeyType): The key of the stream.
+            groupname (str): The name of the consumer group.
+            consumername (str): The consumer that takes over the entries.
+            min_idle_time (int): The minimum idle time of the claimed entries in milliseconds.
+            start_id (str): The ID to start scanning the pending entries list from. Defaults to "0-0".
+            count (int | None): The maximum number of entries to claim. Defaults to None.
+            justid (bool): Return only the IDs and don't increment the delivery counters. Defaults to False.
+
+        Returns:
+            RedisResponseType: A list of the next start ID, the claimed entries and, on Redis 7+, the IDs
+                of pending entries that no longer exist in the stream.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_bytes(self, key: str) -> RedisResponseType:
+        """Retrieves the raw value of a key without decoding it asynchronously.
+
+        Use it for binary payloads such as serialized or compressed values, which cannot be
+        decoded as text by clients configured with ``decode_responses``.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            RedisResponseType: The raw bytes stored at the key, or None if the key doesn't exist.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_model[M: BaseModel](
+        self,
+        key: str,
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> M | None:
+        """Retrieves a pydantic model, such as a BaseDTO, stored with set_model.
+
+        Args:
+            key (str): The key to retrieve.
+            model_type (RedisModelType[M]): The model class to validate the value into.
+            codec (RedisCodec | None): The codec of the value. Defaults to the adapter codec.
+
+        Returns:
+            M | None: The model, or None if the key doesn't exist.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_model(
+        self,
+        key: str,
+        model: BaseModel,
+        ex: RedisExpiryType | None = None,
+        px: RedisExpiryType | None = None,
+        nx: bool = False,
+        xx: bool = False,
+        codec: RedisCodec | None = None,
+    ) -> RedisResponseType:
+        """Stores a pydantic model, such as a BaseDTO, encoded with a codec.
+
+        Args:
+            key (str): The key to set.
+            model (BaseModel): The model to store.
+            ex (RedisExpiryType | None): Expiration time in seconds or timedelta. Defaults to None.
+            px (RedisExpiryType | None): Expiration time in milliseconds or timedelta. Defaults to None.
+            nx (bool): Only set if the key does not exist. Defaults to False.
+            xx (bool): Only set if the key exists. Defaults to False.
+            codec (RedisCodec | None): The codec of the value. Defaults to the adapter codec.
+
+        Returns:
+            RedisResponseType: True if the key was set, None otherwise.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mget_models[M: BaseModel](
+        self,
+        keys: Iterable[str],
+        model_type: RedisModelType[M],
+        codec: RedisCodec | None = None,
+    ) -> list[M | None]:
+        """Retrieves several pydantic models stored with set_model in one round trip.
+
+        Args:
+            keys (Iterable[str]): The keys to retrieve.
+            model_type (RedisModelType[M]): The model class to validate the values into.
+            codec (RedisCodec | None): The codec of the values. Defaults to the adapter codec.
+
+        Returns:
+            list[M | None]: The models in the order of the keys, with None for missing keys.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def eval(self, script: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Executes a Lua script on the server asynchronously.
+
+        Args:
+            script (str): The Lua script to execute.
+            numkeys (int): The number of leading arguments in ``keys_and_args`` that are key names.
+            *keys_and_args (bytes | str | float): The key names followed by the script arguments.
+
+        Returns:
+            RedisResponseType: The value returned by the script.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: bytes | str | float) -> RedisResponseType:
+        """Executes a Lua script cached on the server by its SHA1 digest asynchronously.
+
+        Args:
+            sha (str): The SHA1 digest of the cached script.
+            numkeys (int): The number of leading arguments in ``keys_and_args`` that are key names.
+            *keys_and_args (bytes | str | float): The key names followed by the script arguments.
+
+        Returns:
+            RedisResponseType: The value returned by the script.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def pubsub(self, **kwargs: Any) -> Any:
         """Returns a pub/sub object for subscribing to channels asynchronously.
@@ -0,0 +1,361 @@
+import pickle
+import threading
+from abc import abstractmethod
+from typing import Any, Literal
+
+import pydantic_core
+from pydantic import BaseModel
+
+from archipy.configs.config_template import RedisConfig
+from archipy.models.errors import InvalidArgumentError
+
+RedisSerializerName = Literal["json", "pickle", "orjson", "msgpack"]
+RedisCompressionName = Literal["zstd", "lz4"]
+
+# First byte of every value encoded by RedisCodec, naming the compression of the payload
+_UNCOMPRESSED = b"\x00"
+_ZSTD = b"\x01"
+_LZ4 = b"\x02"
+
+
+class RedisSerializer:
+    """Interface for converting Python values to and from the bytes stored in Redis."""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a value.
+
+        Args:
+            value (Any): The value to serialize.
+
+        Returns:
+            bytes: The serialized value.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserializes a value.
+
+        Args:
+            data (bytes): The serialized value.
+
+        Returns:
+            Any: The deserialized value.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass.
+        """
+        raise NotImplementedError
+
+    def dumps_model(self, model: BaseModel) -> bytes:
+        """Serializes a pydantic model, such as a BaseDTO.
+
+        Args:
+            model (BaseModel): The model to serialize.
+
+        Returns:
+            bytes: The serialized model.
+        """
+        return self.dumps(model.model_dump(mode="json"))
+
+    def loads_model[M: BaseModel](self, data: bytes, model_type: type[M]) -> M:
+        """Deserializes and validates a pydantic model.
+
+        Args:
+            data (bytes): The serialized model.
+            model_type (type[M]): The model class.
+
+        Returns:
+            M: The validated model.
+        """
+        return model_type.model_validate(self.loads(data))
+
+
+class JsonSerializer(RedisSerializer):
+    """Serializes JSON-compatible values, datetimes, UUIDs, enums and pydantic models with pydantic-core.
+
+    Models are dumped and validated directly from JSON bytes by pydantic's Rust core, without an
+    intermediate dict, which makes this the fastest choice for DTOs and needs no extra package.
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a value to JSON bytes."""
+        return pydantic_core.to_json(value)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserializes JSON bytes."""
+        return pydantic_core.from_json(data)
+
+    def dumps_model(self, model: BaseModel) -> bytes:
+        """Serializes a model to JSON bytes in one pass."""
+        return pydantic_core.to_json(model)
+
+    def loads_model[M: BaseModel](self, data: bytes, model_type: type[M]) -> M:
+        """Validates a model directly from JSON bytes."""
+        return model_type.model_validate_json(data)
+
+
+class PickleSerializer(RedisSerializer):
+    """Serializes any picklable Python object, including DTOs and datetimes.
+
+    Only use it for data written by trusted processes: unpickling runs arbitrary code.
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a value with the highest pickle protocol."""
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserializes a pickled value."""
+        return pickle.loads(data)
+
+    def dumps_model(self, model: BaseModel) -> bytes:
+        """Pickles the fields of a model, keeping datetimes and UUIDs native.
+
+        The model class itself is not pickled, so stored values survive the class being moved or renamed.
+        """
+        return self.dumps(model.model_dump())
+
+
+class OrjsonSerializer(RedisSerializer):
+    """Serializes JSON-compatible values, dataclasses, datetimes, UUIDs and enums with orjson.
+
+    Pydantic models use pydantic's own JSON fast path. Requires the ``orjson`` package.
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a value to JSON bytes."""
+        return self._orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserializes JSON bytes."""
+        return self._orjson.loads(data)
+
+    def dumps_model(self, model: BaseModel) -> bytes:
+        """Serializes a model to JSON bytes in one pass."""
+        return pydantic_core.to_json(model)
+
+    def loads_model[M: BaseModel](self, data: bytes, model_type: type[M]) -> M:
+        """Validates a model directly from JSON bytes."""
+        return model_type.model_validate_json(data)
+
+
+class MsgpackSerializer(RedisSerializer):
+    """Serializes JSON-like values to the compact MessagePack binary format.
+
+    Requires the ``msgpack`` package.
+    """
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        """Serializes a value to MessagePack bytes."""
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserializes MessagePack bytes."""
+        return self._msgpack.unpackb(data, raw=False)
+
+
+def get_serializer(serializer: RedisSerializerName | RedisSerializer) -> RedisSerializer:
+    """Resolves a serializer name to a serializer instance.
+
+    Args:
+        serializer (RedisSerializerName | RedisSerializer): A serializer name ("json", "pickle", "orjson"
+            or "msgpack") or a serializer instance, which is returned unchanged.
+
+    Returns:
+        RedisSerializer: The serializer instance.
+
+    Raises:
+        InvalidArgumentError: If the serializer name is unknown.
+    """
+    if isinstance(serializer, RedisSerializer):
+        return serializer
+    match serializer:
+        case "json":
+            return JsonSerializer()
+        case "pickle":
+            return PickleSerializer()
+        case "orjson":
+            return OrjsonSerializer()
+        case "msgpack":
+            return MsgpackSerializer()
+        case _:
+            raise InvalidArgumentError(argument_name="serializer")
+
+
+class RedisCodec:
+    """Encodes values for Redis with a serializer and optional compression.
+
+    Payloads at least ``compression_threshold`` bytes long are compressed with zstd or lz4;
+    smaller ones are stored as is, since compressing them costs CPU without saving bytes.
+    Every encoded value starts with a one-byte header naming its compression, so values stay
+    readable after the compression settings change.
+
+    A codec can be shared by threads: zstd contexts are not thread-safe, so each thread compresses
+    and decompresses with contexts of its own.
+
+    Args:
+        serializer (RedisSerializerName | RedisSerializer): The serializer of the values. Defaults to "json".
+        compression (RedisCompressionName | None): "zstd" (requires the ``zstandard`` package), "lz4"
+            (requires the ``lz4`` package) or None to disable compression. Defaults to None.
+        compression_threshold (int): Minimum payload size in bytes to compress. Defaults to 1024.
+        compression_level (int | None): Compression level, or None for the library default. Defaults to None.
+
+    Raises:
+        InvalidArgumentError: If the serializer or compression name is unknown.
+
+    Example:
+        >>> codec = RedisCodec("msgpack", compression="zstd", compression_threshold=512)
+        >>> codec.decode(codec.encode({"id": 1}))
+        {'id': 1}
+    """
+
+    __slots__ = (
+        "_local",
+        "compression",
+        "compression_level",
+        "compression_threshold",
+        "serializer",
+    )
+
+    def __init__(
+        self,
+        serializer: RedisSerializerName | RedisSerializer = "json",
+        compression: RedisCompressionName | None = None,
+        compression_threshold: int = 1024,
+        compression_level: int | None = None,
+    ) -> None:
+        self.serializer = get_serializer(serializer)
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self._local = threading.local()
+        match compression:
+            case None:
+                pass
+            case "zstd":
+                import zstandard  # noqa: F401 - fail at construction when the package is missing
+            case "lz4":
+                import lz4.frame  # noqa: F401 - fail at construction when the package is missing
+            case _:
+                raise InvalidArgumentError(argument_name="compression")
+
+    @classmethod
+    def from_config(cls, config: RedisConfig) -> "RedisCodec":
+        """Creates the codec described by a Redis configuration.
+
+        Args:
+            config (RedisConfig): The Redis configuration.
+
+        Returns:
+            RedisCodec: The codec.
+        """
+        return cls(
+            config.SERIALIZER,
+            config.COMPRESSION,
+            config.COMPRESSION_THRESHOLD,
+            config.COMPRESSION_LEVEL,
+        )
+
+    def encode(self, value: Any) -> bytes:
+        """Serializes and, above the threshold, compresses a value.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The encoded value.
+        """
+        return self._compress(self.serializer.dumps(value))
+
+    def decode(self, data: bytes) -> Any:
+        """Decompresses and deserializes a value encoded by any RedisCodec.
+
+        Args:
+            data (bytes): The encoded value.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return self.serializer.loads(self._decompress(data))
+
+    def encode_model(self, model: BaseModel) -> bytes:
+        """Serializes and, above the threshold, compresses a pydantic model.
+
+        Args:
+            model (BaseModel): The model to encode, such as a BaseDTO.
+
+        Returns:
+            bytes: The encoded model.
+        """
+        return self._compress(self.serializer.dumps_model(model))
+
+    def decode_model[M: BaseModel](self, data: bytes, model_type: type[M]) -> M:
+        """Decompresses, deserializes and validates a pydantic model.
+
+        Args:
+            data (bytes): The encoded model.
+            model_type (type[M]): The model class.
+
+        Returns:
+            M: The validated model.
+        """
+        return self.serializer.loads_model(self._decompress(data), model_type)
+
+    def _zstd_compressor(self) -> Any:
+        """Returns the zstd compressor of the calling thread, creating it on first use."""
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            import zstandard
+
+            level = 3 if self.compression_level is None else self.compression_level
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=level)
+        return compressor
+
+    def _zstd_decompressor(self) -> Any:
+        """Returns the zstd decompressor of the calling thread, creating it on first use."""
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            import zstandard
+
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor
+
+    def _compress(self, payload: bytes) -> bytes:
+        """Prefixes a payload with its compression header, compressing it above the threshold."""
+        if self.compression is None or len(payload) < self.compression_threshold:
+            return _UNCOMPRESSED + payload
+        if self.compression == "zstd":
+            return _ZSTD + self._zstd_compressor().compress(payload)
+        import lz4.frame
+
+        if self.compression_level is None:
+            return _LZ4 + lz4.frame.compress(payload)
+        return _LZ4 + lz4.frame.compress(payload, compression_level=self.compression_level)
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Strips the compression header of a value and decompresses its payload."""
+        header, payload = data[:1], data[1:]
+        if header == _UNCOMPRESSED:
+            return payload
+        if header == _ZSTD:
+            return self._zstd_decompressor().decompress(payload)
+        if header == _LZ4:
+            import lz4.frame
+
+            return lz4.frame.decompress(payload)
+        raise InvalidArgumentError(argument_name="data")
@@ -0,0 +1,242 @@
+import asyncio
+import functools
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+from archipy.adapters.redis.lock import AsyncRedisLock, RedisLock
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
+from archipy.models.errors import ResourceLockedError
+
+
+class SingleFlight:
+    """Collapses concurrent computations of the same key into a single call.
+
+    Threads asking for a key that is already being computed in this process wait for
+    that computation instead of starting their own. When a Redis client is given the
+    leader of each process also takes a RedisLock on the key, so only one process at a
+    time computes it; processes that had to wait for the lock call ``recheck`` first,
+    which typically reads the value the previous holder just cached.
+
+    Args:
+        redis_client (RedisPort | None): Redis adapter used for cross-process locking.
+            If None, calls are only collapsed within this process. Defaults to None.
+        lock_timeout_ms (int): Lease of the cross-process lock, renewed while computing. Defaults to 30000.
+        wait_timeout_ms (int | None): Maximum time to wait for another process. None waits forever.
+            Defaults to 10000.
+        key_prefix (str): Prefix of the Redis lock keys. Defaults to "single_flight".
+
+    Example:
+        >>> flight = SingleFlight(RedisAdapter())
+        >>> report = flight.do(
+        ...     f"report:{report_id}",
+        ...     lambda: build_and_cache_report(report_id),
+        ...     recheck=lambda: load_cached_report(report_id),
+        ... )
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisPort | None = None,
+        lock_timeout_ms: int = 30000,
+        wait_timeout_ms: int | None = 10000,
+        key_prefix: str = "single_flight",
+    ) -> None:
+        self.redis_client = redis_client
+        self.lock_timeout_ms = lock_timeout_ms
+        self.wait_timeout_ms = wait_timeout_ms
+        self.key_prefix = key_prefix
+        self._calls: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do[T](self, key: str, func: Callable[[], T], recheck: Callable[[], T | None] | None = None) -> T:
+        """Returns the result of ``func`` for the key, sharing it with concurrent callers.
+
+        Args:
+            key (str): Identifies the computation.
+            func (Callable[[], T]): Computes the value.
+            recheck (Callable[[], T | None] | None): Looks up a value produced by another process.
+                Called after waiting for the cross-process lock; a non-None result is returned
+                without calling ``func``. Defaults to None.
+
+        Returns:
+            T: The computed or shared value.
+
+        Raises:
+            ResourceLockedError: If another process held the lock longer than ``wait_timeout_ms``.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = self._execute(key, func, recheck)
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def _execute[T](self, key: str, func: Callable[[], T], recheck: Callable[[], T | None] | None) -> T:
+        """Runs the computation under the cross-process lock when Redis is configured.
+
+        Args:
+            key (str): Identifies the computation.
+            func (Callable[[], T]): Computes the value.
+            recheck (Callable[[], T | None] | None): Looks up a value produced by another process.
+
+        Returns:
+            T: The computed or shared value.
+
+        Raises:
+            ResourceLockedError: If another process held the lock longer than ``wait_timeout_ms``.
+        """
+        if self.redis_client is None:
+            return func()
+
+        lock = RedisLock(
+            self.redis_client,
+            key,
+            timeout_ms=self.lock_timeout_ms,
+            auto_extend=True,
+            key_prefix=self.key_prefix,
+        )
+        waited = not lock.acquire(blocking=False)
+        if waited and not lock.acquire(blocking_timeout_ms=self.wait_timeout_ms):
+            raise ResourceLockedError(resource_id=key)
+        try:
+            if waited and recheck is not None and (value := recheck()) is not None:
+                return value
+            return func()
+        finally:
+            lock.release()
+
+
+class AsyncSingleFlight:
+    """Collapses concurrent async computations of the same key into a single call.
+
+    Coroutines asking for a key that is already being computed in this process await the
+    task running that computation. When a Redis client is given the
+    leader of each process also takes an AsyncRedisLock on the key, so only one process at
+    a time computes it; processes that had to wait for the lock call ``recheck`` first,
+    which typically reads the value the previous holder just cached.
+
+    Args:
+        redis_client (AsyncRedisPort | None): Async Redis adapter used for cross-process locking.
+            If None, calls are only collapsed within this process. Defaults to None.
+        lock_timeout_ms (int): Lease of the cross-process lock, renewed while computing. Defaults to 30000.
+        wait_timeout_ms (int | None): Maximum time to wait for another process. None waits forever.
+            Defaults to 10000.
+        key_prefix (str): Prefix of the Redis lock keys. Defaults to "single_flight".
+
+    Example:
+        >>> flight = AsyncSingleFlight(AsyncRedisAdapter())
+        >>> report = await flight.do(
+        ...     f"report:{report_id}",
+        ...     lambda: build_and_cache_report(report_id),
+        ...     recheck=lambda: load_cached_report(report_id),
+        ... )
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedisPort | None = None,
+        lock_timeout_ms: int = 30000,
+        wait_timeout_ms: int | None = 10000,
+        key_prefix: str = "single_flight",
+    ) -> None:
+        self.redis_client = redis_client
+        self.lock_timeout_ms = lock_timeout_ms
+        self.wait_timeout_ms = wait_timeout_ms
+        self.key_prefix = key_prefix
+        self._calls: dict[str, asyncio.Task[Any]] = {}
+
+    async def do[T](
+        self,
+        key: str,
+        func: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None = None,
+    ) -> T:
+        """Returns the result of ``func`` for the key, sharing it with concurrent callers.
+
+        The computation runs in its own task, so a cancelled caller, the first one included,
+        does not cancel it for the others.
+
+        Args:
+            key (str): Identifies the computation.
+            func (Callable[[], Awaitable[T]]): Computes the value.
+            recheck (Callable[[], Awaitable[T | None]] | None): Looks up a value produced by another
+                process. Awaited after waiting for the cross-process lock; a non-None result is
+                returned without calling ``func``. Defaults to None.
+
+        Returns:
+            T: The computed or shared value.
+
+        Raises:
+            ResourceLockedError: If another process held the lock longer than ``wait_timeout_ms``.
+        """
+        if (task := self._calls.get(key)) is None:
+            task = self._calls[key] = asyncio.create_task(self._execute(key, func, recheck))
+            task.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Removes a finished computation so the next caller starts a new one.
+
+        Args:
+            key (str): Identifies the computation.
+            task (asyncio.Task[Any]): The finished task of the computation.
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when every caller was cancelled before it was raised
+        if not task.cancelled():
+            task.exception()
+
+    async def _execute[T](
+        self,
+        key: str,
+        func: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None,
+    ) -> T:
+        """Runs the computation under the cross-process lock when Redis is configured.
+
+        Args:
+            key (str): Identifies the computation.
+            func (Callable[[], Awaitable[T]]): Computes the value.
+            recheck (Callable[[], Awaitable[T | None]] | None): Looks up a value produced by another process.
+
+        Returns:
+            T: The computed or shared value.
+
+        Raises:
+            ResourceLockedError: If another process held the lock longer than ``wait_timeout_ms``.
+        """
+        if self.redis_client is None:
+            return await func()
+
+        lock = AsyncRedisLock(
+            self.redis_client,
+            key,
+            timeout_ms=self.lock_timeout_ms,
+            auto_extend=True,
+            key_prefix=self.key_prefix,
+        )
+        waited = not await lock.acquire(blocking=False)
+        if waited and not await lock.acquire(blocking_timeout_ms=self.wait_timeout_ms):
+            raise ResourceLockedError(resource_id=key)
+        try:
+            if waited and recheck is not None and (value := await recheck()) is not None:
+                return value
+            return await func()
+        finally:
+            await lock.release()
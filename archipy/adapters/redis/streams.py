@@ -0,0 +1,479 @@
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+
+from redis.exceptions import RedisError, ResponseError
+
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying after Redis errors in the consume loop
+_ERROR_BACKOFF_SECONDS = 1.0
+
+
+class RedisStreamMessage(NamedTuple):
+    """An entry read from a Redis stream.
+
+    Attributes:
+        stream (str): The key of the stream.
+        message_id (str): The ID of the entry.
+        fields (dict[str, str]): The field-value pairs of the entry.
+    """
+
+    stream: str
+    message_id: str
+    fields: dict[str, str]
+
+
+class _BaseRedisStreamConsumer:
+    """Configuration and response parsing shared by the sync and async stream consumers.
+
+    Args:
+        stream (str): The key of the stream to consume.
+        group (str): The name of the consumer group.
+        consumer_name (str | None): The name of this consumer within the group. Defaults to "<hostname>-<pid>".
+        batch_size (int): Maximum number of entries read or claimed per call. Defaults to 100.
+        block_ms (int): Milliseconds XREADGROUP waits for new entries. Defaults to 5000.
+        concurrency (int): Maximum number of entries processed at the same time. Defaults to 16.
+        claim_min_idle_ms (int): Pending entries idle for longer are reclaimed from other consumers.
+            Defaults to 60000.
+        claim_interval_ms (int): Milliseconds between two XAUTOCLAIM sweeps. Defaults to 30000.
+        start_id (str): ID the consumer group starts from when it is created; "0" consumes the whole
+            stream and "$" only new entries. Defaults to "0".
+    """
+
+    def __init__(
+        self,
+        stream: str,
+        group: str,
+        consumer_name: str | None = None,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        concurrency: int = 16,
+        claim_min_idle_ms: int = 60000,
+        claim_interval_ms: int = 30000,
+        start_id: str = "0",
+    ) -> None:
+        self.stream = stream
+        self.group = group
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.concurrency = concurrency
+        self.claim_min_idle_ms = claim_min_idle_ms
+        self.claim_interval_ms = claim_interval_ms
+        self.start_id = start_id
+        self._next_claim_at = 0.0
+
+    def _claim_due(self) -> bool:
+        """Returns whether the next XAUTOCLAIM sweep is due and schedules the following one."""
+        now = time.monotonic()
+        if now < self._next_claim_at:
+            return False
+        self._next_claim_at = now + self.claim_interval_ms / 1000
+        return True
+
+    @staticmethod
+    def _is_busy_group(exception: ResponseError) -> bool:
+        """Returns whether XGROUP CREATE failed because the group already exists."""
+        return "BUSYGROUP" in str(exception)
+
+    def _parse_read(self, response: list | dict | None) -> list[RedisStreamMessage]:
+        """Converts an XREADGROUP response into messages.
+
+        Args:
+            response (list | dict | None): The response as a list of [stream, entries] pairs (RESP2)
+                or a dict (RESP3).
+
+        Returns:
+            list[RedisStreamMessage]: The messages read.
+        """
+        if not response:
+            return []
+        pairs = response.items() if isinstance(response, dict) else response
+        messages: list[RedisStreamMessage] = []
+        for stream, entries in pairs:
+            messages.extend(self._parse_entries(stream, entries))
+        return messages
+
+    def _parse_entries(self, stream: str, entries: list | None) -> list[RedisStreamMessage]:
+        """Converts (id, fields) entries into messages, skipping entries deleted from the stream."""
+        return [
+            RedisStreamMessage(stream, message_id, dict(fields))
+            for message_id, fields in entries or []
+            if fields is not None
+        ]
+
+    def _parse_claim(self, response: list) -> tuple[str, list[RedisStreamMessage]]:
+        """Converts an XAUTOCLAIM response into the next start ID and the claimed messages.
+
+        Args:
+            response (list): The XAUTOCLAIM response.
+
+        Returns:
+            tuple[str, list[RedisStreamMessage]]: The ID to continue the sweep from ("0-0" when the
+                sweep is complete) and the claimed messages.
+        """
+        next_start_id, entries = response[0], response[1]
+        return next_start_id, self._parse_entries(self.stream, entries)
+
+
+class RedisStreamConsumer(_BaseRedisStreamConsumer):
+    """Consumes a Redis stream as a member of a consumer group.
+
+    Entries are read in batches with ``XREADGROUP COUNT/BLOCK`` and handed to a thread pool;
+    a bounded semaphore caps the number of entries in flight, so reading pauses while all
+    workers are busy. Entries whose handler returns are acknowledged in bulk with one
+    ``XACK`` per loop iteration. Entries whose handler raises stay pending and are retried
+    once they have been idle for ``claim_min_idle_ms``, as are entries delivered to consumers
+    that crashed: a periodic ``XAUTOCLAIM`` sweep moves them to this consumer.
+
+    Handlers must therefore be idempotent: an entry can be delivered more than once.
+
+    Args:
+        redis_client (RedisPort): The Redis adapter holding the stream.
+        stream (str): The key of the stream to consume.
+        group (str): The name of the consumer group.
+        handler (Callable[[RedisStreamMessage], None]): Processes one message.
+        consumer_name (str | None): The name of this consumer within the group. Defaults to "<hostname>-<pid>".
+        batch_size (int): Maximum number of entries read or claimed per call. Defaults to 100.
+        block_ms (int): Milliseconds XREADGROUP waits for new entries. Defaults to 5000.
+        concurrency (int): Maximum number of entries processed at the same time. Defaults to 16.
+        claim_min_idle_ms (int): Pending entries idle for longer are reclaimed. Defaults to 60000.
+        claim_interval_ms (int): Milliseconds between two XAUTOCLAIM sweeps. Defaults to 30000.
+        start_id (str): ID the consumer group starts from when it is created. Defaults to "0".
+
+    Example:
+        >>> consumer = RedisStreamConsumer(RedisAdapter(), "emails", "mailers", send_email, concurrency=8)
+        >>> threading.Thread(target=consumer.run, daemon=True).start()
+        >>> ...
+        >>> consumer.stop()
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisPort,
+        stream: str,
+        group: str,
+        handler: Callable[[RedisStreamMessage], None],
+        consumer_name: str | None = None,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        concurrency: int = 16,
+        claim_min_idle_ms: int = 60000,
+        claim_interval_ms: int = 30000,
+        start_id: str = "0",
+    ) -> None:
+        super().__init__(
+            stream,
+            group,
+            consumer_name,
+            batch_size,
+            block_ms,
+            concurrency,
+            claim_min_idle_ms,
+            claim_interval_ms,
+            start_id,
+        )
+        self.redis_client = redis_client
+        self.handler = handler
+        self._semaphore = threading.BoundedSemaphore(self.concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+        self._acks: list[str] = []
+        self._acks_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def ensure_group(self) -> None:
+        """Creates the consumer group, and the stream if needed, unless the group already exists."""
+        try:
+            self.redis_client.xgroup_create(self.stream, self.group, id=self.start_id, mkstream=True)
+        except ResponseError as exception:
+            if not self._is_busy_group(exception):
+                raise
+
+    def poll(self) -> int:
+        """Reads one batch of new entries and dispatches it to the workers.
+
+        Returns:
+            int: The number of messages dispatched.
+        """
+        response = self.redis_client.xreadgroup(
+            self.group,
+            self.consumer_name,
+            {self.stream: ">"},
+            count=self.batch_size,
+            block=self.block_ms,
+        )
+        messages = self._parse_read(response)
+        self._dispatch(messages)
+        return len(messages)
+
+    def claim_stale(self) -> int:
+        """Reclaims entries pending for longer than ``claim_min_idle_ms`` and dispatches them.
+
+        Returns:
+            int: The number of messages reclaimed.
+        """
+        claimed = 0
+        start_id = "0-0"
+        while True:
+            response = self.redis_client.xautoclaim(
+                self.stream,
+                self.group,
+                self.consumer_name,
+                self.claim_min_idle_ms,
+                start_id=start_id,
+                count=self.batch_size,
+            )
+            start_id, messages = self._parse_claim(response)
+            self._dispatch(messages)
+            claimed += len(messages)
+            if start_id == "0-0":
+                return claimed
+
+    def flush_acks(self) -> int:
+        """Acknowledges every message processed since the last flush with one XACK.
+
+        Returns:
+            int: The number of messages acknowledged.
+        """
+        with self._acks_lock:
+            message_ids, self._acks = self._acks, []
+        if not message_ids:
+            return 0
+        try:
+            self.redis_client.xack(self.stream, self.group, *message_ids)
+        except RedisError:
+            # Keep the IDs so the next flush acknowledges them
+            with self._acks_lock:
+                self._acks.extend(message_ids)
+            raise
+        return len(message_ids)
+
+    def run(self) -> None:
+        """Consumes the stream until stop() is called, then waits for in-flight messages."""
+        self._stop_event.clear()
+        self.ensure_group()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f"redis-stream-{self.stream}") as pool:
+            self._executor = pool
+            try:
+                while not self._stop_event.is_set():
+                    try:
+                        if self._claim_due():
+                            self.claim_stale()
+                        self.poll()
+                        self.flush_acks()
+                    except RedisError as exception:
+                        logger.warning(f"Consuming stream {self.stream} failed: {exception}")
+                        self._stop_event.wait(_ERROR_BACKOFF_SECONDS)
+            finally:
+                pool.shutdown(wait=True)
+                self._executor = None
+        self.flush_acks()
+
+    def stop(self) -> None:
+        """Asks run() to return after the current iteration."""
+        self._stop_event.set()
+
+    def _dispatch(self, messages: list[RedisStreamMessage]) -> None:
+        """Submits messages to the workers, waiting for a free slot before each one."""
+        for message in messages:
+            self._semaphore.acquire()
+            if self._executor is None:
+                self._handle(message)
+                continue
+            future = self._executor.submit(self._handle, message)
+            future.add_done_callback(self._release)
+
+    def _release(self, _future: Future[None]) -> None:
+        """Frees the slot of a finished message."""
+        self._semaphore.release()
+
+    def _handle(self, message: RedisStreamMessage) -> None:
+        """Runs the handler and queues the message for acknowledgement if it succeeds."""
+        try:
+            self.handler(message)
+        except Exception:
+            logger.exception(f"Handling message {message.message_id} of stream {self.stream} failed")
+        else:
+            with self._acks_lock:
+                self._acks.append(message.message_id)
+        finally:
+            if self._executor is None:
+                self._semaphore.release()
+
+
+class AsyncRedisStreamConsumer(_BaseRedisStreamConsumer):
+    """Consumes a Redis stream as a member of a consumer group on the event loop.
+
+    Async counterpart of RedisStreamConsumer: each message is handled in its own task and an
+    ``asyncio.Semaphore`` caps the number of messages in flight.
+
+    Args:
+        redis_client (AsyncRedisPort): The async Redis adapter holding the stream.
+        stream (str): The key of the stream to consume.
+        group (str): The name of the consumer group.
+        handler (Callable[[RedisStreamMessage], Awaitable[None]]): Processes one message.
+        consumer_name (str | None): The name of this consumer within the group. Defaults to "<hostname>-<pid>".
+        batch_size (int): Maximum number of entries read or claimed per call. Defaults to 100.
+        block_ms (int): Milliseconds XREADGROUP waits for new entries. Defaults to 5000.
+        concurrency (int): Maximum number of entries processed at the same time. Defaults to 16.
+        claim_min_idle_ms (int): Pending entries idle for longer are reclaimed. Defaults to 60000.
+        claim_interval_ms (int): Milliseconds between two XAUTOCLAIM sweeps. Defaults to 30000.
+        start_id (str): ID the consumer group starts from when it is created. Defaults to "0".
+
+    Example:
+        >>> consumer = AsyncRedisStreamConsumer(AsyncRedisAdapter(), "emails", "mailers", send_email)
+        >>> task = asyncio.create_task(consumer.run())
+        >>> ...
+        >>> consumer.stop()
+        >>> await task
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedisPort,
+        stream: str,
+        group: str,
+        handler: Callable[[RedisStreamMessage], Awaitable[None]],
+        consumer_name: str | None = None,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        concurrency: int = 16,
+        claim_min_idle_ms: int = 60000,
+        claim_interval_ms: int = 30000,
+        start_id: str = "0",
+    ) -> None:
+        super().__init__(
+            stream,
+            group,
+            consumer_name,
+            batch_size,
+            block_ms,
+            concurrency,
+            claim_min_idle_ms,
+            claim_interval_ms,
+            start_id,
+        )
+        self.redis_client = redis_client
+        self.handler = handler
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._acks: list[str] = []
+        self._stopped = False
+
+    async def ensure_group(self) -> None:
+        """Creates the consumer group, and the stream if needed, unless the group already exists."""
+        try:
+            await self.redis_client.xgroup_create(self.stream, self.group, id=self.start_id, mkstream=True)
+        except ResponseError as exception:
+            if not self._is_busy_group(exception):
+                raise
+
+    async def poll(self) -> int:
+        """Reads one batch of new entries and dispatches it to handler tasks.
+
+        Returns:
+            int: The number of messages dispatched.
+        """
+        response = await self.redis_client.xreadgroup(
+            self.group,
+            self.consumer_name,
+            {self.stream: ">"},
+            count=self.batch_size,
+            block=self.block_ms,
+        )
+        messages = self._parse_read(response)
+        await self._dispatch(messages)
+        return len(messages)
+
+    async def claim_stale(self) -> int:
+        """Reclaims entries pending for longer than ``claim_min_idle_ms`` and dispatches them.
+
+        Returns:
+            int: The number of messages reclaimed.
+        """
+        claimed = 0
+        start_id = "0-0"
+        while True:
+            response = await self.redis_client.xautoclaim(
+                self.stream,
+                self.group,
+                self.consumer_name,
+                self.claim_min_idle_ms,
+                start_id=start_id,
+                count=self.batch_size,
+            )
+            start_id, messages = self._parse_claim(response)
+            await self._dispatch(messages)
+            claimed += len(messages)
+            if start_id == "0-0":
+                return claimed
+
+    async def flush_acks(self) -> int:
+        """Acknowledges every message processed since the last flush with one XACK.
+
+        Returns:
+            int: The number of messages acknowledged.
+        """
+        message_ids, self._acks = self._acks, []
+        if not message_ids:
+            return 0
+        try:
+            await self.redis_client.xack(self.stream, self.group, *message_ids)
+        except RedisError:
+            # Keep the IDs so the next flush acknowledges them
+            self._acks.extend(message_ids)
+            raise
+        return len(message_ids)
+
+    async def run(self) -> None:
+        """Consumes the stream until stop() is called, then waits for in-flight messages."""
+        self._stopped = False
+        await self.ensure_group()
+        try:
+            while not self._stopped:
+                try:
+                    if self._claim_due():
+                        await self.claim_stale()
+                    if not await self.poll():
+                        # Let handler tasks run when the client returns without blocking
+                        await asyncio.sleep(0)
+                    await self.flush_acks()
+                except RedisError as exception:
+                    logger.warning(f"Consuming stream {self.stream} failed: {exception}")
+                    await asyncio.sleep(_ERROR_BACKOFF_SECONDS)
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush_acks()
+
+    def stop(self) -> None:
+        """Asks run() to return after the current iteration."""
+        self._stopped = True
+
+    async def _dispatch(self, messages: list[RedisStreamMessage]) -> None:
+        """Starts a handler task per message, waiting for a free slot before each one."""
+        for message in messages:
+            await self._semaphore.acquire()
+            task = asyncio.create_task(self._handle(message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _handle(self, message: RedisStreamMessage) -> None:
+        """Runs the handler and queues the message for acknowledgement if it succeeds."""
+        try:
+            await self.handler(message)
+        except Exception:
+            logger.exception(f"Handling message {message.message_id} of stream {self.stream} failed")
+        else:
+            self._acks.append(message.message_id)
+        finally:
+            self._semaphore.release()
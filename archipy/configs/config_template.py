@@ -52,6 +52,20 @@ class ElasticsearchConfig(BaseModel):
         CONNECTIONS_PER_NODE (int): Number of HTTP connections per node.
         DEAD_NODE_BACKOFF_FACTOR (float): Factor for calculating node timeout duration after failures.
         MAX_DEAD_NODE_BACKOFF (float): Maximum timeout duration for a dead node in seconds.
+        SEARCH_COALESCING_WINDOW_MS (float): Milliseconds the async adapter collects concurrent searches to send
+            them in one msearch request, 0 to disable coalescing.
+        SEARCH_COALESCING_MAX_BATCH (int): Maximum number of searches coalesced in one msearch request.
+        SEARCH_CACHE_ENABLED (bool): Whether search results are cached and invalidated by writes through the adapter.
+        SEARCH_CACHE_TTL_SECONDS (float): Seconds a search result is cached.
+        SEARCH_CACHE_LOCAL_TTL_SECONDS (float): Seconds a search result is kept in process memory, which bounds
+            how long writes made by other processes go unseen.
+        SEARCH_CACHE_LOCAL_MAXSIZE (int): Maximum number of search results kept in process memory.
+        SEARCH_CACHE_REDIS_ENABLED (bool): Whether search results are shared across processes in Redis,
+            configured by the REDIS settings.
+        SEARCH_CACHE_REFRESH_INTERVAL_SECONDS (float): Seconds writes take to become visible to searches,
+            during which results of the written indices are not cached.
+        SEARCH_CACHE_KEY_PREFIX (str): Prefix of the Redis keys of the search cache.
+        METRICS_ENABLED (bool): Whether Prometheus metrics of the adapters are exported.
     """
 
     HOSTS: list[str] = Field(default=["https://localhost:9200"], description="List of Elasticsearch server hosts")
@@ -93,6 +107,45 @@ class ElasticsearchConfig(BaseModel):
         ge=0.0,
         description="Maximum timeout duration for a dead node in seconds",
     )
+    SEARCH_COALESCING_WINDOW_MS: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Milliseconds the async adapter collects concurrent searches into one msearch request, 0 to disable",
+    )
+    SEARCH_COALESCING_MAX_BATCH: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of searches coalesced in one msearch request",
+    )
+    SEARCH_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Cache search results, invalidated by writes through the adapter",
+    )
+    SEARCH_CACHE_TTL_SECONDS: float = Field(default=60.0, gt=0.0, description="Seconds a search result is cached")
+    SEARCH_CACHE_LOCAL_TTL_SECONDS: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Seconds a search result is kept in process memory",
+    )
+    SEARCH_CACHE_LOCAL_MAXSIZE: int = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of search results kept in process memory",
+    )
+    SEARCH_CACHE_REDIS_ENABLED: bool = Field(
+        default=False,
+        description="Share cached search results across processes in Redis",
+    )
+    SEARCH_CACHE_REFRESH_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Seconds writes take to become visible to searches, matching index.refresh_interval",
+    )
+    SEARCH_CACHE_KEY_PREFIX: str = Field(
+        default="elasticsearch:search",
+        description="Prefix of the Redis keys of the search cache",
+    )
+    METRICS_ENABLED: bool = Field(default=False, description="Export Prometheus metrics of the adapters")
 
     @model_validator(mode="after")
     def validate_tls_settings(self) -> Self:
@@ -286,6 +339,11 @@ class KafkaConfig(BaseModel):
     )
     ENABLE_IDEMPOTENCE: bool = Field(default=False, description="Enable idempotent producer for exactly-once delivery")
     TRANSACTIONAL_ID: str | None = Field(default=None, description="Transactional ID for the producer")
+    TRANSACTION_TIMEOUT_MS: int = Field(
+        default=120000,
+        ge=1000,
+        description="Time the transaction coordinator waits for a transaction before aborting it (ms)",
+    )
     ISOLATION_LEVEL: Literal["read_uncommitted", "read_committed"] = Field(
         default="read_uncommitted",
         description="Isolation level for consumer",
@@ -315,6 +373,24 @@ class KafkaConfig(BaseModel):
         ge=0,
         description="Frequency in milliseconds to send statistics data",
     )
+    METRICS_ENABLED: bool = Field(
+        default=False,
+        description="Export Prometheus metrics of the clients, refreshed every STATISTICS_INTERVAL_MS",
+    )
+    PRODUCER_POLL_MODE: Literal["inline", "thread", "none"] = Field(
+        default="inline",
+        description="How producer delivery reports are served: poll after each produce, a poll thread, or on flush",
+    )
+    PRODUCER_POLL_INTERVAL_MS: int = Field(
+        default=100,
+        ge=1,
+        description="Poll timeout of the producer poll thread (ms)",
+    )
+    PRODUCER_QUEUE_FULL_TIMEOUT_MS: int = Field(
+        default=0,
+        ge=0,
+        description="Time produce waits for space on a full producer queue before raising, 0 to raise at once (ms)",
+    )
 
     @model_validator(mode="after")
     def validate_security_settings(self) -> "KafkaConfig":
@@ -362,7 +438,8 @@ class KafkaConfig(BaseModel):
         """Validate idempotence and transaction settings for Kafka configuration.
 
         Ensures that idempotence is properly configured with 'all' acknowledgments,
-        and that transactional producers have idempotence enabled.
+        and that transactional producers have idempotence enabled and deliver messages
+        within the transaction timeout.
 
         Returns:
             KafkaConfig: The validated configuration instance.
@@ -374,6 +451,8 @@ class KafkaConfig(BaseModel):
             raise ValueError("ENABLE_IDEMPOTENCE requires ACKS to be 'all'.")
         if self.TRANSACTIONAL_ID is not None and not self.ENABLE_IDEMPOTENCE:
             raise ValueError("TRANSACTIONAL_ID requires ENABLE_IDEMPOTENCE to be True.")
+        if self.TRANSACTIONAL_ID is not None and self.DELIVERY_TIMEOUT_MS > self.TRANSACTION_TIMEOUT_MS:
+            raise ValueError("TRANSACTIONAL_ID requires DELIVERY_TIMEOUT_MS to be at most TRANSACTION_TIMEOUT_MS.")
         return self
 
 
@@ -409,6 +488,34 @@ class MinioConfig(BaseModel):
     SECURE: bool = Field(default=False, description="Whether to use secure (HTTPS) connection")
     SESSION_TOKEN: str | None = Field(default=None, description="Session token for temporary credentials")
     REGION: str | None = Field(default=None, description="AWS region for S3 compatibility")
+    PART_SIZE: int = Field(
+        default=16 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        le=5 * 1024 * 1024 * 1024,
+        description="Size in bytes of the parts of streamed uploads and of the ranges of streamed downloads",
+    )
+    PART_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Parts uploaded or ranges downloaded at once by a streamed transfer",
+    )
+    CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Whether bucket and object metadata are cached per adapter and invalidated by its writes",
+    )
+    CACHE_TTL_SECONDS: float = Field(default=300.0, gt=0.0, description="Seconds bucket and object metadata is cached")
+    CACHE_MAXSIZE: int = Field(default=1000, ge=0, description="Maximum number of metadata entries cached per adapter")
+    METRICS_ENABLED: bool = Field(default=False, description="Export Prometheus metrics of the adapters")
+    CONNECTION_POOL_SIZE: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum number of connections the async adapter keeps open to the server",
+    )
+    BATCH_CONCURRENCY: int = Field(
+        default=16,
+        ge=1,
+        description="Requests sent at once by the batch operations of the async adapter",
+    )
 
 
 class SQLAlchemyConfig(BaseModel):
@@ -592,6 +699,15 @@ class RedisConfig(BaseModel):
     SOCKET_CONNECT_TIMEOUT: float = Field(default=5.0, description="Socket connection timeout")
     SOCKET_TIMEOUT: float = Field(default=5.0, description="Socket operation timeout")
 
+    # Value codec used by the model helpers; orjson, msgpack, zstd and lz4 are installed with archipy[redis]
+    SERIALIZER: Literal["json", "pickle", "orjson", "msgpack"] = Field(
+        default="json",
+        description="Serializer of values stored with get_model/set_model",
+    )
+    COMPRESSION: Literal["zstd", "lz4"] | None = Field(default=None, description="Compression of large values")
+    COMPRESSION_THRESHOLD: int = Field(default=1024, description="Minimum value size in bytes to compress")
+    COMPRESSION_LEVEL: int | None = Field(default=None, description="Compression level, None for the default")
+
     @model_validator(mode="after")
     def validate_mode_configuration(self) -> Self:
         """Validate mode-specific configuration."""
@@ -1,6 +1,12 @@
 from .cache import ttl_cache_decorator
 from .deprecation_exception import class_deprecation_error, method_deprecation_error
 from .deprecation_warnings import class_deprecation_warning, method_deprecation_warning
+from .redis_cache import (
+    async_invalidate_redis_cache_tags,
+    async_redis_cache_decorator,
+    invalidate_redis_cache_tags,
+    redis_cache_decorator,
+)
 from .retry import retry_decorator
 from .singleton import singleton_decorator
 from .sqlalchemy_atomic import (
@@ -17,16 +23,20 @@ from .timing import timing_decorator
 from .tracing import capture_span, capture_transaction
 
 __all__ = [
+    "async_invalidate_redis_cache_tags",
     "async_postgres_sqlalchemy_atomic_decorator",
+    "async_redis_cache_decorator",
     "async_sqlite_sqlalchemy_atomic_decorator",
     "async_starrocks_sqlalchemy_atomic_decorator",
     "capture_span",
     "capture_transaction",
     "class_deprecation_error",
     "class_deprecation_warning",
+    "invalidate_redis_cache_tags",
     "method_deprecation_error",
     "method_deprecation_warning",
     "postgres_sqlalchemy_atomic_decorator",
+    "redis_cache_decorator",
     "retry_decorator",
     "singleton_decorator",
     "sqlalchemy_atomic_decorator",
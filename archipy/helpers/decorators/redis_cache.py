@@ -0,0 +1,752 @@
+import hashlib
+import inspect
+import logging
+import math
+import secrets
+import struct
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from functools import wraps
+from typing import Any, NamedTuple, Protocol, cast
+
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
+from archipy.adapters.redis.serializers import RedisSerializer, RedisSerializerName, get_serializer
+from archipy.adapters.redis.single_flight import AsyncSingleFlight, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Header of every value stored in Redis: compute time in seconds and absolute expiry as a Unix timestamp
+_ENVELOPE_HEADER = struct.Struct(">dd")
+_random = secrets.SystemRandom()
+_local_caches: weakref.WeakSet["_LocalCache"] = weakref.WeakSet()
+
+CacheTags = Iterable[str] | Callable[..., Iterable[str]] | None
+
+
+class _CacheEntry(NamedTuple):
+    """A decoded cache value with the metadata used for probabilistic early expiration."""
+
+    value: Any
+    delta: float
+    expiry: float
+
+
+class _LocalCache:
+    """A small thread-safe LRU holding decoded entries in process memory (the L1 tier)."""
+
+    __slots__ = ("__weakref__", "_entries", "_lock", "maxsize", "ttl_seconds")
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[_CacheEntry, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        _local_caches.add(self)
+
+    def get(self, key: str, now: float) -> _CacheEntry | None:
+        """Returns the entry for the key if it has not expired locally."""
+        if self.maxsize <= 0:
+            return None
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[1] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, entry: _CacheEntry, now: float) -> None:
+        """Stores an entry until the local TTL or the entry expiry, whichever comes first."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (entry, min(now + self.ttl_seconds, entry.expiry))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """Removes the given keys."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _discard_local(keys: Iterable[str]) -> None:
+    """Removes keys from every L1 cache of this process.
+
+    Args:
+        keys (Iterable[str]): The Redis keys to remove.
+    """
+    keys = list(keys)
+    for local_cache in list(_local_caches):
+        local_cache.discard(keys)
+
+
+def _should_recompute(entry: _CacheEntry, beta: float, now: float) -> bool:
+    """Decides whether to refresh an entry early (XFetch).
+
+    The probability of an early refresh grows as the expiry approaches and with the time the
+    value took to compute, so a single caller refreshes a hot key shortly before it expires
+    instead of every caller recomputing it at the same time after it expires.
+
+    Args:
+        entry (_CacheEntry): The cached entry.
+        beta (float): Eagerness of early refreshes. 0 disables them, values above 1 refresh earlier.
+        now (float): The current Unix timestamp.
+
+    Returns:
+        bool: True if the caller should recompute the value.
+    """
+    return now - entry.delta * beta * math.log(1.0 - _random.random()) >= entry.expiry
+
+
+def _tag_key(tag_prefix: str, tag: str) -> str:
+    """Returns the Redis key of the set indexing the cache keys of a tag."""
+    return f"{tag_prefix}:{tag}"
+
+
+class _BaseRedisCache:
+    """Key building, encoding and L1 handling shared by the sync and async cache decorators.
+
+    Args:
+        func (Callable[..., Any]): The decorated function.
+        ttl_seconds (int): Time to live of the values in Redis.
+        key_prefix (str | None): Prefix of the cache keys.
+        key_builder (Callable[..., str] | None): Builds the key suffix from the call arguments.
+        tags (CacheTags): Tags attached to cached values, or a callable computing them.
+        serializer (RedisSerializerName | RedisSerializer): Serializer of the cached values.
+        local_ttl_seconds (float): Maximum staleness of the in-process copies.
+        local_maxsize (int): Maximum number of in-process entries.
+        beta (float): Eagerness of early refreshes.
+        lock_across_processes (bool): Whether misses also take a Redis lock.
+        tag_prefix (str): Prefix of the tag index keys.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        ttl_seconds: int,
+        key_prefix: str | None,
+        key_builder: Callable[..., str] | None,
+        tags: CacheTags,
+        serializer: RedisSerializerName | RedisSerializer,
+        local_ttl_seconds: float,
+        local_maxsize: int,
+        beta: float,
+        lock_across_processes: bool,
+        tag_prefix: str,
+    ) -> None:
+        parameters = list(inspect.signature(func).parameters)
+        self.func = func
+        self.skip_first_arg = bool(parameters) and parameters[0] in ("self", "cls")
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix or f"cache:{func.__module__}.{func.__qualname__}"
+        self.key_builder = key_builder
+        self.tags = tags
+        self.serializer = get_serializer(serializer)
+        self.local_cache = _LocalCache(local_maxsize, local_ttl_seconds)
+        self.beta = beta
+        self.lock_across_processes = lock_across_processes
+        self.tag_prefix = tag_prefix
+
+    def build_key(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        """Builds the Redis key of a call.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            str: The cache key.
+        """
+        if self.key_builder is not None:
+            return f"{self.key_prefix}:{self.key_builder(*args, **kwargs)}"
+        key_args = args[1:] if self.skip_first_arg else args
+        digest = hashlib.blake2b(repr((key_args, sorted(kwargs.items()))).encode(), digest_size=16).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    def resolve_tags(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[str]:
+        """Returns the tags of a call.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            list[str]: The tags to attach to the cached value.
+        """
+        if self.tags is None:
+            return []
+        if callable(self.tags):
+            return list(self.tags(*args, **kwargs))
+        return list(self.tags)
+
+    def lookup_local(self, key: str, now: float) -> _CacheEntry | None:
+        """Returns a fresh L1 entry, or None if it is missing or due for an early refresh."""
+        entry = self.local_cache.get(key, now)
+        if entry is None or _should_recompute(entry, self.beta, now):
+            return None
+        return entry
+
+    def decode_remote(self, key: str, data: bytes | None, now: float) -> _CacheEntry | None:
+        """Decodes an envelope read from Redis and copies it to the L1 tier.
+
+        Args:
+            key (str): The cache key.
+            data (bytes | None): The stored envelope, or None on a miss.
+            now (float): The current Unix timestamp.
+
+        Returns:
+            _CacheEntry | None: The entry, or None on a miss.
+        """
+        if data is None:
+            return None
+        delta, expiry = _ENVELOPE_HEADER.unpack_from(data)
+        entry = _CacheEntry(self.serializer.loads(data[_ENVELOPE_HEADER.size :]), delta, expiry)
+        self.local_cache.set(key, entry, now)
+        return entry
+
+    def store_local(self, key: str, value: Any, delta: float) -> _CacheEntry:
+        """Stores a freshly computed value in the L1 tier.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The computed value.
+            delta (float): The time the computation took, in seconds.
+
+        Returns:
+            _CacheEntry: The new entry.
+        """
+        now = time.time()
+        entry = _CacheEntry(value, delta, now + self.ttl_seconds)
+        self.local_cache.set(key, entry, now)
+        return entry
+
+    def queue_write(self, pipeline: Any, key: str, entry: _CacheEntry, tags: list[str]) -> None:
+        """Queues the commands storing an entry in Redis and indexing it under its tags.
+
+        Args:
+            pipeline (Any): A non-transactional Redis pipeline.
+            key (str): The cache key.
+            entry (_CacheEntry): The entry to store.
+            tags (list[str]): The tags of the entry.
+        """
+        ttl_ms = self.ttl_seconds * 1000
+        data = _ENVELOPE_HEADER.pack(entry.delta, entry.expiry) + self.serializer.dumps(entry.value)
+        pipeline.set(key, data, px=ttl_ms)
+        for tag in tags:
+            tag_key = _tag_key(self.tag_prefix, tag)
+            pipeline.sadd(tag_key, key)
+            # Keep the tag index alive as long as its longest-lived member
+            pipeline.pexpire(tag_key, ttl_ms, nx=True)
+            pipeline.pexpire(tag_key, ttl_ms, gt=True)
+
+
+class _RedisCache(_BaseRedisCache):
+    """Two-tier cache of a function decorated with redis_cache_decorator.
+
+    Args:
+        redis_client (RedisPort | None): Redis adapter. If None, a RedisAdapter is created on first use.
+        *args (Any): Arguments of _BaseRedisCache.
+    """
+
+    def __init__(self, redis_client: RedisPort | None, *args: Any) -> None:
+        super().__init__(*args)
+        self._redis_client = redis_client
+        self._single_flight: SingleFlight | None = None
+
+    @property
+    def redis_client(self) -> RedisPort:
+        """The Redis adapter holding the L2 tier."""
+        if self._redis_client is None:
+            from archipy.adapters.redis.adapters import RedisAdapter
+
+            self._redis_client = RedisAdapter()
+        return self._redis_client
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        """The single flight collapsing concurrent misses of the same key."""
+        if self._single_flight is None:
+            redis_client = self.redis_client if self.lock_across_processes else None
+            self._single_flight = SingleFlight(redis_client, key_prefix="cache:lock")
+        return self._single_flight
+
+    def fetch(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Returns the cached result of a call, computing it on a miss or an early refresh.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            Any: The result of the call.
+        """
+        key = self.build_key(args, kwargs)
+        now = time.time()
+        if (entry := self.lookup_local(key, now)) is not None:
+            return entry.value
+        entry = self.read_remote(key, now)
+        if entry is not None and not _should_recompute(entry, self.beta, now):
+            return entry.value
+
+        def recheck() -> Any:
+            remote = self.read_remote(key, time.time())
+            return None if remote is None else remote.value
+
+        return self.single_flight.do(key, lambda: self.compute(key, args, kwargs), recheck=recheck)
+
+    def read_remote(self, key: str, now: float) -> _CacheEntry | None:
+        """Reads an entry from Redis, treating Redis errors as misses.
+
+        Args:
+            key (str): The cache key.
+            now (float): The current Unix timestamp.
+
+        Returns:
+            _CacheEntry | None: The entry, or None on a miss.
+        """
+        try:
+            data = cast(bytes | None, self.redis_client.get_bytes(key))
+        except Exception as exception:
+            logger.warning(f"Reading cache key {key} from Redis failed: {exception}")
+            return None
+        return self.decode_remote(key, data, now)
+
+    def compute(self, key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Calls the function and stores its result in both tiers.
+
+        Args:
+            key (str): The cache key.
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            Any: The result of the call.
+        """
+        started = time.perf_counter()
+        result = self.func(*args, **kwargs)
+        entry = self.store_local(key, result, time.perf_counter() - started)
+        try:
+            pipeline = self.redis_client.get_pipeline(transaction=False)
+            self.queue_write(pipeline, key, entry, self.resolve_tags(args, kwargs))
+            pipeline.execute()
+        except Exception as exception:
+            logger.warning(f"Writing cache key {key} to Redis failed: {exception}")
+        return result
+
+    def invalidate(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """Removes the cached result of a call from both tiers."""
+        key = self.build_key(args, kwargs)
+        self.local_cache.discard([key])
+        self.redis_client.delete(key)
+
+
+class _AsyncRedisCache(_BaseRedisCache):
+    """Two-tier cache of a coroutine function decorated with async_redis_cache_decorator.
+
+    Args:
+        redis_client (AsyncRedisPort | None): Async Redis adapter. If None, an AsyncRedisAdapter is
+            created on first use.
+        *args (Any): Arguments of _BaseRedisCache.
+    """
+
+    def __init__(self, redis_client: AsyncRedisPort | None, *args: Any) -> None:
+        super().__init__(*args)
+        self._redis_client = redis_client
+        self._single_flight: AsyncSingleFlight | None = None
+
+    @property
+    def redis_client(self) -> AsyncRedisPort:
+        """The async Redis adapter holding the L2 tier."""
+        if self._redis_client is None:
+            from archipy.adapters.redis.adapters import AsyncRedisAdapter
+
+            self._redis_client = AsyncRedisAdapter()
+        return self._redis_client
+
+    @property
+    def single_flight(self) -> AsyncSingleFlight:
+        """The single flight collapsing concurrent misses of the same key."""
+        if self._single_flight is None:
+            redis_client = self.redis_client if self.lock_across_processes else None
+            self._single_flight = AsyncSingleFlight(redis_client, key_prefix="cache:lock")
+        return self._single_flight
+
+    async def fetch(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Returns the cached result of a call, computing it on a miss or an early refresh.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            Any: The result of the call.
+        """
+        key = self.build_key(args, kwargs)
+        now = time.time()
+        if (entry := self.lookup_local(key, now)) is not None:
+            return entry.value
+        entry = await self.read_remote(key, now)
+        if entry is not None and not _should_recompute(entry, self.beta, now):
+            return entry.value
+
+        async def recheck() -> Any:
+            remote = await self.read_remote(key, time.time())
+            return None if remote is None else remote.value
+
+        return await self.single_flight.do(key, lambda: self.compute(key, args, kwargs), recheck=recheck)
+
+    async def read_remote(self, key: str, now: float) -> _CacheEntry | None:
+        """Reads an entry from Redis, treating Redis errors as misses.
+
+        Args:
+            key (str): The cache key.
+            now (float): The current Unix timestamp.
+
+        Returns:
+            _CacheEntry | None: The entry, or None on a miss.
+        """
+        try:
+            data = cast(bytes | None, await self.redis_client.get_bytes(key))
+        except Exception as exception:
+            logger.warning(f"Reading cache key {key} from Redis failed: {exception}")
+            return None
+        return self.decode_remote(key, data, now)
+
+    async def compute(self, key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Awaits the function and stores its result in both tiers.
+
+        Args:
+            key (str): The cache key.
+            args (tuple[Any, ...]): Positional arguments of the call.
+            kwargs (dict[str, Any]): Keyword arguments of the call.
+
+        Returns:
+            Any: The result of the call.
+        """
+        started = time.perf_counter()
+        result = await self.func(*args, **kwargs)
+        entry = self.store_local(key, result, time.perf_counter() - started)
+        try:
+            pipeline = await self.redis_client.get_pipeline(transaction=False)
+            self.queue_write(pipeline, key, entry, self.resolve_tags(args, kwargs))
+            await pipeline.execute()
+        except Exception as exception:
+            logger.warning(f"Writing cache key {key} to Redis failed: {exception}")
+        return result
+
+    async def invalidate(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """Removes the cached result of a call from both tiers."""
+        key = self.build_key(args, kwargs)
+        self.local_cache.discard([key])
+        await self.redis_client.delete(key)
+
+
+class RedisCachedFunction[**P, R](Protocol):
+    """Protocol for a function cached by redis_cache_decorator."""
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Call the function."""
+        ...
+
+    def invalidate(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Remove the cached result of the given arguments."""
+        ...
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Remove every cached result attached to any of the tags."""
+        ...
+
+    def clear_local_cache(self) -> None:
+        """Clear the in-process cache."""
+        ...
+
+
+class AsyncRedisCachedFunction[**P, R](Protocol):
+    """Protocol for a coroutine function cached by async_redis_cache_decorator."""
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Call the function."""
+        ...
+
+    async def invalidate(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Remove the cached result of the given arguments."""
+        ...
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Remove every cached result attached to any of the tags."""
+        ...
+
+    def clear_local_cache(self) -> None:
+        """Clear the in-process cache."""
+        ...
+
+
+def invalidate_redis_cache_tags(
+    *tags: str,
+    redis_client: RedisPort | None = None,
+    tag_prefix: str = "cache:tag",
+) -> int:
+    """Removes every result cached by redis_cache_decorator under any of the given tags.
+
+    The results are removed from Redis and from the in-process caches of this process; other
+    processes drop their in-process copies within ``local_ttl_seconds``.
+
+    Args:
+        *tags (str): The tags to invalidate.
+        redis_client (RedisPort | None): Redis adapter holding the cache. If None, a RedisAdapter
+            is created from global config. Defaults to None.
+        tag_prefix (str): Prefix of the tag index keys. Defaults to "cache:tag".
+
+    Returns:
+        int: The number of cache keys that were indexed under the tags.
+    """
+    if redis_client is None:
+        from archipy.adapters.redis.adapters import RedisAdapter
+
+        redis_client = RedisAdapter()
+    members_by_tag = {
+        _tag_key(tag_prefix, tag): cast(set[str], redis_client.smembers(_tag_key(tag_prefix, tag))) for tag in tags
+    }
+    keys: set[str] = set().union(*members_by_tag.values())
+    if keys:
+        redis_client.delete(*keys)
+        # Only remove the members we saw, so keys cached concurrently stay indexed
+        for tag_key, members in members_by_tag.items():
+            if members:
+                redis_client.srem(tag_key, *members)
+    _discard_local(keys)
+    return len(keys)
+
+
+async def async_invalidate_redis_cache_tags(
+    *tags: str,
+    redis_client: AsyncRedisPort | None = None,
+    tag_prefix: str = "cache:tag",
+) -> int:
+    """Removes every result cached by async_redis_cache_decorator under any of the given tags.
+
+    The results are removed from Redis and from the in-process caches of this process; other
+    processes drop their in-process copies within ``local_ttl_seconds``.
+
+    Args:
+        *tags (str): The tags to invalidate.
+        redis_client (AsyncRedisPort | None): Async Redis adapter holding the cache. If None, an
+            AsyncRedisAdapter is created from global config. Defaults to None.
+        tag_prefix (str): Prefix of the tag index keys. Defaults to "cache:tag".
+
+    Returns:
+        int: The number of cache keys that were indexed under the tags.
+    """
+    if redis_client is None:
+        from archipy.adapters.redis.adapters import AsyncRedisAdapter
+
+        redis_client = AsyncRedisAdapter()
+    members_by_tag = {
+        _tag_key(tag_prefix, tag): cast(set[str], await redis_client.smembers(_tag_key(tag_prefix, tag)))
+        for tag in tags
+    }
+    keys: set[str] = set().union(*members_by_tag.values())
+    if keys:
+        await redis_client.delete(*keys)
+        # Only remove the members we saw, so keys cached concurrently stay indexed
+        for tag_key, members in members_by_tag.items():
+            if members:
+                await redis_client.srem(tag_key, *members)
+    _discard_local(keys)
+    return len(keys)
+
+
+def redis_cache_decorator[**P, R](
+    ttl_seconds: int = 300,
+    key_prefix: str | None = None,
+    key_builder: Callable[..., str] | None = None,
+    tags: CacheTags = None,
+    serializer: RedisSerializerName | RedisSerializer = "pickle",
+    local_ttl_seconds: float = 5,
+    local_maxsize: int = 1024,
+    beta: float = 1.0,
+    lock_across_processes: bool = False,
+    redis_client: RedisPort | None = None,
+    tag_prefix: str = "cache:tag",
+) -> Callable[[Callable[P, R]], RedisCachedFunction[P, R]]:
+    """Decorator that caches function results in process memory (L1) and Redis (L2).
+
+    Lookups check a small in-process LRU first, then Redis, and only call the function on a
+    miss. Concurrent misses of the same key in a process share one call; with
+    ``lock_across_processes`` replicas also take a Redis lock so only one of them computes.
+    Values are refreshed shortly before they expire using probabilistic early expiration
+    (XFetch), which prevents stampedes when hot keys expire.
+
+    Redis errors never fail the call: the function result is returned uncached and a warning
+    is logged.
+
+    Args:
+        ttl_seconds (int): Time to live of the results in Redis. Defaults to 300.
+        key_prefix (str | None): Prefix of the cache keys. Defaults to "cache:<module>.<qualname>".
+        key_builder (Callable[..., str] | None): Builds the key suffix from the call arguments. By
+            default a digest of the arguments' repr is used, skipping ``self``/``cls``.
+        tags (Iterable[str] | Callable[..., Iterable[str]] | None): Tags attached to cached results, or a
+            callable computing them from the call arguments. Defaults to None.
+        serializer (RedisSerializerName | RedisSerializer): "pickle", "json", "orjson", "msgpack" or a custom
+            serializer. Defaults to "pickle".
+        local_ttl_seconds (float): Maximum staleness of the in-process copies. Defaults to 5.
+        local_maxsize (int): Maximum number of in-process entries; 0 disables the L1 tier. Defaults to 1024.
+        beta (float): Eagerness of early refreshes; 0 disables them. Defaults to 1.0.
+        lock_across_processes (bool): Whether misses also take a Redis lock. Defaults to False.
+        redis_client (RedisPort | None): Redis adapter to use. If None, a RedisAdapter is created from
+            global config on first use. Defaults to None.
+        tag_prefix (str): Prefix of the tag index keys. Defaults to "cache:tag".
+
+    Returns:
+        Callable: The decorator. The decorated function gains ``invalidate(*args, **kwargs)``,
+            ``invalidate_tags(*tags)`` and ``clear_local_cache()``.
+
+    Example:
+        ```python
+        @redis_cache_decorator(ttl_seconds=600, tags=lambda user_id: [f"user:{user_id}"], serializer="orjson")
+        def get_user_profile(user_id: int) -> dict:
+            return load_profile(user_id)
+
+        get_user_profile(42)
+        get_user_profile.invalidate_tags("user:42")
+        ```
+    """
+
+    def decorator(func: Callable[P, R]) -> RedisCachedFunction[P, R]:
+        cache = _RedisCache(
+            redis_client,
+            func,
+            ttl_seconds,
+            key_prefix,
+            key_builder,
+            tags,
+            serializer,
+            local_ttl_seconds,
+            local_maxsize,
+            beta,
+            lock_across_processes,
+            tag_prefix,
+        )
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return cast(R, cache.fetch(args, kwargs))
+
+        def invalidate(*args: P.args, **kwargs: P.kwargs) -> None:
+            cache.invalidate(args, kwargs)
+
+        def invalidate_tags(*tags_to_invalidate: str) -> int:
+            return invalidate_redis_cache_tags(
+                *tags_to_invalidate,
+                redis_client=cache.redis_client,
+                tag_prefix=tag_prefix,
+            )
+
+        # Type ignored because we're adding attributes that are not defined in the function type
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        wrapper.invalidate_tags = invalidate_tags  # type: ignore[attr-defined]
+        wrapper.clear_local_cache = cache.local_cache.clear  # type: ignore[attr-defined]
+        return cast(RedisCachedFunction[P, R], wrapper)
+
+    return decorator
+
+
+def async_redis_cache_decorator[**P, R](
+    ttl_seconds: int = 300,
+    key_prefix: str | None = None,
+    key_builder: Callable[..., str] | None = None,
+    tags: CacheTags = None,
+    serializer: RedisSerializerName | RedisSerializer = "pickle",
+    local_ttl_seconds: float = 5,
+    local_maxsize: int = 1024,
+    beta: float = 1.0,
+    lock_across_processes: bool = False,
+    redis_client: AsyncRedisPort | None = None,
+    tag_prefix: str = "cache:tag",
+) -> Callable[[Callable[P, Awaitable[R]]], AsyncRedisCachedFunction[P, R]]:
+    """Async version of redis_cache_decorator for coroutine functions.
+
+    Concurrent misses of the same key on the event loop await one shared call.
+
+    Args:
+        ttl_seconds (int): Time to live of the results in Redis. Defaults to 300.
+        key_prefix (str | None): Prefix of the cache keys. Defaults to "cache:<module>.<qualname>".
+        key_builder (Callable[..., str] | None): Builds the key suffix from the call arguments. By
+            default a digest of the arguments' repr is used, skipping ``self``/``cls``.
+        tags (Iterable[str] | Callable[..., Iterable[str]] | None): Tags attached to cached results, or a
+            callable computing them from the call arguments. Defaults to None.
+        serializer (RedisSerializerName | RedisSerializer): "pickle", "json", "orjson", "msgpack" or a custom
+            serializer. Defaults to "pickle".
+        local_ttl_seconds (float): Maximum staleness of the in-process copies. Defaults to 5.
+        local_maxsize (int): Maximum number of in-process entries; 0 disables the L1 tier. Defaults to 1024.
+        beta (float): Eagerness of early refreshes; 0 disables them. Defaults to 1.0.
+        lock_across_processes (bool): Whether misses also take a Redis lock. Defaults to False.
+        redis_client (AsyncRedisPort | None): Async Redis adapter to use. If None, an AsyncRedisAdapter
+            is created from global config on first use. Defaults to None.
+        tag_prefix (str): Prefix of the tag index keys. Defaults to "cache:tag".
+
+    Returns:
+        Callable: The decorator. The decorated coroutine function gains ``invalidate(*args, **kwargs)``,
+            ``invalidate_tags(*tags)`` (both awaitable) and ``clear_local_cache()``.
+
+    Example:
+        ```python
+        @async_redis_cache_decorator(ttl_seconds=60, tags=["catalog"], serializer="msgpack")
+        async def list_products(category: str) -> list[dict]:
+            return await product_repository.list(category)
+
+        await list_products("books")
+        await list_products.invalidate_tags("catalog")
+        ```
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> AsyncRedisCachedFunction[P, R]:
+        cache = _AsyncRedisCache(
+            redis_client,
+            func,
+            ttl_seconds,
+            key_prefix,
+            key_builder,
+            tags,
+            serializer,
+            local_ttl_seconds,
+            local_maxsize,
+            beta,
+            lock_across_processes,
+            tag_prefix,
+        )
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return cast(R, await cache.fetch(args, kwargs))
+
+        async def invalidate(*args: P.args, **kwargs: P.kwargs) -> None:
+            await cache.invalidate(args, kwargs)
+
+        async def invalidate_tags(*tags_to_invalidate: str) -> int:
+            return await async_invalidate_redis_cache_tags(
+                *tags_to_invalidate,
+                redis_client=cache.redis_client,
+                tag_prefix=tag_prefix,
+            )
+
+        # Type ignored because we're adding attributes that are not defined in the function type
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        wrapper.invalidate_tags = invalidate_tags  # type: ignore[attr-defined]
+        wrapper.clear_local_cache = cache.local_cache.clear  # type: ignore[attr-defined]
+        return cast(AsyncRedisCachedFunction[P, R], wrapper)
+
+    return decorator
@@ -6,8 +6,8 @@ from pydantic import StrictInt, StrictStr
 from starlette.datastructures import QueryParams
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
 
-from archipy.adapters.redis.adapters import AsyncRedisAdapter
-from archipy.adapters.redis.ports import RedisResponseType
+from archipy.adapters.redis.ports import AsyncRedisPort
+from archipy.helpers.interceptors.rate_limit.rate_limit_engine import AsyncRateLimitEngine, calculate_window_ms
 
 
 class FastAPIRestRateLimitHandler:
@@ -17,6 +17,11 @@ class FastAPIRestRateLimitHandler:
     made to a specific endpoint within a defined time window. If the request limit is
     exceeded, it raises an HTTP 429 Too Many Requests error.
 
+    In hybrid mode (``local_pre_limit=True``) each process keeps local token buckets per key
+    and rejects clearly over-limit clients without any network call. Accepted hits are
+    reconciled with Redis in batches every ``sync_interval_ms`` milliseconds by a background
+    task; when Redis is unavailable the handler keeps enforcing the local buckets.
+
     Args:
         calls_count (StrictInt): The maximum number of allowed requests within the time window.
         milliseconds (StrictInt): The time window in milliseconds.
@@ -25,6 +30,8 @@ class FastAPIRestRateLimitHandler:
         hours (StrictInt): The time window in hours.
         days (StrictInt): The time window in days.
         query_params (set(StrictStr)): request query parameters for rate-limiting based on query params.
+        local_pre_limit (bool): Whether to enable the hybrid local pre-limiter mode.
+        sync_interval_ms (StrictInt): Interval between batched Redis reconciliations in hybrid mode.
     """
 
     def __init__(
@@ -36,6 +43,8 @@ class FastAPIRestRateLimitHandler:
         hours: StrictInt = 0,
         days: StrictInt = 0,
         query_params: set[StrictStr] | None = None,
+        local_pre_limit: bool = False,
+        sync_interval_ms: StrictInt = 100,
     ) -> None:
         """Initialize the rate limit handler with specified time window and request limits.
 
@@ -58,6 +67,11 @@ class FastAPIRestRateLimitHandler:
             query_params (set[StrictStr] | None, optional): Set of query parameter names to include
                 in rate limit key generation. If None, no query parameters will be used.
                 Defaults to None.
+            local_pre_limit (bool, optional): Whether to decide locally and reconcile with Redis in
+                batches instead of calling Redis on every request. Defaults to False.
+            sync_interval_ms (StrictInt, optional): Milliseconds between batched reconciliations with
+                Redis in hybrid mode. Lower values are more accurate across processes, higher values
+                send fewer commands to Redis. Defaults to 100.
 
         Example:
             >>> # Allow 100 requests per minute
@@ -69,39 +83,29 @@ class FastAPIRestRateLimitHandler:
             ...     days=1,
             ...     query_params={'user_id', 'action'}
             ... )
+            >>>
+            >>> # Allow 1000 requests per second, reconciled with Redis every 50 ms
+            >>> handler = FastAPIRestRateLimitHandler(
+            ...     calls_count=1000,
+            ...     seconds=1,
+            ...     local_pre_limit=True,
+            ...     sync_interval_ms=50,
+            ... )
         """
         self.query_params = query_params or set()
         self.calls_count = calls_count
-        # Calculate total time in milliseconds directly for better readability
-        self.milliseconds = (
-            milliseconds + 1000 * seconds + 60 * 1000 * minutes + 60 * 60 * 1000 * hours + 24 * 60 * 60 * 1000 * days
+        self.milliseconds = calculate_window_ms(milliseconds, seconds, minutes, hours, days)
+        self.engine = AsyncRateLimitEngine(
+            calls_count=calls_count,
+            window_ms=self.milliseconds,
+            local_pre_limit=local_pre_limit,
+            sync_interval_ms=sync_interval_ms,
         )
-        self.redis_client = AsyncRedisAdapter()
-
-    async def _check(self, key: str) -> RedisResponseType:
-        """Checks if the request count for the given key exceeds the allowed limit.
 
-        Args:
-            key (str): The Redis key used to track the request count.
-
-        Returns:
-            int: The remaining time-to-live (TTL) in milliseconds if the limit is exceeded, otherwise 0.
-        """
-        # Use await for getting value from Redis as it's asynchronous
-        current_request = await self.redis_client.get(key)
-        if current_request is None:
-            await self.redis_client.set(key, 1, px=self.milliseconds)
-            return 0
-
-        current_request = int(current_request)  # type:ignore[arg-type]
-        if current_request < self.calls_count:
-            await self.redis_client.incrby(key)
-            return 0
-
-        ttl = await self.redis_client.pttl(key)
-        if ttl == -1:
-            await self.redis_client.delete(key)
-        return ttl
+    @property
+    def redis_client(self) -> AsyncRedisPort:
+        """The Redis adapter used to track request counts."""
+        return self.engine.redis_client
 
     async def __call__(self, request: Request) -> None:
         """Handles the rate-limiting logic for incoming requests.
@@ -114,9 +118,17 @@ class FastAPIRestRateLimitHandler:
         """
         rate_key = await self._get_identifier(request)
         key = f"RateLimitHandler:{rate_key}:{request.scope['path']}:{request.method}"
-        pexpire = await self._check(key)  # Awaiting the function since it is an async call
+        pexpire = await self.engine.hit(key)
         if pexpire != 0:
-            await self._create_callback(pexpire)  # type:ignore[arg-type]
+            await self._create_callback(pexpire)
+
+    async def sync(self) -> None:
+        """Reconciles locally accepted hits with Redis in a single pipelined batch (hybrid mode only)."""
+        await self.engine.sync()
+
+    async def close(self) -> None:
+        """Stops the background reconciliation task and flushes the remaining local hits."""
+        await self.engine.close()
 
     @staticmethod
     async def _create_callback(pexpire: int) -> None:
@@ -0,0 +1,8 @@
+"""Rate limiting interceptors for gRPC services."""
+
+from .server_interceptor import AsyncGrpcServerRateLimitInterceptor, GrpcServerRateLimitInterceptor
+
+__all__ = [
+    "AsyncGrpcServerRateLimitInterceptor",
+    "GrpcServerRateLimitInterceptor",
+]
@@ -0,0 +1,238 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import grpc
+
+from archipy.helpers.interceptors.grpc.base.server_interceptor import (
+    BaseAsyncGrpcServerInterceptor,
+    BaseGrpcServerInterceptor,
+    MethodName,
+)
+from archipy.helpers.interceptors.rate_limit.rate_limit_engine import (
+    AsyncRateLimitEngine,
+    RateLimitEngine,
+    calculate_window_ms,
+)
+from archipy.models.errors import ResourceExhaustedError
+
+
+def _extract_peer_address(peer: str) -> str:
+    """Strips the port from a gRPC peer string.
+
+    Args:
+        peer (str): The peer string reported by the context (e.g., "ipv4:10.0.0.1:51234").
+
+    Returns:
+        str: The peer without the client port (e.g., "ipv4:10.0.0.1").
+    """
+    if peer.startswith(("ipv4:", "ipv6:")):
+        return peer.rsplit(":", 1)[0]
+    return peer
+
+
+def _generate_rate_limit_key(
+    peer: str,
+    invocation_metadata: Sequence[Any] | None,
+    method_name_model: MethodName,
+    metadata_keys: set[str],
+    key_by_peer: bool,
+    key_by_method: bool,
+) -> str:
+    """Generates the Redis key identifying the caller of a gRPC request.
+
+    Args:
+        peer (str): The peer string reported by the context.
+        invocation_metadata (Sequence[Any] | None): The invocation metadata of the call.
+        method_name_model (MethodName): The parsed method name of the call.
+        metadata_keys (set[str]): Metadata keys whose values identify the caller.
+        key_by_peer (bool): Whether to include the peer address in the key.
+        key_by_method (bool): Whether to include the full method name in the key.
+
+    Returns:
+        str: The rate limit key.
+    """
+    parts = []
+    if metadata_keys and invocation_metadata:
+        metadata = {item[0]: item[1] for item in invocation_metadata}
+        parts.extend(f"{key}={metadata[key]}" for key in sorted(metadata_keys) if key in metadata)
+    if key_by_peer:
+        parts.append(_extract_peer_address(peer))
+    if key_by_method:
+        parts.append(method_name_model.full_name)
+    return f"GrpcRateLimitInterceptor:{':'.join(parts) or 'global'}"
+
+
+class GrpcServerRateLimitInterceptor(BaseGrpcServerInterceptor):
+    """A sync gRPC server interceptor limiting the rate of calls using Redis for tracking.
+
+    Calls are keyed by any combination of metadata values, the peer address and the method
+    name. When the limit is exceeded the call is aborted with ``RESOURCE_EXHAUSTED`` and the
+    remaining window is reported as ``retry_after_ms`` in the trailing metadata.
+
+    It shares the Redis commands and the local pre-limiter with FastAPIRestRateLimitHandler.
+
+    Args:
+        calls_count (int): Maximum number of allowed calls within the time window. Defaults to 1.
+        milliseconds (int): Number of milliseconds in the time window. Defaults to 0.
+        seconds (int): Number of seconds in the time window. Defaults to 0.
+        minutes (int): Number of minutes in the time window. Defaults to 0.
+        hours (int): Number of hours in the time window. Defaults to 0.
+        days (int): Number of days in the time window. Defaults to 0.
+        metadata_keys (set[str] | None): Metadata keys whose values identify the caller (e.g., {"x-user-id"}).
+            Defaults to None.
+        key_by_peer (bool): Whether to include the peer address in the key. Defaults to True.
+        key_by_method (bool): Whether to limit each method separately. Defaults to True.
+        local_pre_limit (bool): Whether to decide locally and reconcile with Redis in batches. Defaults to False.
+        sync_interval_ms (int): Milliseconds between batched reconciliations in hybrid mode. Defaults to 100.
+
+    Example:
+        >>> # Allow 100 calls per minute per user and method
+        >>> interceptor = GrpcServerRateLimitInterceptor(
+        ...     calls_count=100,
+        ...     minutes=1,
+        ...     metadata_keys={"x-user-id"},
+        ...     key_by_peer=False,
+        ... )
+        >>> server = grpc.server(thread_pool, interceptors=[interceptor])
+    """
+
+    def __init__(
+        self,
+        calls_count: int = 1,
+        milliseconds: int = 0,
+        seconds: int = 0,
+        minutes: int = 0,
+        hours: int = 0,
+        days: int = 0,
+        metadata_keys: set[str] | None = None,
+        key_by_peer: bool = True,
+        key_by_method: bool = True,
+        local_pre_limit: bool = False,
+        sync_interval_ms: int = 100,
+    ) -> None:
+        self.metadata_keys = metadata_keys or set()
+        self.key_by_peer = key_by_peer
+        self.key_by_method = key_by_method
+        self.engine = RateLimitEngine(
+            calls_count=calls_count,
+            window_ms=calculate_window_ms(milliseconds, seconds, minutes, hours, days),
+            local_pre_limit=local_pre_limit,
+            sync_interval_ms=sync_interval_ms,
+        )
+
+    def intercept(
+        self,
+        method: Callable,
+        request: object,
+        context: grpc.ServicerContext,
+        method_name_model: MethodName,
+    ) -> object:
+        """Intercepts a sync gRPC server call and rejects it when the rate limit is exceeded.
+
+        Args:
+            method: The sync gRPC method being intercepted.
+            request: The request object passed to the method.
+            context: The context of the sync gRPC call.
+            method_name_model: The parsed method name containing package, service, and method components.
+
+        Returns:
+            object: The result of the intercepted gRPC method.
+        """
+        key = _generate_rate_limit_key(
+            context.peer(),
+            context.invocation_metadata(),
+            method_name_model,
+            self.metadata_keys,
+            self.key_by_peer,
+            self.key_by_method,
+        )
+        retry_after_ms = self.engine.hit(key)
+        if retry_after_ms != 0:
+            ResourceExhaustedError(
+                resource_type="rate_limit",
+                additional_data={"retry_after_ms": retry_after_ms},
+            ).abort_grpc_sync(context)
+        return method(request, context)
+
+
+class AsyncGrpcServerRateLimitInterceptor(BaseAsyncGrpcServerInterceptor):
+    """An async gRPC server interceptor limiting the rate of calls using Redis for tracking.
+
+    Calls are keyed by any combination of metadata values, the peer address and the method
+    name. When the limit is exceeded the call is aborted with ``RESOURCE_EXHAUSTED`` and the
+    remaining window is reported as ``retry_after_ms`` in the trailing metadata.
+
+    It shares the Redis commands and the local pre-limiter with FastAPIRestRateLimitHandler.
+
+    Args:
+        calls_count (int): Maximum number of allowed calls within the time window. Defaults to 1.
+        milliseconds (int): Number of milliseconds in the time window. Defaults to 0.
+        seconds (int): Number of seconds in the time window. Defaults to 0.
+        minutes (int): Number of minutes in the time window. Defaults to 0.
+        hours (int): Number of hours in the time window. Defaults to 0.
+        days (int): Number of days in the time window. Defaults to 0.
+        metadata_keys (set[str] | None): Metadata keys whose values identify the caller (e.g., {"x-user-id"}).
+            Defaults to None.
+        key_by_peer (bool): Whether to include the peer address in the key. Defaults to True.
+        key_by_method (bool): Whether to limit each method separately. Defaults to True.
+        local_pre_limit (bool): Whether to decide locally and reconcile with Redis in batches. Defaults to False.
+        sync_interval_ms (int): Milliseconds between batched reconciliations in hybrid mode. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        calls_count: int = 1,
+        milliseconds: int = 0,
+        seconds: int = 0,
+        minutes: int = 0,
+        hours: int = 0,
+        days: int = 0,
+        metadata_keys: set[str] | None = None,
+        key_by_peer: bool = True,
+        key_by_method: bool = True,
+        local_pre_limit: bool = False,
+        sync_interval_ms: int = 100,
+    ) -> None:
+        self.metadata_keys = metadata_keys or set()
+        self.key_by_peer = key_by_peer
+        self.key_by_method = key_by_method
+        self.engine = AsyncRateLimitEngine(
+            calls_count=calls_count,
+            window_ms=calculate_window_ms(milliseconds, seconds, minutes, hours, days),
+            local_pre_limit=local_pre_limit,
+            sync_interval_ms=sync_interval_ms,
+        )
+
+    async def intercept(
+        self,
+        method: Callable,
+        request: object,
+        context: grpc.aio.ServicerContext,
+        method_name_model: MethodName,
+    ) -> object:
+        """Intercepts an async gRPC server call and rejects it when the rate limit is exceeded.
+
+        Args:
+            method: The async gRPC method being intercepted.
+            request: The request object passed to the method.
+            context: The context of the async gRPC call.
+            method_name_model: The parsed method name containing package, service, and method components.
+
+        Returns:
+            object: The result of the intercepted gRPC method.
+        """
+        key = _generate_rate_limit_key(
+            context.peer(),
+            context.invocation_metadata(),
+            method_name_model,
+            self.metadata_keys,
+            self.key_by_peer,
+            self.key_by_method,
+        )
+        retry_after_ms = await self.engine.hit(key)
+        if retry_after_ms != 0:
+            await ResourceExhaustedError(
+                resource_type="rate_limit",
+                additional_data={"retry_after_ms": retry_after_ms},
+            ).abort_grpc_async(context)
+        return await method(request, context)
@@ -0,0 +1,146 @@
+import time
+from math import ceil
+
+
+class LocalRateLimitState:
+    """Per-key state kept by the in-process pre-limiter.
+
+    Attributes:
+        tokens (float): Tokens currently available in the local bucket.
+        last_refill (float): Monotonic timestamp of the last bucket refill.
+        pending (int): Hits accepted locally that are not yet reported to Redis.
+        remote_count (int): Last known global hit count of the current Redis window.
+        remote_reset_at (float): Monotonic timestamp at which the known Redis window resets.
+        blocked_until (float): Monotonic timestamp until which the key is known to be over the global limit.
+    """
+
+    __slots__ = ("blocked_until", "last_refill", "pending", "remote_count", "remote_reset_at", "tokens")
+
+    def __init__(self, tokens: float, last_refill: float) -> None:
+        self.tokens = tokens
+        self.last_refill = last_refill
+        self.pending = 0
+        self.remote_count = 0
+        self.remote_reset_at = 0.0
+        self.blocked_until = 0.0
+
+
+class LocalRateLimiter:
+    """In-process token bucket pre-limiter reconciled with a shared counter.
+
+    Each key owns a token bucket holding up to ``calls_count`` tokens that refills at
+    ``calls_count`` tokens per window. Besides the bucket, the limiter remembers the last
+    global count reported by the shared store, so clients that are clearly over the limit
+    are rejected without any network call. Accepted hits are accumulated as pending and
+    handed over in batches through :meth:`drain_pending`.
+
+    The limiter itself performs no I/O and is safe to use from a single event loop.
+
+    Args:
+        calls_count (int): Maximum number of allowed requests within the time window.
+        window_ms (int): The time window in milliseconds.
+    """
+
+    def __init__(self, calls_count: int, window_ms: int) -> None:
+        self.calls_count = calls_count
+        self.window_ms = window_ms
+        self._refill_rate = calls_count / window_ms if window_ms > 0 else float("inf")
+        self._states: dict[str, LocalRateLimitState] = {}
+
+    def acquire(self, key: str) -> int:
+        """Tries to consume one hit for the given key using local state only.
+
+        Args:
+            key (str): The rate limit key.
+
+        Returns:
+            int: 0 if the hit is accepted, otherwise the milliseconds until a retry may succeed.
+        """
+        now = time.monotonic()
+        state = self._states.get(key)
+        if state is None:
+            state = LocalRateLimitState(tokens=float(self.calls_count), last_refill=now)
+            self._states[key] = state
+
+        if state.blocked_until > now:
+            return ceil((state.blocked_until - now) * 1000)
+
+        self._refill(state, now)
+        if state.tokens < 1:
+            return max(1, ceil((1 - state.tokens) / self._refill_rate))
+
+        if state.remote_reset_at > now and state.remote_count + state.pending >= self.calls_count:
+            return ceil((state.remote_reset_at - now) * 1000)
+
+        state.tokens -= 1
+        state.pending += 1
+        return 0
+
+    def drain_pending(self) -> dict[str, int]:
+        """Collects and resets the pending hit counts of all keys.
+
+        Returns:
+            dict[str, int]: Mapping of rate limit keys to the hits accepted since the last drain.
+        """
+        pending: dict[str, int] = {}
+        for key, state in self._states.items():
+            if state.pending:
+                pending[key] = state.pending
+                state.pending = 0
+        return pending
+
+    def restore_pending(self, pending: dict[str, int]) -> None:
+        """Puts back hits that could not be reported, capped at one window worth of hits.
+
+        Args:
+            pending (dict[str, int]): Mapping of rate limit keys to unreported hits.
+        """
+        for key, count in pending.items():
+            if state := self._states.get(key):
+                state.pending = min(state.pending + count, self.calls_count)
+
+    def update_remote(self, key: str, remote_count: int, remote_ttl_ms: int) -> None:
+        """Records the global state of a key as reported by the shared store.
+
+        Args:
+            key (str): The rate limit key.
+            remote_count (int): The global hit count of the current window.
+            remote_ttl_ms (int): Remaining lifetime of the global window in milliseconds.
+        """
+        state = self._states.get(key)
+        if state is None:
+            return
+        now = time.monotonic()
+        ttl_ms = remote_ttl_ms if remote_ttl_ms > 0 else self.window_ms
+        state.remote_count = remote_count
+        state.remote_reset_at = now + ttl_ms / 1000
+        if remote_count >= self.calls_count:
+            state.blocked_until = state.remote_reset_at
+
+    def evict_idle(self) -> None:
+        """Drops keys whose bucket is full, with no pending hits and no active global window."""
+        now = time.monotonic()
+        idle_keys = []
+        for key, state in self._states.items():
+            self._refill(state, now)
+            if (
+                not state.pending
+                and state.tokens >= self.calls_count
+                and state.remote_reset_at <= now
+                and state.blocked_until <= now
+            ):
+                idle_keys.append(key)
+        for key in idle_keys:
+            del self._states[key]
+
+    def _refill(self, state: LocalRateLimitState, now: float) -> None:
+        """Refills the bucket of a key according to the elapsed time.
+
+        Args:
+            state (LocalRateLimitState): The state of the key.
+            now (float): The current monotonic timestamp.
+        """
+        elapsed_ms = (now - state.last_refill) * 1000
+        if elapsed_ms > 0:
+            state.tokens = min(float(self.calls_count), state.tokens + elapsed_ms * self._refill_rate)
+            state.last_refill = now
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import threading
+from typing import Any
+
+from redis.asyncio.client import Pipeline as AsyncPipeline
+from redis.client import Pipeline
+
+from archipy.adapters.redis.adapters import AsyncRedisAdapter, RedisAdapter
+from archipy.adapters.redis.ports import AsyncRedisPort, RedisPort
+from archipy.helpers.interceptors.rate_limit.local_rate_limiter import LocalRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_window_ms(
+    milliseconds: int = 0,
+    seconds: int = 0,
+    minutes: int = 0,
+    hours: int = 0,
+    days: int = 0,
+) -> int:
+    """Combines all time unit parameters into a single window in milliseconds.
+
+    Args:
+        milliseconds (int): Number of milliseconds in the time window. Defaults to 0.
+        seconds (int): Number of seconds in the time window. Defaults to 0.
+        minutes (int): Number of minutes in the time window. Defaults to 0.
+        hours (int): Number of hours in the time window. Defaults to 0.
+        days (int): Number of days in the time window. Defaults to 0.
+
+    Returns:
+        int: The total time window in milliseconds.
+    """
+    return milliseconds + 1000 * seconds + 60 * 1000 * minutes + 60 * 60 * 1000 * hours + 24 * 60 * 60 * 1000 * days
+
+
+class _BaseRateLimitEngine:
+    """Transport-agnostic fixed window rate limit logic shared by the sync and async engines.
+
+    Hits are recorded in Redis with one pipelined round trip per batch: for every key the
+    pipeline increments the counter, starts the window expiry if it is not set yet and reads
+    the remaining window TTL. The strict mode sends a batch of one hit per request, the hybrid
+    mode sends the hits accepted by the local pre-limiter every ``sync_interval_ms``.
+
+    Args:
+        calls_count (int): Maximum number of allowed requests within the time window.
+        window_ms (int): The time window in milliseconds.
+        local_pre_limit (bool): Whether to enable the hybrid local pre-limiter mode.
+        sync_interval_ms (int): Interval between batched Redis reconciliations in hybrid mode.
+    """
+
+    def __init__(
+        self,
+        calls_count: int,
+        window_ms: int,
+        local_pre_limit: bool = False,
+        sync_interval_ms: int = 100,
+    ) -> None:
+        self.calls_count = calls_count
+        self.window_ms = window_ms
+        self.sync_interval_ms = sync_interval_ms
+        self.local_limiter = LocalRateLimiter(calls_count, window_ms) if local_pre_limit else None
+
+    def _queue_hits(self, pipeline: Pipeline | AsyncPipeline, hits: dict[str, int]) -> None:
+        """Queues the commands recording the given hits on a Redis pipeline.
+
+        Args:
+            pipeline (Pipeline | AsyncPipeline): A non-transactional Redis pipeline.
+            hits (dict[str, int]): Mapping of rate limit keys to the number of hits to record.
+        """
+        for key, count in hits.items():
+            pipeline.incrby(key, count)
+            pipeline.pexpire(key, self.window_ms, nx=True)
+            pipeline.pttl(key)
+
+    @staticmethod
+    def _parse_hits(hits: dict[str, int], results: list[Any]) -> dict[str, tuple[int, int]]:
+        """Extracts the global count and window TTL of each key from pipeline results.
+
+        Args:
+            hits (dict[str, int]): The hits that were queued on the pipeline.
+            results (list[Any]): The results returned by the pipeline execution.
+
+        Returns:
+            dict[str, tuple[int, int]]: Mapping of rate limit keys to their global count and TTL in milliseconds.
+        """
+        return {key: (int(results[index * 3]), int(results[index * 3 + 2])) for index, key in enumerate(hits)}
+
+    def _retry_after(self, count: int, ttl: int) -> int:
+        """Computes the retry delay for a key from its global state.
+
+        Args:
+            count (int): The global hit count of the current window.
+            ttl (int): The remaining window lifetime in milliseconds.
+
+        Returns:
+            int: 0 if the count is within the limit, otherwise the milliseconds until the window resets.
+        """
+        if count <= self.calls_count:
+            return 0
+        return ttl if ttl > 0 else self.window_ms
+
+    def _apply_sync_results(self, pending: dict[str, int], results: list[Any]) -> None:
+        """Feeds the global state reported by Redis back to the local pre-limiter.
+
+        Args:
+            pending (dict[str, int]): The hits that were reported.
+            results (list[Any]): The results returned by the pipeline execution.
+        """
+        if self.local_limiter is None:
+            return
+        for key, (count, ttl) in self._parse_hits(pending, results).items():
+            self.local_limiter.update_remote(key, count, ttl)
+        self.local_limiter.evict_idle()
+
+
+class RateLimitEngine(_BaseRateLimitEngine):
+    """Synchronous rate limit engine backed by Redis with an optional local pre-limiter.
+
+    In hybrid mode the reconciliation with Redis runs in a daemon thread, so the engine can be
+    shared by the worker threads of a synchronous server.
+
+    Args:
+        calls_count (int): Maximum number of allowed requests within the time window.
+        window_ms (int): The time window in milliseconds.
+        local_pre_limit (bool): Whether to enable the hybrid local pre-limiter mode. Defaults to False.
+        sync_interval_ms (int): Interval between batched Redis reconciliations in hybrid mode. Defaults to 100.
+        redis_client (RedisPort | None): Redis adapter to use. If None, a RedisAdapter is created from global config.
+    """
+
+    def __init__(
+        self,
+        calls_count: int,
+        window_ms: int,
+        local_pre_limit: bool = False,
+        sync_interval_ms: int = 100,
+        redis_client: RedisPort | None = None,
+    ) -> None:
+        super().__init__(calls_count, window_ms, local_pre_limit, sync_interval_ms)
+        self.redis_client = redis_client or RedisAdapter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sync_thread: threading.Thread | None = None
+
+    def hit(self, key: str) -> int:
+        """Records one hit for the given key.
+
+        Args:
+            key (str): The rate limit key.
+
+        Returns:
+            int: 0 if the hit is allowed, otherwise the milliseconds until a retry may succeed.
+        """
+        if self.local_limiter is None:
+            hits = {key: 1}
+            pipeline = self.redis_client.get_pipeline(transaction=False)
+            self._queue_hits(pipeline, hits)
+            count, ttl = self._parse_hits(hits, pipeline.execute())[key]
+            return self._retry_after(count, ttl)
+
+        self._ensure_sync_thread()
+        with self._lock:
+            return self.local_limiter.acquire(key)
+
+    def sync(self) -> None:
+        """Reconciles locally accepted hits with Redis in a single pipelined batch.
+
+        If Redis is unavailable the hits are kept for the next attempt and the local
+        buckets continue to protect the service.
+        """
+        if self.local_limiter is None:
+            return
+        with self._lock:
+            pending = self.local_limiter.drain_pending()
+            if not pending:
+                self.local_limiter.evict_idle()
+                return
+
+        try:
+            pipeline = self.redis_client.get_pipeline(transaction=False)
+            self._queue_hits(pipeline, pending)
+            results = pipeline.execute()
+        except Exception as exception:
+            logger.warning(f"Rate limit reconciliation with Redis failed, using local limits only: {exception}")
+            with self._lock:
+                self.local_limiter.restore_pending(pending)
+            return
+
+        with self._lock:
+            self._apply_sync_results(pending, results)
+
+    def close(self) -> None:
+        """Stops the background reconciliation thread and flushes the remaining local hits."""
+        if self._sync_thread is not None:
+            self._stop_event.set()
+            self._sync_thread.join()
+            self._sync_thread = None
+            self._stop_event.clear()
+        self.sync()
+
+    def _ensure_sync_thread(self) -> None:
+        """Starts the background reconciliation thread if needed."""
+        if self._sync_thread is None or not self._sync_thread.is_alive():
+            with self._lock:
+                if self._sync_thread is None or not self._sync_thread.is_alive():
+                    self._sync_thread = threading.Thread(target=self._sync_loop, name="rate-limit-sync", daemon=True)
+                    self._sync_thread.start()
+
+    def _sync_loop(self) -> None:
+        """Periodically reconciles local hits with Redis until stopped."""
+        interval = self.sync_interval_ms / 1000
+        while not self._stop_event.wait(interval):
+            self.sync()
+
+
+class AsyncRateLimitEngine(_BaseRateLimitEngine):
+    """Asynchronous rate limit engine backed by Redis with an optional local pre-limiter.
+
+    In hybrid mode the reconciliation with Redis runs as a background task on the event loop
+    that handles the first hit.
+
+    Args:
+        calls_count (int): Maximum number of allowed requests within the time window.
+        window_ms (int): The time window in milliseconds.
+        local_pre_limit (bool): Whether to enable the hybrid local pre-limiter mode. Defaults to False.
+        sync_interval_ms (int): Interval between batched Redis reconciliations in hybrid mode. Defaults to 100.
+        redis_client (AsyncRedisPort | None): Redis adapter to use. If None, an AsyncRedisAdapter is
+            created from global config.
+    """
+
+    def __init__(
+        self,
+        calls_count: int,
+        window_ms: int,
+        local_pre_limit: bool = False,
+        sync_interval_ms: int = 100,
+        redis_client: AsyncRedisPort | None = None,
+    ) -> None:
+        super().__init__(calls_count, window_ms, local_pre_limit, sync_interval_ms)
+        self.redis_client = redis_client or AsyncRedisAdapter()
+        self._sync_task: asyncio.Task[None] | None = None
+
+    async def hit(self, key: str) -> int:
+        """Records one hit for the given key.
+
+        Args:
+            key (str): The rate limit key.
+
+        Returns:
+            int: 0 if the hit is allowed, otherwise the milliseconds until a retry may succeed.
+        """
+        if self.local_limiter is None:
+            hits = {key: 1}
+            pipeline = await self.redis_client.get_pipeline(transaction=False)
+            self._queue_hits(pipeline, hits)
+            count, ttl = self._parse_hits(hits, await pipeline.execute())[key]
+            return self._retry_after(count, ttl)
+
+        self._ensure_sync_task()
+        return self.local_limiter.acquire(key)
+
+    async def sync(self) -> None:
+        """Reconciles locally accepted hits with Redis in a single pipelined batch.
+
+        If Redis is unavailable the hits are kept for the next attempt and the local
+        buckets continue to protect the service.
+        """
+        if self.local_limiter is None:
+            return
+        pending = self.local_limiter.drain_pending()
+        if not pending:
+            self.local_limiter.evict_idle()
+            return
+
+        try:
+            pipeline = await self.redis_client.get_pipeline(transaction=False)
+            self._queue_hits(pipeline, pending)
+            results = await pipeline.execute()
+        except Exception as exception:
+            logger.warning(f"Rate limit reconciliation with Redis failed, using local limits only: {exception}")
+            self.local_limiter.restore_pending(pending)
+            return
+
+        self._apply_sync_results(pending, results)
+
+    async def close(self) -> None:
+        """Stops the background reconciliation task and flushes the remaining local hits."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        await self.sync()
+
+    def _ensure_sync_task(self) -> None:
+        """Starts the background reconciliation task on the running event loop if needed."""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.get_running_loop().create_task(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        """Periodically reconciles local hits with Redis until cancelled."""
+        interval = self.sync_interval_ms / 1000
+        while True:
+            await asyncio.sleep(interval)
+            await self.sync()
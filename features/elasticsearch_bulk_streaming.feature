@@ -0,0 +1,65 @@
+Feature: Elasticsearch Streaming and Parallel Bulk Indexing
+  As a developer
+  I want to stream bulk actions from a generator to Elasticsearch in bounded chunks
+  So that large ingestions keep memory flat, saturate the cluster and survive rejections
+
+  Scenario: Streaming bulk sends a generator of actions in chunks and yields every result
+    Given an in-memory Elasticsearch cluster
+    And a generator of 25 index actions for index "products"
+    When the actions are sent with streaming bulk in chunks of 10 actions
+    Then 25 successful results should be yielded
+    And the cluster should have received 3 bulk requests
+    And index "products" should hold 25 documents
+    And no more than 11 actions should have been read before the first result
+
+  Scenario: Streaming bulk splits chunks that exceed the byte limit
+    Given an in-memory Elasticsearch cluster
+    And a generator of 20 index actions for index "products"
+    When the actions are sent with streaming bulk in chunks of 100 actions and 400 bytes
+    Then 20 successful results should be yielded
+    And every bulk request should be at most 400 bytes
+    And the cluster should have received more than 1 bulk requests
+
+  Scenario: Streaming bulk retries actions rejected with a 429 status
+    Given an in-memory Elasticsearch cluster
+    And the cluster rejects documents "3" and "7" with a 429 status 2 times
+    And a generator of 10 index actions for index "products"
+    When the actions are sent with streaming bulk in chunks of 10 actions
+    Then 10 successful results should be yielded
+    And the cluster should have received 3 bulk requests
+    And index "products" should hold 10 documents
+
+  Scenario: Streaming bulk yields failed actions instead of raising
+    Given an in-memory Elasticsearch cluster
+    And the cluster fails document "4" with "mapper_parsing_exception"
+    And a generator of 10 index actions for index "products"
+    When the actions are sent with streaming bulk in chunks of 10 actions
+    Then 9 successful results should be yielded
+    And the result of document "4" should be a failure with "mapper_parsing_exception"
+
+  Scenario: Parallel bulk sends chunks concurrently with bounded parallelism
+    Given an in-memory Elasticsearch cluster taking 50 milliseconds per bulk request
+    And a generator of 60 index actions for index "products"
+    When the actions are sent with parallel bulk in chunks of 5 actions on 3 threads
+    Then 60 successful results should be yielded
+    And the results should follow the order of the actions
+    And the cluster should have handled at most 3 bulk requests at once, more than 1
+    And index "products" should hold 60 documents
+
+  Scenario: Async streaming bulk sends an async generator of actions in chunks
+    Given an in-memory Elasticsearch cluster
+    And the cluster rejects documents "3" and "7" with a 429 status 1 times
+    And an async generator of 25 index actions for index "products"
+    When the actions are sent with async streaming bulk in chunks of 10 actions
+    Then 25 successful results should be yielded
+    And the cluster should have received 4 bulk requests
+    And index "products" should hold 25 documents
+
+  Scenario: Async parallel bulk sends chunks concurrently with bounded parallelism
+    Given an in-memory Elasticsearch cluster taking 50 milliseconds per bulk request
+    And an async generator of 60 index actions for index "products"
+    When the actions are sent with async parallel bulk in chunks of 5 actions with a concurrency of 3
+    Then 60 successful results should be yielded
+    And the results should follow the order of the actions
+    And the cluster should have handled at most 3 bulk requests at once, more than 1
+    And index "products" should hold 60 documents
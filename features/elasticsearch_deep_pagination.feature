@@ -0,0 +1,70 @@
+Feature: Elasticsearch Deep Pagination
+  As a developer
+  I want to iterate over every hit of a search with points in time, search_after and scrolls
+  So that I can export more documents than the result window allows without leaking search contexts
+
+  Scenario: Iterating hits goes beyond the result window with a point in time
+    Given an in-memory Elasticsearch cluster with 12000 documents in index "products"
+    When I search index "products" from hit 10000
+    Then the search should be rejected because the result window is too large
+    When I iterate over the hits of index "products" in pages of 1000
+    Then 12000 distinct hits should be returned
+    And every point in time should have been closed after opening 1
+
+  Scenario: Iterating hits reads the index as of the point in time
+    Given an in-memory Elasticsearch cluster with 50 documents in index "products"
+    When I iterate over the hits of index "products" in pages of 10 while 20 documents are added
+    Then 50 distinct hits should be returned
+    And every point in time should have been closed after opening 1
+
+  Scenario: Iterating hits applies the query and sort of the search body
+    Given an in-memory Elasticsearch cluster with 300 documents in index "products"
+    When I iterate over the hits of category "books" in index "products" by descending price in pages of 25
+    Then 100 distinct hits should be returned
+    And every hit should be of category "books"
+    And the hits should be sorted by descending price
+
+  Scenario: Closing the iterator early closes the point in time
+    Given an in-memory Elasticsearch cluster with 100 documents in index "products"
+    When I read 5 hits of index "products" in pages of 10 and close the iterator
+    Then every point in time should have been closed after opening 1
+
+  Scenario: Iterating hits falls back to a scroll when points in time are not supported
+    Given an in-memory Elasticsearch cluster with 120 documents in index "products"
+    And the cluster does not support points in time
+    When I iterate over the hits of index "products" in pages of 50
+    Then 120 distinct hits should be returned
+    And every scroll should have been cleared after opening 1
+
+  Scenario: Slices split the hits across independent workers
+    Given an in-memory Elasticsearch cluster with 200 documents in index "products"
+    When 3 workers each iterate over their slice of index "products" in pages of 20
+    Then every hit should have been returned by exactly one worker
+    And every worker should have returned some hits
+    And every point in time should have been closed after opening 3
+
+  Scenario: Parallel iteration fetches slices concurrently over one point in time
+    Given an in-memory Elasticsearch cluster with 400 documents in index "products" taking 20 milliseconds per request
+    When I iterate over the hits of index "products" with 4 parallel slices in pages of 25
+    Then 400 distinct hits should be returned
+    And the cluster should have handled more than 1 search at once
+    And every point in time should have been closed after opening 1
+
+  Scenario: Parallel iteration clears its scrolls when points in time are not supported
+    Given an in-memory Elasticsearch cluster with 400 documents in index "products"
+    And the cluster does not support points in time
+    When I iterate over the hits of index "products" with 4 parallel slices in pages of 25
+    Then 400 distinct hits should be returned
+    And every scroll should have been cleared after opening 4
+
+  Scenario: Async iteration of hits with a point in time
+    Given an in-memory Elasticsearch cluster with 250 documents in index "products"
+    When I asynchronously iterate over the hits of index "products" in pages of 40
+    Then 250 distinct hits should be returned
+    And every point in time should have been closed after opening 1
+
+  Scenario: Async parallel iteration closed early releases its point in time
+    Given an in-memory Elasticsearch cluster with 400 documents in index "products" taking 10 milliseconds per request
+    When I asynchronously read 30 hits of index "products" with 4 parallel slices in pages of 25 and close the iterator
+    Then 30 distinct hits should be returned
+    And every point in time should have been closed after opening 1
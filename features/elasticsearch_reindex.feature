@@ -0,0 +1,60 @@
+Feature: Elasticsearch Reindex and Alias Swap
+  As a developer
+  I want to rebuild the index behind an alias and switch searches to it at once
+  So that mappings can change without downtime or half-copied results
+
+  Background:
+    Given an in-memory Elasticsearch cluster with 30 products in index "products-v1" behind alias "products"
+
+  Scenario: A reindex task copies the documents into a new version and swaps the alias
+    When I reindex alias "products" with a reindex task in batches of 10
+    Then alias "products" should point to "products-v2" only
+    And index "products-v2" should hold 30 products
+    And index "products-v2" should have been created without refreshes or replicas
+    And index "products-v2" should have a refresh interval of "30s" and 2 replicas
+    And index "products-v2" should have been force-merged to 1 segment
+    And the reindex should report 30 documents copied from "products-v1"
+
+  Scenario: The reindex task is sliced and throttled on the cluster
+    When I reindex alias "products" with a reindex task in 4 slices at 500 documents per second
+    Then the reindex request should have used 4 slices and 500 requests per second
+    And index "products-v2" should hold 30 products
+
+  Scenario: Documents are copied through throttled bulk requests
+    When I reindex alias "products" with bulk requests in batches of 10 at 100 documents per second
+    Then alias "products" should point to "products-v2" only
+    And index "products-v2" should hold 30 products
+    And the copy should have taken at least 250 milliseconds
+    And the cluster should have received 3 bulk requests
+
+  Scenario: A failed copy deletes the new index and leaves the alias untouched
+    Given the cluster fails to copy the product with id "7"
+    When I try to reindex alias "products" with a reindex task in batches of 10
+    Then the reindex should fail with an InternalError
+    And alias "products" should point to "products-v1" only
+    And index "products-v2" should not exist
+
+  Scenario: An index is replaced by an alias of the same name when the source is deleted
+    Given index "catalog" holds 12 products
+    When I reindex alias "catalog" with bulk requests in batches of 5 deleting the source
+    Then alias "catalog" should point to "catalog-v1" only
+    And index "catalog-v1" should hold 12 products
+
+  Scenario: An index is not replaced by an alias unless the source is deleted
+    Given index "catalog" holds 12 products
+    When I try to reindex alias "catalog" with bulk requests in batches of 5
+    Then the reindex should fail with a FailedPreconditionError
+    And index "catalog" should hold 12 products
+
+  Scenario: Reindex progress is exported as Prometheus metrics
+    Given reindex metrics exported to a fresh registry
+    When I reindex alias "products" with a reindex task in batches of 10
+    Then the metrics should show the reindex of alias "products" as "completed"
+    And the metrics should show 30 of 30 documents copied for alias "products"
+    And the metrics should show the duration of every phase of the reindex of alias "products"
+
+  Scenario: The async adapter reindexes behind an alias
+    When I reindex alias "products" asynchronously with bulk requests in batches of 10 deleting the source
+    Then alias "products" should point to "products-v2" only
+    And index "products-v2" should hold 30 products
+    And index "products-v1" should not exist
@@ -0,0 +1,80 @@
+Feature: Elasticsearch Search Result Cache
+  As a developer
+  I want repeated searches to be served from a cache invalidated by writes to the searched index
+  So that identical aggregation queries from many replicas do not hit the cluster again and again
+
+  Background:
+    Given an in-memory Elasticsearch cluster with 30 products in index "products"
+
+  Scenario: Repeated searches are served from the cache
+    Given an adapter caching search results
+    When I search "products" for price 3 3 times, with the query keys in a different order each time
+    Then the cluster should have received 1 search
+    And every search should have returned the products priced 3
+    And the cache should report 2 local hits, 0 Redis hits and 1 miss
+
+  Scenario: Search results are not cached by default
+    Given an adapter with the default configuration
+    When I search "products" for price 3 3 times, with the query keys in a different order each time
+    Then the cluster should have received 3 searches
+
+  Scenario: A refreshed write invalidates the cached results of its index
+    Given an adapter caching search results
+    When I search "products" for price 3
+    And I index a product priced 3 with id "new" in "products" waiting for the refresh
+    And I search "products" for price 3
+    And I search "products" for price 3
+    Then the cluster should have received 2 searches
+    And the last search should have returned 4 products
+
+  Scenario: Results are not cached until a write becomes visible to searches
+    Given an adapter caching search results with a refresh interval of 300 milliseconds
+    When I search "products" for price 3
+    And I delete the product with id "3" from "products"
+    And I search "products" for price 3
+    And I search "products" for price 3
+    Then the cluster should have received 3 searches
+    When I wait 300 milliseconds
+    And I search "products" for price 3
+    And I search "products" for price 3
+    Then the cluster should have received 4 searches
+
+  Scenario: Bulk writes invalidate only the indices they write
+    Given an adapter caching search results
+    When I search "products" for price 3
+    And I stream 5 orders to index "orders" waiting for the refresh
+    And I search "products" for price 3
+    Then the cluster should have received 1 search
+    When I bulk update the product with id "3" in "products" waiting for the refresh
+    And I search "products" for price 3
+    Then the cluster should have received 2 searches
+
+  Scenario: Cached results expire after their TTL
+    Given an adapter caching search results for 200 milliseconds
+    When I search "products" for price 3
+    And I wait 250 milliseconds
+    And I search "products" for price 3
+    Then the cluster should have received 2 searches
+
+  Scenario: Replicas share cached results through Redis
+    Given two adapters caching search results in a shared Redis only
+    When the first adapter searches "products" for price 3
+    And the second adapter searches "products" for price 3
+    Then the cluster should have received 1 search
+    And the second adapter should report 0 local hits, 1 Redis hit and 0 misses
+    When the first adapter updates the product with id "3" in "products" waiting for the refresh
+    And the second adapter searches "products" for price 3
+    Then the cluster should have received 2 searches
+
+  Scenario: Cache lookups are exported as Prometheus metrics
+    Given an adapter caching search results with metrics in a fresh registry
+    When I search "products" for price 3 3 times, with the query keys in a different order each time
+    And I index a product priced 3 with id "new" in "products" waiting for the refresh
+    Then the metrics should count 2 local hits and 1 miss for index "products"
+    And the metrics should count 1 invalidation of index "products"
+
+  Scenario: The async adapter caches coalesced searches
+    Given an async adapter caching search results and coalescing searches for 20 milliseconds
+    When 4 identical searches for price 3 are issued concurrently twice
+    Then the cluster should have received 1 msearch request of 4 searches
+    And the cluster should not have received single searches
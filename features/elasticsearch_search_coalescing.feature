@@ -0,0 +1,49 @@
+Feature: Elasticsearch Multi-Search and Search Coalescing
+  As a developer
+  I want to send many small searches to Elasticsearch in a single msearch request
+  So that high query rates cost fewer HTTP round trips and less cluster queueing
+
+  Background:
+    Given an in-memory Elasticsearch cluster with 90 products in index "products"
+
+  Scenario: Multi-search runs several searches in one request
+    When I run a multi-search for prices 3 and 5 in "products" and price 3 in "missing"
+    Then the cluster should have received 1 msearch request of 3 searches
+    And the multi-search responses should hold the products priced 3 and 5 and an error with status 404
+
+  Scenario: Concurrent searches are coalesced into one msearch request
+    Given an async adapter coalescing searches for 20 milliseconds
+    When 30 searches for distinct prices are issued concurrently
+    Then the cluster should have received 1 msearch request of 30 searches
+    And the cluster should not have received single searches
+    And every search should have received the products of its own price
+
+  Scenario: Coalesced searches are split in batches of the maximum size
+    Given an async adapter coalescing searches for 20 milliseconds in batches of at most 10
+    When 25 searches for distinct prices are issued concurrently
+    Then the cluster should have received msearch requests of 10, 10 and 5 searches
+    And every search should have received the products of its own price
+
+  Scenario: A failed coalesced search raises its own error without failing the others
+    Given an async adapter coalescing searches for 20 milliseconds
+    When 5 searches for distinct prices and one search of index "missing" are issued concurrently
+    Then the search of index "missing" should have raised a not found error
+    And every search should have received the products of its own price
+
+  Scenario: A lone search is sent as a plain search after the window
+    Given an async adapter coalescing searches for 20 milliseconds
+    When 1 searches for distinct prices are issued concurrently
+    Then the cluster should have received 0 msearch requests
+    And every search should have received the products of its own price
+
+  Scenario: Searches with client options bypass coalescing
+    Given an async adapter coalescing searches for 20 milliseconds
+    When 3 searches for distinct prices are issued concurrently with a routing option
+    Then the cluster should have received 0 msearch requests
+    And the cluster should have received 3 single searches
+
+  Scenario: Searches are not coalesced by default
+    Given an async adapter with the default configuration
+    When 3 searches for distinct prices are issued concurrently
+    Then the cluster should have received 0 msearch requests
+    And the cluster should have received 3 single searches
@@ -0,0 +1,522 @@
+"""An in-memory Elasticsearch cluster for testing the adapters without a running cluster.
+
+The cluster is served through custom elastic-transport node classes, so the real elasticsearch-py
+clients, helpers and serializers are exercised and only the HTTP layer is replaced.
+"""
+
+import asyncio
+import functools
+import itertools
+import json
+import threading
+import time
+import zlib
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from elastic_transport import ApiResponseMeta, BaseAsyncNode, BaseNode, HttpHeaders
+from elastic_transport._node._base import NodeApiResponse
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+_RESPONSE_HEADERS = {"content-type": "application/json", "x-elastic-product": "Elasticsearch"}
+MAX_RESULT_WINDOW = 10_000
+
+
+class FakeElasticsearchCluster:
+    """Holds the indices of an in-memory cluster and answers the requests of the fake nodes.
+
+    Attributes:
+        indices (dict[str, dict[str, dict]]): Documents by id of every index.
+        requests (list[tuple[str, str]]): Method and path of every request received.
+        rejections (dict[str, int]): Times the bulk actions on a document id are still rejected with 429.
+        failures (dict[str, str]): Error type returned for bulk actions on a document id.
+        request_delay (float): Seconds every request takes.
+        max_active_requests (int): Most requests handled at the same time.
+        point_in_time_supported (bool): Whether points in time can be opened, as on clusters before 7.10.
+        msearch_sizes (list[int]): Number of searches of every msearch request.
+        points_in_time (dict[str, dict[str, dict]]): Snapshot of the index of every open point in time.
+        scrolls (dict[str, list[dict]]): Hits still to return of every open scroll.
+        aliases (dict[str, set[str]]): Indices every alias points to.
+        settings (dict[str, dict[str, object]]): Flat settings of every index created through the API.
+        created_settings (dict[str, dict[str, object]]): Flat settings every index was created with.
+        reindex_requests (list[dict]): Parameters and body of every reindex request.
+        tasks (dict[str, dict]): State of every reindex task, copying ``size`` documents per status request.
+        force_merges (list[tuple[str, int]]): Index and segments of every force-merge.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.indices = {}
+        self.requests = []
+        self.bulk_bodies = []
+        self.msearch_sizes = []
+        self.rejections = {}
+        self.failures = {}
+        self.request_delay = 0.0
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self.point_in_time_supported = True
+        self.points_in_time = {}
+        self.scrolls = {}
+        self.opened_points_in_time = 0
+        self.opened_scrolls = 0
+        self.aliases = {}
+        self.settings = {}
+        self.created_settings = {}
+        self.reindex_requests = []
+        self.tasks = {}
+        self.force_merges = []
+        self._ids = itertools.count(1)
+
+    def client(self):
+        """Returns a synchronous client of the cluster."""
+        cluster = self
+
+        class Node(FakeNode):
+            pass
+
+        Node.cluster = cluster
+        return Elasticsearch("http://fake-elasticsearch:9200", node_class=Node)
+
+    def async_client(self):
+        """Returns an asynchronous client of the cluster."""
+        cluster = self
+
+        class Node(FakeAsyncNode):
+            pass
+
+        Node.cluster = cluster
+        return AsyncElasticsearch("http://fake-elasticsearch:9200", node_class=Node)
+
+    def enter(self):
+        with self.lock:
+            self.active_requests += 1
+            self.max_active_requests = max(self.max_active_requests, self.active_requests)
+
+    def leave(self):
+        with self.lock:
+            self.active_requests -= 1
+
+    def handle(self, method, target, body):
+        """Answers a request.
+
+        Returns:
+            tuple[int, dict]: The status and body of the response.
+        """
+        url = urlsplit(target)
+        path = [unquote(part) for part in url.path.split("/") if part]
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        with self.lock:
+            self.requests.append((method, url.path))
+            if path and path[-1] == "_bulk":
+                return self._bulk(path[0] if len(path) > 1 else None, body)
+            if path and path[-1] == "_msearch":
+                return self._msearch(path[0] if len(path) > 1 else None, body)
+            payload = json.loads(body) if body else {}
+            if path == ["_search", "scroll"]:
+                if method == "DELETE":
+                    return self._clear_scroll(payload)
+                return self._scroll(payload)
+            if path and path[-1] == "_pit":
+                if method == "DELETE":
+                    return self._close_point_in_time(payload)
+                return self._open_point_in_time(path[0])
+            if path and path[-1] == "_search":
+                return self._search(path[0] if len(path) > 1 else None, payload, query)
+            if len(path) == 3 and path[1] in ("_doc", "_create", "_update"):
+                return self._document(method, *path, payload)
+            if path and path[-1] == "_count":
+                return self._count(path[0], payload)
+            if path == ["_aliases"]:
+                return self._update_aliases(payload["actions"])
+            if len(path) == 2 and path[0] == "_alias":
+                return self._get_alias(path[1])
+            if path == ["_reindex"]:
+                return self._reindex(payload, query)
+            if path and path[0] == "_tasks":
+                return self._task(path[1], cancel=path[-1] == "_cancel")
+            if len(path) == 2 and path[1] == "_settings":
+                return self._index_settings(method, path[0], payload)
+            if len(path) == 2 and path[1] in ("_refresh", "_forcemerge"):
+                if path[1] == "_forcemerge":
+                    self.force_merges.append((path[0], int(query["max_num_segments"])))
+                return 200, {"_shards": {"total": 1, "successful": 1, "failed": 0}}
+            if len(path) == 1 and not path[0].startswith("_"):
+                return self._index(method, path[0], payload)
+        return _error(404, "unsupported_operation", f"{method} {url.path}")
+
+    def store(self, index, documents):
+        """Stores documents by id in an index."""
+        with self.lock:
+            self.indices.setdefault(index, {}).update(documents)
+
+    def _resolve(self, name):
+        """Returns the concrete indices of comma separated indices and aliases, None if one does not exist."""
+        if name is None:
+            return None
+        indices = []
+        for part in name.split(","):
+            if part in self.indices:
+                indices.append(part)
+            elif part in self.aliases:
+                indices.extend(sorted(self.aliases[part]))
+            else:
+                return None
+        return indices
+
+    def _documents(self, name):
+        """Returns the index hits are labelled with and the documents of indices and aliases."""
+        indices = self._resolve(name)
+        if indices is None:
+            return None, None
+        documents = {}
+        for index in indices:
+            documents.update(self.indices[index])
+        return indices[0] if len(indices) == 1 else name, documents
+
+    def _open_point_in_time(self, index):
+        if not self.point_in_time_supported:
+            return _error(400, "illegal_argument_exception", "request [/_pit] contains unrecognized parameter")
+        index, documents = self._documents(index)
+        if documents is None:
+            return _error(404, "index_not_found_exception", f"no such index [{index}]")
+        pit_id = f"pit-{next(self._ids)}"
+        self.points_in_time[pit_id] = {"index": index, "documents": documents}
+        self.opened_points_in_time += 1
+        return 200, {"id": pit_id}
+
+    def _close_point_in_time(self, payload):
+        if self.points_in_time.pop(payload["id"], None) is None:
+            return _error(404, "search_context_missing_exception", "no search context found")
+        return 200, {"succeeded": True, "num_freed": 1}
+
+    def _search(self, index, payload, query):
+        pit = payload.get("pit")
+        sort = payload.get("sort", ["_doc"])
+        if pit is not None:
+            if pit["id"] not in self.points_in_time:
+                return _error(404, "search_context_missing_exception", "no search context found")
+            snapshot = self.points_in_time[pit["id"]]
+            index, documents = snapshot["index"], snapshot["documents"]
+            if "_shard_doc" not in sort:
+                sort = [*sort, "_shard_doc"]
+        else:
+            index, documents = self._documents(index)
+            if documents is None:
+                return _error(404, "index_not_found_exception", f"no such index [{index}]")
+        size = payload.get("size", 10)
+        start = payload.get("from", 0)
+        if "scroll" not in query and pit is None and start + size > MAX_RESULT_WINDOW:
+            return _error(400, "illegal_argument_exception", "Result window is too large")
+        hits = _sorted_hits(index, documents, payload, sort)
+        if "search_after" in payload:
+            hits = [hit for hit in hits if _compare(hit["sort"], payload["search_after"], sort) > 0]
+        response = {"took": 1, "timed_out": False, "hits": {"total": {"value": len(hits), "relation": "eq"}}}
+        if "scroll" in query:
+            scroll_id = f"scroll-{next(self._ids)}"
+            self.scrolls[scroll_id] = {"hits": hits[size:], "size": size}
+            self.opened_scrolls += 1
+            response["_scroll_id"] = scroll_id
+        if pit is not None:
+            response["pit_id"] = pit["id"]
+        response["hits"]["hits"] = hits[start : start + size]
+        return 200, response
+
+    def _msearch(self, default_index, body):
+        lines = [json.loads(line) for line in body.decode().splitlines() if line.strip()]
+        responses = []
+        for header, payload in itertools.batched(lines, 2, strict=True):
+            status, response = self._search(header.get("index", default_index), payload, {})
+            responses.append({**response, "status": status})
+        self.msearch_sizes.append(len(responses))
+        return 200, {"took": 1, "responses": responses}
+
+    def _scroll(self, payload):
+        scroll = self.scrolls.get(payload["scroll_id"])
+        if scroll is None:
+            return _error(404, "search_context_missing_exception", "no search context found")
+        hits, scroll["hits"] = scroll["hits"][: scroll["size"]], scroll["hits"][scroll["size"] :]
+        return 200, {"_scroll_id": payload["scroll_id"], "took": 1, "hits": {"hits": hits}}
+
+    def _clear_scroll(self, payload):
+        scroll_ids = payload["scroll_id"]
+        freed = 0
+        for scroll_id in [scroll_ids] if isinstance(scroll_ids, str) else scroll_ids:
+            freed += self.scrolls.pop(scroll_id, None) is not None
+        return 200, {"succeeded": True, "num_freed": freed}
+
+    def _bulk(self, default_index, body):
+        lines = [json.loads(line) for line in body.decode().splitlines() if line.strip()]
+        items = []
+        errors = False
+        self.bulk_bodies.append(body)
+        position = 0
+        while position < len(lines):
+            ((operation, meta),) = lines[position].items()
+            position += 1
+            source = None
+            if operation != "delete":
+                source = lines[position]
+                position += 1
+            index = meta.get("_index", default_index)
+            document_id = str(meta.get("_id", len(self.indices.get(index, {})) + 1))
+            item = {"_index": index, "_id": document_id}
+            if self.rejections.get(document_id, 0) > 0:
+                self.rejections[document_id] -= 1
+                item.update(status=429, error={"type": "es_rejected_execution_exception", "reason": "queue full"})
+            elif document_id in self.failures:
+                item.update(status=400, error={"type": self.failures[document_id], "reason": "rejected"})
+            else:
+                item.update(self._apply(operation, index, document_id, source))
+            errors = errors or "error" in item
+            items.append({operation: item})
+        return 200, {"took": 1, "errors": errors, "items": items}
+
+    def _document(self, method, index, endpoint, document_id, payload):
+        operation = {"_create": "create", "_update": "update"}.get(
+            endpoint, "delete" if method == "DELETE" else "index"
+        )
+        result = self._apply(operation, index, document_id, payload)
+        return result.get("status", 200), {"_index": index, "_id": document_id, **result}
+
+    def _count(self, index, payload):
+        _, documents = self._documents(index)
+        if documents is None:
+            return _error(404, "index_not_found_exception", f"no such index [{index}]")
+        return 200, {"count": sum(_matches(source, payload.get("query")) for source in documents.values())}
+
+    def _index(self, method, index, payload):
+        if method == "HEAD":
+            return (200 if index in self.indices else 404), {}
+        if method == "PUT":
+            if index in self.indices or index in self.aliases:
+                return _error(400, "resource_already_exists_exception", f"index [{index}] already exists")
+            self.indices[index] = {}
+            self.settings[index] = _flat_settings(payload.get("settings", {}))
+            self.created_settings[index] = dict(self.settings[index])
+            return 200, {"acknowledged": True, "index": index}
+        indices = self._resolve(index)
+        if indices is None:
+            return _error(404, "index_not_found_exception", f"no such index [{index}]")
+        for name in indices:
+            self._delete_index(name)
+        return 200, {"acknowledged": True}
+
+    def _delete_index(self, index):
+        del self.indices[index]
+        self.settings.pop(index, None)
+        for alias, indices in list(self.aliases.items()):
+            indices.discard(index)
+            if not indices:
+                del self.aliases[alias]
+
+    def _index_settings(self, method, index, payload):
+        indices = self._resolve(index)
+        if indices is None:
+            return _error(404, "index_not_found_exception", f"no such index [{index}]")
+        if method == "GET":
+            return 200, {name: {"settings": dict(self.settings.get(name, {}))} for name in indices}
+        for name in indices:
+            settings = self.settings.setdefault(name, {})
+            for setting, value in _flat_settings(payload).items():
+                if value is None:
+                    settings.pop(setting, None)
+                else:
+                    settings[setting] = value
+        return 200, {"acknowledged": True}
+
+    def _get_alias(self, alias):
+        if alias not in self.aliases:
+            return 404, {"error": f"alias [{alias}] missing", "status": 404}
+        return 200, {index: {"aliases": {alias: {}}} for index in sorted(self.aliases[alias])}
+
+    def _update_aliases(self, actions):
+        """Applies alias actions atomically, none of them if one fails."""
+        removed = {
+            target["index"] for action in actions for operation, target in action.items() if operation == "remove_index"
+        }
+        for action in actions:
+            ((operation, target),) = action.items()
+            if target["index"] not in self.indices:
+                return _error(404, "index_not_found_exception", f"no such index [{target['index']}]")
+            if operation == "add" and target["alias"] in self.indices.keys() - removed:
+                return _error(400, "invalid_alias_name_exception", f"an index exists with the same name [{target}]")
+        for action in actions:
+            ((operation, target),) = action.items()
+            if operation == "remove_index":
+                self._delete_index(target["index"])
+            elif operation == "remove":
+                self.aliases.get(target["alias"], set()).discard(target["index"])
+            else:
+                self.aliases.setdefault(target["alias"], set()).add(target["index"])
+        self.aliases = {alias: indices for alias, indices in self.aliases.items() if indices}
+        return 200, {"acknowledged": True}
+
+    def _reindex(self, payload, query):
+        self.reindex_requests.append({**query, **payload})
+        source = payload["source"]
+        index = ",".join(source["index"]) if isinstance(source["index"], list) else source["index"]
+        _, documents = self._documents(index)
+        if documents is None:
+            return _error(404, "index_not_found_exception", f"no such index [{index}]")
+        selected = [(key, value) for key, value in documents.items() if _matches(value, source.get("query"))]
+        task_id = f"fake-node:{next(self._ids)}"
+        self.tasks[task_id] = {
+            "documents": selected,
+            "dest": payload["dest"]["index"],
+            "size": source.get("size", 1000),
+            "created": 0,
+            "failures": [],
+            "cancelled": False,
+        }
+        return 200, {"task": task_id}
+
+    def _task(self, task_id, cancel):
+        """Answers a status request of a reindex task, copying its next batch, or cancels it."""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return _error(404, "resource_not_found_exception", f"task [{task_id}] isn't running")
+        if cancel:
+            task["cancelled"] = True
+            return 200, {"nodes": {}}
+        batch, task["documents"] = task["documents"][: task["size"]], task["documents"][task["size"] :]
+        for document_id, source in batch:
+            if document_id in self.failures:
+                task["failures"].append({"id": document_id, "cause": {"type": self.failures[document_id]}})
+            else:
+                self._apply("index", task["dest"], document_id, source)
+                task["created"] += 1
+        total = task["created"] + len(task["failures"]) + len(task["documents"])
+        status = {"total": total, "created": task["created"], "updated": 0, "deleted": 0}
+        completed = not task["documents"] or bool(task["failures"])
+        response = {"completed": completed, "task": {"node": "fake-node", "status": status}}
+        if completed:
+            response["response"] = {**status, "failures": task["failures"]}
+        return 200, response
+
+    def _apply(self, operation, index, document_id, source):
+        documents = self.indices.setdefault(index, {})
+        if operation == "delete":
+            if documents.pop(document_id, None) is None:
+                return {"status": 404, "result": "not_found"}
+            return {"status": 200, "result": "deleted"}
+        if operation == "update":
+            if document_id not in documents:
+                return {"status": 404, "error": {"type": "document_missing_exception", "reason": "missing"}}
+            documents[document_id] = {**documents[document_id], **source.get("doc", {})}
+            return {"status": 200, "result": "updated"}
+        if operation == "create" and document_id in documents:
+            return {"status": 409, "error": {"type": "version_conflict_engine_exception", "reason": "exists"}}
+        created = document_id not in documents
+        documents[document_id] = source
+        return {"status": 201 if created else 200, "result": "created" if created else "updated"}
+
+
+def _flat_settings(settings, prefix=""):
+    """Flattens nested settings to names such as ``index.refresh_interval``, always prefixed with ``index.``."""
+    flat = {}
+    for name, value in settings.items():
+        if isinstance(value, dict):
+            flat.update(_flat_settings(value, f"{prefix}{name}."))
+        else:
+            name = f"{prefix}{name}"
+            flat[name if name.startswith("index.") else f"index.{name}"] = value
+    return flat
+
+
+def _error(status, error_type, reason):
+    return status, {"error": {"type": error_type, "reason": reason}, "status": status}
+
+
+def _matches(source, query):
+    """Evaluates the match_all, term and range queries against a document."""
+    if not query or "match_all" in query:
+        return True
+    if "term" in query:
+        ((field, value),) = query["term"].items()
+        return source.get(field) == (value["value"] if isinstance(value, dict) else value)
+    if "range" in query:
+        ((field, bounds),) = query["range"].items()
+        value = source.get(field)
+        checks = {"gt": value.__gt__, "gte": value.__ge__, "lt": value.__lt__, "lte": value.__le__}
+        return value is not None and all(checks[name](bound) for name, bound in bounds.items())
+    raise ValueError(f"Unsupported query {query}")
+
+
+def _sort_field(spec):
+    if isinstance(spec, str):
+        return spec, "asc"
+    ((field, order),) = spec.items()
+    return field, order["order"] if isinstance(order, dict) else order
+
+
+def _compare(left, right, sort):
+    for (_, order), left_value, right_value in zip(map(_sort_field, sort), left, right, strict=True):
+        if left_value != right_value:
+            result = -1 if left_value < right_value else 1
+            return -result if order == "desc" else result
+    return 0
+
+
+def _sorted_hits(index, documents, payload, sort):
+    """Returns the hits of the documents matching a search, sorted, with their sort values."""
+    slice_ = payload.get("slice")
+    hits = []
+    for position, (document_id, source) in enumerate(documents.items()):
+        if slice_ is not None and zlib.crc32(document_id.encode()) % slice_["max"] != slice_["id"]:
+            continue
+        if not _matches(source, payload.get("query")):
+            continue
+        values = []
+        for field, _ in map(_sort_field, sort):
+            values.append(position if field in ("_doc", "_shard_doc") else source.get(field))
+        hits.append({"_index": index, "_id": document_id, "_source": source, "sort": values})
+    hits.sort(key=functools.cmp_to_key(lambda left, right: _compare(left["sort"], right["sort"], sort)))
+    return hits
+
+
+def _response(node_config, status, body, started):
+    meta = ApiResponseMeta(
+        status=status,
+        http_version="1.1",
+        headers=HttpHeaders(_RESPONSE_HEADERS),
+        duration=time.monotonic() - started,
+        node=node_config,
+    )
+    return NodeApiResponse(meta, json.dumps(body).encode())
+
+
+class FakeNode(BaseNode):
+    """Synchronous node answering from the FakeElasticsearchCluster bound to its class."""
+
+    cluster: FakeElasticsearchCluster
+
+    def perform_request(self, method, target, body=None, headers=None, request_timeout=None):
+        started = time.monotonic()
+        self.cluster.enter()
+        try:
+            if self.cluster.request_delay:
+                time.sleep(self.cluster.request_delay)
+            status, response = self.cluster.handle(method, target, body)
+        finally:
+            self.cluster.leave()
+        return _response(self.config, status, response, started)
+
+
+class FakeAsyncNode(BaseAsyncNode):
+    """Asynchronous node answering from the FakeElasticsearchCluster bound to its class."""
+
+    cluster: FakeElasticsearchCluster
+
+    async def perform_request(self, method, target, body=None, headers=None, request_timeout=None):
+        started = time.monotonic()
+        self.cluster.enter()
+        try:
+            if self.cluster.request_delay:
+                await asyncio.sleep(self.cluster.request_delay)
+            status, response = self.cluster.handle(method, target, body)
+        finally:
+            self.cluster.leave()
+        return _response(self.config, status, response, started)
+
+    async def close(self):
+        pass
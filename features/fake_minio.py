@@ -0,0 +1,349 @@
+"""An in-memory S3 server for testing the MinIO adapters without a running MinIO.
+
+The server listens on a local port and answers the S3 requests the adapters send, so the real minio
+client, its request signing and its response parsing are exercised. Signatures are not verified.
+"""
+
+import hashlib
+import itertools
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+
+_S3_NAMESPACE = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class FakeS3Server:
+    """Holds the buckets of an in-memory S3 server and answers the requests of its HTTP handler.
+
+    Attributes:
+        buckets (dict[str, dict[str, dict]]): Data, content type, ETag and modification time of every object by
+            name in every bucket.
+        policies (dict[str, str]): Policy of every bucket that has one.
+        requests (list[tuple[str, str, dict[str, str]]]): Method, path and query of every request received.
+        uploads (dict[str, dict]): Bucket, object name and parts of every multipart upload in progress.
+        aborted_uploads (list[str]): Ids of the multipart uploads aborted.
+        request_delay (float): Seconds every part upload, ranged download, copy and multi-object delete takes.
+        max_active_transfers (int): Most part uploads, ranged downloads, copies and multi-object deletes handled at
+            the same time.
+        failing_parts (set[int]): Part numbers whose upload is rejected.
+        failing_deletes (set[str]): Object names a multi-object delete fails to remove.
+        received_part_bytes (int): Bytes of all the parts uploaded.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.policies = {}
+        self.requests = []
+        self.uploads = {}
+        self.aborted_uploads = []
+        self.request_delay = 0.0
+        self.active_transfers = 0
+        self.max_active_transfers = 0
+        self.failing_parts = set()
+        self.failing_deletes = set()
+        self.received_part_bytes = 0
+        self._ids = itertools.count(1)
+        self._http = None
+
+    @property
+    def endpoint(self):
+        """Returns the host and port the server listens on, starting it on first use."""
+        if self._http is None:
+            server = self
+
+            class Handler(FakeS3Handler):
+                pass
+
+            Handler.server_state = server
+            self._http = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+            self._http.daemon_threads = True
+            threading.Thread(target=self._http.serve_forever, daemon=True).start()
+        host, port = self._http.server_address[:2]
+        return f"{host}:{port}"
+
+    def stop(self):
+        """Stops the server if it was started."""
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+
+    def store(self, bucket, name, data, content_type="application/octet-stream"):
+        """Stores an object, creating its bucket if needed."""
+        with self.lock:
+            self._put(bucket, name, data, content_type, hashlib.md5(data).hexdigest())  # noqa: S324
+
+    def objects(self, bucket):
+        """Returns the data of every object of a bucket by name."""
+        with self.lock:
+            return {name: entry["data"] for name, entry in self.buckets.get(bucket, {}).items()}
+
+    def handle(self, method, target, headers, body):
+        """Answers a request.
+
+        Returns:
+            tuple[int, dict[str, str], bytes]: The status, headers and body of the response.
+        """
+        url = urlsplit(target)
+        bucket, _, name = unquote(url.path).lstrip("/").partition("/")
+        query = {key: values[-1] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+        with self.lock:
+            self.requests.append((method, url.path, query))
+        transfer = (
+            ("partNumber" in query and method == "PUT")
+            or ("Range" in headers and method == "GET")
+            or ("x-amz-copy-source" in headers and method == "PUT")
+            or ("delete" in query and method == "POST")
+        )
+        if transfer:
+            self._enter()
+        try:
+            if transfer and self.request_delay:
+                time.sleep(self.request_delay)
+            with self.lock:
+                return self._dispatch(method, bucket, name, query, headers, body)
+        finally:
+            if transfer:
+                self._leave()
+
+    def _enter(self):
+        with self.lock:
+            self.active_transfers += 1
+            self.max_active_transfers = max(self.max_active_transfers, self.active_transfers)
+
+    def _leave(self):
+        with self.lock:
+            self.active_transfers -= 1
+
+    def _dispatch(self, method, bucket, name, query, headers, body):
+        if not bucket:
+            return self._list_buckets()
+        if not name:
+            return self._bucket(method, bucket, query, body)
+        if bucket not in self.buckets:
+            return _error(404, "NoSuchBucket", "The specified bucket does not exist", bucket, name)
+        if "uploads" in query and method == "POST":
+            return self._create_upload(bucket, name, headers)
+        if "uploadId" in query:
+            return self._upload(method, bucket, name, query, body)
+        if "x-amz-copy-source" in headers and method == "PUT":
+            return self._copy(bucket, name, unquote(headers["x-amz-copy-source"]))
+        if method == "PUT":
+            self._put(bucket, name, body, headers.get("Content-Type"), hashlib.md5(body).hexdigest())  # noqa: S324
+            return 200, {"ETag": f'"{self.buckets[bucket][name]["etag"]}"'}, b""
+        entry = self.buckets[bucket].get(name)
+        if entry is None:
+            return _error(404, "NoSuchKey", "The specified key does not exist", bucket, name)
+        if method == "DELETE":
+            del self.buckets[bucket][name]
+            return 204, {}, b""
+        if "If-Match" in headers and headers["If-Match"].strip('"') != entry["etag"]:
+            return _error(412, "PreconditionFailed", "At least one of the preconditions failed", bucket, name)
+        response_headers = {
+            "ETag": f'"{entry["etag"]}"',
+            "Content-Type": entry["content_type"],
+            "Last-Modified": formatdate(entry["modified"], usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+        data = entry["data"]
+        if method == "HEAD":
+            return 200, {**response_headers, "Content-Length": str(len(data))}, b""
+        if "Range" in headers:
+            first, _, last = headers["Range"].removeprefix("bytes=").partition("-")
+            first, last = int(first), min(int(last or len(data) - 1), len(data) - 1)
+            response_headers["Content-Range"] = f"bytes {first}-{last}/{len(data)}"
+            return 206, response_headers, data[first : last + 1]
+        return 200, response_headers, data
+
+    def _list_buckets(self):
+        root = ElementTree.Element("ListAllMyBucketsResult", xmlns=_S3_NAMESPACE)
+        buckets = ElementTree.SubElement(root, "Buckets")
+        for bucket in sorted(self.buckets):
+            element = ElementTree.SubElement(buckets, "Bucket")
+            ElementTree.SubElement(element, "Name").text = bucket
+            ElementTree.SubElement(element, "CreationDate").text = "2024-01-01T00:00:00.000Z"
+        return 200, {"Content-Type": "application/xml"}, ElementTree.tostring(root, encoding="UTF-8")
+
+    def _bucket(self, method, bucket, query, body):
+        if method == "PUT" and "policy" not in query:
+            if bucket in self.buckets:
+                return _error(409, "BucketAlreadyOwnedByYou", "Your bucket already exists", bucket, "")
+            self.buckets[bucket] = {}
+            return 200, {}, b""
+        if bucket not in self.buckets:
+            return _error(404, "NoSuchBucket", "The specified bucket does not exist", bucket, "")
+        if "policy" in query:
+            return self._policy(method, bucket, body)
+        if "delete" in query and method == "POST":
+            return self._delete_objects(bucket, body)
+        if method == "DELETE":
+            del self.buckets[bucket]
+            self.policies.pop(bucket, None)
+            return 204, {}, b""
+        if method == "GET":
+            return self._list_objects(bucket, query)
+        return 200, {}, b""
+
+    def _policy(self, method, bucket, body):
+        if method == "PUT":
+            self.policies[bucket] = body.decode()
+            return 204, {}, b""
+        if bucket not in self.policies:
+            return _error(404, "NoSuchBucketPolicy", "The bucket policy does not exist", bucket, "")
+        return 200, {"Content-Type": "application/json"}, self.policies[bucket].encode()
+
+    def _delete_objects(self, bucket, body):
+        root = ElementTree.Element("DeleteResult", xmlns=_S3_NAMESPACE)
+        names = [element.text for element in ElementTree.fromstring(body).iter() if element.tag.endswith("Key")]
+        for name in names:
+            if name in self.failing_deletes:
+                element = ElementTree.SubElement(root, "Error")
+                ElementTree.SubElement(element, "Key").text = name
+                ElementTree.SubElement(element, "Code").text = "AccessDenied"
+                ElementTree.SubElement(element, "Message").text = "Access Denied"
+            else:
+                self.buckets[bucket].pop(name, None)
+        return 200, {"Content-Type": "application/xml"}, ElementTree.tostring(root, encoding="UTF-8")
+
+    def _copy(self, bucket, name, source):
+        source_bucket, _, source_name = source.lstrip("/").partition("/")
+        entry = self.buckets.get(source_bucket, {}).get(source_name)
+        if entry is None:
+            return _error(404, "NoSuchKey", "The specified key does not exist", source_bucket, source_name)
+        self._put(bucket, name, entry["data"], entry["content_type"], entry["etag"])
+        modified = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(self.buckets[bucket][name]["modified"]))
+        result = _xml("CopyObjectResult", {"LastModified": modified, "ETag": f'"{entry["etag"]}"'})
+        return 200, {"Content-Type": "application/xml"}, result
+
+    def _list_objects(self, bucket, query):
+        prefix, delimiter = query.get("prefix", ""), query.get("delimiter", "")
+        root = ElementTree.Element("ListBucketResult", xmlns=_S3_NAMESPACE)
+        ElementTree.SubElement(root, "Name").text = bucket
+        ElementTree.SubElement(root, "Prefix").text = prefix
+        ElementTree.SubElement(root, "IsTruncated").text = "false"
+        common_prefixes = []
+        for name, entry in sorted(self.buckets[bucket].items()):
+            if not name.startswith(prefix):
+                continue
+            if delimiter and delimiter in name[len(prefix) :]:
+                common_prefix = name[: name.index(delimiter, len(prefix)) + len(delimiter)]
+                if common_prefix not in common_prefixes:
+                    common_prefixes.append(common_prefix)
+                continue
+            element = ElementTree.SubElement(root, "Contents")
+            ElementTree.SubElement(element, "Key").text = name
+            ElementTree.SubElement(element, "LastModified").text = time.strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z",
+                time.gmtime(entry["modified"]),
+            )
+            ElementTree.SubElement(element, "ETag").text = f'"{entry["etag"]}"'
+            ElementTree.SubElement(element, "Size").text = str(len(entry["data"]))
+        for common_prefix in common_prefixes:
+            ElementTree.SubElement(ElementTree.SubElement(root, "CommonPrefixes"), "Prefix").text = common_prefix
+        return 200, {"Content-Type": "application/xml"}, ElementTree.tostring(root, encoding="UTF-8")
+
+    def _put(self, bucket, name, data, content_type, etag):
+        self.buckets.setdefault(bucket, {})[name] = {
+            "data": bytes(data),
+            "content_type": content_type or "application/octet-stream",
+            "etag": etag,
+            "modified": time.time(),
+        }
+
+    def _create_upload(self, bucket, name, headers):
+        upload_id = f"upload-{next(self._ids)}"
+        self.uploads[upload_id] = {
+            "bucket": bucket,
+            "name": name,
+            "content_type": headers.get("Content-Type"),
+            "parts": {},
+        }
+        result = _xml(
+            "InitiateMultipartUploadResult",
+            {"Bucket": bucket, "Key": name, "UploadId": upload_id},
+        )
+        return 200, {"Content-Type": "application/xml"}, result
+
+    def _upload(self, method, bucket, name, query, body):
+        upload = self.uploads.get(query["uploadId"])
+        if upload is None:
+            return _error(404, "NoSuchUpload", "The specified upload does not exist", bucket, name)
+        if method == "DELETE":
+            del self.uploads[query["uploadId"]]
+            self.aborted_uploads.append(query["uploadId"])
+            return 204, {}, b""
+        if method == "PUT":
+            number = int(query["partNumber"])
+            if number in self.failing_parts:
+                return _error(400, "InvalidRequest", "The part was rejected", bucket, name)
+            etag = hashlib.md5(body).hexdigest()  # noqa: S324
+            upload["parts"][number] = (etag, bytes(body))
+            self.received_part_bytes += len(body)
+            return 200, {"ETag": f'"{etag}"'}, b""
+        root = ElementTree.fromstring(body)
+        numbers = [int(element.text) for element in root.iter() if element.tag.endswith("PartNumber")]
+        if numbers != sorted(numbers) or any(number not in upload["parts"] for number in numbers):
+            return _error(400, "InvalidPartOrder", "The list of parts was not in ascending order", bucket, name)
+        del self.uploads[query["uploadId"]]
+        digest = hashlib.md5(b"".join(bytes.fromhex(upload["parts"][number][0]) for number in numbers))  # noqa: S324
+        etag = f"{digest.hexdigest()}-{len(numbers)}"
+        data = b"".join(upload["parts"][number][1] for number in numbers)
+        self._put(bucket, name, data, upload["content_type"], etag)
+        result = _xml(
+            "CompleteMultipartUploadResult",
+            {"Location": f"/{bucket}/{name}", "Bucket": bucket, "Key": name, "ETag": f'"{etag}"'},
+        )
+        return 200, {"Content-Type": "application/xml"}, result
+
+
+class FakeS3Handler(BaseHTTPRequestHandler):
+    """HTTP handler answering from the FakeS3Server bound to its class."""
+
+    server_state: FakeS3Server
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.server_state.handle(self.command, self.path, dict(self.headers), body)
+        self.send_response(status)
+        headers.setdefault("Content-Length", str(len(payload)))
+        headers.setdefault("x-amz-request-id", "fake-request")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_PUT = do_POST = do_DELETE = do_HEAD = _respond
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+def _xml(root, fields):
+    element = ElementTree.Element(root, xmlns=_S3_NAMESPACE)
+    for tag, text in fields.items():
+        ElementTree.SubElement(element, tag).text = text
+    return ElementTree.tostring(element, xml_declaration=True, encoding="UTF-8")
+
+
+def _error(status, code, message, bucket, name):
+    body = _xml(
+        "Error",
+        {
+            "Code": code,
+            "Message": message,
+            "BucketName": bucket,
+            "Key": name,
+            "Resource": f"/{bucket}/{name}",
+            "RequestId": "fake-request",
+            "HostId": "fake-host",
+        },
+    )
+    return status, {"Content-Type": "application/xml"}, body
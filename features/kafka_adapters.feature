@@ -36,3 +36,23 @@ Feature: Kafka Adapter Operations Testing
     Given a topic named "test-topic-deletable" exists
     When I delete the topic "test-topic-deletable"
     Then the topic "test-topic-deletable" should not exist
+
+  Scenario: Await the delivery of a message
+    Given a test topic named "test-topic-delivery"
+    And a Kafka producer for topic "test-topic-delivery"
+    When I send a message "Delivered message" to topic "test-topic-delivery"
+    Then the delivery future should report the message on topic "test-topic-delivery"
+
+  Scenario: Produce a batch of records with headers
+    Given a test topic named "test-topic-batch"
+    And a Kafka producer for topic "test-topic-batch"
+    And a Kafka consumer subscribed to topic "test-topic-batch" with group "test-group-batch"
+    When I produce a batch of 3 records with header "source" set to "outbox" to topic "test-topic-batch"
+    Then all 3 records of the batch should be delivered
+    And the consumer should receive 3 messages with header "source" set to "outbox" from topic "test-topic-batch" with group "test-group-batch"
+
+  @async
+  Scenario: Produce and consume a message asynchronously
+    Given a test topic named "test-topic-async"
+    When I produce a message "Async message" asynchronously to topic "test-topic-async"
+    Then an async consumer with group "test-group-async" should receive message "Async message" from topic "test-topic-async"
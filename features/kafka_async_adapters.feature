@@ -0,0 +1,33 @@
+Feature: Asynchronous Kafka Adapters
+  As a developer
+  I want asyncio Kafka producers and consumers
+  So that async services produce and consume messages without blocking the event loop
+
+  @async
+  Scenario: An async produce fails with the delivery error without blocking the loop
+    Given an async Kafka producer for an unreachable broker
+    When a message is produced asynchronously while the event loop keeps ticking
+    Then the async produce should fail with an internal error
+    And the event loop should have kept ticking meanwhile
+
+  @async
+  Scenario: An async batch aggregates the delivery reports of its records
+    Given an async Kafka producer for an unreachable broker
+    When an async batch of 4 records is produced waiting up to 100 milliseconds
+    Then the async batch result should report 0 delivered, 0 failed and 4 pending records
+    When an async batch of 4 records is produced
+    Then the async batch result should report 0 delivered, 4 failed and 0 pending records
+
+  @async
+  Scenario: An async produce awaits queue space before raising
+    Given an async Kafka producer for an unreachable broker with a queue of 2 messages and a queue wait of 300 milliseconds
+    When 3 messages are produced concurrently while the event loop keeps ticking
+    Then one async produce should fail with a resource exhausted error after at least 300 milliseconds
+    And the event loop should have kept ticking meanwhile
+
+  @async
+  Scenario: Closing an async consumer ends the iteration over its messages
+    Given an async Kafka consumer for an unreachable broker
+    When its messages are iterated until it is closed 500 milliseconds later while the event loop keeps ticking
+    Then the iteration should end without messages
+    And the event loop should have kept ticking meanwhile
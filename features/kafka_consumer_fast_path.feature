@@ -0,0 +1,27 @@
+Feature: Kafka Consumer Fast Path
+  As a developer
+  I want a lean batch consume path reporting aggregate statistics
+  So that high-throughput consumers avoid per-message work on the hot path
+
+  Scenario: The fast path returns messages as delivered with batch statistics
+    Given a Kafka consumer whose client delivers 3 messages of 5 bytes on partition 0 and 2 messages of 4 bytes on partition 1
+    And the client also delivers 1 error event
+    And the cached high watermarks are 10 on partition 0 and 2 on partition 1
+    When a batch is consumed on the fast path
+    Then the batch should hold 5 messages of 23 bytes with 1 error
+    And the batch lag should be 7 on partition 0 and 0 on partition 1
+    And the batch payloads should be memory views of the message values
+
+  Scenario: Partitions without a cached watermark are left out of the lag
+    Given a Kafka consumer whose client delivers 3 messages of 5 bytes on partition 0 and 2 messages of 4 bytes on partition 1
+    And the cached high watermarks are 10 on partition 0 and unknown on partition 1
+    When a batch is consumed on the fast path
+    Then the batch should hold 5 messages of 23 bytes with 0 errors
+    And the batch lag should be 7 on partition 0 only
+
+  @async
+  Scenario: The async consumer serves the fast path
+    Given a Kafka consumer whose client delivers 3 messages of 5 bytes on partition 0 and 2 messages of 4 bytes on partition 1
+    And the cached high watermarks are 10 on partition 0 and 2 on partition 1
+    When a batch is consumed on the fast path of the async consumer
+    Then the batch should hold 5 messages of 23 bytes with 0 errors
@@ -0,0 +1,63 @@
+Feature: Concurrent Kafka Consumer Runner
+  As a developer
+  I want a consumer runner that processes messages in parallel
+  So that one consumer uses every core while messages keep their order and offsets are committed in batches
+
+  Scenario: Worker threads process partitions in parallel and in order
+    Given an in-memory Kafka consumer with 4 partitions of 25 messages
+    When a thread runner with partition ordering and 4 workers processes the messages
+    Then the messages of each partition should be processed in offset order
+    And several messages should have been processed at the same time
+    And every partition should be committed up to offset 25
+    And offsets should be committed in fewer than 20 commits
+
+  Scenario: Key ordering processes the keys of a partition in parallel
+    Given an in-memory Kafka consumer with 1 partitions of 40 messages
+    When a thread runner with key ordering and 4 workers processes the messages
+    Then the messages of each key should be processed in offset order
+    And several messages should have been processed at the same time
+    And every partition should be committed up to offset 40
+
+  Scenario: A slow message holds back the committed offset of its partition
+    Given an in-memory Kafka consumer with 1 partitions of 10 messages and a slow first message
+    When a thread runner with key ordering and 4 workers starts
+    And every message but the slow one is processed
+    Then no offset should be committed while the slow message is processed
+    When the slow message finishes
+    Then every partition should be committed up to offset 10
+
+  Scenario: A partition with a full backlog is paused until it drains
+    Given an in-memory Kafka consumer with 1 partitions of 60 messages
+    When a thread runner with partition ordering, 2 workers and a backlog of 10 messages processes the messages
+    Then the partition should have been paused and resumed
+    And the messages of each partition should be processed in offset order
+    And every partition should be committed up to offset 60
+
+  Scenario: Revoked partitions are committed before they change owner
+    Given an in-memory Kafka consumer with 2 partitions of 30 messages
+    When a thread runner with partition ordering and 2 workers starts
+    And partition 1 is revoked after 5 of its messages are processed
+    Then partition 1 should be committed up to its last processed message
+    And no message of partition 1 should be processed after the revocation
+    And partition 0 should be committed up to offset 30
+
+  Scenario: Worker processes handle the messages
+    Given an in-memory Kafka consumer with 2 partitions of 10 messages
+    When a process runner with 2 workers processes the messages
+    Then every partition should be committed up to offset 10
+
+  @async
+  Scenario: Asyncio tasks process partitions in parallel and in order
+    Given an in-memory Kafka consumer with 3 partitions of 20 messages
+    When an async runner with partition ordering and a concurrency of 8 processes the messages
+    Then the messages of each partition should be processed in offset order
+    And several messages should have been processed at the same time
+    And every partition should be committed up to offset 20
+
+  @async
+  Scenario: The async runner commits revoked partitions before they change owner
+    Given an in-memory Kafka consumer with 2 partitions of 30 messages
+    When an async runner revokes partition 1 after 5 of its messages are processed
+    Then partition 1 should be committed up to its last processed message
+    And no message of partition 1 should be processed after the revocation
+    And partition 0 should be committed up to offset 30
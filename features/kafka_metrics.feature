@@ -0,0 +1,35 @@
+Feature: Kafka Metrics
+  As a developer
+  I want Kafka producers and consumers to export Prometheus metrics
+  So that I can monitor throughput and scale consumers on their lag
+
+  Scenario: Consumer statistics export lag, throughput and rebalances
+    Given Kafka metrics in a fresh registry
+    When consumer statistics report a lag of 40 on partition 0 and 2 on partition 1 after 100 messages and 1 rebalance
+    Then the lag of partition 0 should be 40 and the lag of partition 1 should be 2
+    And the consumed messages counter should be 100
+    And the rebalance counter should be 1
+    And the broker rtt p99 should be 0.015 seconds
+    When consumer statistics report a lag of 5 on partition 0 only after 180 messages and 2 rebalances
+    Then the lag of partition 0 should be 5 and partition 1 should have no lag
+    And the consumed messages counter should be 180
+    And the rebalance counter should be 2
+
+  Scenario: Producer statistics export queue depth and batch sizes
+    Given Kafka metrics in a fresh registry
+    When producer statistics report 7 queued messages and batches of 16384 bytes at the median
+    Then the producer queue depth should be 7
+    And the median batch size of the topic should be 16384 bytes
+
+  Scenario: Malformed statistics are logged instead of raised
+    Given Kafka metrics in a fresh registry
+    When malformed statistics are reported
+    Then no metric should be exported
+
+  Scenario: Adapters feed the global metrics when enabled
+    Given a Kafka producer with metrics enabled for an unreachable broker
+    When a message is produced and statistics are served
+    Then the global registry should report 1 message queued by the producer
+    Given a Kafka consumer with metrics enabled for an unreachable broker
+    When a batch is consumed on the fast path by the metered consumer
+    Then the global registry should report 1 consumed batch
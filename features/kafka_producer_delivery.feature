@@ -0,0 +1,32 @@
+Feature: Kafka Producer Delivery Reports and Backpressure
+  As a developer
+  I want the Kafka producer to serve delivery reports and wait for queue space
+  So that I can await acknowledgements without flushing and absorb bursts without errors
+
+  Scenario: A full producer queue raises at once without a wait timeout
+    Given a Kafka producer for an unreachable broker with a queue of 2 messages and no queue wait
+    When 3 messages are produced
+    Then producing should fail with a resource exhausted error within 200 milliseconds
+
+  Scenario: A full producer queue waits for space before raising
+    Given a Kafka producer for an unreachable broker with a queue of 2 messages and a queue wait of 300 milliseconds
+    When 3 messages are produced
+    Then producing should fail with a resource exhausted error after at least 300 milliseconds
+
+  Scenario: The poll thread completes delivery futures without a flush
+    Given a Kafka producer for an unreachable broker polling in a background thread
+    When a message is sent
+    Then its delivery future should fail within 5 seconds without a flush
+
+  Scenario: Inline polling serves earlier delivery reports on produce
+    Given a Kafka producer for an unreachable broker polling inline
+    When a message is sent
+    And 3000 milliseconds later another message is produced
+    Then the first delivery future should already be done
+
+  Scenario: A batch aggregates the delivery reports of its records
+    Given a Kafka producer for an unreachable broker polling in a background thread
+    When a batch of 5 records to 2 topics is produced waiting up to 100 milliseconds
+    Then the batch result should report 0 delivered, 0 failed and 5 pending records
+    When a batch of 5 records to 2 topics is produced
+    Then the batch result should report 0 delivered, 5 failed and 0 pending records
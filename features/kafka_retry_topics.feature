@@ -0,0 +1,39 @@
+Feature: Kafka Retry and Dead-Letter Topics
+  As a developer
+  I want failed Kafka messages to be retried from delayed retry topics and then dead-lettered
+  So that a poison message neither stalls its partition nor gets lost
+
+  Scenario: A failed message goes through the retry tiers to the dead-letter topic with error headers
+    Given a retry policy with tiers "retry-fast" and "retry-slow"
+    And a consumed message of topic "orders" at offset 3 with a "trace-id" header
+    When the message fails with "Malformed order" 3 times and is forwarded each time
+    Then it should have been forwarded to "orders.retry-fast", "orders.retry-slow" and "orders.dlq"
+    And the dead-lettered message should keep its key, value and "trace-id" header
+    And the dead-lettered message should record topic "orders", offset 3, attempt 3 and the error "Malformed order"
+
+  Scenario: A thread runner retries a poison message without stalling its partition
+    Given an in-memory broker with 5 messages in topic "orders" and a poison message at offset 2
+    And a retry policy for the broker with delays of 200 and 300 milliseconds
+    When a thread runner with the retry policy processes the messages
+    Then the poison message should have been handled 3 times, each retry after its delay
+    And the messages after the poison message should have been handled before its first retry
+    And topic "orders.dlq" should hold the poison message
+    And topic "orders" should be committed up to offset 5
+
+  Scenario: An async runner retries a poison message without stalling its partition
+    Given an in-memory broker with 5 messages in topic "orders" and a poison message at offset 2
+    And a retry policy for the broker with delays of 200 and 300 milliseconds
+    When an async runner with the retry policy processes the messages
+    Then the poison message should have been handled 3 times, each retry after its delay
+    And the messages after the poison message should have been handled before its first retry
+    And topic "orders.dlq" should hold the poison message
+    And topic "orders" should be committed up to offset 5
+
+  Scenario: A message that cannot be forwarded is handled again instead of being committed
+    Given an in-memory broker with 3 messages in topic "orders" and a poison message at offset 0
+    And a retry policy for the broker without retry tiers
+    And the broker rejects the next message produced
+    When a thread runner with the retry policy processes the messages
+    Then the poison message should have been handled 2 times
+    And topic "orders.dlq" should hold the poison message
+    And topic "orders" should be committed up to offset 3
@@ -0,0 +1,56 @@
+Feature: Kafka Serializers
+  As a developer
+  I want the Kafka adapters to serialize DTOs with pluggable, schema-aware serializers
+  So that producers and consumers exchange typed messages instead of raw bytes
+
+  Scenario: The orjson serializer round-trips a DTO
+    Given an orjson serializer for invoice DTOs
+    When an invoice DTO is serialized and deserialized
+    Then the deserialized value should equal the invoice DTO
+
+  Scenario: The protobuf serializer round-trips a DTO through its proto class
+    Given a protobuf serializer for method DTOs
+    When a method DTO is serialized and deserialized
+    Then the serialized value should parse as the proto class
+    And the deserialized value should equal the method DTO
+
+  Scenario: The JSON schema serializer frames payloads with registered schema ids
+    Given a JSON schema serializer for invoice DTOs with an in-memory registry
+    When an invoice DTO is serialized for topics "invoices" and "invoices-replay"
+    Then both payloads should start with the wire format header of schema 1
+    And the registry should hold the schema under subjects "invoices-value" and "invoices-replay-value"
+    And both payloads should deserialize to the invoice DTO
+
+  Scenario: The Avro serializer frames payloads with registered schema ids
+    Given an Avro serializer for invoice DTOs with an in-memory registry
+    When an invoice DTO is serialized for topics "invoices" and "invoices-replay"
+    Then both payloads should start with the wire format header of schema 1
+    And both payloads should deserialize to the invoice DTO
+
+  Scenario: The Avro serializer reads records written with an older schema version
+    Given an in-memory schema registry
+    And an Avro serializer writing invoices with the first version of their schema
+    And an Avro serializer reading invoices with a second version adding a currency defaulting to "IRR"
+    When an invoice is written with the first version and read with the second
+    Then the record read should hold the invoice fields and the currency "IRR"
+    And the writer schema should have been resolved through the registry
+
+  Scenario: The validating JSON schema serializer rejects values that do not match the schema
+    Given a validating JSON schema serializer for invoice DTOs
+    When a value without an invoice number is serialized
+    Then the serialization should fail with an invalid format error
+    When a payload without an invoice number is deserialized
+    Then the deserialization should fail with an invalid format error
+
+  Scenario: A producer encodes values and keys with its serializers
+    Given a Kafka producer for an unreachable broker with an orjson value serializer and a string key serializer
+    When a batch of 2 invoice DTOs keyed by their number is produced
+    Then the failed messages should carry the orjson encoding of the invoices and their numbers as keys
+
+  Scenario: A consumer decodes a batch in a process pool and isolates malformed messages
+    Given a Kafka consumer with an orjson value serializer decoding in a process pool
+    And its client delivers 600 JSON messages, a tombstone and a malformed message
+    When the consumer decodes a batch
+    Then 600 messages should be decoded without errors
+    And the tombstone should be decoded to None without an error
+    And the malformed message should be decoded with an invalid format error
@@ -0,0 +1,31 @@
+Feature: Kafka Transactional Pipeline
+  As a developer
+  I want to consume, transform and produce Kafka messages in transactions
+  So that every input message affects the output exactly once
+
+  Scenario: Messages of several polls are committed with their offsets in one transaction
+    Given a transactional pipeline whose consumer delivers 3 messages on partition 0 then 2 messages on partition 1
+    When the pipeline processes a transaction
+    Then 5 messages should be committed in 1 transaction
+    And the committed output should hold the 5 transformed messages
+    And the committed offsets should be 3 on partition 0 and 7 on partition 1
+
+  Scenario: A transaction that must be aborted is rewound for processing again
+    Given a transactional pipeline whose consumer delivers 3 messages on partition 0 then 2 messages on partition 1
+    And the producer fails the next commit with an abortable error
+    When the pipeline processes a transaction
+    Then 0 messages should be committed in 0 transactions
+    And 1 transaction should be aborted
+    And the consumer should be rewound to 0 on partition 0 and 5 on partition 1
+
+  Scenario: A failing transform aborts the transaction and raises its error
+    Given a transactional pipeline whose consumer delivers 3 messages on partition 0 then 2 messages on partition 1
+    And the transform fails on the last message
+    When the pipeline processes a transaction expecting an error
+    Then the transform error should be raised
+    And 1 transaction should be aborted
+    And the consumer should be rewound to 0 on partition 0 and 5 on partition 1
+
+  Scenario: Transactional producers must deliver within the transaction timeout
+    When a transactional configuration delivers for longer than its transaction timeout
+    Then the configuration should be rejected
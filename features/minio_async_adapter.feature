@@ -0,0 +1,61 @@
+Feature: Async MinIO Adapter
+  As a developer
+  I want a MinIO adapter whose calls never block the event loop
+  So that async services can transfer objects and run batch operations over pooled connections
+
+  Background:
+    Given an in-memory S3 server with a bucket "archives"
+    And an async MinIO adapter on the server
+
+  Scenario: Buckets and objects are managed without blocking
+    When I create the bucket "reports" through the async adapter
+    And I upload a file holding "quarterly numbers" as "q1.txt" to "reports" through the async adapter
+    Then the async adapter should list the buckets "archives, reports"
+    And the async adapter should list "q1.txt" in "reports"
+    And downloading "q1.txt" from "reports" to a file through the async adapter should return "quarterly numbers"
+
+  Scenario: A stream is uploaded in concurrent parts and downloaded in ranges
+    When I stream 12 MiB to "backup.tar" in "archives" in 5 MiB parts through the async adapter
+    Then object "backup.tar" in "archives" should hold the streamed data
+    And the upload should have been sent in 3 parts
+    And downloading "backup.tar" from "archives" in 1 MiB chunks through the async adapter should return the streamed data
+
+  Scenario: Missing objects are reported by a batch stat
+    Given bucket "archives" holds "a.bin" of 10 bytes
+    And bucket "archives" holds "b.bin" of 20 bytes
+    When I stat "a.bin, b.bin, missing.bin" in "archives" through the async adapter
+    Then the batch stat should report sizes "a.bin=10, b.bin=20, missing.bin=none"
+
+  Scenario: A batch delete is split into requests of at most 1000 objects
+    Given bucket "archives" holds 2500 objects named "logs/{number}.log"
+    When I remove the 2500 objects named "logs/{number}.log" from "archives" through the async adapter
+    Then bucket "archives" should hold no objects
+    And the async adapter should have sent 3 multi-object delete requests
+    And the batch delete should report no failures
+
+  Scenario: Objects the server fails to delete are reported rather than raised
+    Given bucket "archives" holds "keep.bin" of 10 bytes
+    And bucket "archives" holds "drop.bin" of 10 bytes
+    And the server refuses to delete "keep.bin"
+    When I remove "keep.bin, drop.bin" from "archives" through the async adapter
+    Then the batch delete should report "keep.bin" with the code "AccessDenied"
+    And bucket "archives" should not hold "drop.bin"
+
+  Scenario: Objects are copied in parallel with bounded concurrency
+    Given bucket "archives" holds 8 objects named "src/{number}.bin"
+    And the server takes 50 milliseconds per part
+    When I copy the 8 objects named "src/{number}.bin" from "archives" to "mirror" 3 at a time through the async adapter
+    Then bucket "mirror" should hold copies of the 8 objects named "src/{number}.bin" of "archives"
+    And the server should have handled up to 3 parts at once
+
+  Scenario: A batch delete drops the cached metadata of the objects removed
+    Given bucket "archives" holds "a.bin" of 10 bytes
+    When I stat "a.bin" in "archives" through the async adapter
+    And I remove "a.bin" from "archives" through the async adapter
+    And I stat "a.bin" in "archives" through the async adapter
+    Then the batch stat should report sizes "a.bin=none"
+
+  Scenario: Presigned URLs are signed without a request
+    When I generate a presigned GET URL for "q1.txt" in "archives" through the async adapter
+    Then the presigned URL should carry a signature
+    And the server should have received no requests
@@ -0,0 +1,75 @@
+Feature: MinIO Metadata Cache
+  As a developer
+  I want each MinIO adapter to cache the metadata it reads and to drop only what its writes change
+  So that repeated lookups skip the server without serving results older than the adapter's own writes
+
+  Background:
+    Given an in-memory S3 server with a bucket "photos"
+    And bucket "photos" holds "2024/a.jpg" of 10 bytes
+    And bucket "photos" holds "2025/b.jpg" of 20 bytes
+
+  Scenario: Repeated metadata reads are served from the cache
+    Given a caching MinIO adapter on the server
+    When I stat "2024/a.jpg" in "photos" 3 times
+    And I list "2024/" in "photos" 3 times
+    Then the server should have answered 1 stat requests
+    And the server should have answered 1 listing requests
+    And the adapter cache should have a hit ratio of 0.67
+
+  Scenario: Writing an object drops only its metadata and the listings covering it
+    Given bucket "videos" holds "clip.mp4" of 30 bytes
+    And a caching MinIO adapter on the server
+    When I stat "2024/a.jpg" in "photos" 1 times
+    And I stat "clip.mp4" in "videos" 1 times
+    And I list "2024/" in "photos" 1 times
+    And I list "2025/" in "photos" 1 times
+    And I upload "2024/c.jpg" of 5 bytes to "photos" through the adapter
+    And I stat "2024/a.jpg" in "photos" 1 times
+    And I stat "clip.mp4" in "videos" 1 times
+    And I list "2024/" in "photos" 1 times
+    And I list "2025/" in "photos" 1 times
+    Then the server should have answered 2 stat requests
+    And the server should have answered 3 listing requests
+    And the last listing of "2024/" in "photos" should include "2024/c.jpg"
+
+  Scenario: Removing an object drops its cached metadata
+    Given a caching MinIO adapter on the server
+    When I stat "2024/a.jpg" in "photos" 1 times
+    And I remove "2024/a.jpg" from "photos" through the adapter
+    And I try to stat "2024/a.jpg" in "photos"
+    Then the stat should fail with a NotFoundError
+
+  Scenario: Changing a bucket policy drops the cached policy
+    Given bucket "photos" has the policy "first"
+    And a caching MinIO adapter on the server
+    When I read the policy of "photos"
+    And I set the policy of "photos" to "second" through the adapter
+    And I read the policy of "photos"
+    Then the policy read should be "second"
+
+  Scenario: Adapters on different servers do not share cached metadata
+    Given a second in-memory S3 server where bucket "photos" holds "2024/a.jpg" of 99 bytes
+    And a caching MinIO adapter on the server
+    And a caching MinIO adapter on the second server
+    When both adapters stat "2024/a.jpg" in "photos"
+    Then the adapters should report sizes of 10 and 99 bytes
+
+  Scenario: Cached metadata expires after its time to live
+    Given a caching MinIO adapter on the server keeping entries for 200 milliseconds
+    When I stat "2024/a.jpg" in "photos" 2 times
+    And I wait 300 milliseconds
+    And I stat "2024/a.jpg" in "photos" 1 times
+    Then the server should have answered 2 stat requests
+
+  Scenario: Cache lookups and invalidations are exported as metrics
+    Given a caching MinIO adapter on the server
+    And cache metrics exported to a fresh registry
+    When I stat "2024/a.jpg" in "photos" 2 times
+    And I upload "2024/a.jpg" of 5 bytes to "photos" through the adapter
+    Then the metrics should count 1 "stat_object" cache hits and 1 misses
+    And the metrics should count 1 "stat_object" cache invalidations
+
+  Scenario: Caching can be disabled
+    Given a MinIO adapter on the server with caching disabled
+    When I stat "2024/a.jpg" in "photos" 3 times
+    Then the server should have answered 3 stat requests
@@ -0,0 +1,60 @@
+Feature: MinIO Streaming Transfers
+  As a developer
+  I want to upload streams and download objects in parts transferred concurrently
+  So that large archives move at line rate without being held in memory or written to disk
+
+  Background:
+    Given an in-memory S3 server with a bucket "archives"
+    And a MinIO adapter transferring 5 MiB parts 3 at a time
+
+  Scenario: A file-like object is uploaded in concurrent parts
+    Given the server takes 50 milliseconds per part
+    When I stream 23 MiB from a file-like object to "backup.tar" in "archives"
+    Then object "backup.tar" in "archives" should hold the streamed data
+    And the upload should have been sent in 5 parts
+    And the server should have handled up to 3 parts at once
+
+  Scenario: Chunks of an iterator are regrouped into parts
+    When I stream 12 MiB in chunks of 64 KiB from a generator to "backup.tar" in "archives"
+    Then object "backup.tar" in "archives" should hold the streamed data
+    And the upload should have been sent in 3 parts
+
+  Scenario: Chunks of an async iterator are uploaded
+    When I stream 12 MiB in chunks of 1 MiB from an async generator to "backup.tar" in "archives"
+    Then object "backup.tar" in "archives" should hold the streamed data
+    And the upload should have been sent in 3 parts
+
+  Scenario: A stream shorter than a part is uploaded in a single request
+    When I stream 100 KiB in chunks of 64 KiB from a generator to "notes.txt" in "archives"
+    Then object "notes.txt" in "archives" should hold the streamed data
+    And the upload should have been sent in a single request
+
+  Scenario: The stream is read only as parts are uploaded
+    Given the server takes 20 milliseconds per part
+    When I stream 40 MiB in chunks of 1 MiB from a generator to "backup.tar" in "archives"
+    Then object "backup.tar" in "archives" should hold the streamed data
+    And the stream should never have been read more than 5 parts ahead of the server
+
+  Scenario: A rejected part aborts the upload
+    Given the server rejects part 2
+    When I try to stream 12 MiB from a file-like object to "backup.tar" in "archives"
+    Then the transfer should fail with a StorageError
+    And the multipart upload should have been aborted
+    And bucket "archives" should not hold "backup.tar"
+
+  Scenario: Parts smaller than the S3 minimum are refused
+    When I try to stream 12 MiB in 1 MiB parts to "backup.tar" in "archives"
+    Then the transfer should fail with an InvalidArgumentError
+
+  Scenario: An object is downloaded with concurrent ranged requests
+    Given bucket "archives" holds an object "backup.tar" of 12 MiB
+    And the server takes 50 milliseconds per part
+    When I download "backup.tar" from "archives" as a stream of 1 MiB chunks
+    Then the chunks should reassemble object "backup.tar" in "archives"
+    And the server should have received 12 ranged requests
+    And the server should have handled up to 3 parts at once
+
+  Scenario: An object overwritten during a download fails it
+    Given bucket "archives" holds an object "backup.tar" of 12 MiB
+    When I download "backup.tar" from "archives" in 1 MiB chunks while it is overwritten after the first chunk
+    Then the transfer should fail with a StorageError
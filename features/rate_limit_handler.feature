@@ -0,0 +1,25 @@
+Feature: Rate Limiting
+  As a developer
+  I want to rate limit REST and gRPC endpoints without calling Redis on every request
+  So that hot endpoints stay fast under high load
+
+  Scenario: Hybrid mode rejects over-limit clients locally
+    Given a rate limit handler allowing 2 calls per minute in hybrid mode
+    When a client sends 3 requests to "/items"
+    Then 2 requests should be accepted
+    And 1 request should be rejected with status code 429
+
+  Scenario: Hybrid mode keeps limiting when Redis is unavailable
+    Given a rate limit handler allowing 2 calls per minute in hybrid mode
+    And Redis is unavailable for the rate limit handler
+    When a client sends 3 requests to "/items" and the handler reconciles with Redis
+    Then 2 requests should be accepted
+    And 1 request should be rejected with status code 429
+    And the unreported hits should be kept for the next reconciliation
+
+  Scenario: gRPC interceptor aborts over-limit callers with RESOURCE_EXHAUSTED
+    Given a gRPC rate limit interceptor allowing 2 calls per minute keyed by metadata "x-user-id" in hybrid mode
+    When user "alice" calls "/users.UserService/GetUser" 3 times through the interceptor
+    And user "bob" calls "/users.UserService/GetUser" 1 times through the interceptor
+    Then 3 gRPC calls should be accepted
+    And 1 gRPC call should be aborted with status "RESOURCE_EXHAUSTED"
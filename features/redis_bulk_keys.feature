@@ -0,0 +1,32 @@
+Feature: Redis Bulk Key Management
+  As a developer
+  I want to manage keys by pattern with SCAN instead of KEYS
+  So that maintenance jobs do not block the Redis server
+
+  Scenario: Deleting by pattern removes only matching keys
+    Given a Redis mock with 50 keys prefixed "session" and 5 keys prefixed "user"
+    When keys matching "session:*" are deleted in batches of 10
+    Then 50 keys should have been affected
+    And 0 keys should match "session:*"
+    And 5 keys should match "user:*"
+
+  Scenario: Setting the time to live by pattern
+    Given a Redis mock with 20 keys prefixed "session" and 5 keys prefixed "user"
+    When keys matching "session:*" expire in 60 seconds
+    Then 20 keys should have been affected
+    And keys prefixed "session" should expire within 60 seconds
+    And keys prefixed "user" should not expire
+
+  Scenario: Rate-limited deletion is paced
+    Given a Redis mock with 40 keys prefixed "session" and 0 keys prefixed "user"
+    When keys matching "session:*" are deleted at 200 keys per second in batches of 10
+    Then 40 keys should have been affected
+    And the deletion should have taken at least 150 milliseconds
+
+  @async
+  Scenario: Async bulk operations by pattern
+    Given an async Redis mock with 30 keys prefixed "cache" and 3 keys prefixed "user"
+    When async keys matching "cache:*" are counted and deleted in batches of 7
+    Then 30 keys should have been counted asynchronously
+    And 30 keys should have been deleted asynchronously
+    And 3 keys should remain asynchronously
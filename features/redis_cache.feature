@@ -0,0 +1,63 @@
+Feature: Redis Cache Decorator
+  As a developer
+  I want function results cached in process memory and Redis
+  So that replicas share cached results without recomputing them
+
+  Scenario: Results are served from the local cache and then from Redis
+    Given a Redis mock for caching
+    And a cached function "load_profile" with serializer "pickle"
+    When "load_profile" is called with 7
+    And "load_profile" is called with 7
+    Then "load_profile" should have been computed 1 time
+    When the local cache of "load_profile" is cleared
+    And "load_profile" is called with 7
+    Then "load_profile" should have been computed 1 time
+    And "load_profile" should return the value for 7
+
+  Scenario: Another process reuses the value cached in Redis
+    Given a Redis mock for caching
+    And a cached function "first_replica" with key prefix "cache:shared"
+    And a cached function "second_replica" with key prefix "cache:shared"
+    When "first_replica" is called with 3
+    And "second_replica" is called with 3
+    Then "first_replica" should have been computed 1 time
+    And "second_replica" should have been computed 0 times
+    And "second_replica" should return the value for 3
+
+  Scenario: Invalidating a tag removes only the tagged results
+    Given a Redis mock for caching
+    And a cached function "load_profile" tagged by user
+    When "load_profile" is called with 1
+    And "load_profile" is called with 2
+    And the tag "user:1" is invalidated for "load_profile"
+    And "load_profile" is called with 1
+    And "load_profile" is called with 2
+    Then "load_profile" should have been computed 3 times
+
+  Scenario: Eager early expiration refreshes values before they expire
+    Given a Redis mock for caching
+    And a slow cached function "load_report" that always refreshes early
+    When "load_report" is called with 1
+    And "load_report" is called with 1
+    Then "load_report" should have been computed 2 times
+
+  Scenario Outline: Values round-trip through the <serializer> serializer
+    Given a Redis mock for caching
+    And a cached function "load_profile" with serializer "<serializer>"
+    When "load_profile" is called with 5
+    And the local cache of "load_profile" is cleared
+    Then "load_profile" should return the value for 5
+    And "load_profile" should have been computed 1 time
+
+    Examples:
+      | serializer |
+      | pickle     |
+      | orjson     |
+      | msgpack    |
+
+  @async
+  Scenario: Concurrent async misses compute the value once
+    Given an async Redis mock for caching
+    When 10 callers request an async cached value concurrently
+    Then the async cached function should have been computed 1 time
+    And all async callers should receive the same value
@@ -0,0 +1,55 @@
+Feature: Redis Value Codecs
+  As a developer
+  I want to store DTOs in Redis through pluggable codecs
+  So that I don't hand-roll serialization and large payloads use less memory and bandwidth
+
+  Scenario Outline: DTOs round-trip through the <serializer> serializer
+    Given a Redis mock with the "<serializer>" serializer and no compression
+    When a profile DTO with 3 orders is stored under "profile:1"
+    Then reading "profile:1" as a profile DTO should return the stored DTO
+
+    Examples:
+      | serializer |
+      | json       |
+      | orjson     |
+      | msgpack    |
+      | pickle     |
+
+  Scenario Outline: Large values are compressed with <compression>
+    Given a Redis mock with the "json" serializer and "<compression>" compression above 256 bytes
+    When a profile DTO with 200 orders is stored under "profile:large"
+    And a profile DTO with 1 orders is stored under "profile:small"
+    Then the value of "profile:large" should be compressed with "<compression>"
+    And the value of "profile:small" should not be compressed
+    And reading "profile:large" as a profile DTO should return the stored DTO
+
+    Examples:
+      | compression |
+      | zstd        |
+      | lz4         |
+
+  Scenario: Values stay readable after the compression settings change
+    Given a Redis mock with the "json" serializer and "zstd" compression above 256 bytes
+    When a profile DTO with 200 orders is stored under "profile:large"
+    Then reading "profile:large" without compression should return the stored DTO
+
+  Scenario Outline: A codec is shared by concurrent threads
+    Given a "msgpack" codec with "<compression>" compression above 0 bytes
+    When 8 threads each encode and decode 200 profile DTOs with the codec
+    Then every DTO should survive the round trip
+
+    Examples:
+      | compression |
+      | zstd        |
+      | lz4         |
+
+  Scenario: Several DTOs are read in one round trip
+    Given a Redis mock with the "msgpack" serializer and no compression
+    When profile DTOs are stored under "profile:1" and "profile:2"
+    Then reading "profile:1", "profile:missing" and "profile:2" at once should return 2 DTOs and 1 missing
+
+  @async
+  Scenario: Async adapters store and read DTOs
+    Given an async Redis mock with the "orjson" serializer and "lz4" compression above 256 bytes
+    When profile DTOs with 150 orders are stored asynchronously under "profile:1" and "profile:2"
+    Then reading them asynchronously should return both DTOs
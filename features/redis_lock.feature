@@ -0,0 +1,52 @@
+Feature: Redis Lock and Single Flight
+  As a developer
+  I want distributed locks and single-flight computations on Redis
+  So that expensive cache misses are computed once instead of by every caller
+
+  Scenario: A held lock blocks other owners and fencing tokens increase
+    Given a configured Redis mock for locking
+    When lock owner "first" acquires the lock "invoice"
+    And lock owner "second" tries to acquire the lock "invoice" without waiting
+    Then lock owner "first" should hold the lock with fencing token 1
+    And lock owner "second" should not hold the lock
+    When lock owner "first" releases the lock
+    And lock owner "second" tries to acquire the lock "invoice" without waiting
+    Then lock owner "second" should hold the lock with fencing token 2
+
+  Scenario: An expired owner cannot release a lock taken over by another owner
+    Given a configured Redis mock for locking
+    When lock owner "first" acquires the lock "report" with a lease of 100 milliseconds
+    And the lease expires
+    And lock owner "second" tries to acquire the lock "report" without waiting
+    Then releasing the lock by owner "first" should fail
+    And lock owner "second" should hold the lock with fencing token 2
+
+  @async
+  Scenario: The watchdog keeps an async lock alive past its lease
+    Given a configured async Redis mock for locking
+    When an async lock "export" with a lease of 300 milliseconds and auto extension is held for 800 milliseconds
+    Then the async lock should still be owned
+    And the async lock should be released afterwards
+
+  @async
+  Scenario: Concurrent callers in one process share a single computation
+    Given an in-process async single flight
+    When 10 callers request the key "dashboard" concurrently
+    Then the computation should run 1 time
+    And all callers should receive the same result
+
+  @async
+  Scenario: Cancelling the first caller does not cancel the shared computation
+    Given an in-process async single flight
+    When the first of 2 callers requesting the key "dashboard" is cancelled
+    Then the first caller should have been cancelled
+    And the computation should run 1 time
+    And the second caller should receive the computed value
+
+  @async
+  Scenario: Another process reuses the value computed under the lock
+    Given a configured async Redis mock for locking
+    And 2 async single flights sharing the Redis mock
+    When both single flights request the key "catalog" concurrently with a shared cache
+    Then the computation should run 1 time
+    And all callers should receive the same result
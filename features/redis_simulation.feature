@@ -0,0 +1,42 @@
+Feature: In-Memory Redis Cluster and Fault Injection
+  As a developer
+  I want an in-process Redis that behaves like a cluster and injects latency and failures
+  So that I can test and benchmark pipelining, batching and cluster fan-out without a real Redis
+
+  Scenario: Keys are mapped to hash slots with CRC16 and hash tags
+    Given a simulated Redis cluster with 3 primaries
+    Then the key "foo" should map to slot 12182
+    And the keys "{user:1}:profile" and "{user:1}:orders" should map to the same slot
+
+  Scenario: Keys are spread over the primaries and bulk operations fan out
+    Given a simulated Redis cluster with 3 primaries
+    When 60 keys with the prefix "session:" are stored
+    Then every primary should hold some of the keys
+    And counting the keys matching "session:*" should return 60
+    And deleting the keys matching "session:*" should remove 60 keys
+
+  Scenario: Multi-key commands must keep their keys in one slot
+    Given a simulated Redis cluster with 3 primaries
+    When the keys "{cart:7}:items" and "{cart:7}:total" and "order:1" are stored
+    Then getting "{cart:7}:items" and "{cart:7}:total" at once should succeed
+    And getting "{cart:7}:items" and "order:1" at once should fail with a cross-slot error
+    And pipelining GET over all three keys should return every value
+
+  Scenario: Pipelining pays the round trip latency once
+    Given a Redis mock with 20 milliseconds of latency per round trip
+    When 10 keys are written one command at a time
+    And 10 keys are written in one pipeline
+    Then the pipeline should take less than half the time of the single commands
+    And the mock should have counted 10 SET round trips and 1 PIPELINE round trip
+
+  Scenario: Failing commands raise connection errors
+    Given a Redis mock where "INCRBY" always fails
+    Then incrementing a counter should raise a connection error
+    And setting a key should still succeed
+
+  @async
+  Scenario: Async round trips with latency overlap
+    Given an async simulated Redis cluster with 3 primaries and 50 milliseconds of latency
+    When 20 keys are written concurrently
+    Then the writes should take less than 10 round trips of latency
+    And counting the keys asynchronously should return 20
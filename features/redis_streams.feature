@@ -0,0 +1,38 @@
+Feature: Redis Streams Consumer Groups
+  As a developer
+  I want a consumer-group worker on Redis Streams
+  So that I can run a reliable job queue without Kafka
+
+  Scenario: Adding entries with MAXLEN trims the stream
+    Given a Redis mock for streams
+    When 20 entries are added to the stream "events" with a maximum length of 5
+    Then the stream "events" should contain 5 entries
+
+  Scenario: The consumer processes and acknowledges every entry
+    Given a Redis mock for streams
+    And 10 jobs in the stream "jobs"
+    When a stream consumer of group "workers" processes 10 jobs from "jobs"
+    Then every job should have been handled once
+    And the group "workers" of "jobs" should have 0 pending entries
+
+  Scenario: Entries whose handler fails stay pending
+    Given a Redis mock for streams
+    And 5 jobs in the stream "jobs"
+    When a stream consumer of group "workers" processes 5 jobs from "jobs" failing job 3
+    Then the group "workers" of "jobs" should have 1 pending entries
+
+  @async
+  Scenario: Entries of a crashed consumer are reclaimed
+    Given an async Redis mock for streams
+    When consumer "crashed" of group "workers" reads 4 jobs from "jobs" without acknowledging them
+    And an async stream consumer of group "workers" runs on "jobs" until 4 jobs are handled
+    Then the async stream consumer should have handled 4 jobs
+    And the async group "workers" of "jobs" should have 0 pending entries
+
+  @async
+  Scenario: The async consumer bounds the number of jobs in flight
+    Given an async Redis mock for streams
+    When an async stream consumer with concurrency 3 runs on 12 slow jobs
+    Then the async stream consumer should have handled 12 jobs
+    And no more than 3 jobs should have been in flight at once
+    And the async group "workers" of "jobs" should have 0 pending entries
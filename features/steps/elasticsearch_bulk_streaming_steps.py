@@ -0,0 +1,214 @@
+"""Implementation of steps for testing the streaming and parallel bulk helpers of the Elasticsearch adapters."""
+
+import asyncio
+
+from behave import given, then, when
+from features.fake_elasticsearch import FakeElasticsearchCluster
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter, ElasticsearchAdapter
+from archipy.configs.config_template import ElasticsearchConfig
+
+# Short backoff so retried actions do not slow the scenarios down
+RETRY_BACKOFF = 0.01
+
+
+class ActionSource:
+    """Generates index actions and records how many were read."""
+
+    def __init__(self, count, index):
+        self.count = count
+        self.index = index
+        self.read = 0
+        self.read_before_first_result = None
+
+    def actions(self):
+        for number in range(self.count):
+            self.read += 1
+            yield {"_index": self.index, "_id": str(number), "name": f"product {number}"}
+
+    async def async_actions(self):
+        for action in self.actions():
+            await asyncio.sleep(0)
+            yield action
+
+    def result_yielded(self):
+        if self.read_before_first_result is None:
+            self.read_before_first_result = self.read
+
+
+def _sync_adapter(cluster):
+    adapter = ElasticsearchAdapter(ElasticsearchConfig())
+    adapter.client = cluster.client()
+    return adapter
+
+
+def _async_adapter(cluster):
+    adapter = AsyncElasticsearchAdapter(ElasticsearchConfig())
+    adapter.client = cluster.async_client()
+    return adapter
+
+
+def _collect(context, results):
+    scenario_context = get_current_scenario_context(context)
+    source = scenario_context.get("source")
+    collected = []
+    for result in results:
+        source.result_yielded()
+        collected.append(result)
+    scenario_context.store("results", collected)
+
+
+async def _collect_async(context, adapter, results):
+    scenario_context = get_current_scenario_context(context)
+    source = scenario_context.get("source")
+    collected = []
+    try:
+        async for result in results:
+            source.result_yielded()
+            collected.append(result)
+    finally:
+        await adapter.client.close()
+    scenario_context.store("results", collected)
+
+
+@given("an in-memory Elasticsearch cluster")
+def step_given_cluster(context):
+    get_current_scenario_context(context).store("cluster", FakeElasticsearchCluster())
+
+
+@given("an in-memory Elasticsearch cluster taking {delay:d} milliseconds per bulk request")
+def step_given_slow_cluster(context, delay):
+    cluster = FakeElasticsearchCluster()
+    cluster.request_delay = delay / 1000
+    get_current_scenario_context(context).store("cluster", cluster)
+
+
+@given('the cluster rejects documents "{first}" and "{second}" with a 429 status {times:d} times')
+def step_given_rejections(context, first, second, times):
+    cluster = get_current_scenario_context(context).get("cluster")
+    cluster.rejections.update({first: times, second: times})
+
+
+@given('the cluster fails document "{document_id}" with "{error_type}"')
+def step_given_failure(context, document_id, error_type):
+    cluster = get_current_scenario_context(context).get("cluster")
+    cluster.failures[document_id] = error_type
+
+
+@given('a generator of {count:d} index actions for index "{index}"')
+@given('an async generator of {count:d} index actions for index "{index}"')
+def step_given_actions(context, count, index):
+    get_current_scenario_context(context).store("source", ActionSource(count, index))
+
+
+@when("the actions are sent with streaming bulk in chunks of {chunk_size:d} actions")
+def step_when_streaming_bulk(context, chunk_size):
+    scenario_context = get_current_scenario_context(context)
+    adapter = _sync_adapter(scenario_context.get("cluster"))
+    source = scenario_context.get("source")
+    _collect(context, adapter.streaming_bulk(source.actions(), chunk_size=chunk_size, initial_backoff=RETRY_BACKOFF))
+
+
+@when("the actions are sent with streaming bulk in chunks of {chunk_size:d} actions and {max_bytes:d} bytes")
+def step_when_streaming_bulk_bytes(context, chunk_size, max_bytes):
+    scenario_context = get_current_scenario_context(context)
+    adapter = _sync_adapter(scenario_context.get("cluster"))
+    source = scenario_context.get("source")
+    _collect(context, adapter.streaming_bulk(source.actions(), chunk_size=chunk_size, max_chunk_bytes=max_bytes))
+
+
+@when("the actions are sent with parallel bulk in chunks of {chunk_size:d} actions on {thread_count:d} threads")
+def step_when_parallel_bulk(context, chunk_size, thread_count):
+    scenario_context = get_current_scenario_context(context)
+    adapter = _sync_adapter(scenario_context.get("cluster"))
+    source = scenario_context.get("source")
+    _collect(context, adapter.parallel_bulk(source.actions(), thread_count=thread_count, chunk_size=chunk_size))
+
+
+@when("the actions are sent with async streaming bulk in chunks of {chunk_size:d} actions")
+def step_when_async_streaming_bulk(context, chunk_size):
+    scenario_context = get_current_scenario_context(context)
+    source = scenario_context.get("source")
+
+    async def send():
+        adapter = _async_adapter(scenario_context.get("cluster"))
+        results = adapter.streaming_bulk(source.async_actions(), chunk_size=chunk_size, initial_backoff=RETRY_BACKOFF)
+        await _collect_async(context, adapter, results)
+
+    asyncio.run(send())
+
+
+@when(
+    "the actions are sent with async parallel bulk in chunks of {chunk_size:d} actions "
+    "with a concurrency of {concurrency:d}",
+)
+def step_when_async_parallel_bulk(context, chunk_size, concurrency):
+    scenario_context = get_current_scenario_context(context)
+    source = scenario_context.get("source")
+
+    async def send():
+        adapter = _async_adapter(scenario_context.get("cluster"))
+        results = adapter.parallel_bulk(source.async_actions(), concurrency=concurrency, chunk_size=chunk_size)
+        await _collect_async(context, adapter, results)
+
+    asyncio.run(send())
+
+
+@then("{count:d} successful results should be yielded")
+def step_then_successful_results(context, count):
+    results = get_current_scenario_context(context).get("results")
+    assert sum(1 for ok, _ in results if ok) == count, results
+
+
+@then("the cluster should have received {count:d} bulk requests")
+def step_then_bulk_requests(context, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert len(cluster.bulk_bodies) == count, cluster.requests
+
+
+@then("the cluster should have received more than {count:d} bulk requests")
+def step_then_more_bulk_requests(context, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert len(cluster.bulk_bodies) > count, cluster.requests
+
+
+@then('index "{index}" should hold {count:d} documents')
+def step_then_index_documents(context, index, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert len(cluster.indices.get(index, {})) == count
+
+
+@then("no more than {count:d} actions should have been read before the first result")
+def step_then_read_ahead(context, count):
+    source = get_current_scenario_context(context).get("source")
+    assert source.read_before_first_result <= count, source.read_before_first_result
+
+
+@then("every bulk request should be at most {max_bytes:d} bytes")
+def step_then_bulk_bytes(context, max_bytes):
+    cluster = get_current_scenario_context(context).get("cluster")
+    sizes = [len(body) for body in cluster.bulk_bodies]
+    assert max(sizes) <= max_bytes, sizes
+
+
+@then('the result of document "{document_id}" should be a failure with "{error_type}"')
+def step_then_failure(context, document_id, error_type):
+    results = get_current_scenario_context(context).get("results")
+    failures = [item["index"] for ok, item in results if not ok]
+    assert len(failures) == 1, failures
+    assert failures[0]["_id"] == document_id
+    assert failures[0]["error"]["type"] == error_type
+
+
+@then("the results should follow the order of the actions")
+def step_then_results_ordered(context):
+    results = get_current_scenario_context(context).get("results")
+    ids = [item["index"]["_id"] for _, item in results]
+    assert ids == [str(number) for number in range(len(ids))], ids
+
+
+@then("the cluster should have handled at most {limit:d} bulk requests at once, more than 1")
+def step_then_bounded_concurrency(context, limit):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert 1 < cluster.max_active_requests <= limit, cluster.max_active_requests
@@ -0,0 +1,210 @@
+"""Implementation of steps for testing the deep pagination iterators of the Elasticsearch adapters."""
+
+import asyncio
+import contextlib
+import itertools
+
+from behave import given, then, when
+from elasticsearch import BadRequestError
+from features.fake_elasticsearch import FakeElasticsearchCluster
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter, ElasticsearchAdapter
+from archipy.configs.config_template import ElasticsearchConfig
+
+CATEGORIES = ("books", "games", "music")
+
+
+def _products(start, count):
+    return {
+        str(number): {"name": f"product {number}", "category": CATEGORIES[number % 3], "price": (number * 7) % 101}
+        for number in range(start, start + count)
+    }
+
+
+def _sync_adapter(context):
+    adapter = ElasticsearchAdapter(ElasticsearchConfig())
+    adapter.client = get_current_scenario_context(context).get("cluster").client()
+    return adapter
+
+
+def _async_adapter(context):
+    adapter = AsyncElasticsearchAdapter(ElasticsearchConfig())
+    adapter.client = get_current_scenario_context(context).get("cluster").async_client()
+    return adapter
+
+
+@given('an in-memory Elasticsearch cluster with {count:d} documents in index "{index}"')
+def step_given_cluster_with_documents(context, count, index):
+    cluster = FakeElasticsearchCluster()
+    cluster.store(index, _products(0, count))
+    get_current_scenario_context(context).store("cluster", cluster)
+
+
+@given(
+    'an in-memory Elasticsearch cluster with {count:d} documents in index "{index}" '
+    "taking {delay:d} milliseconds per request",
+)
+def step_given_slow_cluster_with_documents(context, count, index, delay):
+    step_given_cluster_with_documents(context, count, index)
+    get_current_scenario_context(context).get("cluster").request_delay = delay / 1000
+
+
+@given("the cluster does not support points in time")
+def step_given_no_point_in_time(context):
+    get_current_scenario_context(context).get("cluster").point_in_time_supported = False
+
+
+@when('I search index "{index}" from hit {start:d}')
+def step_when_search_from(context, index, start):
+    try:
+        _sync_adapter(context).search(index, {"from": start, "size": 10})
+        error = None
+    except BadRequestError as e:
+        error = e
+    get_current_scenario_context(context).store("search_error", error)
+
+
+@when('I iterate over the hits of index "{index}" in pages of {page_size:d}')
+def step_when_iterate_hits(context, index, page_size):
+    hits = list(_sync_adapter(context).iterate_hits(index, page_size=page_size))
+    get_current_scenario_context(context).store("hits", hits)
+
+
+@when('I iterate over the hits of index "{index}" in pages of {page_size:d} while {count:d} documents are added')
+def step_when_iterate_hits_while_indexing(context, index, page_size, count):
+    scenario_context = get_current_scenario_context(context)
+    cluster = scenario_context.get("cluster")
+    hits = []
+    for hit in _sync_adapter(context).iterate_hits(index, page_size=page_size):
+        if not hits:
+            cluster.store(index, _products(len(cluster.indices[index]), count))
+        hits.append(hit)
+    scenario_context.store("hits", hits)
+
+
+@when(
+    'I iterate over the hits of category "{category}" in index "{index}" by descending price '
+    "in pages of {page_size:d}",
+)
+def step_when_iterate_hits_query(context, category, index, page_size):
+    query = {"query": {"term": {"category": category}}, "sort": [{"price": "desc"}]}
+    hits = list(_sync_adapter(context).iterate_hits(index, query, page_size=page_size))
+    get_current_scenario_context(context).store("hits", hits)
+
+
+@when('I read {count:d} hits of index "{index}" in pages of {page_size:d} and close the iterator')
+def step_when_iterate_hits_partially(context, count, index, page_size):
+    iterator = _sync_adapter(context).iterate_hits(index, page_size=page_size)
+    hits = list(itertools.islice(iterator, count))
+    iterator.close()
+    get_current_scenario_context(context).store("hits", hits)
+
+
+@when('{workers:d} workers each iterate over their slice of index "{index}" in pages of {page_size:d}')
+def step_when_workers_iterate_slices(context, workers, index, page_size):
+    adapter = _sync_adapter(context)
+    slices = [
+        list(adapter.iterate_hits(index, page_size=page_size, slice_id=slice_id, max_slices=workers))
+        for slice_id in range(workers)
+    ]
+    get_current_scenario_context(context).store("slices", slices)
+
+
+@when('I iterate over the hits of index "{index}" with {slices:d} parallel slices in pages of {page_size:d}')
+def step_when_parallel_iterate_hits(context, index, slices, page_size):
+    hits = list(_sync_adapter(context).parallel_iterate_hits(index, slices=slices, page_size=page_size))
+    get_current_scenario_context(context).store("hits", hits)
+
+
+@when('I asynchronously iterate over the hits of index "{index}" in pages of {page_size:d}')
+def step_when_async_iterate_hits(context, index, page_size):
+    async def iterate():
+        adapter = _async_adapter(context)
+        try:
+            return [hit async for hit in adapter.iterate_hits(index, page_size=page_size)]
+        finally:
+            await adapter.client.close()
+
+    get_current_scenario_context(context).store("hits", asyncio.run(iterate()))
+
+
+@when(
+    'I asynchronously read {count:d} hits of index "{index}" with {slices:d} parallel slices '
+    "in pages of {page_size:d} and close the iterator",
+)
+def step_when_async_parallel_iterate_hits_partially(context, count, index, slices, page_size):
+    async def iterate():
+        adapter = _async_adapter(context)
+        hits = []
+        try:
+            async with contextlib.aclosing(
+                adapter.parallel_iterate_hits(index, slices=slices, page_size=page_size),
+            ) as iterator:
+                async for hit in iterator:
+                    hits.append(hit)
+                    if len(hits) == count:
+                        break
+        finally:
+            await adapter.client.close()
+        return hits
+
+    get_current_scenario_context(context).store("hits", asyncio.run(iterate()))
+
+
+@then("the search should be rejected because the result window is too large")
+def step_then_result_window(context):
+    error = get_current_scenario_context(context).get("search_error")
+    assert error is not None and error.status_code == 400, error
+
+
+@then("{count:d} distinct hits should be returned")
+def step_then_distinct_hits(context, count):
+    hits = get_current_scenario_context(context).get("hits")
+    assert len(hits) == count, len(hits)
+    assert len({hit["_id"] for hit in hits}) == count
+
+
+@then("every point in time should have been closed after opening {count:d}")
+def step_then_points_in_time_closed(context, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert cluster.opened_points_in_time == count, cluster.opened_points_in_time
+    assert not cluster.points_in_time, cluster.points_in_time
+
+
+@then("every scroll should have been cleared after opening {count:d}")
+def step_then_scrolls_cleared(context, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert cluster.opened_scrolls == count, cluster.opened_scrolls
+    assert not cluster.scrolls, cluster.scrolls
+    assert cluster.opened_points_in_time == 0
+
+
+@then('every hit should be of category "{category}"')
+def step_then_hits_category(context, category):
+    hits = get_current_scenario_context(context).get("hits")
+    assert all(hit["_source"]["category"] == category for hit in hits)
+
+
+@then("the hits should be sorted by descending price")
+def step_then_hits_sorted(context):
+    prices = [hit["_source"]["price"] for hit in get_current_scenario_context(context).get("hits")]
+    assert prices == sorted(prices, reverse=True), prices
+
+
+@then("every hit should have been returned by exactly one worker")
+def step_then_slices_disjoint(context):
+    scenario_context = get_current_scenario_context(context)
+    ids = [hit["_id"] for hits in scenario_context.get("slices") for hit in hits]
+    assert len(ids) == len(set(ids)) == len(scenario_context.get("cluster").indices["products"])
+
+
+@then("every worker should have returned some hits")
+def step_then_slices_non_empty(context):
+    assert all(get_current_scenario_context(context).get("slices"))
+
+
+@then("the cluster should have handled more than 1 search at once")
+def step_then_concurrent_searches(context):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert cluster.max_active_requests > 1, cluster.max_active_requests
@@ -0,0 +1,194 @@
+"""Implementation of steps for testing the reindex and alias swap pipeline of the Elasticsearch adapters."""
+
+import asyncio
+import time
+
+from behave import given, then, when
+from features.fake_elasticsearch import FakeElasticsearchCluster
+from features.test_helpers import get_current_scenario_context
+from prometheus_client import CollectorRegistry
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter, ElasticsearchAdapter
+from archipy.adapters.elasticsearch.metrics import ElasticsearchMetrics
+from archipy.configs.config_template import ElasticsearchConfig
+from archipy.models.errors import FailedPreconditionError, InternalError
+
+SOURCE_SETTINGS = {"index.refresh_interval": "30s", "index.number_of_replicas": 2}
+
+
+def _products(count):
+    return {str(number): {"name": f"product {number}", "price": number} for number in range(count)}
+
+
+def _reindex(context, alias, asynchronous=False, **kwargs):
+    """Reindex an alias through a new adapter, storing the result or the error raised."""
+    scenario_context = get_current_scenario_context(context)
+    cluster = scenario_context.get("cluster")
+    kwargs.setdefault("poll_interval", 0)
+    started = time.monotonic()
+    try:
+        if asynchronous:
+            adapter = AsyncElasticsearchAdapter(ElasticsearchConfig())
+            adapter.client = cluster.async_client()
+
+            async def run():
+                try:
+                    return await adapter.reindex_alias(alias, **kwargs)
+                finally:
+                    await adapter.client.close()
+
+            result = asyncio.run(run())
+        else:
+            adapter = ElasticsearchAdapter(ElasticsearchConfig())
+            adapter.client = cluster.client()
+            adapter._metrics = scenario_context.get("metrics")
+            result = adapter.reindex_alias(alias, **kwargs)
+    except (InternalError, FailedPreconditionError) as e:
+        scenario_context.store("error", e)
+    else:
+        scenario_context.store("result", result)
+    scenario_context.store("duration", time.monotonic() - started)
+
+
+@given('an in-memory Elasticsearch cluster with {count:d} products in index "{index}" behind alias "{alias}"')
+def step_given_cluster_with_alias(context, count, index, alias):
+    cluster = FakeElasticsearchCluster()
+    cluster.store(index, _products(count))
+    cluster.settings[index] = dict(SOURCE_SETTINGS)
+    cluster.aliases[alias] = {index}
+    get_current_scenario_context(context).store("cluster", cluster)
+
+
+@given('index "{index}" holds {count:d} products')
+def step_given_index(context, index, count):
+    get_current_scenario_context(context).get("cluster").store(index, _products(count))
+
+
+@given('the cluster fails to copy the product with id "{doc_id}"')
+def step_given_copy_failure(context, doc_id):
+    get_current_scenario_context(context).get("cluster").failures[doc_id] = "mapper_parsing_exception"
+
+
+@given("reindex metrics exported to a fresh registry")
+def step_given_metrics(context):
+    registry = CollectorRegistry()
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("registry", registry)
+    scenario_context.store("metrics", ElasticsearchMetrics(registry))
+
+
+@when('I reindex alias "{alias}" with a reindex task in batches of {size:d}')
+@when('I try to reindex alias "{alias}" with a reindex task in batches of {size:d}')
+def step_when_reindex_task(context, alias, size):
+    _reindex(context, alias, batch_size=size)
+
+
+@when('I reindex alias "{alias}" with a reindex task in {slices:d} slices at {rate:d} documents per second')
+def step_when_reindex_task_throttled(context, alias, slices, rate):
+    _reindex(context, alias, slices=slices, requests_per_second=rate)
+
+
+@when('I reindex alias "{alias}" with bulk requests in batches of {size:d} at {rate:d} documents per second')
+def step_when_reindex_bulk_throttled(context, alias, size, rate):
+    _reindex(context, alias, method="bulk", batch_size=size, requests_per_second=rate)
+
+
+@when('I reindex alias "{alias}" with bulk requests in batches of {size:d} deleting the source')
+def step_when_reindex_bulk_deleting(context, alias, size):
+    _reindex(context, alias, method="bulk", batch_size=size, delete_source=True)
+
+
+@when('I try to reindex alias "{alias}" with bulk requests in batches of {size:d}')
+def step_when_reindex_bulk(context, alias, size):
+    _reindex(context, alias, method="bulk", batch_size=size)
+
+
+@when('I reindex alias "{alias}" asynchronously with bulk requests in batches of {size:d} deleting the source')
+def step_when_reindex_async(context, alias, size):
+    _reindex(context, alias, asynchronous=True, method="bulk", batch_size=size, delete_source=True)
+
+
+@then('alias "{alias}" should point to "{index}" only')
+def step_then_alias(context, alias, index):
+    aliases = get_current_scenario_context(context).get("cluster").aliases
+    assert aliases.get(alias) == {index}, aliases
+
+
+@then('index "{index}" should hold {count:d} products')
+def step_then_index_documents(context, index, count):
+    documents = get_current_scenario_context(context).get("cluster").indices[index]
+    assert documents == _products(count), documents
+
+
+@then('index "{index}" should not exist')
+def step_then_no_index(context, index):
+    assert index not in get_current_scenario_context(context).get("cluster").indices
+
+
+@then('index "{index}" should have been created without refreshes or replicas')
+def step_then_created_settings(context, index):
+    settings = get_current_scenario_context(context).get("cluster").created_settings[index]
+    assert settings == {"index.refresh_interval": "-1", "index.number_of_replicas": 0}, settings
+
+
+@then('index "{index}" should have a refresh interval of "{interval}" and {replicas:d} replicas')
+def step_then_settings(context, index, interval, replicas):
+    settings = get_current_scenario_context(context).get("cluster").settings[index]
+    assert settings == {"index.refresh_interval": interval, "index.number_of_replicas": replicas}, settings
+
+
+@then('index "{index}" should have been force-merged to {segments:d} segment')
+def step_then_force_merged(context, index, segments):
+    force_merges = get_current_scenario_context(context).get("cluster").force_merges
+    assert force_merges == [(index, segments)], force_merges
+
+
+@then('the reindex should report {count:d} documents copied from "{index}"')
+def step_then_result(context, count, index):
+    result = get_current_scenario_context(context).get("result")
+    assert result["documents"] == count and result["previous_indices"] == [index], result
+
+
+@then("the reindex request should have used {slices:d} slices and {rate:d} requests per second")
+def step_then_reindex_request(context, slices, rate):
+    (request,) = get_current_scenario_context(context).get("cluster").reindex_requests
+    assert (request["slices"], request["requests_per_second"]) == (str(slices), str(rate)), request
+
+
+@then("the copy should have taken at least {duration:d} milliseconds")
+def step_then_duration(context, duration):
+    assert get_current_scenario_context(context).get("duration") >= duration / 1000
+
+
+@then("the reindex should fail with an InternalError")
+def step_then_internal_error(context):
+    assert isinstance(get_current_scenario_context(context).get("error"), InternalError)
+
+
+@then("the reindex should fail with a FailedPreconditionError")
+def step_then_failed_precondition(context):
+    assert isinstance(get_current_scenario_context(context).get("error"), FailedPreconditionError)
+
+
+@then('the metrics should show the reindex of alias "{alias}" as "{phase}"')
+def step_then_phase_metric(context, alias, phase):
+    registry = get_current_scenario_context(context).get("registry")
+    assert (
+        registry.get_sample_value("elasticsearch_reindex_phase", {"alias": alias, "elasticsearch_reindex_phase": phase})
+        == 1
+    )
+
+
+@then('the metrics should show {copied:d} of {total:d} documents copied for alias "{alias}"')
+def step_then_document_metrics(context, copied, total, alias):
+    registry = get_current_scenario_context(context).get("registry")
+    assert registry.get_sample_value("elasticsearch_reindex_source_documents", {"alias": alias}) == total
+    assert registry.get_sample_value("elasticsearch_reindex_copied_documents", {"alias": alias}) == copied
+
+
+@then('the metrics should show the duration of every phase of the reindex of alias "{alias}"')
+def step_then_phase_durations(context, alias):
+    registry = get_current_scenario_context(context).get("registry")
+    for phase in ("creating", "copying", "merging", "swapping"):
+        seconds = registry.get_sample_value("elasticsearch_reindex_phase_seconds", {"alias": alias, "phase": phase})
+        assert seconds is not None and seconds >= 0, phase
@@ -0,0 +1,219 @@
+"""Implementation of steps for testing the search result cache of the Elasticsearch adapters."""
+
+import asyncio
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+from prometheus_client import CollectorRegistry
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter, ElasticsearchAdapter
+from archipy.adapters.elasticsearch.cache import ElasticsearchSearchCache
+from archipy.adapters.elasticsearch.metrics import ElasticsearchMetrics
+from archipy.adapters.redis.mocks import RedisMock
+from archipy.configs.config_template import ElasticsearchConfig, RedisConfig
+
+
+def _price_query(price, reverse=False):
+    """Build a search for a price, with its keys in reverse order if requested."""
+    query = {"query": {"term": {"price": price}}, "size": 100, "track_total_hits": True}
+    return dict(reversed(query.items())) if reverse else query
+
+
+def _store_adapter(context, config, name="adapter"):
+    scenario_context = get_current_scenario_context(context)
+    adapter = ElasticsearchAdapter(config)
+    adapter.client = scenario_context.get("cluster").client()
+    scenario_context.store(name, adapter)
+    return adapter
+
+
+def _search(context, index, price, name="adapter"):
+    scenario_context = get_current_scenario_context(context)
+    response = scenario_context.get(name).search(index, _price_query(price))
+    scenario_context.store("responses", [*(scenario_context.get("responses") or []), response])
+
+
+def _searches(context):
+    cluster = get_current_scenario_context(context).get("cluster")
+    return [path for _, path in cluster.requests if path.endswith("/_search")]
+
+
+@given("an adapter caching search results")
+def step_given_caching_adapter(context):
+    _store_adapter(context, ElasticsearchConfig(SEARCH_CACHE_ENABLED=True))
+
+
+@given("an adapter with the default configuration")
+def step_given_default_adapter(context):
+    _store_adapter(context, ElasticsearchConfig())
+
+
+@given("an adapter caching search results with a refresh interval of {interval:d} milliseconds")
+def step_given_caching_adapter_refresh_interval(context, interval):
+    config = ElasticsearchConfig(SEARCH_CACHE_ENABLED=True, SEARCH_CACHE_REFRESH_INTERVAL_SECONDS=interval / 1000)
+    _store_adapter(context, config)
+
+
+@given("an adapter caching search results for {ttl:d} milliseconds")
+def step_given_caching_adapter_ttl(context, ttl):
+    _store_adapter(context, ElasticsearchConfig(SEARCH_CACHE_ENABLED=True, SEARCH_CACHE_TTL_SECONDS=ttl / 1000))
+
+
+@given("two adapters caching search results in a shared Redis only")
+def step_given_adapters_sharing_redis(context):
+    redis = RedisMock(redis_config=RedisConfig(MASTER_HOST="localhost", PORT=6379, DATABASE=0, DECODE_RESPONSES=True))
+    for name in ("first_adapter", "second_adapter"):
+        adapter = _store_adapter(context, ElasticsearchConfig(), name)
+        adapter.search_cache = ElasticsearchSearchCache(local_maxsize=0, redis_client=redis)
+
+
+@given("an adapter caching search results with metrics in a fresh registry")
+def step_given_caching_adapter_metrics(context):
+    registry = CollectorRegistry()
+    get_current_scenario_context(context).store("registry", registry)
+    adapter = _store_adapter(context, ElasticsearchConfig(SEARCH_CACHE_ENABLED=True))
+    adapter.search_cache.metrics = ElasticsearchMetrics(registry)
+
+
+@given("an async adapter caching search results and coalescing searches for {window:d} milliseconds")
+def step_given_async_caching_adapter(context, window):
+    scenario_context = get_current_scenario_context(context)
+    adapter = AsyncElasticsearchAdapter(
+        ElasticsearchConfig(SEARCH_CACHE_ENABLED=True, SEARCH_COALESCING_WINDOW_MS=window),
+    )
+    adapter.client = scenario_context.get("cluster").async_client()
+    scenario_context.store("async_adapter", adapter)
+
+
+@when('I search "{index}" for price {price:d} {count:d} times, with the query keys in a different order each time')
+def step_when_search_repeatedly(context, index, price, count):
+    scenario_context = get_current_scenario_context(context)
+    adapter = scenario_context.get("adapter")
+    responses = [adapter.search(index, _price_query(price, reverse=bool(number % 2))) for number in range(count)]
+    scenario_context.store("responses", responses)
+
+
+@when('I search "{index}" for price {price:d}')
+def step_when_search(context, index, price):
+    _search(context, index, price)
+
+
+@when('the {ordinal} adapter searches "{index}" for price {price:d}')
+def step_when_adapter_search(context, ordinal, index, price):
+    _search(context, index, price, f"{ordinal}_adapter")
+
+
+@when('I index a product priced {price:d} with id "{doc_id}" in "{index}" waiting for the refresh')
+def step_when_index_product(context, price, doc_id, index):
+    get_current_scenario_context(context).get("adapter").index(index, {"price": price}, doc_id, refresh="wait_for")
+
+
+@when('I delete the product with id "{doc_id}" from "{index}"')
+def step_when_delete_product(context, doc_id, index):
+    get_current_scenario_context(context).get("adapter").delete(index, doc_id)
+
+
+@when('the first adapter updates the product with id "{doc_id}" in "{index}" waiting for the refresh')
+def step_when_update_product(context, doc_id, index):
+    adapter = get_current_scenario_context(context).get("first_adapter")
+    adapter.update(index, doc_id, {"price": 100}, refresh="wait_for")
+
+
+@when('I stream {count:d} orders to index "{index}" waiting for the refresh')
+def step_when_stream_orders(context, count, index):
+    actions = ({"_index": index, "_id": str(number), "total": number} for number in range(count))
+    results = list(get_current_scenario_context(context).get("adapter").streaming_bulk(actions, refresh="wait_for"))
+    assert all(ok for ok, _ in results), results
+
+
+@when('I bulk update the product with id "{doc_id}" in "{index}" waiting for the refresh')
+def step_when_bulk_update(context, doc_id, index):
+    actions = [{"update": {"_index": index, "_id": doc_id}}, {"doc": {"price": 100}}]
+    response = get_current_scenario_context(context).get("adapter").bulk(actions, refresh="wait_for")
+    assert not response["errors"], response
+
+
+@when("I wait {delay:d} milliseconds")
+def step_when_wait(context, delay):
+    time.sleep(delay / 1000)
+
+
+@when("{count:d} identical searches for price {price:d} are issued concurrently twice")
+def step_when_concurrent_identical_searches(context, count, price):
+    adapter = get_current_scenario_context(context).get("async_adapter")
+
+    async def run():
+        try:
+            for _ in range(2):
+                responses = await asyncio.gather(
+                    *(adapter.search("products", _price_query(price)) for _ in range(count))
+                )
+                assert all(len(response["hits"]["hits"]) == 3 for response in responses), responses
+        finally:
+            await adapter.client.close()
+
+    asyncio.run(run())
+
+
+@then("the cluster should have received 1 search")
+def step_then_one_search(context):
+    step_then_searches(context, 1)
+
+
+@then("the cluster should have received {count:d} searches")
+def step_then_searches(context, count):
+    searches = _searches(context)
+    assert len(searches) == count, searches
+
+
+@then("every search should have returned the products priced {price:d}")
+def step_then_products_priced(context, price):
+    for response in get_current_scenario_context(context).get("responses"):
+        hits = response["hits"]["hits"]
+        assert len(hits) == 3 and all(hit["_source"]["price"] == price for hit in hits), hits
+
+
+@then("the last search should have returned {count:d} products")
+def step_then_last_search(context, count):
+    hits = get_current_scenario_context(context).get("responses")[-1]["hits"]["hits"]
+    assert len(hits) == count, hits
+
+
+@then(
+    "the cache should report {local_hits:d} local hits, {redis_hits:d} Redis hits and {misses:d} miss",
+)
+def step_then_cache_statistics(context, local_hits, redis_hits, misses):
+    _assert_statistics(
+        get_current_scenario_context(context).get("adapter").search_cache, local_hits, redis_hits, misses
+    )
+
+
+@then("the second adapter should report {local_hits:d} local hits, {redis_hits:d} Redis hit and {misses:d} misses")
+def step_then_second_adapter_statistics(context, local_hits, redis_hits, misses):
+    cache = get_current_scenario_context(context).get("second_adapter").search_cache
+    _assert_statistics(cache, local_hits, redis_hits, misses)
+
+
+def _assert_statistics(cache, local_hits, redis_hits, misses):
+    assert (cache.local_hits, cache.redis_hits, cache.misses) == (local_hits, redis_hits, misses), (
+        cache.local_hits,
+        cache.redis_hits,
+        cache.misses,
+    )
+    assert cache.hit_ratio == (local_hits + redis_hits) / (local_hits + redis_hits + misses)
+
+
+@then('the metrics should count {local_hits:d} local hits and {misses:d} miss for index "{index}"')
+def step_then_lookup_metrics(context, local_hits, misses, index):
+    registry = get_current_scenario_context(context).get("registry")
+    name = "elasticsearch_search_cache_lookups_total"
+    assert registry.get_sample_value(name, {"index": index, "result": "local_hit"}) == local_hits
+    assert registry.get_sample_value(name, {"index": index, "result": "miss"}) == misses
+    assert registry.get_sample_value(name, {"index": index, "result": "redis_hit"}) is None
+
+
+@then('the metrics should count {count:d} invalidation of index "{index}"')
+def step_then_invalidation_metrics(context, count, index):
+    registry = get_current_scenario_context(context).get("registry")
+    assert registry.get_sample_value("elasticsearch_search_cache_invalidations_total", {"index": index}) == count
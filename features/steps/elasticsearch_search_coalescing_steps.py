@@ -0,0 +1,161 @@
+"""Implementation of steps for testing msearch and search coalescing of the Elasticsearch adapters."""
+
+import asyncio
+
+from behave import given, then, when
+from elasticsearch import NotFoundError
+from features.fake_elasticsearch import FakeElasticsearchCluster
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter, ElasticsearchAdapter
+from archipy.configs.config_template import ElasticsearchConfig
+
+# Products per price in the index, so every search has several hits
+PRODUCTS_PER_PRICE = 3
+
+
+def _price_query(price):
+    return {"query": {"term": {"price": price}}}
+
+
+def _run_searches(context, searches, **kwargs):
+    """Issues searches concurrently and stores their responses or errors in order."""
+    scenario_context = get_current_scenario_context(context)
+    adapter = scenario_context.get("async_adapter")
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                *(adapter.search(index, query, **kwargs) for index, query in searches),
+                return_exceptions=True,
+            )
+        finally:
+            await adapter.client.close()
+
+    scenario_context.store("searches", searches)
+    scenario_context.store("outcomes", asyncio.run(run()))
+
+
+@given('an in-memory Elasticsearch cluster with {count:d} products in index "{index}"')
+def step_given_cluster_with_products(context, count, index):
+    cluster = FakeElasticsearchCluster()
+    cluster.store(index, {str(number): {"price": number % (count // PRODUCTS_PER_PRICE)} for number in range(count)})
+    get_current_scenario_context(context).store("cluster", cluster)
+
+
+@given("an async adapter coalescing searches for {window:d} milliseconds")
+def step_given_coalescing_adapter(context, window):
+    _store_async_adapter(context, ElasticsearchConfig(SEARCH_COALESCING_WINDOW_MS=window))
+
+
+@given("an async adapter coalescing searches for {window:d} milliseconds in batches of at most {max_batch:d}")
+def step_given_coalescing_adapter_batches(context, window, max_batch):
+    config = ElasticsearchConfig(SEARCH_COALESCING_WINDOW_MS=window, SEARCH_COALESCING_MAX_BATCH=max_batch)
+    _store_async_adapter(context, config)
+
+
+@given("an async adapter with the default configuration")
+def step_given_default_adapter(context):
+    _store_async_adapter(context, ElasticsearchConfig())
+
+
+def _store_async_adapter(context, config):
+    scenario_context = get_current_scenario_context(context)
+    adapter = AsyncElasticsearchAdapter(config)
+    adapter.client = scenario_context.get("cluster").async_client()
+    scenario_context.store("async_adapter", adapter)
+
+
+@when('I run a multi-search for prices {first:d} and {second:d} in "{index}" and price {third:d} in "{missing}"')
+def step_when_msearch(context, first, second, index, third, missing):
+    scenario_context = get_current_scenario_context(context)
+    adapter = ElasticsearchAdapter(ElasticsearchConfig())
+    adapter.client = scenario_context.get("cluster").client()
+    searches = [(index, _price_query(first)), (index, _price_query(second)), (missing, _price_query(third))]
+    scenario_context.store("msearch_response", adapter.msearch(searches))
+
+
+@when("{count:d} searches for distinct prices are issued concurrently")
+def step_when_concurrent_searches(context, count):
+    _run_searches(context, [("products", _price_query(price)) for price in range(count)])
+
+
+@when("{count:d} searches for distinct prices are issued concurrently with a routing option")
+def step_when_concurrent_searches_with_options(context, count):
+    _run_searches(context, [("products", _price_query(price)) for price in range(count)], routing="shop")
+
+
+@when('{count:d} searches for distinct prices and one search of index "{index}" are issued concurrently')
+def step_when_concurrent_searches_with_failure(context, count, index):
+    searches = [("products", _price_query(price)) for price in range(count)]
+    _run_searches(context, [*searches[:2], (index, _price_query(0)), *searches[2:]])
+
+
+@then("the cluster should have received {count:d} msearch request of {size:d} searches")
+def step_then_msearch_request(context, count, size):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert cluster.msearch_sizes == [size] * count, cluster.msearch_sizes
+
+
+@then("the cluster should have received msearch requests of {first:d}, {second:d} and {third:d} searches")
+def step_then_msearch_batches(context, first, second, third):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert sorted(cluster.msearch_sizes, reverse=True) == [first, second, third], cluster.msearch_sizes
+
+
+@then("the cluster should have received {count:d} msearch requests")
+def step_then_msearch_count(context, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    assert len(cluster.msearch_sizes) == count, cluster.msearch_sizes
+
+
+@then("the cluster should not have received single searches")
+def step_then_no_single_searches(context):
+    step_then_single_searches(context, 0)
+
+
+@then("the cluster should have received {count:d} single searches")
+def step_then_single_searches(context, count):
+    cluster = get_current_scenario_context(context).get("cluster")
+    searches = [path for _, path in cluster.requests if path.endswith("/_search")]
+    assert len(searches) == count, cluster.requests
+
+
+@then(
+    "the multi-search responses should hold the products priced {first:d} and {second:d} and an error with status 404"
+)
+def step_then_msearch_responses(context, first, second):
+    responses = get_current_scenario_context(context).get("msearch_response")["responses"]
+    assert [response["status"] for response in responses] == [200, 200, 404], responses
+    for response, price in zip(responses, (first, second), strict=False):
+        hits = response["hits"]["hits"]
+        assert len(hits) == PRODUCTS_PER_PRICE and all(hit["_source"]["price"] == price for hit in hits)
+    assert responses[2]["error"]["type"] == "index_not_found_exception"
+
+
+@then("every search should have received the products of its own price")
+def step_then_own_results(context):
+    scenario_context = get_current_scenario_context(context)
+    for (index, query), outcome in zip(scenario_context.get("searches"), scenario_context.get("outcomes"), strict=True):
+        if index != "products":
+            continue
+        assert not isinstance(outcome, BaseException), outcome
+        price = query["query"]["term"]["price"]
+        hits = outcome["hits"]["hits"]
+        assert len(hits) == PRODUCTS_PER_PRICE, hits
+        assert all(hit["_source"]["price"] == price for hit in hits), (price, hits)
+
+
+@then('the search of index "{index}" should have raised a not found error')
+def step_then_not_found(context, index):
+    scenario_context = get_current_scenario_context(context)
+    outcomes = [
+        outcome
+        for (search_index, _), outcome in zip(
+            scenario_context.get("searches"), scenario_context.get("outcomes"), strict=True
+        )
+        if search_index == index
+    ]
+    assert len(outcomes) == 1 and isinstance(outcomes[0], NotFoundError), outcomes
+    assert outcomes[0].status_code == 404
+    assert len(scenario_context.get("cluster").msearch_sizes) == 1
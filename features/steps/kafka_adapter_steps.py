@@ -1,10 +1,18 @@
 # features/steps/kafka_steps.py
+import asyncio
 import time
 from behave import given, then, when
 from confluent_kafka import TopicPartition
 from features.test_helpers import get_current_scenario_context
 
-from archipy.adapters.kafka.adapters import KafkaAdminAdapter, KafkaConsumerAdapter, KafkaProducerAdapter
+from archipy.adapters.kafka.adapters import (
+    AsyncKafkaConsumerAdapter,
+    AsyncKafkaProducerAdapter,
+    KafkaAdminAdapter,
+    KafkaConsumerAdapter,
+    KafkaProducerAdapter,
+)
+from archipy.adapters.kafka.ports import KafkaRecord
 from archipy.models.errors import UnavailableError
 
 
@@ -172,6 +180,34 @@ def step_produce_message_with_key(context, message, key, topic_name):
         raise e
 
 
+@when('I send a message "{message}" to topic "{topic_name}"')
+def step_send_message(context, message, topic_name):
+    adapter = get_kafka_producer_adapter(context, topic_name)
+    try:
+        future = adapter.send(message)
+        adapter.flush(timeout=5)
+        get_current_scenario_context(context).store("delivery_future", future)
+        context.logger.info(f"Sent message '{message}' to '{topic_name}'")
+    except Exception as e:
+        context.logger.exception(f"Failed to send message: {str(e)}")
+        raise e
+
+
+@when('I produce a batch of {count:d} records with header "{header}" set to "{value}" to topic "{topic_name}"')
+def step_produce_batch(context, count, header, value, topic_name):
+    adapter = get_kafka_producer_adapter(context, topic_name)
+    try:
+        records = [
+            KafkaRecord(f"Batch message {index}", key=f"key-{index}", headers={header: value}) for index in range(count)
+        ]
+        result = adapter.produce_batch(records, timeout=10)
+        get_current_scenario_context(context).store("batch_result", result)
+        context.logger.info(f"Produced a batch of {count} records to '{topic_name}'")
+    except Exception as e:
+        context.logger.exception(f"Failed to produce batch: {str(e)}")
+        raise e
+
+
 @when("I validate the producer health")
 def step_validate_health(context):
     scenario_context = get_current_scenario_context(context)
@@ -253,3 +289,61 @@ def step_health_check_pass(context):
     except UnavailableError as e:
         context.logger.error(f"Health check failed: {str(e)}")
         raise AssertionError(f"Producer health check failed: {str(e)}")
+
+
+@then('the delivery future should report the message on topic "{topic_name}"')
+def step_delivery_future_reports(context, topic_name):
+    future = get_current_scenario_context(context).get("delivery_future")
+    delivered = future.result(timeout=5)
+    assert delivered.topic() == topic_name, f"Expected topic '{topic_name}', got '{delivered.topic()}'"
+    assert delivered.offset() >= 0, f"Unexpected offset {delivered.offset()}"
+    context.logger.info(f"Verified delivery at offset {delivered.offset()}")
+
+
+@then("all {count:d} records of the batch should be delivered")
+def step_batch_delivered(context, count):
+    result = get_current_scenario_context(context).get("batch_result")
+    assert result.delivered == count, f"Expected {count} delivered records, got {result}"
+    assert not result.failed and not result.pending, f"Unexpected batch result: {result}"
+
+
+@then(
+    'the consumer should receive {count:d} messages with header "{header}" set to "{value}" '
+    'from topic "{topic_name}" with group "{group_id}"',
+)
+def step_consumer_receive_with_header(context, count, header, value, topic_name, group_id):
+    adapter = get_kafka_consumer_adapter(context, topic_name, group_id)
+    messages = []
+    for _ in range(5):
+        messages += adapter.batch_consume(messages_number=count, timeout=2)
+        if len(messages) >= count:
+            break
+    assert len(messages) == count, f"Expected {count} messages, got {len(messages)}"
+    for message in messages:
+        headers = dict(message.headers() or [])
+        assert headers.get(header) == value.encode("utf-8"), f"Unexpected headers {headers}"
+    context.logger.info(f"Verified {count} messages with header '{header}'")
+
+
+@when('I produce a message "{message}" asynchronously to topic "{topic_name}"')
+async def step_produce_message_async(context, message, topic_name):
+    kafka_config = get_current_scenario_context(context).get("test_containers").get_container("kafka").config
+    producer = AsyncKafkaProducerAdapter(topic_name, kafka_configs=kafka_config)
+    try:
+        delivered = await producer.produce(message)
+        context.logger.info(f"Produced message '{message}' to '{topic_name}' at offset {delivered.offset()}")
+    finally:
+        await producer.close(timeout=5)
+
+
+@then('an async consumer with group "{group_id}" should receive message "{expected_message}" from topic "{topic_name}"')
+async def step_async_consumer_receive(context, group_id, expected_message, topic_name):
+    kafka_config = get_current_scenario_context(context).get("test_containers").get_container("kafka").config
+    consumer = AsyncKafkaConsumerAdapter(group_id, topic_list=[topic_name], kafka_configs=kafka_config)
+    try:
+        message = await asyncio.wait_for(anext(consumer.messages(batch_size=1)), timeout=30)
+        received_message = message.value().decode("utf-8")
+        assert received_message == expected_message, f"Expected '{expected_message}', got '{received_message}'"
+        context.logger.info(f"Verified received message '{expected_message}'")
+    finally:
+        await consumer.close()
@@ -0,0 +1,188 @@
+"""Implementation of steps for testing the asynchronous Kafka producer and consumer adapters."""
+
+import asyncio
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.kafka.adapters import AsyncKafkaConsumerAdapter, AsyncKafkaProducerAdapter
+from archipy.adapters.kafka.ports import KafkaRecord
+from archipy.configs.config_template import KafkaConfig
+from archipy.models.errors import InternalError, ResourceExhaustedError
+
+
+def build_config(**settings):
+    """Build a configuration for a broker that cannot be reached, so deliveries time out."""
+    return KafkaConfig(BROKERS_LIST=["localhost:1"], DELIVERY_TIMEOUT_MS=1000, **settings)
+
+
+def build_async_producer(context, **settings):
+    """Create an async producer and close it once the scenario ends."""
+    producer = AsyncKafkaProducerAdapter("async-topic", kafka_configs=build_config(**settings))
+    context.add_cleanup(lambda: asyncio.run(producer.close(5)))
+    get_current_scenario_context(context).store("async_producer", producer)
+
+
+async def run_while_ticking(context, operation):
+    """Run an operation while counting the ticks of a coroutine sleeping 10 milliseconds at a time."""
+    ticks = 0
+    started = time.monotonic()
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    try:
+        await operation()
+    finally:
+        ticker.cancel()
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("ticks", ticks)
+    scenario_context.store("ticking_duration", time.monotonic() - started)
+
+
+@given("an async Kafka producer for an unreachable broker")
+def step_given_async_producer(context):
+    """Set up an async producer whose deliveries time out."""
+    build_async_producer(context, PRODUCER_POLL_INTERVAL_MS=50)
+
+
+@given(
+    "an async Kafka producer for an unreachable broker with a queue of {size:d} messages "
+    "and a queue wait of {wait_ms:d} milliseconds",
+)
+def step_given_async_producer_with_queue_wait(context, size, wait_ms):
+    """Set up an async producer with a small queue that awaits space before raising."""
+    build_async_producer(context, QUEUE_BUFFERING_MAX_MESSAGES=size, PRODUCER_QUEUE_FULL_TIMEOUT_MS=wait_ms)
+
+
+@given("an async Kafka consumer for an unreachable broker")
+def step_given_async_consumer(context):
+    """Set up an async consumer subscribed to a topic it cannot fetch."""
+    consumer = AsyncKafkaConsumerAdapter("async-group", topic_list=["async-topic"], kafka_configs=build_config())
+    get_current_scenario_context(context).store("async_consumer", consumer)
+
+
+@when("a message is produced asynchronously while the event loop keeps ticking")
+async def step_when_message_produced_async(context):
+    """Await the delivery of a message while another coroutine keeps running."""
+    scenario_context = get_current_scenario_context(context)
+    producer = scenario_context.get("async_producer")
+
+    async def produce():
+        try:
+            await producer.produce("async message", key="key")
+        except InternalError as error:
+            scenario_context.store("error", error)
+
+    await run_while_ticking(context, produce)
+
+
+@when("{count:d} messages are produced concurrently while the event loop keeps ticking")
+async def step_when_messages_produced_concurrently(context, count):
+    """Produce messages concurrently, recording when the first produce hitting a full queue raised."""
+    scenario_context = get_current_scenario_context(context)
+    producer = scenario_context.get("async_producer")
+    started = time.monotonic()
+    scenario_context.store("error", None)
+
+    async def produce(index):
+        try:
+            await producer.produce(f"message-{index}")
+        except ResourceExhaustedError as error:
+            scenario_context.store("error", error)
+            scenario_context.store("elapsed", time.monotonic() - started)
+        except InternalError:
+            pass
+
+    async def produce_all():
+        await asyncio.gather(*(produce(index) for index in range(count)))
+
+    await run_while_ticking(context, produce_all)
+
+
+@when("an async batch of {count:d} records is produced waiting up to {timeout_ms:d} milliseconds")
+async def step_when_async_batch_produced_with_timeout(context, count, timeout_ms):
+    """Produce a batch without waiting for all of its delivery reports."""
+    scenario_context = get_current_scenario_context(context)
+    records = [KafkaRecord(f"event-{index}", key=f"key-{index}") for index in range(count)]
+    result = await scenario_context.get("async_producer").produce_batch(records, timeout_ms / 1000)
+    scenario_context.store("batch_result", result)
+
+
+@when("an async batch of {count:d} records is produced")
+async def step_when_async_batch_produced(context, count):
+    """Produce a batch and wait for all of its delivery reports."""
+    scenario_context = get_current_scenario_context(context)
+    records = [KafkaRecord(f"event-{index}", headers={"source": "async"}) for index in range(count)]
+    scenario_context.store("batch_result", await scenario_context.get("async_producer").produce_batch(records))
+
+
+@when(
+    "its messages are iterated until it is closed {delay_ms:d} milliseconds later "
+    "while the event loop keeps ticking",
+)
+async def step_when_messages_iterated(context, delay_ms):
+    """Iterate over the consumed messages and close the consumer from another task."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("async_consumer")
+    received = []
+
+    async def iterate():
+        async for message in consumer:
+            received.append(message)
+
+    async def close_later():
+        await asyncio.sleep(delay_ms / 1000)
+        await consumer.close()
+
+    async def iterate_and_close():
+        await asyncio.wait_for(asyncio.gather(iterate(), close_later()), timeout=10)
+
+    await run_while_ticking(context, iterate_and_close)
+    scenario_context.store("received", received)
+
+
+@then("the async produce should fail with an internal error")
+def step_then_async_produce_fails(context):
+    """Verify the awaited delivery failed with the mapped delivery error."""
+    error = get_current_scenario_context(context).get("error")
+    assert isinstance(error, InternalError), f"Unexpected delivery error: {error!r}"
+
+
+@then("one async produce should fail with a resource exhausted error after at least {wait_ms:d} milliseconds")
+def step_then_async_produce_exhausted(context, wait_ms):
+    """Verify a full queue raised only after the wait timeout."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("error") is not None, "Producing to a full queue did not fail"
+    elapsed = scenario_context.get("elapsed")
+    assert elapsed >= wait_ms / 1000, f"Raising took only {elapsed:.3f}s"
+
+
+@then("the event loop should have kept ticking meanwhile")
+def step_then_loop_kept_ticking(context):
+    """Verify the ticking coroutine ran throughout the operation, at a third of its nominal rate or more."""
+    scenario_context = get_current_scenario_context(context)
+    ticks = scenario_context.get("ticks")
+    duration = scenario_context.get("ticking_duration")
+    assert ticks >= duration / 0.01 / 3, f"Only {ticks} ticks in {duration:.3f}s: the event loop was blocked"
+
+
+@then("the async batch result should report {delivered:d} delivered, {failed:d} failed and {pending:d} pending records")
+def step_then_async_batch_result(context, delivered, failed, pending):
+    """Verify the aggregated delivery results of the batch."""
+    result = get_current_scenario_context(context).get("batch_result")
+    assert result.delivered == delivered, f"Unexpected result: {result}"
+    assert len(result.failed) == failed, f"Unexpected result: {result}"
+    assert result.pending == pending, f"Unexpected result: {result}"
+
+
+@then("the iteration should end without messages")
+def step_then_iteration_ends(context):
+    """Verify the iteration ended once the consumer was closed."""
+    received = get_current_scenario_context(context).get("received")
+    assert received == [], f"Unexpected messages: {received}"
@@ -0,0 +1,140 @@
+"""Implementation of steps for testing the fast consume path of the Kafka consumer adapters."""
+
+from behave import given, then, when
+from confluent_kafka import KafkaError, Message
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.kafka.adapters import AsyncKafkaConsumerAdapter, KafkaConsumerAdapter
+from archipy.configs.config_template import KafkaConfig
+
+
+class FakeConsumerClient:
+    """Stands in for the confluent-kafka consumer, returning preset messages and cached watermarks."""
+
+    def __init__(self):
+        self.messages = []
+        self.high_watermarks = {}
+
+    def consume(self, num_messages, timeout):
+        return self.messages[:num_messages]
+
+    def get_watermark_offsets(self, partition, timeout=None, cached=False):
+        return 0, self.high_watermarks.get(partition.partition, -1001)
+
+    def close(self):
+        pass
+
+
+def build_consumer():
+    """Create a consumer for an unreachable broker whose client is replaced by a fake."""
+    config = KafkaConfig(BROKERS_LIST=["localhost:1"])
+    consumer = KafkaConsumerAdapter("fast-path-group", topic_list=["fast-topic"], kafka_configs=config)
+    consumer._adapter.close()
+    consumer._adapter = FakeConsumerClient()
+    return consumer
+
+
+def partition_messages(partition, count, size):
+    """Build messages of a partition, each with a value of the given size."""
+    return [
+        Message(topic="fast-topic", partition=partition, offset=offset, value=bytes([offset]) * size)
+        for offset in range(count)
+    ]
+
+
+@given(
+    "a Kafka consumer whose client delivers {first_count:d} messages of {first_size:d} bytes on partition 0 "
+    "and {second_count:d} messages of {second_size:d} bytes on partition 1",
+)
+def step_given_consumer_with_messages(context, first_count, first_size, second_count, second_size):
+    """Set up a consumer whose client returns messages from two partitions."""
+    consumer = build_consumer()
+    consumer._adapter.messages = partition_messages(0, first_count, first_size) + partition_messages(
+        1,
+        second_count,
+        second_size,
+    )
+    get_current_scenario_context(context).store("consumer", consumer)
+
+
+@given("the client also delivers {count:d} error event")
+def step_given_error_events(context, count):
+    """Add error events to the messages returned by the client."""
+    client = get_current_scenario_context(context).get("consumer")._adapter
+    error = KafkaError(KafkaError._PARTITION_EOF)
+    client.messages += [Message(topic="fast-topic", partition=0, error=error) for _ in range(count)]
+
+
+@given("the cached high watermarks are {first:d} on partition 0 and {second:d} on partition 1")
+def step_given_watermarks(context, first, second):
+    """Set the high watermarks cached by the client."""
+    get_current_scenario_context(context).get("consumer")._adapter.high_watermarks = {0: first, 1: second}
+
+
+@given("the cached high watermarks are {first:d} on partition 0 and unknown on partition 1")
+def step_given_partial_watermarks(context, first):
+    """Set a cached high watermark for the first partition only."""
+    get_current_scenario_context(context).get("consumer")._adapter.high_watermarks = {0: first}
+
+
+@when("a batch is consumed on the fast path")
+def step_when_fast_consume(context):
+    """Consume a batch on the fast path."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("batch", scenario_context.get("consumer").fast_consume(100, 0))
+
+
+@when("a batch is consumed on the fast path of the async consumer")
+async def step_when_async_fast_consume(context):
+    """Consume a batch on the fast path of an async consumer wrapping the fake client."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = AsyncKafkaConsumerAdapter(
+        "fast-path-group",
+        topic_list=["fast-topic"],
+        kafka_configs=KafkaConfig(BROKERS_LIST=["localhost:1"]),
+    )
+    consumer._consumer._adapter.close()
+    consumer._consumer = scenario_context.get("consumer")
+    try:
+        scenario_context.store("batch", await consumer.fast_consume(100, 0))
+    finally:
+        await consumer.close()
+
+
+@then("the batch should hold {count:d} messages of {size:d} bytes with {errors:d} {noun}")
+def step_then_batch_stats(context, count, size, errors, noun):
+    """Check the messages and aggregate statistics of the batch."""
+    batch = get_current_scenario_context(context).get("batch")
+    assert len(batch.messages) == count, f"Expected {count} messages, got {len(batch.messages)}"
+    assert all(message.error() is None for message in batch.messages), "Error events should be dropped"
+    assert batch.stats.message_count == count, f"Expected a count of {count}, got {batch.stats.message_count}"
+    assert batch.stats.payload_bytes == size, f"Expected {size} bytes, got {batch.stats.payload_bytes}"
+    assert batch.stats.errors == errors, f"Expected {errors} errors, got {batch.stats.errors}"
+
+
+@then("the batch lag should be {first:d} on partition 0 and {second:d} on partition 1")
+def step_then_batch_lag(context, first, second):
+    """Check the lag of both partitions and its total."""
+    stats = get_current_scenario_context(context).get("batch").stats
+    expected = {("fast-topic", 0): first, ("fast-topic", 1): second}
+    assert stats.partition_lag == expected, f"Expected lag {expected}, got {stats.partition_lag}"
+    assert stats.lag == first + second, f"Expected a total lag of {first + second}, got {stats.lag}"
+
+
+@then("the batch lag should be {first:d} on partition 0 only")
+def step_then_partial_batch_lag(context, first):
+    """Check that only the partition with a known watermark reports a lag."""
+    stats = get_current_scenario_context(context).get("batch").stats
+    expected = {("fast-topic", 0): first}
+    assert stats.partition_lag == expected, f"Expected lag {expected}, got {stats.partition_lag}"
+    assert stats.lag == first, f"Expected a total lag of {first}, got {stats.lag}"
+
+
+@then("the batch payloads should be memory views of the message values")
+def step_then_batch_payloads(context):
+    """Check that the payloads are zero-copy views of the message values."""
+    batch = get_current_scenario_context(context).get("batch")
+    payloads = batch.payloads()
+    assert all(isinstance(payload, memoryview) for payload in payloads), "Payloads should be memory views"
+    assert [bytes(payload) for payload in payloads] == [message.value() for message in batch.messages]
+    assert all(payload.obj is message.value() for payload, message in zip(payloads, batch.messages, strict=True))
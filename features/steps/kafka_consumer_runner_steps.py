@@ -0,0 +1,403 @@
+"""Implementation of steps for testing the concurrent Kafka consumer runners."""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from behave import given, then, when
+from confluent_kafka import Message, TopicPartition
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.kafka.ports import KafkaConsumerPort
+from archipy.adapters.kafka.runner import AsyncKafkaConsumerRunner, KafkaConsumerRunner
+
+TOPIC = "runner-topic"
+
+
+class InMemoryConsumer(KafkaConsumerPort):
+    """A consumer serving generated messages, recording pauses, commits and processed messages."""
+
+    def __init__(self, partitions, count, fetch_size=10):
+        self.queues = {
+            partition: deque(
+                Message(
+                    topic=TOPIC,
+                    partition=partition,
+                    offset=offset,
+                    key=f"key-{offset % 4}".encode(),
+                    value=f"value-{offset}".encode(),
+                )
+                for offset in range(count)
+            )
+            for partition in range(partitions)
+        }
+        self.fetch_size = fetch_size
+        self.callbacks = {}
+        self.assigned = False
+        self.paused = set()
+        self.pause_count = 0
+        self.resume_count = 0
+        self.committed = {}
+        self.commit_count = 0
+        self.revoke_requests = queue.SimpleQueue()
+        self.processed_at_revoke = None
+        # Filled by the scenario handlers
+        self.lock = threading.Lock()
+        self.processed = []
+        self.active = 0
+        self.max_active = 0
+
+    def subscribe(self, topic_list, on_assign=None, on_revoke=None, on_lost=None):
+        self.callbacks = {"on_assign": on_assign, "on_revoke": on_revoke, "on_lost": on_lost}
+
+    def batch_consume(self, messages_number, timeout):
+        if not self.assigned:
+            self.assigned = True
+            self.callbacks["on_assign"]([TopicPartition(TOPIC, partition) for partition in self.queues])
+        while not self.revoke_requests.empty():
+            partition = self.revoke_requests.get()
+            self.callbacks["on_revoke"]([TopicPartition(TOPIC, partition)])
+            self.queues.pop(partition)
+            with self.lock:
+                self.processed_at_revoke = list(self.processed)
+        batch = []
+        for partition, messages in self.queues.items():
+            if partition in self.paused:
+                continue
+            while messages and len(batch) < messages_number and len(batch) % self.fetch_size < self.fetch_size - 1:
+                batch.append(messages.popleft())
+        if not batch:
+            time.sleep(min(timeout, 0.01))
+        return batch
+
+    def poll(self, timeout):
+        batch = self.batch_consume(1, timeout)
+        return batch[0] if batch else None
+
+    def commit(self, message, asynchronous=True):
+        return None
+
+    def commit_offsets(self, offsets, asynchronous=True):
+        self.commit_count += 1
+        for offset in offsets:
+            self.committed[offset.partition] = offset.offset
+
+    def assign(self, partition_list):
+        pass
+
+    def pause(self, partition_list):
+        self.pause_count += 1
+        self.paused.update(partition.partition for partition in partition_list)
+
+    def resume(self, partition_list):
+        self.resume_count += 1
+        self.paused.difference_update(partition.partition for partition in partition_list)
+
+    def close(self):
+        pass
+
+    def start_processing(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def finish_processing(self, message):
+        with self.lock:
+            self.active -= 1
+            self.processed.append((message.partition(), message.key(), message.offset()))
+
+    def processed_count(self, partition=None):
+        with self.lock:
+            return sum(1 for processed in self.processed if partition is None or processed[0] == partition)
+
+
+def wait_until(predicate, timeout=20):
+    """Wait until a predicate holds, failing after the timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for the runner"
+        time.sleep(0.01)
+
+
+async def async_wait_until(predicate, timeout=20):
+    """Wait on the event loop until a predicate holds, failing after the timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for the runner"
+        await asyncio.sleep(0.01)
+
+
+def all_committed(consumer, count):
+    """Return whether every partition is committed up to the given offset."""
+    return all(consumer.committed.get(partition) == count for partition in range(len(consumer.queues)))
+
+
+def build_handler(consumer, slow_event=None):
+    """Build a handler recording the processing of each message."""
+
+    def handle(message):
+        consumer.start_processing()
+        time.sleep(0.002)
+        if slow_event is not None and message.offset() == 0:
+            slow_event.wait(10)
+        consumer.finish_processing(message)
+
+    return handle
+
+
+def start_thread_runner(context, runner):
+    """Run a runner in a thread, stopping it once the scenario ends."""
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+
+    def stop():
+        runner.stop()
+        thread.join(10)
+
+    context.add_cleanup(stop)
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("runner", runner)
+    scenario_context.store("runner_thread", thread)
+
+
+def stop_thread_runner(context):
+    """Stop the runner and wait for its final commit."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.get("runner").stop()
+    scenario_context.get("runner_thread").join(10)
+
+
+@given("an in-memory Kafka consumer with {partitions:d} partitions of {count:d} messages")
+def step_given_in_memory_consumer(context, partitions, count):
+    """Set up a consumer serving generated messages."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("consumer", InMemoryConsumer(partitions, count))
+    scenario_context.store("count", count)
+    scenario_context.store("slow_event", None)
+
+
+@given("an in-memory Kafka consumer with {partitions:d} partitions of {count:d} messages and a slow first message")
+def step_given_in_memory_consumer_with_slow_message(context, partitions, count):
+    """Set up a consumer whose first message is processed until the scenario releases it."""
+    step_given_in_memory_consumer(context, partitions, count)
+    # A key of its own, so that only the slow message is held back by key ordering
+    messages = get_current_scenario_context(context).get("consumer").queues[0]
+    messages[0] = Message(topic=TOPIC, partition=0, offset=0, key=b"slow", value=b"slow")
+    slow_event = threading.Event()
+    context.add_cleanup(slow_event.set)
+    get_current_scenario_context(context).store("slow_event", slow_event)
+
+
+@when("a thread runner with {ordering} ordering and {workers:d} workers starts")
+def step_when_thread_runner_starts(context, ordering, workers):
+    """Start a thread runner committing every 50 milliseconds."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+    handler = build_handler(consumer, scenario_context.get("slow_event"))
+    runner = KafkaConsumerRunner(
+        consumer,
+        [TOPIC],
+        handler,
+        ordering=ordering,
+        concurrency=workers,
+        commit_interval_ms=50,
+    )
+    start_thread_runner(context, runner)
+
+
+@when("a thread runner with {ordering} ordering and {workers:d} workers processes the messages")
+def step_when_thread_runner_processes(context, ordering, workers):
+    """Run a thread runner until every message is committed."""
+    step_when_thread_runner_starts(context, ordering, workers)
+    scenario_context = get_current_scenario_context(context)
+    wait_until(lambda: all_committed(scenario_context.get("consumer"), scenario_context.get("count")))
+    stop_thread_runner(context)
+
+
+@when(
+    "a thread runner with {ordering} ordering, {workers:d} workers and a backlog of {backlog:d} messages "
+    "processes the messages",
+)
+def step_when_thread_runner_with_backlog_processes(context, ordering, workers, backlog):
+    """Run a thread runner with a small backlog until every message is committed."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+    runner = KafkaConsumerRunner(
+        consumer,
+        [TOPIC],
+        build_handler(consumer),
+        ordering=ordering,
+        concurrency=workers,
+        max_pending_per_partition=backlog,
+        commit_interval_ms=50,
+    )
+    start_thread_runner(context, runner)
+    wait_until(lambda: all_committed(consumer, scenario_context.get("count")))
+    stop_thread_runner(context)
+
+
+@when("a process runner with {workers:d} workers processes the messages")
+def step_when_process_runner_processes(context, workers):
+    """Run a runner with worker processes until every message is committed."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+    runner = KafkaConsumerRunner(consumer, [TOPIC], repr, workers="process", concurrency=workers, commit_interval_ms=50)
+    start_thread_runner(context, runner)
+    wait_until(lambda: all_committed(consumer, scenario_context.get("count")), timeout=60)
+    stop_thread_runner(context)
+
+
+@when("every message but the slow one is processed")
+def step_when_all_but_slow_processed(context):
+    """Wait until only the slow message is left, then let the runner attempt a few commits."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+    wait_until(lambda: consumer.processed_count() == scenario_context.get("count") - 1)
+    time.sleep(0.2)
+
+
+@when("the slow message finishes")
+def step_when_slow_message_finishes(context):
+    """Release the slow message and wait for its commit."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.get("slow_event").set()
+    wait_until(lambda: all_committed(scenario_context.get("consumer"), scenario_context.get("count")))
+    stop_thread_runner(context)
+
+
+@when("partition {partition:d} is revoked after {processed:d} of its messages are processed")
+def step_when_partition_revoked(context, partition, processed):
+    """Revoke a partition once some of its messages are processed, then finish the others."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+    wait_until(lambda: consumer.processed_count(partition) >= processed)
+    consumer.revoke_requests.put(partition)
+    wait_until(lambda: consumer.processed_at_revoke is not None)
+    wait_until(lambda: consumer.committed.get(0) == scenario_context.get("count"))
+    stop_thread_runner(context)
+
+
+@when("an async runner with {ordering} ordering and a concurrency of {concurrency:d} processes the messages")
+async def step_when_async_runner_processes(context, ordering, concurrency):
+    """Run an async runner until every message is committed."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+
+    async def handle(message):
+        consumer.start_processing()
+        await asyncio.sleep(0.002)
+        consumer.finish_processing(message)
+
+    runner = AsyncKafkaConsumerRunner(
+        consumer,
+        [TOPIC],
+        handle,
+        ordering=ordering,
+        concurrency=concurrency,
+        commit_interval_ms=50,
+    )
+    task = asyncio.create_task(runner.run())
+    await async_wait_until(lambda: all_committed(consumer, scenario_context.get("count")))
+    runner.stop()
+    await asyncio.wait_for(task, 10)
+
+
+@when("an async runner revokes partition {partition:d} after {processed:d} of its messages are processed")
+async def step_when_async_runner_revokes(context, partition, processed):
+    """Run an async runner, revoking a partition once some of its messages are processed."""
+    scenario_context = get_current_scenario_context(context)
+    consumer = scenario_context.get("consumer")
+
+    async def handle(message):
+        consumer.start_processing()
+        await asyncio.sleep(0.005)
+        consumer.finish_processing(message)
+
+    runner = AsyncKafkaConsumerRunner(consumer, [TOPIC], handle, concurrency=2, commit_interval_ms=50)
+    task = asyncio.create_task(runner.run())
+    await async_wait_until(lambda: consumer.processed_count(partition) >= processed)
+    consumer.revoke_requests.put(partition)
+    await async_wait_until(lambda: consumer.processed_at_revoke is not None)
+    await async_wait_until(lambda: consumer.committed.get(0) == scenario_context.get("count"))
+    runner.stop()
+    await asyncio.wait_for(task, 10)
+
+
+@then("the messages of each partition should be processed in offset order")
+def step_then_partition_order(context):
+    """Verify the messages of every partition were processed in offset order."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    for partition in consumer.queues:
+        offsets = [offset for processed_partition, _, offset in consumer.processed if processed_partition == partition]
+        assert offsets == sorted(offsets), f"Partition {partition} was processed out of order: {offsets}"
+
+
+@then("the messages of each key should be processed in offset order")
+def step_then_key_order(context):
+    """Verify the messages of every key were processed in offset order."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    for key in {key for _, key, _ in consumer.processed}:
+        offsets = [offset for _, processed_key, offset in consumer.processed if processed_key == key]
+        assert offsets == sorted(offsets), f"Key {key} was processed out of order: {offsets}"
+
+
+@then("several messages should have been processed at the same time")
+def step_then_parallel(context):
+    """Verify the handlers ran concurrently."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    assert consumer.max_active > 1, "The messages were processed one at a time"
+
+
+@then("every partition should be committed up to offset {offset:d}")
+def step_then_committed(context, offset):
+    """Verify the committed offset of every partition."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    for partition in range(len(consumer.queues)):
+        assert consumer.committed.get(partition) == offset, f"Unexpected commits: {consumer.committed}"
+
+
+@then("partition {partition:d} should be committed up to offset {offset:d}")
+def step_then_partition_committed(context, partition, offset):
+    """Verify the committed offset of one partition."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    assert consumer.committed.get(partition) == offset, f"Unexpected commits: {consumer.committed}"
+
+
+@then("offsets should be committed in fewer than {limit:d} commits")
+def step_then_commit_count(context, limit):
+    """Verify offsets were committed in batches rather than per message."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    assert consumer.commit_count < limit, f"Offsets were committed {consumer.commit_count} times"
+
+
+@then("no offset should be committed while the slow message is processed")
+def step_then_nothing_committed(context):
+    """Verify the offsets after the slow message were not committed ahead of it."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    assert not consumer.committed, f"Offsets were committed past an unprocessed message: {consumer.committed}"
+
+
+@then("the partition should have been paused and resumed")
+def step_then_paused_and_resumed(context):
+    """Verify backpressure paused and resumed the partition."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    assert consumer.pause_count > 0, "The partition was never paused"
+    assert consumer.resume_count > 0, "The partition was never resumed"
+
+
+@then("partition {partition:d} should be committed up to its last processed message")
+def step_then_revoked_committed(context, partition):
+    """Verify the revoked partition was committed right after its processed messages."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    processed = sum(1 for processed in consumer.processed_at_revoke if processed[0] == partition)
+    assert consumer.committed.get(partition) == processed, f"Committed {consumer.committed}, processed {processed}"
+
+
+@then("no message of partition {partition:d} should be processed after the revocation")
+def step_then_nothing_after_revoke(context, partition):
+    """Verify the runner dropped the queued messages of the revoked partition."""
+    consumer = get_current_scenario_context(context).get("consumer")
+    before = sum(1 for processed in consumer.processed_at_revoke if processed[0] == partition)
+    assert consumer.processed_count(partition) == before, "Messages of a revoked partition were processed"
@@ -0,0 +1,237 @@
+"""Implementation of steps for testing the Kafka Prometheus metrics."""
+
+import json
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from archipy.adapters.kafka.adapters import KafkaConsumerAdapter, KafkaProducerAdapter
+from archipy.adapters.kafka.metrics import KafkaMetrics
+from archipy.configs.config_template import KafkaConfig
+
+
+def window(**values):
+    """Build a librdkafka window statistic with the given percentiles."""
+    return {"min": 0, "max": 0, "avg": 0, "p50": 0, "p95": 0, "p99": 0, "cnt": 1} | values
+
+
+def consumer_statistics(lags, messages, rebalances):
+    """Build the statistics of a consumer with the given partition lags and totals."""
+    partitions = {
+        str(partition): {"partition": partition, "consumer_lag": lag, "fetchq_cnt": 3}
+        for partition, lag in lags.items()
+    }
+    partitions["-1"] = {"partition": -1, "consumer_lag": -1, "fetchq_cnt": 0}
+    return {
+        "name": "metrics-consumer#consumer-1",
+        "client_id": "metrics-consumer",
+        "type": "consumer",
+        "msg_cnt": 0,
+        "msg_size": 0,
+        "rxmsgs": messages,
+        "rxmsg_bytes": messages * 10,
+        "brokers": {"localhost:9092/1": {"rtt": window(p50=5000, p95=12000, p99=15000)}},
+        "topics": {"orders": {"partitions": partitions}},
+        "cgrp": {"state": "up", "rebalance_cnt": rebalances, "assignment_size": len(lags)},
+    }
+
+
+def sample(context, name, **labels):
+    """Read a sample of the scenario registry."""
+    return get_current_scenario_context(context).get("registry").get_sample_value(name, labels)
+
+
+@given("Kafka metrics in a fresh registry")
+def step_given_metrics(context):
+    """Set up metrics registered in a registry of their own."""
+    scenario_context = get_current_scenario_context(context)
+    registry = CollectorRegistry()
+    scenario_context.store("registry", registry)
+    scenario_context.store("metrics", KafkaMetrics(registry))
+
+
+@when(
+    "consumer statistics report a lag of {first:d} on partition 0 and {second:d} on partition 1 "
+    "after {messages:d} messages and {rebalances:d} rebalance",
+)
+def step_when_consumer_statistics(context, first, second, messages, rebalances):
+    """Report consumer statistics for two partitions."""
+    metrics = get_current_scenario_context(context).get("metrics")
+    metrics.observe_statistics(json.dumps(consumer_statistics({0: first, 1: second}, messages, rebalances)))
+
+
+@when(
+    "consumer statistics report a lag of {lag:d} on partition 0 only after {messages:d} messages and {rebalances:d} rebalances"
+)
+def step_when_consumer_statistics_single_partition(context, lag, messages, rebalances):
+    """Report consumer statistics after partition 1 was revoked."""
+    metrics = get_current_scenario_context(context).get("metrics")
+    metrics.observe_statistics(json.dumps(consumer_statistics({0: lag}, messages, rebalances)))
+
+
+@when("producer statistics report {queued:d} queued messages and batches of {size:d} bytes at the median")
+def step_when_producer_statistics(context, queued, size):
+    """Report producer statistics."""
+    statistics = {
+        "name": "metrics-producer#producer-1",
+        "client_id": "metrics-producer",
+        "type": "producer",
+        "msg_cnt": queued,
+        "msg_size": queued * 100,
+        "txmsgs": 10,
+        "txmsg_bytes": 1000,
+        "brokers": {},
+        "topics": {"orders": {"batchsize": window(p50=size), "batchcnt": window(p50=12), "partitions": {}}},
+    }
+    get_current_scenario_context(context).get("metrics").observe_statistics(json.dumps(statistics))
+
+
+@when("malformed statistics are reported")
+def step_when_malformed_statistics(context):
+    """Report statistics that are not JSON."""
+    get_current_scenario_context(context).get("metrics").observe_statistics("{not json")
+
+
+@then("the lag of partition 0 should be {first:d} and the lag of partition 1 should be {second:d}")
+def step_then_partition_lags(context, first, second):
+    """Check the lag gauges of both partitions."""
+    for partition, expected in (("0", first), ("1", second)):
+        value = sample(
+            context, "kafka_consumer_lag_messages", client_id="metrics-consumer", topic="orders", partition=partition
+        )
+        assert value == expected, f"Expected lag {expected} on partition {partition}, got {value}"
+    unassigned = sample(
+        context, "kafka_consumer_lag_messages", client_id="metrics-consumer", topic="orders", partition="-1"
+    )
+    assert unassigned is None, "The unassigned partition should not be exported"
+
+
+@then("the lag of partition 0 should be {lag:d} and partition 1 should have no lag")
+def step_then_revoked_partition_removed(context, lag):
+    """Check that the gauge of the revoked partition was removed."""
+    value = sample(context, "kafka_consumer_lag_messages", client_id="metrics-consumer", topic="orders", partition="0")
+    assert value == lag, f"Expected lag {lag}, got {value}"
+    revoked = sample(
+        context, "kafka_consumer_lag_messages", client_id="metrics-consumer", topic="orders", partition="1"
+    )
+    assert revoked is None, f"The revoked partition should have no lag, got {revoked}"
+
+
+@then("the consumed messages counter should be {count:d}")
+def step_then_consumed_messages(context, count):
+    """Check the consumed messages counter."""
+    value = sample(context, "kafka_client_messages_total", client_id="metrics-consumer", type="consumer")
+    assert value == count, f"Expected {count} consumed messages, got {value}"
+
+
+@then("the rebalance counter should be {count:d}")
+def step_then_rebalances(context, count):
+    """Check the rebalance counter."""
+    value = sample(context, "kafka_consumer_rebalances_total", client_id="metrics-consumer")
+    assert value == count, f"Expected {count} rebalances, got {value}"
+
+
+@then("the broker rtt p99 should be {seconds:f} seconds")
+def step_then_broker_rtt(context, seconds):
+    """Check the round-trip time of the broker."""
+    value = sample(
+        context,
+        "kafka_broker_rtt_seconds",
+        client_id="metrics-consumer",
+        type="consumer",
+        broker="localhost:9092/1",
+        quantile="0.99",
+    )
+    assert value == seconds, f"Expected an rtt of {seconds}, got {value}"
+
+
+@then("the producer queue depth should be {count:d}")
+def step_then_queue_depth(context, count):
+    """Check the producer queue depth."""
+    value = sample(context, "kafka_client_queue_messages", client_id="metrics-producer", type="producer")
+    assert value == count, f"Expected {count} queued messages, got {value}"
+
+
+@then("the median batch size of the topic should be {size:d} bytes")
+def step_then_batch_size(context, size):
+    """Check the median batch size of the topic."""
+    value = sample(
+        context, "kafka_producer_batch_size_bytes", client_id="metrics-producer", topic="orders", quantile="0.5"
+    )
+    assert value == size, f"Expected a median batch of {size} bytes, got {value}"
+
+
+@then("no metric should be exported")
+def step_then_no_metric(context):
+    """Check that the registry holds no samples."""
+    registry = get_current_scenario_context(context).get("registry")
+    samples = [sample for metric in registry.collect() for sample in metric.samples]
+    assert samples == [], f"Unexpected samples {samples}"
+
+
+def metrics_config(client_id):
+    """Build a configuration with metrics enabled for a broker that cannot be reached."""
+    return KafkaConfig(
+        BROKERS_LIST=["localhost:1"],
+        CLIENT_ID=client_id,
+        METRICS_ENABLED=True,
+        STATISTICS_INTERVAL_MS=100,
+    )
+
+
+@given("a Kafka producer with metrics enabled for an unreachable broker")
+def step_given_metered_producer(context):
+    """Set up a producer exporting metrics to the global registry."""
+    producer = KafkaProducerAdapter("metrics-topic", kafka_configs=metrics_config("metered-producer"))
+    context.add_cleanup(producer.close, 0)
+    get_current_scenario_context(context).store("producer", producer)
+
+
+@when("a message is produced and statistics are served")
+def step_when_metered_produce(context):
+    """Produce a message and poll until statistics are reported."""
+    producer = get_current_scenario_context(context).get("producer")
+    producer.produce("queued")
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        producer._adapter.poll(0.1)
+        if REGISTRY.get_sample_value(
+            "kafka_client_queue_messages", {"client_id": "metered-producer", "type": "producer"}
+        ):
+            break
+
+
+@then("the global registry should report {count:d} message queued by the producer")
+def step_then_global_queue_depth(context, count):
+    """Check the queue depth exported by the producer."""
+    value = REGISTRY.get_sample_value(
+        "kafka_client_queue_messages", {"client_id": "metered-producer", "type": "producer"}
+    )
+    assert value == count, f"Expected {count} queued messages, got {value}"
+
+
+@given("a Kafka consumer with metrics enabled for an unreachable broker")
+def step_given_metered_consumer(context):
+    """Set up a consumer exporting metrics to the global registry."""
+    consumer = KafkaConsumerAdapter(
+        "metrics-group",
+        topic_list=["metrics-topic"],
+        kafka_configs=metrics_config("metered-consumer"),
+    )
+    context.add_cleanup(consumer.close)
+    get_current_scenario_context(context).store("consumer", consumer)
+
+
+@when("a batch is consumed on the fast path by the metered consumer")
+def step_when_metered_consume(context):
+    """Consume an empty batch."""
+    get_current_scenario_context(context).get("consumer").fast_consume(10, 0.1)
+
+
+@then("the global registry should report {count:d} consumed batch")
+def step_then_global_batches(context, count):
+    """Check the number of consumed batches exported by the consumer."""
+    value = REGISTRY.get_sample_value("kafka_consumer_batch_messages_count", {"client_id": "metered-consumer"})
+    assert value == count, f"Expected {count} consumed batches, got {value}"
@@ -0,0 +1,152 @@
+"""Implementation of steps for testing Kafka producer delivery reports and backpressure."""
+
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.kafka.adapters import KafkaProducerAdapter
+from archipy.adapters.kafka.ports import KafkaRecord
+from archipy.configs.config_template import KafkaConfig
+from archipy.models.errors import InternalError, ResourceExhaustedError
+
+
+def build_producer(context, **settings):
+    """Create a producer for a broker that cannot be reached, so messages stay queued until they time out."""
+    config = KafkaConfig(BROKERS_LIST=["localhost:1"], DELIVERY_TIMEOUT_MS=1000, **settings)
+    producer = KafkaProducerAdapter("delivery-topic", kafka_configs=config)
+    context.add_cleanup(producer.close, 5)
+    get_current_scenario_context(context).store("producer", producer)
+
+
+@given("a Kafka producer for an unreachable broker with a queue of {size:d} messages and no queue wait")
+def step_given_producer_without_queue_wait(context, size):
+    """Set up a producer with a small queue that raises as soon as it is full."""
+    build_producer(context, QUEUE_BUFFERING_MAX_MESSAGES=size, PRODUCER_POLL_MODE="none")
+
+
+@given(
+    "a Kafka producer for an unreachable broker with a queue of {size:d} messages "
+    "and a queue wait of {wait_ms:d} milliseconds",
+)
+def step_given_producer_with_queue_wait(context, size, wait_ms):
+    """Set up a producer with a small queue that waits for space before raising."""
+    build_producer(
+        context,
+        QUEUE_BUFFERING_MAX_MESSAGES=size,
+        PRODUCER_POLL_MODE="none",
+        PRODUCER_QUEUE_FULL_TIMEOUT_MS=wait_ms,
+    )
+
+
+@given("a Kafka producer for an unreachable broker polling in a background thread")
+def step_given_producer_with_poll_thread(context):
+    """Set up a producer serving delivery reports in a background thread."""
+    build_producer(context, PRODUCER_POLL_MODE="thread", PRODUCER_POLL_INTERVAL_MS=50)
+
+
+@given("a Kafka producer for an unreachable broker polling inline")
+def step_given_producer_polling_inline(context):
+    """Set up a producer serving delivery reports on each produce."""
+    build_producer(context, PRODUCER_POLL_MODE="inline")
+
+
+@when("{count:d} messages are produced")
+def step_when_messages_produced(context, count):
+    """Produce messages, recording the error and the time taken by the call that failed."""
+    scenario_context = get_current_scenario_context(context)
+    producer = scenario_context.get("producer")
+    scenario_context.store("error", None)
+    for index in range(count):
+        started = time.monotonic()
+        try:
+            producer.produce(f"message-{index}")
+        except ResourceExhaustedError as error:
+            scenario_context.store("error", error)
+            scenario_context.store("elapsed", time.monotonic() - started)
+            return
+
+
+@then("producing should fail with a resource exhausted error within {limit_ms:d} milliseconds")
+def step_then_produce_fails_quickly(context, limit_ms):
+    """Verify a full queue raised without waiting."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("error") is not None, "Producing to a full queue did not fail"
+    elapsed = scenario_context.get("elapsed")
+    assert elapsed < limit_ms / 1000, f"Raising took {elapsed:.3f}s"
+
+
+@then("producing should fail with a resource exhausted error after at least {wait_ms:d} milliseconds")
+def step_then_produce_fails_after_wait(context, wait_ms):
+    """Verify a full queue raised only after the wait timeout."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("error") is not None, "Producing to a full queue did not fail"
+    elapsed = scenario_context.get("elapsed")
+    assert elapsed >= wait_ms / 1000, f"Raising took only {elapsed:.3f}s"
+
+
+@when("a message is sent")
+def step_when_message_sent(context):
+    """Send a message and keep its delivery future."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("future", scenario_context.get("producer").send("awaited message", key="key"))
+
+
+@when("{delay_ms:d} milliseconds later another message is produced")
+def step_when_another_message_produced(context, delay_ms):
+    """Produce another message once the first one has timed out."""
+    time.sleep(delay_ms / 1000)
+    get_current_scenario_context(context).get("producer").produce("next message")
+
+
+@then("its delivery future should fail within {seconds:d} seconds without a flush")
+def step_then_future_fails(context, seconds):
+    """Verify the poll thread resolved the delivery future with the mapped delivery error."""
+    error = get_current_scenario_context(context).get("future").exception(timeout=seconds)
+    assert isinstance(error, InternalError), f"Unexpected delivery error: {error!r}"
+
+
+@then("the first delivery future should already be done")
+def step_then_future_done(context):
+    """Verify the delivery report was served by the inline poll."""
+    assert get_current_scenario_context(context).get("future").done(), "The delivery report was not served"
+
+
+def build_records(count, topics):
+    """Build records with keys, headers and timestamps spread over several topics."""
+    return [
+        KafkaRecord(
+            f"event-{index}",
+            key=f"key-{index}",
+            topic=f"batch-topic-{index % topics}",
+            headers={"event-type": "created"},
+            timestamp=1_700_000_000_000 + index,
+        )
+        for index in range(count)
+    ]
+
+
+@when("a batch of {count:d} records to {topics:d} topics is produced waiting up to {timeout_ms:d} milliseconds")
+def step_when_batch_produced_with_timeout(context, count, topics, timeout_ms):
+    """Produce a batch without waiting for all of its delivery reports."""
+    scenario_context = get_current_scenario_context(context)
+    producer = scenario_context.get("producer")
+    scenario_context.store("batch_result", producer.produce_batch(build_records(count, topics), timeout_ms / 1000))
+
+
+@when("a batch of {count:d} records to {topics:d} topics is produced")
+def step_when_batch_produced(context, count, topics):
+    """Produce a batch and wait for all of its delivery reports."""
+    scenario_context = get_current_scenario_context(context)
+    producer = scenario_context.get("producer")
+    scenario_context.store("batch_result", producer.produce_batch(build_records(count, topics)))
+
+
+@then("the batch result should report {delivered:d} delivered, {failed:d} failed and {pending:d} pending records")
+def step_then_batch_result(context, delivered, failed, pending):
+    """Verify the aggregated delivery results of the batch."""
+    result = get_current_scenario_context(context).get("batch_result")
+    assert result.delivered == delivered, f"Unexpected result: {result}"
+    assert len(result.failed) == failed, f"Unexpected result: {result}"
+    assert result.pending == pending, f"Unexpected result: {result}"
+    assert all(message.error() is not None for message in result.failed), "A failed message has no error"
@@ -0,0 +1,331 @@
+"""Implementation of steps for testing the retry and dead-letter topics of the Kafka consumer runners."""
+
+import asyncio
+import threading
+import time
+
+from behave import given, then, when
+from confluent_kafka import KafkaError, Message, TopicPartition
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.kafka.ports import KafkaBatchResult, KafkaConsumerPort, KafkaProducerPort
+from archipy.adapters.kafka.retry import (
+    ERROR_MESSAGE_HEADER,
+    ERROR_TYPE_HEADER,
+    ORIGINAL_OFFSET_HEADER,
+    ORIGINAL_TOPIC_HEADER,
+    RETRY_ATTEMPT_HEADER,
+    KafkaRetryPolicy,
+    KafkaRetryTier,
+)
+from archipy.adapters.kafka.runner import AsyncKafkaConsumerRunner, KafkaConsumerRunner
+
+POISON = b"poison"
+
+
+class InMemoryBroker:
+    """Holds the messages of single-partition topics, shared by the fake producer and consumer."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.topics = {}
+        self.rejections = 0
+
+    def append(self, topic, key, value, headers=None):
+        with self.lock:
+            messages = self.topics.setdefault(topic, [])
+            message = Message(topic=topic, partition=0, offset=len(messages), key=key, value=value, headers=headers)
+            messages.append(message)
+            return message
+
+    def messages(self, topic):
+        with self.lock:
+            return list(self.topics.get(topic, []))
+
+
+class InMemoryProducer(KafkaProducerPort):
+    """A producer appending records to the in-memory broker, rejecting as many records as requested."""
+
+    def __init__(self, broker):
+        self.broker = broker
+
+    def produce_batch(self, records, timeout=None):
+        delivered, failed = 0, []
+        for record in records:
+            if self.broker.rejections:
+                self.broker.rejections -= 1
+                failed.append(Message(topic=record.topic, error=KafkaError(KafkaError._MSG_TIMED_OUT)))
+                continue
+            self.broker.append(record.topic, record.key, record.value, record.headers)
+            delivered += 1
+        return KafkaBatchResult(delivered, failed, 0)
+
+
+class InMemoryConsumer(KafkaConsumerPort):
+    """A consumer reading the subscribed topics of the in-memory broker and recording commits."""
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.topics = []
+        self.positions = {}
+        self.committed = {}
+        self.on_assign = None
+
+    def subscribe(self, topic_list, on_assign=None, on_revoke=None, on_lost=None):
+        self.topics = list(topic_list)
+        self.on_assign = on_assign
+
+    def batch_consume(self, messages_number, timeout):
+        if self.on_assign is not None:
+            self.on_assign([TopicPartition(topic, 0) for topic in self.topics])
+            self.on_assign = None
+        batch = []
+        for topic in self.topics:
+            messages = self.broker.messages(topic)[self.positions.get(topic, 0) :]
+            messages = messages[: messages_number - len(batch)]
+            self.positions[topic] = self.positions.get(topic, 0) + len(messages)
+            batch += messages
+        if not batch:
+            time.sleep(min(timeout, 0.01))
+        return batch
+
+    def commit_offsets(self, offsets, asynchronous=True):
+        for offset in offsets:
+            self.committed[offset.topic] = offset.offset
+
+    def pause(self, partition_list):
+        pass
+
+    def resume(self, partition_list):
+        pass
+
+    def close(self):
+        pass
+
+
+class RecordingHandler:
+    """Records when each message is handled and fails on the poison message."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.handled = []
+
+    def __call__(self, message):
+        with self.lock:
+            self.handled.append((time.monotonic(), message.topic(), message.value()))
+        if message.value() == POISON:
+            raise ValueError("Poison message")
+
+    def poison_attempts(self):
+        with self.lock:
+            return [handled_at for handled_at, _, value in self.handled if value == POISON]
+
+
+def wait_until(predicate, timeout=20):
+    """Wait until a predicate holds, failing after the timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out waiting for the runner"
+        time.sleep(0.01)
+
+
+def runner_done(scenario_context):
+    """Return whether the poison message reached the dead-letter topic and every offset is committed."""
+    broker = scenario_context.get("broker")
+    consumer = scenario_context.get("consumer")
+    count = len(broker.messages("orders"))
+    return bool(broker.messages("orders.dlq")) and consumer.committed.get("orders") == count
+
+
+@given('a retry policy with tiers "{first}" and "{second}"')
+def step_given_policy(context, first, second):
+    """Set up a retry policy producing to an in-memory broker."""
+    broker = InMemoryBroker()
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("broker", broker)
+    policy = KafkaRetryPolicy(InMemoryProducer(broker), [KafkaRetryTier(first, 0), KafkaRetryTier(second, 0)])
+    scenario_context.store("policy", policy)
+
+
+@given('a consumed message of topic "{topic}" at offset {offset:d} with a "{header}" header')
+def step_given_consumed_message(context, topic, offset, header):
+    """Create a consumed message carrying a header of the application."""
+    message = Message(topic=topic, partition=0, offset=offset, key=b"order-7", value=b"{}", headers=[(header, b"abc")])
+    get_current_scenario_context(context).store("message", message)
+
+
+@when('the message fails with "{error}" {count:d} times and is forwarded each time')
+def step_when_forwarded(context, error, count):
+    """Forward the message, then each forwarded copy, as if every attempt failed."""
+    scenario_context = get_current_scenario_context(context)
+    policy = scenario_context.get("policy")
+    broker = scenario_context.get("broker")
+    message = scenario_context.get("message")
+    destinations = []
+    for _ in range(count):
+        topic = policy.forward(message, ValueError(error))
+        destinations.append(topic)
+        message = broker.messages(topic)[-1]
+    scenario_context.store("destinations", destinations)
+    scenario_context.store("dead_letter", message)
+
+
+@then('it should have been forwarded to "{first}", "{second}" and "{third}"')
+def step_then_destinations(context, first, second, third):
+    """Check the topics the message was forwarded to."""
+    destinations = get_current_scenario_context(context).get("destinations")
+    assert destinations == [first, second, third], f"Unexpected destinations {destinations}"
+
+
+@then('the dead-lettered message should keep its key, value and "{header}" header')
+def step_then_dead_letter_kept(context, header):
+    """Check that the dead-lettered message is the original one."""
+    message = get_current_scenario_context(context).get("dead_letter")
+    headers = dict(message.headers())
+    assert message.key() == b"order-7", f"Unexpected key {message.key()}"
+    assert message.value() == b"{}", f"Unexpected value {message.value()}"
+    assert headers[header] == b"abc", f"The {header} header should be kept, got {headers}"
+
+
+@then(
+    'the dead-lettered message should record topic "{topic}", offset {offset:d}, attempt {attempt:d} '
+    'and the error "{error}"',
+)
+def step_then_dead_letter_headers(context, topic, offset, attempt, error):
+    """Check the routing headers of the dead-lettered message."""
+    message = get_current_scenario_context(context).get("dead_letter")
+    headers = dict(message.headers())
+    names = [name for name, _ in message.headers()]
+    assert len(names) == len(set(names)), f"Routing headers should not be repeated, got {names}"
+    assert headers[ORIGINAL_TOPIC_HEADER] == topic.encode(), f"Unexpected original topic in {headers}"
+    assert headers[ORIGINAL_OFFSET_HEADER] == str(offset).encode(), f"Unexpected original offset in {headers}"
+    assert headers[RETRY_ATTEMPT_HEADER] == str(attempt).encode(), f"Unexpected attempt in {headers}"
+    assert headers[ERROR_TYPE_HEADER] == b"ValueError", f"Unexpected error type in {headers}"
+    assert headers[ERROR_MESSAGE_HEADER] == error.encode(), f"Unexpected error message in {headers}"
+
+
+@given('an in-memory broker with {count:d} messages in topic "{topic}" and a poison message at offset {poison:d}')
+def step_given_broker(context, count, topic, poison):
+    """Fill a topic of an in-memory broker with messages, one of which always fails."""
+    broker = InMemoryBroker()
+    for offset in range(count):
+        broker.append(topic, b"key", POISON if offset == poison else f"value-{offset}".encode())
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("broker", broker)
+    scenario_context.store("consumer", InMemoryConsumer(broker))
+    scenario_context.store("handler", RecordingHandler())
+
+
+@given("a retry policy for the broker with delays of {first:d} and {second:d} milliseconds")
+def step_given_broker_policy(context, first, second):
+    """Set up a retry policy with two short tiers."""
+    scenario_context = get_current_scenario_context(context)
+    tiers = [KafkaRetryTier("retry-1", first), KafkaRetryTier("retry-2", second)]
+    scenario_context.store("delays", [first / 1000, second / 1000])
+    scenario_context.store("policy", KafkaRetryPolicy(InMemoryProducer(scenario_context.get("broker")), tiers))
+
+
+@given("a retry policy for the broker without retry tiers")
+def step_given_dead_letter_policy(context):
+    """Set up a retry policy forwarding failed messages straight to the dead-letter topic."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("policy", KafkaRetryPolicy(InMemoryProducer(scenario_context.get("broker")), []))
+
+
+@given("the broker rejects the next message produced")
+def step_given_rejection(context):
+    """Make the broker reject the next produced message."""
+    get_current_scenario_context(context).get("broker").rejections = 1
+
+
+@when("a thread runner with the retry policy processes the messages")
+def step_when_thread_runner(context):
+    """Run a thread runner until the poison message is dead-lettered and every offset is committed."""
+    scenario_context = get_current_scenario_context(context)
+    runner = KafkaConsumerRunner(
+        scenario_context.get("consumer"),
+        ["orders"],
+        scenario_context.get("handler"),
+        concurrency=2,
+        poll_timeout=0.05,
+        commit_interval_ms=10,
+        retry_policy=scenario_context.get("policy"),
+    )
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    try:
+        wait_until(lambda: runner_done(scenario_context))
+    finally:
+        runner.stop()
+        thread.join(timeout=10)
+
+
+@when("an async runner with the retry policy processes the messages")
+async def step_when_async_runner(context):
+    """Run an async runner until the poison message is dead-lettered and every offset is committed."""
+    scenario_context = get_current_scenario_context(context)
+    handler = scenario_context.get("handler")
+
+    async def handle(message):
+        handler(message)
+
+    runner = AsyncKafkaConsumerRunner(
+        scenario_context.get("consumer"),
+        ["orders"],
+        handle,
+        concurrency=2,
+        poll_timeout=0.05,
+        commit_interval_ms=10,
+        retry_policy=scenario_context.get("policy"),
+    )
+    task = asyncio.create_task(runner.run())
+    try:
+        deadline = time.monotonic() + 20
+        while not runner_done(scenario_context):
+            assert time.monotonic() < deadline, "Timed out waiting for the runner"
+            await asyncio.sleep(0.01)
+    finally:
+        runner.stop()
+        await asyncio.wait_for(task, 10)
+
+
+@then("the poison message should have been handled {count:d} times, each retry after its delay")
+def step_then_poison_retried(context, count):
+    """Check the attempts of the poison message and the delays between them."""
+    scenario_context = get_current_scenario_context(context)
+    attempts = scenario_context.get("handler").poison_attempts()
+    assert len(attempts) == count, f"Expected {count} attempts, got {len(attempts)}"
+    for delay, previous, current in zip(scenario_context.get("delays"), attempts, attempts[1:], strict=False):
+        # Due times are in milliseconds, so a retry may start up to a millisecond early
+        assert current - previous >= delay - 0.002, f"Retried after {current - previous:.3f}s instead of {delay}s"
+
+
+@then("the poison message should have been handled {count:d} times")
+def step_then_poison_handled(context, count):
+    """Check the number of attempts of the poison message."""
+    attempts = get_current_scenario_context(context).get("handler").poison_attempts()
+    assert len(attempts) == count, f"Expected {count} attempts, got {len(attempts)}"
+
+
+@then("the messages after the poison message should have been handled before its first retry")
+def step_then_not_stalled(context):
+    """Check that the partition moved on while the poison message waited for its retry."""
+    handler = get_current_scenario_context(context).get("handler")
+    first_retry = handler.poison_attempts()[1]
+    later = [handled_at for handled_at, _, value in handler.handled if value in (b"value-3", b"value-4")]
+    assert len(later) == 2, f"Expected the later messages to be handled once each, got {len(later)}"
+    assert max(later) < first_retry, "The later messages should not wait for the retry of the poison message"
+
+
+@then('topic "{topic}" should hold the poison message')
+def step_then_dead_lettered(context, topic):
+    """Check that the poison message, and only it, reached the topic."""
+    messages = get_current_scenario_context(context).get("broker").messages(topic)
+    assert [message.value() for message in messages] == [POISON], f"Unexpected messages in {topic}"
+
+
+@then('topic "{topic}" should be committed up to offset {offset:d}')
+def step_then_topic_committed(context, topic, offset):
+    """Check the committed offset of a topic."""
+    committed = get_current_scenario_context(context).get("consumer").committed.get(topic)
+    assert committed == offset, f"Expected {topic} committed up to {offset}, got {committed}"
@@ -0,0 +1,380 @@
+"""Implementation of steps for testing the Kafka serializers."""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import orjson
+from behave import given, then, when
+from confluent_kafka import Message
+from features.test_helpers import get_current_scenario_context
+from google.protobuf import api_pb2
+
+from archipy.adapters.kafka.adapters import KafkaConsumerAdapter, KafkaProducerAdapter
+from archipy.adapters.kafka.ports import KafkaRecord
+from archipy.adapters.kafka.serializers import (
+    AvroSerializer,
+    JsonSchemaSerializer,
+    KafkaSchemaRegistry,
+    OrjsonSerializer,
+    ProtobufSerializer,
+    StringSerializer,
+)
+from archipy.configs.config_template import KafkaConfig
+from archipy.models.dtos.base_dtos import BaseDTO
+from archipy.models.dtos.base_protobuf_dto import BaseProtobufDTO
+from archipy.models.errors import InvalidFormatError
+
+
+class InvoiceDTO(BaseDTO):
+    """Invoice DTO used by the serializer scenarios."""
+
+    number: str
+    amount: Decimal
+    issued_at: datetime
+
+
+class MethodDTO(BaseProtobufDTO):
+    """DTO mapped to the well-known protobuf Method message."""
+
+    _proto_class = api_pb2.Method
+
+    name: str
+    request_type_url: str
+    request_streaming: bool = False
+
+
+class FakeConsumerClient:
+    """Stands in for the confluent-kafka consumer, returning preset messages."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def consume(self, num_messages, timeout):
+        return self.messages[:num_messages]
+
+    def get_watermark_offsets(self, partition, timeout=None, cached=False):
+        return -1001, -1001
+
+    def close(self):
+        pass
+
+
+INVOICE_AVRO_SCHEMA = {
+    "type": "record",
+    "name": "Invoice",
+    "namespace": "archipy.test",
+    "fields": [
+        {"name": "number", "type": "string"},
+        {"name": "amount", "type": "string"},
+        {"name": "issued_at", "type": "string"},
+    ],
+}
+
+
+def build_invoice(index=1):
+    """Build an invoice DTO."""
+    return InvoiceDTO(
+        number=f"INV-{index:04d}",
+        amount=Decimal("125.50"),
+        issued_at=datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+    )
+
+
+@given("an orjson serializer for invoice DTOs")
+def step_given_orjson_serializer(context):
+    """Set up an orjson serializer validating invoices."""
+    get_current_scenario_context(context).store("serializer", OrjsonSerializer(InvoiceDTO))
+
+
+@given("a protobuf serializer for method DTOs")
+def step_given_protobuf_serializer(context):
+    """Set up a protobuf serializer for method DTOs."""
+    get_current_scenario_context(context).store("serializer", ProtobufSerializer(MethodDTO))
+
+
+@given("a JSON schema serializer for invoice DTOs with an in-memory registry")
+def step_given_json_schema_serializer(context):
+    """Set up a JSON schema serializer registering the invoice schema in memory."""
+    scenario_context = get_current_scenario_context(context)
+    registry = KafkaSchemaRegistry()
+    scenario_context.store("registry", registry)
+    scenario_context.store("serializer", JsonSchemaSerializer(InvoiceDTO, registry=registry))
+
+
+@given("an Avro serializer for invoice DTOs with an in-memory registry")
+def step_given_avro_serializer(context):
+    """Set up an Avro serializer registering the invoice schema in memory."""
+    scenario_context = get_current_scenario_context(context)
+    registry = KafkaSchemaRegistry()
+    scenario_context.store("registry", registry)
+    scenario_context.store("serializer", AvroSerializer(INVOICE_AVRO_SCHEMA, dto_type=InvoiceDTO, registry=registry))
+
+
+@given("an in-memory schema registry")
+def step_given_schema_registry(context):
+    """Set up an in-memory registry shared by a writer and a reader."""
+    get_current_scenario_context(context).store("registry", KafkaSchemaRegistry())
+
+
+@given("an Avro serializer writing invoices with the first version of their schema")
+def step_given_avro_writer(context):
+    """Set up an Avro serializer writing the first version of the invoice schema."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("writer", AvroSerializer(INVOICE_AVRO_SCHEMA, registry=scenario_context.get("registry")))
+
+
+@given('an Avro serializer reading invoices with a second version adding a currency defaulting to "{currency}"')
+def step_given_avro_reader(context, currency):
+    """Set up an Avro serializer reading a second version of the invoice schema with an added field."""
+    scenario_context = get_current_scenario_context(context)
+    schema = {
+        **INVOICE_AVRO_SCHEMA,
+        "fields": [*INVOICE_AVRO_SCHEMA["fields"], {"name": "currency", "type": "string", "default": currency}],
+    }
+    scenario_context.store("reader", AvroSerializer(schema, registry=scenario_context.get("registry")))
+
+
+@given("a validating JSON schema serializer for invoice DTOs")
+def step_given_validating_json_schema_serializer(context):
+    """Set up a JSON schema serializer validating values against the invoice schema."""
+    get_current_scenario_context(context).store("serializer", JsonSchemaSerializer(InvoiceDTO, validate=True))
+
+
+@when("an invoice is written with the first version and read with the second")
+def step_when_invoice_evolved(context):
+    """Write an invoice with the first schema version and read it with the second."""
+    scenario_context = get_current_scenario_context(context)
+    invoice = build_invoice()
+    scenario_context.store("expected", invoice)
+    data = scenario_context.get("writer").serialize(invoice, "invoices")
+    scenario_context.store("result", scenario_context.get("reader").deserialize(data, "invoices"))
+
+
+@when("a value without an invoice number is serialized")
+def step_when_invalid_value_serialized(context):
+    """Serialize a value missing a required field."""
+    scenario_context = get_current_scenario_context(context)
+    try:
+        scenario_context.get("serializer").serialize({"amount": "125.50"}, "invoices")
+    except InvalidFormatError as e:
+        scenario_context.store("error", e)
+
+
+@when("a payload without an invoice number is deserialized")
+def step_when_invalid_payload_deserialized(context):
+    """Deserialize a payload missing a required field."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("error", None)
+    try:
+        scenario_context.get("serializer").deserialize(orjson.dumps({"amount": "125.50"}), "invoices")
+    except InvalidFormatError as e:
+        scenario_context.store("error", e)
+
+
+@when("an invoice DTO is serialized and deserialized")
+def step_when_invoice_round_trip(context):
+    """Serialize an invoice and deserialize it back."""
+    scenario_context = get_current_scenario_context(context)
+    serializer = scenario_context.get("serializer")
+    scenario_context.store("expected", build_invoice())
+    data = serializer.serialize(scenario_context.get("expected"), "invoices")
+    scenario_context.store("data", data)
+    scenario_context.store("result", serializer.deserialize(data, "invoices"))
+
+
+@when("a method DTO is serialized and deserialized")
+def step_when_method_round_trip(context):
+    """Serialize a method DTO and deserialize it back."""
+    scenario_context = get_current_scenario_context(context)
+    serializer = scenario_context.get("serializer")
+    expected = MethodDTO(name="GetInvoice", request_type_url="type.example.com/InvoiceRequest", request_streaming=True)
+    scenario_context.store("expected", expected)
+    data = serializer.serialize(expected, "methods")
+    scenario_context.store("data", data)
+    scenario_context.store("result", serializer.deserialize(data, "methods"))
+
+
+@when('an invoice DTO is serialized for topics "{first}" and "{second}"')
+def step_when_invoice_serialized_for_topics(context, first, second):
+    """Serialize an invoice for two topics."""
+    scenario_context = get_current_scenario_context(context)
+    serializer = scenario_context.get("serializer")
+    scenario_context.store("expected", build_invoice())
+    scenario_context.store("topics", [first, second])
+    scenario_context.store(
+        "payloads",
+        [
+            serializer.serialize(scenario_context.get("expected"), first),
+            serializer.serialize(scenario_context.get("expected"), second),
+        ],
+    )
+
+
+@then("the deserialized value should equal the invoice DTO")
+@then("the deserialized value should equal the method DTO")
+def step_then_round_trip_equal(context):
+    """Check that the round-trip preserved the DTO."""
+    scenario_context = get_current_scenario_context(context)
+    result = scenario_context.get("result")
+    assert result == scenario_context.get("expected"), f"Unexpected value {result!r}"
+
+
+@then("the serialized value should parse as the proto class")
+def step_then_parses_as_proto(context):
+    """Check that the payload is the binary encoding of the proto message."""
+    scenario_context = get_current_scenario_context(context)
+    message = api_pb2.Method.FromString(scenario_context.get("data"))
+    assert message.name == "GetInvoice", f"Unexpected proto message {message}"
+    assert message.request_streaming, "request_streaming should be encoded"
+
+
+@then("both payloads should start with the wire format header of schema {schema_id:d}")
+def step_then_wire_format_header(context, schema_id):
+    """Check the magic byte and schema id of the payloads."""
+    header = b"\x00" + schema_id.to_bytes(4, "big")
+    for payload in get_current_scenario_context(context).get("payloads"):
+        assert payload[:5] == header, f"Unexpected header {payload[:5]!r}"
+
+
+@then('the registry should hold the schema under subjects "{first}" and "{second}"')
+def step_then_registry_subjects(context, first, second):
+    """Check that the schema was registered under both subjects."""
+    registry = get_current_scenario_context(context).get("registry")
+    subjects = sorted(subject for subject, _ in registry._ids)
+    assert subjects == sorted([first, second]), f"Unexpected subjects {subjects}"
+    assert orjson.loads(registry.get_schema(1))["title"] == "InvoiceDTO", "The schema should describe invoices"
+
+
+@then("both payloads should deserialize to the invoice DTO")
+def step_then_payloads_deserialize(context):
+    """Check that the framed payloads deserialize back to the invoice."""
+    scenario_context = get_current_scenario_context(context)
+    serializer = scenario_context.get("serializer")
+    for topic, payload in zip(scenario_context.get("topics"), scenario_context.get("payloads"), strict=True):
+        result = serializer.deserialize(payload, topic)
+        assert result == scenario_context.get("expected"), f"Unexpected value {result!r}"
+
+
+@then('the record read should hold the invoice fields and the currency "{currency}"')
+def step_then_evolved_record(context, currency):
+    """Check that the record kept the written fields and took the default of the added one."""
+    scenario_context = get_current_scenario_context(context)
+    expected = {**scenario_context.get("expected").model_dump(mode="json"), "currency": currency}
+    result = scenario_context.get("result")
+    assert result == expected, f"Unexpected record {result!r}"
+
+
+@then("the writer schema should have been resolved through the registry")
+def step_then_writer_schema_resolved(context):
+    """Check that the reader looked up the schema id of the writer."""
+    scenario_context = get_current_scenario_context(context)
+    writer_schema_id = scenario_context.get("writer")._schema_ids["invoices"]
+    reader = scenario_context.get("reader")
+    assert list(reader._writer_schemas) == [writer_schema_id], f"Unexpected writer schemas {reader._writer_schemas}"
+    assert reader._writer_schemas[writer_schema_id] is not reader._parsed_schema, "The writer schema should differ"
+
+
+@then("the serialization should fail with an invalid format error")
+@then("the deserialization should fail with an invalid format error")
+def step_then_invalid_format_error(context):
+    """Check that the value was rejected with an InvalidFormatError."""
+    error = get_current_scenario_context(context).get("error")
+    assert isinstance(error, InvalidFormatError), f"Expected an InvalidFormatError, got {error!r}"
+
+
+@given("a Kafka producer for an unreachable broker with an orjson value serializer and a string key serializer")
+def step_given_producer_with_serializers(context):
+    """Set up a producer whose messages fail delivery, so their encoded payloads are reported back."""
+    producer = KafkaProducerAdapter(
+        "invoices",
+        kafka_configs=KafkaConfig(BROKERS_LIST=["localhost:1"], DELIVERY_TIMEOUT_MS=1000),
+        value_serializer=OrjsonSerializer(),
+        key_serializer=StringSerializer(),
+    )
+    context.add_cleanup(producer.close, 5)
+    get_current_scenario_context(context).store("producer", producer)
+
+
+@when("a batch of {count:d} invoice DTOs keyed by their number is produced")
+def step_when_invoice_batch_produced(context, count):
+    """Produce invoices keyed by their number."""
+    scenario_context = get_current_scenario_context(context)
+    invoices = [build_invoice(index) for index in range(count)]
+    scenario_context.store("invoices", invoices)
+    records = [KafkaRecord(invoice, key=invoice.number) for invoice in invoices]
+    scenario_context.store("result", scenario_context.get("producer").produce_batch(records))
+
+
+@then("the failed messages should carry the orjson encoding of the invoices and their numbers as keys")
+def step_then_failed_messages_encoded(context):
+    """Check the payloads reported by the failed deliveries."""
+    scenario_context = get_current_scenario_context(context)
+    failed = sorted(scenario_context.get("result").failed, key=lambda message: message.key())
+    invoices = scenario_context.get("invoices")
+    assert len(failed) == len(invoices), f"Expected {len(invoices)} failed messages, got {len(failed)}"
+    for message, invoice in zip(failed, invoices, strict=True):
+        assert message.key() == invoice.number.encode(), f"Unexpected key {message.key()!r}"
+        assert InvoiceDTO.model_validate(orjson.loads(message.value())) == invoice, "Unexpected value"
+
+
+@given("a Kafka consumer with an orjson value serializer decoding in a process pool")
+def step_given_consumer_with_pool(context):
+    """Set up a consumer decoding with a process pool, its client replaced by a fake."""
+    executor = ProcessPoolExecutor(max_workers=2)
+    context.add_cleanup(executor.shutdown)
+    consumer = KafkaConsumerAdapter(
+        "serializer-group",
+        topic_list=["invoices"],
+        kafka_configs=KafkaConfig(BROKERS_LIST=["localhost:1"]),
+        value_serializer=OrjsonSerializer(),
+        deserialize_executor=executor,
+    )
+    consumer._adapter.close()
+    get_current_scenario_context(context).store("consumer", consumer)
+
+
+@given("its client delivers {count:d} JSON messages, a tombstone and a malformed message")
+def step_given_client_messages(context, count):
+    """Deliver valid JSON messages followed by a tombstone and a malformed message."""
+    messages = [
+        Message(topic="invoices", partition=0, offset=offset, value=orjson.dumps({"number": offset}))
+        for offset in range(count)
+    ]
+    messages.append(Message(topic="invoices", partition=0, offset=count, value=None))
+    messages.append(Message(topic="invoices", partition=0, offset=count + 1, value=b"{malformed"))
+    get_current_scenario_context(context).get("consumer")._adapter = FakeConsumerClient(messages)
+
+
+@when("the consumer decodes a batch")
+def step_when_consumer_decodes(context):
+    """Consume and decode a batch."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("decoded", scenario_context.get("consumer").consume_decoded(1000, 0))
+
+
+@then("{count:d} messages should be decoded without errors")
+def step_then_decoded_without_errors(context, count):
+    """Check the values of the valid messages."""
+    decoded = get_current_scenario_context(context).get("decoded")[:count]
+    assert all(item.error is None for item in decoded), "Valid messages should decode without errors"
+    assert [item.value for item in decoded] == [{"number": offset} for offset in range(count)], "Unexpected values"
+    assert all(
+        item.message.offset() == offset for offset, item in enumerate(decoded)
+    ), "Messages should keep their order"
+
+
+@then("the tombstone should be decoded to None without an error")
+def step_then_tombstone_decoded(context):
+    """Check that the tombstone has no value and no error."""
+    tombstone = get_current_scenario_context(context).get("decoded")[-2]
+    assert tombstone.value is None, f"Unexpected value {tombstone.value!r}"
+    assert tombstone.error is None, f"Unexpected error {tombstone.error!r}"
+
+
+@then("the malformed message should be decoded with an invalid format error")
+def step_then_malformed_decoded(context):
+    """Check that the malformed message reports its error."""
+    malformed = get_current_scenario_context(context).get("decoded")[-1]
+    assert malformed.value is None, f"Unexpected value {malformed.value!r}"
+    assert isinstance(malformed.error, InvalidFormatError), f"Unexpected error {malformed.error!r}"
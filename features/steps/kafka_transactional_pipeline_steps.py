@@ -0,0 +1,241 @@
+"""Implementation of steps for testing the transactional consume-transform-produce pipeline of Kafka."""
+
+from behave import given, then, when
+from confluent_kafka import KafkaError, KafkaException, Message
+from features.test_helpers import get_current_scenario_context
+from pydantic import ValidationError
+
+from archipy.adapters.kafka.adapters import KafkaConsumerAdapter, KafkaProducerAdapter
+from archipy.adapters.kafka.ports import KafkaRecord
+from archipy.adapters.kafka.transactional import KafkaTransactionalPipeline
+from archipy.configs.config_template import KafkaConfig
+
+GROUP_METADATA = "pipeline-group-metadata"
+
+
+class FakeConsumerClient:
+    """Stands in for the confluent-kafka consumer, returning preset batches and recording seeks."""
+
+    def __init__(self):
+        self.batches = []
+        self.seeks = {}
+
+    def consume(self, num_messages, timeout):
+        return self.batches.pop(0) if self.batches else []
+
+    def seek(self, partition):
+        self.seeks[partition.partition] = partition.offset
+
+    def consumer_group_metadata(self):
+        return GROUP_METADATA
+
+    def close(self):
+        pass
+
+
+class FakeTransactionalProducerClient:
+    """Stands in for a transactional confluent-kafka producer, keeping the output of committed transactions."""
+
+    def __init__(self):
+        self.initialized = False
+        self.open = False
+        self.pending = []
+        self.pending_offsets = {}
+        self.committed = []
+        self.committed_offsets = {}
+        self.commits = 0
+        self.aborts = 0
+        self.failing_commits = 0
+
+    def init_transactions(self, timeout):
+        self.initialized = True
+
+    def begin_transaction(self):
+        assert self.initialized, "Transactions should be initialized first"
+        assert not self.open, "A transaction is already open"
+        self.open = True
+
+    def produce(self, topic, value, key, partition, callback, timestamp, headers):
+        assert self.open, "Messages should be produced in a transaction"
+        self.pending.append((topic, value, key))
+
+    def poll(self, timeout):
+        return 0
+
+    def send_offsets_to_transaction(self, offsets, group_metadata, timeout):
+        assert group_metadata == GROUP_METADATA, f"Unexpected group metadata {group_metadata}"
+        self.pending_offsets = {(offset.topic, offset.partition): offset.offset for offset in offsets}
+
+    def commit_transaction(self, timeout):
+        if self.failing_commits:
+            self.failing_commits -= 1
+            raise KafkaException(KafkaError(KafkaError.INVALID_PRODUCER_EPOCH, txn_requires_abort=True))
+        self.committed += self.pending
+        self.committed_offsets.update(self.pending_offsets)
+        self.commits += 1
+        self._finish()
+
+    def abort_transaction(self, timeout):
+        self.aborts += 1
+        self._finish()
+
+    def _finish(self):
+        self.open = False
+        self.pending = []
+        self.pending_offsets = {}
+
+
+def uppercase(message):
+    """Transform a message into one record holding its uppercased value."""
+    return [KafkaRecord(value=message.value().upper(), key=message.key())]
+
+
+def partition_messages(partition, first_offset, count):
+    """Build messages of a partition with consecutive offsets."""
+    return [
+        Message(topic="orders", partition=partition, offset=offset, key=b"k", value=f"order-{offset}".encode())
+        for offset in range(first_offset, first_offset + count)
+    ]
+
+
+@given(
+    "a transactional pipeline whose consumer delivers {first:d} messages on partition 0 "
+    "then {second:d} messages on partition 1",
+)
+def step_given_pipeline(context, first, second):
+    """Set up a pipeline whose clients are replaced by fakes."""
+    consumer = KafkaConsumerAdapter(
+        "pipeline-group",
+        topic_list=["orders"],
+        kafka_configs=KafkaConfig(BROKERS_LIST=["localhost:1"]),
+    )
+    consumer._adapter.close()
+    consumer._adapter = FakeConsumerClient()
+    consumer._adapter.batches = [partition_messages(0, 0, first), partition_messages(1, 5, second)]
+    producer = KafkaProducerAdapter(
+        "orders-out",
+        kafka_configs=KafkaConfig(
+            BROKERS_LIST=["localhost:1"],
+            TRANSACTIONAL_ID="orders-pipeline",
+            ENABLE_IDEMPOTENCE=True,
+            DELIVERY_TIMEOUT_MS=1000,
+        ),
+    )
+    producer._adapter = FakeTransactionalProducerClient()
+    pipeline = KafkaTransactionalPipeline(consumer, producer, ["orders"], uppercase, transaction_interval_ms=1000)
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("pipeline", pipeline)
+    scenario_context.store(
+        "expected_values", [message.value().upper() for batch in consumer._adapter.batches for message in batch]
+    )
+
+
+@given("the producer fails the next commit with an abortable error")
+def step_given_failing_commit(context):
+    """Make the next commit of the producer fail with an error requiring an abort."""
+    get_current_scenario_context(context).get("pipeline").producer._adapter.failing_commits = 1
+
+
+@given("the transform fails on the last message")
+def step_given_failing_transform(context):
+    """Replace the transform with one failing on the last message of partition 1."""
+    pipeline = get_current_scenario_context(context).get("pipeline")
+
+    def transform(message):
+        if message.partition() == 1 and message.offset() == 6:
+            raise ValueError("Malformed order")
+        return uppercase(message)
+
+    pipeline.transform = transform
+
+
+@when("the pipeline processes a transaction")
+def step_when_process(context):
+    """Process one transaction."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("committed_count", scenario_context.get("pipeline").process())
+
+
+@when("the pipeline processes a transaction expecting an error")
+def step_when_process_with_error(context):
+    """Process one transaction and keep the error it raises."""
+    scenario_context = get_current_scenario_context(context)
+    try:
+        scenario_context.get("pipeline").process()
+    except ValueError as error:
+        scenario_context.store("error", error)
+
+
+@when("a transactional configuration delivers for longer than its transaction timeout")
+def step_when_invalid_configuration(context):
+    """Create a transactional configuration whose delivery timeout exceeds the transaction timeout."""
+    scenario_context = get_current_scenario_context(context)
+    try:
+        KafkaConfig(
+            TRANSACTIONAL_ID="orders-pipeline",
+            ENABLE_IDEMPOTENCE=True,
+            DELIVERY_TIMEOUT_MS=180000,
+            TRANSACTION_TIMEOUT_MS=120000,
+        )
+    except ValidationError as error:
+        scenario_context.store("error", error)
+
+
+@then("{count:d} messages should be committed in {transactions:d} {noun}")
+def step_then_committed(context, count, transactions, noun):
+    """Check the number of committed messages and transactions."""
+    scenario_context = get_current_scenario_context(context)
+    client = scenario_context.get("pipeline").producer._adapter
+    committed_count = scenario_context.get("committed_count")
+    assert committed_count == count, f"Expected {count} committed messages, got {committed_count}"
+    assert client.commits == transactions, f"Expected {transactions} transactions, got {client.commits}"
+    assert not client.open, "No transaction should be left open"
+
+
+@then("the committed output should hold the {count:d} transformed messages")
+def step_then_committed_output(context, count):
+    """Check the records committed to the output topic."""
+    scenario_context = get_current_scenario_context(context)
+    committed = scenario_context.get("pipeline").producer._adapter.committed
+    expected = [("orders-out", value, b"k") for value in scenario_context.get("expected_values")]
+    assert len(committed) == count, f"Expected {count} records, got {len(committed)}"
+    assert committed == expected, f"Expected {expected}, got {committed}"
+
+
+@then("the committed offsets should be {first:d} on partition 0 and {second:d} on partition 1")
+def step_then_committed_offsets(context, first, second):
+    """Check the offsets committed with the transaction."""
+    offsets = get_current_scenario_context(context).get("pipeline").producer._adapter.committed_offsets
+    expected = {("orders", 0): first, ("orders", 1): second}
+    assert offsets == expected, f"Expected offsets {expected}, got {offsets}"
+
+
+@then("{count:d} transaction should be aborted")
+def step_then_aborted(context, count):
+    """Check that the transaction was aborted without committing output."""
+    client = get_current_scenario_context(context).get("pipeline").producer._adapter
+    assert client.aborts == count, f"Expected {count} aborted transactions, got {client.aborts}"
+    assert client.committed == [], f"No output should be committed, got {client.committed}"
+    assert client.committed_offsets == {}, f"No offsets should be committed, got {client.committed_offsets}"
+
+
+@then("the consumer should be rewound to {first:d} on partition 0 and {second:d} on partition 1")
+def step_then_rewound(context, first, second):
+    """Check that the consumer was rewound to the first message of the batch of each partition."""
+    seeks = get_current_scenario_context(context).get("pipeline").consumer._adapter.seeks
+    assert seeks == {0: first, 1: second}, f"Expected seeks to {first} and {second}, got {seeks}"
+
+
+@then("the transform error should be raised")
+def step_then_transform_error(context):
+    """Check that the error of the transform was raised."""
+    error = get_current_scenario_context(context).get("error")
+    assert isinstance(error, ValueError), f"Expected the transform error, got {error!r}"
+
+
+@then("the configuration should be rejected")
+def step_then_configuration_rejected(context):
+    """Check that the configuration was rejected."""
+    error = get_current_scenario_context(context).get("error")
+    assert error is not None, "The configuration should be rejected"
+    assert "TRANSACTION_TIMEOUT_MS" in str(error), f"Unexpected error: {error}"
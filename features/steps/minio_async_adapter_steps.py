@@ -0,0 +1,212 @@
+"""Implementation of steps for testing the async MinIO adapter."""
+
+import asyncio
+import itertools
+import os
+import tempfile
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.minio.adapters import AsyncMinioAdapter
+from archipy.configs.config_template import MinioConfig
+
+MIB = 1024 * 1024
+
+
+def _data(size):
+    """Build data of a size whose parts all differ, so misplaced parts are noticed."""
+    return bytes(itertools.islice(itertools.cycle(range(251)), size))
+
+
+def _names(count, pattern):
+    return [pattern.replace("{number}", str(number)) for number in range(count)]
+
+
+def _split(names):
+    return [name.strip() for name in names.split(",")]
+
+
+def _run(context, call):
+    """Run a call of the async adapter in a fresh event loop, closing its connections afterwards."""
+    adapter = get_current_scenario_context(context).get("adapter")
+
+    async def run():
+        try:
+            return await call(adapter)
+        finally:
+            await adapter.close()
+
+    return asyncio.run(run())
+
+
+@given("an async MinIO adapter on the server")
+def step_given_async_adapter(context):
+    scenario_context = get_current_scenario_context(context)
+    config = MinioConfig(
+        ENDPOINT=scenario_context.get("server").endpoint,
+        ACCESS_KEY="test-access-key",
+        SECRET_KEY="test-secret-key",
+        REGION="us-east-1",
+    )
+    scenario_context.store("adapter", AsyncMinioAdapter(config))
+
+
+@given('bucket "{bucket}" holds {count:d} objects named "{pattern}"')
+def step_given_objects(context, bucket, count, pattern):
+    server = get_current_scenario_context(context).get("server")
+    for name in _names(count, pattern):
+        server.store(bucket, name, name.encode())
+
+
+@given('the server refuses to delete "{object_name}"')
+def step_given_failing_delete(context, object_name):
+    get_current_scenario_context(context).get("server").failing_deletes.add(object_name)
+
+
+@when('I create the bucket "{bucket}" through the async adapter')
+def step_when_create_bucket(context, bucket):
+    _run(context, lambda adapter: adapter.make_bucket(bucket))
+
+
+@when('I upload a file holding "{content}" as "{object_name}" to "{bucket}" through the async adapter')
+def step_when_upload_file(context, content, object_name, bucket):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "upload")
+        with open(path, "w") as file:
+            file.write(content)
+        _run(context, lambda adapter: adapter.put_object(bucket, object_name, path))
+
+
+@when('I stream {size:d} MiB to "{object_name}" in "{bucket}" in {part_size:d} MiB parts through the async adapter')
+def step_when_stream(context, size, object_name, bucket, part_size):
+    scenario_context = get_current_scenario_context(context)
+    data = _data(size * MIB)
+    scenario_context.store("data", data)
+
+    async def chunks():
+        for offset in range(0, len(data), MIB):
+            yield data[offset : offset + MIB]
+
+    result = _run(context, lambda adapter: adapter.put_stream(bucket, object_name, chunks(), part_size=part_size * MIB))
+    scenario_context.store("result", result)
+
+
+@when('I stat "{object_names}" in "{bucket}" through the async adapter')
+def step_when_stat_objects(context, object_names, bucket):
+    results = _run(context, lambda adapter: adapter.stat_objects(bucket, _split(object_names)))
+    get_current_scenario_context(context).store("stats", results)
+
+
+@when('I remove the {count:d} objects named "{pattern}" from "{bucket}" through the async adapter')
+def step_when_remove_many(context, count, pattern, bucket):
+    failures = _run(context, lambda adapter: adapter.remove_objects(bucket, _names(count, pattern)))
+    get_current_scenario_context(context).store("failures", failures)
+
+
+@when('I remove "{object_names}" from "{bucket}" through the async adapter')
+def step_when_remove(context, object_names, bucket):
+    failures = _run(context, lambda adapter: adapter.remove_objects(bucket, _split(object_names)))
+    get_current_scenario_context(context).store("failures", failures)
+
+
+@when(
+    'I copy the {count:d} objects named "{pattern}" from "{source}" to "{destination}" {concurrency:d} at a time '
+    "through the async adapter",
+)
+def step_when_copy(context, count, pattern, source, destination, concurrency):
+    get_current_scenario_context(context).get("server").buckets.setdefault(destination, {})
+    names = _names(count, pattern)
+    copies = _run(context, lambda adapter: adapter.copy_objects(source, destination, names, concurrency=concurrency))
+    get_current_scenario_context(context).store("copies", copies)
+
+
+@when('I generate a presigned GET URL for "{object_name}" in "{bucket}" through the async adapter')
+def step_when_presign(context, object_name, bucket):
+    url = _run(context, lambda adapter: adapter.presigned_get_object(bucket, object_name))
+    get_current_scenario_context(context).store("url", url)
+
+
+@then('the async adapter should list the buckets "{buckets}"')
+def step_then_buckets(context, buckets):
+    listed = _run(context, lambda adapter: adapter.list_buckets())
+    assert [bucket["name"] for bucket in listed] == _split(buckets), listed
+
+
+@then('the async adapter should list "{object_name}" in "{bucket}"')
+def step_then_listed(context, object_name, bucket):
+    listed = _run(context, lambda adapter: adapter.list_objects(bucket))
+    assert [entry["object_name"] for entry in listed] == [object_name], listed
+
+
+@then('downloading "{object_name}" from "{bucket}" to a file through the async adapter should return "{content}"')
+def step_then_download_file(context, object_name, bucket, content):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "download")
+        _run(context, lambda adapter: adapter.get_object(bucket, object_name, path))
+        with open(path) as file:
+            assert file.read() == content
+        assert os.listdir(directory) == ["download"], os.listdir(directory)
+
+
+@then(
+    'downloading "{object_name}" from "{bucket}" in {chunk:d} MiB chunks through the async adapter '
+    "should return the streamed data",
+)
+def step_then_download_stream(context, object_name, bucket, chunk):
+    async def download(adapter):
+        return [part async for part in adapter.get_stream(bucket, object_name, part_size=chunk * MIB)]
+
+    chunks = _run(context, download)
+    assert len(chunks) == len(get_current_scenario_context(context).get("data")) // (chunk * MIB)
+    assert b"".join(chunks) == get_current_scenario_context(context).get("data")
+
+
+@then('the batch stat should report sizes "{sizes}"')
+def step_then_stats(context, sizes):
+    stats = get_current_scenario_context(context).get("stats")
+    reported = {name: "none" if stat is None else str(stat["size"]) for name, stat in stats.items()}
+    assert reported == dict(entry.split("=") for entry in _split(sizes)), reported
+
+
+@then('bucket "{bucket}" should hold no objects')
+def step_then_empty(context, bucket):
+    assert not get_current_scenario_context(context).get("server").objects(bucket)
+
+
+@then("the async adapter should have sent {count:d} multi-object delete requests")
+def step_then_delete_requests(context, count):
+    server = get_current_scenario_context(context).get("server")
+    deletes = [path for method, path, query in server.requests if method == "POST" and "delete" in query]
+    assert len(deletes) == count, deletes
+
+
+@then("the batch delete should report no failures")
+def step_then_no_failures(context):
+    assert get_current_scenario_context(context).get("failures") == []
+
+
+@then('the batch delete should report "{object_name}" with the code "{code}"')
+def step_then_failure(context, object_name, code):
+    failures = get_current_scenario_context(context).get("failures")
+    assert [(failure["object_name"], failure["code"]) for failure in failures] == [(object_name, code)], failures
+
+
+@then('bucket "{destination}" should hold copies of the {count:d} objects named "{pattern}" of "{source}"')
+def step_then_copies(context, destination, count, pattern, source):
+    scenario_context = get_current_scenario_context(context)
+    server = scenario_context.get("server")
+    names = _names(count, pattern)
+    assert server.objects(destination) == {name: server.objects(source)[name] for name in names}
+    assert [copy["object_name"] for copy in scenario_context.get("copies")] == names
+
+
+@then("the presigned URL should carry a signature")
+def step_then_signed(context):
+    url = get_current_scenario_context(context).get("url")
+    assert "X-Amz-Signature=" in url and "X-Amz-Expires=3600" in url, url
+
+
+@then("the server should have received no requests")
+def step_then_no_requests(context):
+    assert get_current_scenario_context(context).get("server").requests == []
@@ -0,0 +1,188 @@
+"""Implementation of steps for testing the metadata cache of the MinIO adapter."""
+
+import io
+import time
+
+from behave import given, then, when
+from features.fake_minio import FakeS3Server
+from features.test_helpers import get_current_scenario_context
+from prometheus_client import CollectorRegistry
+
+from archipy.adapters.minio.adapters import MinioAdapter
+from archipy.adapters.minio.metrics import MinioMetrics
+from archipy.configs.config_template import MinioConfig
+from archipy.models.errors import NotFoundError
+
+
+def _adapter(server, **kwargs):
+    config = MinioConfig(
+        ENDPOINT=server.endpoint,
+        ACCESS_KEY="test-access-key",
+        SECRET_KEY="test-secret-key",
+        REGION="us-east-1",
+        **kwargs,
+    )
+    return MinioAdapter(config)
+
+
+def _reads(server, kind):
+    """Returns the requests of a kind of metadata read the server received."""
+    if kind == "stat":
+        return [path for method, path, _ in server.requests if method == "HEAD" and path.count("/") > 1]
+    return [path for method, path, query in server.requests if method == "GET" and "list-type" in query]
+
+
+@given('bucket "{bucket}" holds "{object_name}" of {size:d} bytes')
+def step_given_object_bytes(context, bucket, object_name, size):
+    get_current_scenario_context(context).get("server").store(bucket, object_name, b"x" * size)
+
+
+@given('bucket "{bucket}" has the policy "{policy}"')
+def step_given_policy(context, bucket, policy):
+    get_current_scenario_context(context).get("server").policies[bucket] = policy
+
+
+@given('a second in-memory S3 server where bucket "{bucket}" holds "{object_name}" of {size:d} bytes')
+def step_given_second_server(context, bucket, object_name, size):
+    server = FakeS3Server()
+    server.store(bucket, object_name, b"x" * size)
+    context.add_cleanup(server.stop)
+    get_current_scenario_context(context).store("second_server", server)
+
+
+@given("a caching MinIO adapter on the server")
+def step_given_caching_adapter(context):
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("adapter", _adapter(scenario_context.get("server")))
+
+
+@given("a caching MinIO adapter on the second server")
+def step_given_second_adapter(context):
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("second_adapter", _adapter(scenario_context.get("second_server")))
+
+
+@given("a caching MinIO adapter on the server keeping entries for {ttl:d} milliseconds")
+def step_given_expiring_adapter(context, ttl):
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("adapter", _adapter(scenario_context.get("server"), CACHE_TTL_SECONDS=ttl / 1000))
+
+
+@given("a MinIO adapter on the server with caching disabled")
+def step_given_uncached_adapter(context):
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("adapter", _adapter(scenario_context.get("server"), CACHE_ENABLED=False))
+
+
+@given("cache metrics exported to a fresh registry")
+def step_given_metrics(context):
+    registry = CollectorRegistry()
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("registry", registry)
+    scenario_context.get("adapter").cache.metrics = MinioMetrics(registry)
+
+
+@when('I stat "{object_name}" in "{bucket}" {count:d} times')
+def step_when_stat(context, object_name, bucket, count):
+    adapter = get_current_scenario_context(context).get("adapter")
+    for _ in range(count):
+        adapter.stat_object(bucket, object_name)
+
+
+@when('I try to stat "{object_name}" in "{bucket}"')
+def step_when_try_stat(context, object_name, bucket):
+    scenario_context = get_current_scenario_context(context)
+    try:
+        scenario_context.get("adapter").stat_object(bucket, object_name)
+    except NotFoundError as e:
+        scenario_context.store("error", e)
+
+
+@when('I list "{prefix}" in "{bucket}" {count:d} times')
+def step_when_list(context, prefix, bucket, count):
+    scenario_context = get_current_scenario_context(context)
+    for _ in range(count):
+        listing = scenario_context.get("adapter").list_objects(bucket, prefix)
+    scenario_context.store(f"listing {bucket}/{prefix}", listing)
+
+
+@when('I upload "{object_name}" of {size:d} bytes to "{bucket}" through the adapter')
+def step_when_upload(context, object_name, size, bucket):
+    get_current_scenario_context(context).get("adapter").put_stream(bucket, object_name, io.BytesIO(b"y" * size))
+
+
+@when('I remove "{object_name}" from "{bucket}" through the adapter')
+def step_when_remove(context, object_name, bucket):
+    get_current_scenario_context(context).get("adapter").remove_object(bucket, object_name)
+
+
+@when('I read the policy of "{bucket}"')
+def step_when_read_policy(context, bucket):
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("policy", scenario_context.get("adapter").get_bucket_policy(bucket)["policy"])
+
+
+@when('I set the policy of "{bucket}" to "{policy}" through the adapter')
+def step_when_set_policy(context, bucket, policy):
+    get_current_scenario_context(context).get("adapter").set_bucket_policy(bucket, policy)
+
+
+@when('both adapters stat "{object_name}" in "{bucket}"')
+def step_when_both_stat(context, object_name, bucket):
+    scenario_context = get_current_scenario_context(context)
+    sizes = [
+        scenario_context.get(name).stat_object(bucket, object_name)["size"] for name in ("adapter", "second_adapter")
+    ]
+    scenario_context.store("sizes", sizes)
+
+
+@when("I wait {duration:d} milliseconds")
+def step_when_wait(context, duration):
+    time.sleep(duration / 1000)
+
+
+@then("the server should have answered {count:d} {kind} requests")
+def step_then_reads(context, count, kind):
+    reads = _reads(get_current_scenario_context(context).get("server"), kind)
+    assert len(reads) == count, reads
+
+
+@then("the adapter cache should have a hit ratio of {ratio:f}")
+def step_then_hit_ratio(context, ratio):
+    cache = get_current_scenario_context(context).get("adapter").cache
+    assert round(cache.hit_ratio, 2) == ratio, cache.hit_ratio
+
+
+@then('the last listing of "{prefix}" in "{bucket}" should include "{object_name}"')
+def step_then_listing(context, prefix, bucket, object_name):
+    listing = get_current_scenario_context(context).get(f"listing {bucket}/{prefix}")
+    assert object_name in [obj["object_name"] for obj in listing], listing
+
+
+@then("the stat should fail with a NotFoundError")
+def step_then_not_found(context):
+    assert isinstance(get_current_scenario_context(context).get("error"), NotFoundError)
+
+
+@then('the policy read should be "{policy}"')
+def step_then_policy(context, policy):
+    assert get_current_scenario_context(context).get("policy") == policy
+
+
+@then("the adapters should report sizes of {first:d} and {second:d} bytes")
+def step_then_sizes(context, first, second):
+    assert get_current_scenario_context(context).get("sizes") == [first, second]
+
+
+@then('the metrics should count {hits:d} "{operation}" cache hits and {misses:d} misses')
+def step_then_lookup_metrics(context, hits, operation, misses):
+    registry = get_current_scenario_context(context).get("registry")
+    for result, count in (("hit", hits), ("miss", misses)):
+        labels = {"operation": operation, "result": result}
+        assert registry.get_sample_value("minio_cache_lookups_total", labels) == count, result
+
+
+@then('the metrics should count {count:d} "{operation}" cache invalidations')
+def step_then_invalidation_metrics(context, count, operation):
+    registry = get_current_scenario_context(context).get("registry")
+    assert registry.get_sample_value("minio_cache_invalidations_total", {"operation": operation}) == count
@@ -0,0 +1,214 @@
+"""Implementation of steps for testing the streaming transfers of the MinIO adapter."""
+
+import io
+import itertools
+
+from behave import given, then, when
+from features.fake_minio import FakeS3Server
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.minio.adapters import MinioAdapter
+from archipy.configs.config_template import MinioConfig
+from archipy.models.errors import InvalidArgumentError, StorageError
+
+KIB = 1024
+MIB = 1024 * KIB
+
+
+def _data(size):
+    """Build data of a size whose parts all differ, so misplaced parts are noticed."""
+    return bytes(itertools.islice(itertools.cycle(range(251)), size))
+
+
+def _chunks(data, chunk_size):
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+async def _async_chunks(data, chunk_size):
+    for chunk in _chunks(data, chunk_size):
+        yield chunk
+
+
+def _stream(context, bucket, object_name, data, source, **kwargs):
+    """Stream a source through the adapter, storing the data sent and the error raised."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("data", data)
+    try:
+        scenario_context.store(
+            "result", scenario_context.get("adapter").put_stream(bucket, object_name, source, **kwargs)
+        )
+    except (InvalidArgumentError, StorageError) as e:
+        scenario_context.store("error", e)
+
+
+def _part_uploads(context):
+    server = get_current_scenario_context(context).get("server")
+    return [query for method, _, query in server.requests if method == "PUT" and "partNumber" in query]
+
+
+@given('an in-memory S3 server with a bucket "{bucket}"')
+def step_given_server(context, bucket):
+    server = FakeS3Server()
+    server.buckets[bucket] = {}
+    context.add_cleanup(server.stop)
+    get_current_scenario_context(context).store("server", server)
+
+
+@given("a MinIO adapter transferring {part_size:d} MiB parts {concurrency:d} at a time")
+def step_given_adapter(context, part_size, concurrency):
+    scenario_context = get_current_scenario_context(context)
+    config = MinioConfig(
+        ENDPOINT=scenario_context.get("server").endpoint,
+        ACCESS_KEY="test-access-key",
+        SECRET_KEY="test-secret-key",
+        REGION="us-east-1",
+        PART_SIZE=part_size * MIB,
+        PART_CONCURRENCY=concurrency,
+    )
+    scenario_context.store("adapter", MinioAdapter(config))
+
+
+@given("the server takes {delay:d} milliseconds per part")
+def step_given_delay(context, delay):
+    get_current_scenario_context(context).get("server").request_delay = delay / 1000
+
+
+@given("the server rejects part {number:d}")
+def step_given_rejected_part(context, number):
+    get_current_scenario_context(context).get("server").failing_parts.add(number)
+
+
+@given('bucket "{bucket}" holds an object "{object_name}" of {size:d} MiB')
+def step_given_object(context, bucket, object_name, size):
+    get_current_scenario_context(context).get("server").store(bucket, object_name, _data(size * MIB))
+
+
+@when('I stream {size:d} MiB from a file-like object to "{object_name}" in "{bucket}"')
+@when('I try to stream {size:d} MiB from a file-like object to "{object_name}" in "{bucket}"')
+def step_when_stream_file(context, size, object_name, bucket):
+    data = _data(size * MIB)
+    _stream(context, bucket, object_name, data, io.BytesIO(data))
+
+
+@when('I stream {size:d} {unit} in chunks of {chunk:d} KiB from a generator to "{object_name}" in "{bucket}"')
+def step_when_stream_generator(context, size, unit, chunk, object_name, bucket):
+    data = _data(size * (MIB if unit == "MiB" else KIB))
+    _stream(context, bucket, object_name, data, _chunks(data, chunk * KIB))
+
+
+@when('I stream {size:d} MiB in chunks of {chunk:d} MiB from an async generator to "{object_name}" in "{bucket}"')
+def step_when_stream_async_generator(context, size, chunk, object_name, bucket):
+    data = _data(size * MIB)
+    _stream(context, bucket, object_name, data, _async_chunks(data, chunk * MIB))
+
+
+@when('I stream {size:d} MiB in chunks of {chunk:d} MiB from a generator to "{object_name}" in "{bucket}"')
+def step_when_stream_tracked_generator(context, size, chunk, object_name, bucket):
+    server = get_current_scenario_context(context).get("server")
+    data = _data(size * MIB)
+    read_ahead = []
+
+    def chunks():
+        for offset, part in zip(itertools.count(0, chunk * MIB), _chunks(data, chunk * MIB), strict=False):
+            read_ahead.append(offset + len(part) - server.received_part_bytes)
+            yield part
+
+    get_current_scenario_context(context).store("read_ahead", read_ahead)
+    _stream(context, bucket, object_name, data, chunks())
+
+
+@when('I try to stream {size:d} MiB in {part_size:d} MiB parts to "{object_name}" in "{bucket}"')
+def step_when_stream_small_parts(context, size, part_size, object_name, bucket):
+    data = _data(size * MIB)
+    _stream(context, bucket, object_name, data, io.BytesIO(data), part_size=part_size * MIB)
+
+
+@when('I download "{object_name}" from "{bucket}" as a stream of {chunk:d} MiB chunks')
+def step_when_download(context, object_name, bucket, chunk):
+    scenario_context = get_current_scenario_context(context)
+    chunks = list(scenario_context.get("adapter").get_stream(bucket, object_name, part_size=chunk * MIB))
+    scenario_context.store("chunks", chunks)
+
+
+@when(
+    'I download "{object_name}" from "{bucket}" in {chunk:d} MiB chunks while it is overwritten after the first chunk',
+)
+def step_when_download_overwritten(context, object_name, bucket, chunk):
+    scenario_context = get_current_scenario_context(context)
+    chunks = scenario_context.get("adapter").get_stream(bucket, object_name, part_size=chunk * MIB)
+    try:
+        next(chunks)
+        scenario_context.get("server").store(bucket, object_name, b"new version")
+        list(chunks)
+    except StorageError as e:
+        scenario_context.store("error", e)
+
+
+@then('object "{object_name}" in "{bucket}" should hold the streamed data')
+def step_then_object_data(context, object_name, bucket):
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("error") is None, scenario_context.get("error")
+    data = scenario_context.get("data")
+    assert scenario_context.get("server").objects(bucket)[object_name] == data
+    result = scenario_context.get("result")
+    assert (result["object_name"], result["size"]) == (object_name, len(data)), result
+
+
+@then("the upload should have been sent in {count:d} parts")
+def step_then_parts(context, count):
+    numbers = sorted(int(query["partNumber"]) for query in _part_uploads(context))
+    assert numbers == list(range(1, count + 1)), numbers
+
+
+@then("the upload should have been sent in a single request")
+def step_then_single_request(context):
+    server = get_current_scenario_context(context).get("server")
+    uploads = [method for method, _, query in server.requests if method in ("PUT", "POST")]
+    assert uploads == ["PUT"] and not _part_uploads(context), server.requests
+
+
+@then("the server should have handled up to {count:d} parts at once")
+def step_then_concurrency(context, count):
+    server = get_current_scenario_context(context).get("server")
+    assert 1 < server.max_active_transfers <= count, server.max_active_transfers
+
+
+@then("the stream should never have been read more than {count:d} parts ahead of the server")
+def step_then_read_ahead(context, count):
+    read_ahead = get_current_scenario_context(context).get("read_ahead")
+    assert max(read_ahead) <= count * 5 * MIB, max(read_ahead) / MIB
+
+
+@then("the transfer should fail with a StorageError")
+def step_then_storage_error(context):
+    assert isinstance(get_current_scenario_context(context).get("error"), StorageError)
+
+
+@then("the transfer should fail with an InvalidArgumentError")
+def step_then_invalid_argument(context):
+    assert isinstance(get_current_scenario_context(context).get("error"), InvalidArgumentError)
+
+
+@then("the multipart upload should have been aborted")
+def step_then_aborted(context):
+    server = get_current_scenario_context(context).get("server")
+    assert len(server.aborted_uploads) == 1 and not server.uploads, (server.aborted_uploads, server.uploads)
+
+
+@then('bucket "{bucket}" should not hold "{object_name}"')
+def step_then_no_object(context, bucket, object_name):
+    assert object_name not in get_current_scenario_context(context).get("server").objects(bucket)
+
+
+@then('the chunks should reassemble object "{object_name}" in "{bucket}"')
+def step_then_chunks(context, object_name, bucket):
+    scenario_context = get_current_scenario_context(context)
+    assert b"".join(scenario_context.get("chunks")) == scenario_context.get("server").objects(bucket)[object_name]
+
+
+@then("the server should have received {count:d} ranged requests")
+def step_then_ranged_requests(context, count):
+    server = get_current_scenario_context(context).get("server")
+    ranged = [path for method, path, _ in server.requests if method == "GET"]
+    assert len(ranged) == count, ranged
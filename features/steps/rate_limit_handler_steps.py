@@ -0,0 +1,186 @@
+"""Implementation of steps for testing FastAPIRestRateLimitHandler and gRPC rate limit interceptors."""
+
+import logging
+
+import grpc
+from behave import given, then, when
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from archipy.adapters.redis.adapters import AsyncRedisAdapter, RedisAdapter
+from archipy.configs.config_template import RedisConfig
+from archipy.helpers.interceptors.fastapi.rate_limit.fastapi_rest_rate_limit_handler import (
+    FastAPIRestRateLimitHandler,
+)
+from archipy.helpers.interceptors.grpc.base.server_interceptor import parse_method_name
+from archipy.helpers.interceptors.grpc.rate_limit import GrpcServerRateLimitInterceptor
+from features.test_helpers import get_current_scenario_context
+
+
+class AbortedError(Exception):
+    """Raised by the fake servicer context when a call is aborted."""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+class FakeServicerContext:
+    """Minimal stand-in for grpc.ServicerContext."""
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.trailing_metadata = None
+
+    def peer(self):
+        return "ipv4:10.0.0.1:51234"
+
+    def invocation_metadata(self):
+        return self.metadata
+
+    def set_trailing_metadata(self, metadata):
+        self.trailing_metadata = metadata
+
+    def abort(self, code, details):
+        raise AbortedError(code)
+
+
+def build_request(path):
+    """Build a minimal Starlette request for the given path."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [],
+        "query_string": b"",
+        "client": ("8.8.8.8", 12345),
+    }
+    return Request(scope)
+
+
+async def send_requests(handler, path, count):
+    """Send requests through the handler and collect the outcomes."""
+    accepted = 0
+    rejections = []
+    for _ in range(count):
+        try:
+            await handler(build_request(path))
+            accepted += 1
+        except HTTPException as exception:
+            rejections.append(exception)
+    return accepted, rejections
+
+
+@given("a rate limit handler allowing {calls_count:d} calls per minute in hybrid mode")
+def step_given_hybrid_rate_limit_handler(context, calls_count):
+    scenario_context = get_current_scenario_context(context)
+    handler = FastAPIRestRateLimitHandler(calls_count=calls_count, minutes=1, local_pre_limit=True)
+    scenario_context.store("rate_limit_handler", handler)
+
+
+@given("Redis is unavailable for the rate limit handler")
+def step_given_redis_unavailable(context):
+    scenario_context = get_current_scenario_context(context)
+    handler = scenario_context.get("rate_limit_handler")
+    handler.engine.redis_client = AsyncRedisAdapter(RedisConfig(MASTER_HOST="127.0.0.1", PORT=1))
+
+
+@when('a client sends {count:d} requests to "{path}"')
+async def step_when_client_sends_requests(context, count, path):
+    scenario_context = get_current_scenario_context(context)
+    handler = scenario_context.get("rate_limit_handler")
+    accepted, rejections = await send_requests(handler, path, count)
+    handler.engine._sync_task.cancel()
+    scenario_context.store("accepted", accepted)
+    scenario_context.store("rejections", rejections)
+
+
+@when('a client sends {count:d} requests to "{path}" and the handler reconciles with Redis')
+async def step_when_client_sends_requests_and_reconciles(context, count, path):
+    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    scenario_context = get_current_scenario_context(context)
+    handler = scenario_context.get("rate_limit_handler")
+    accepted, rejections = await send_requests(handler, path, count)
+    logger.info("Reconciling rate limit hits with an unavailable Redis")
+    await handler.close()
+    scenario_context.store("accepted", accepted)
+    scenario_context.store("rejections", rejections)
+
+
+@then("{count:d} requests should be accepted")
+def step_then_requests_accepted(context, count):
+    scenario_context = get_current_scenario_context(context)
+    accepted = scenario_context.get("accepted")
+    assert accepted == count, f"Expected {count} accepted requests, got {accepted}"
+
+
+@then("{count:d} request should be rejected with status code {status_code:d}")
+def step_then_requests_rejected(context, count, status_code):
+    scenario_context = get_current_scenario_context(context)
+    rejections = scenario_context.get("rejections")
+    assert len(rejections) == count, f"Expected {count} rejected requests, got {len(rejections)}"
+    for rejection in rejections:
+        assert rejection.status_code == status_code
+        assert int(rejection.headers["Retry-After"]) > 0
+
+
+@then("the unreported hits should be kept for the next reconciliation")
+def step_then_unreported_hits_kept(context):
+    scenario_context = get_current_scenario_context(context)
+    handler = scenario_context.get("rate_limit_handler")
+    pending = handler.engine.local_limiter.drain_pending()
+    assert sum(pending.values()) == 2, f"Expected 2 unreported hits, got {pending}"
+
+
+@given(
+    'a gRPC rate limit interceptor allowing {calls_count:d} calls per minute keyed by metadata "{metadata_key}" '
+    "in hybrid mode",
+)
+def step_given_grpc_rate_limit_interceptor(context, calls_count, metadata_key):
+    scenario_context = get_current_scenario_context(context)
+    interceptor = GrpcServerRateLimitInterceptor(
+        calls_count=calls_count,
+        minutes=1,
+        metadata_keys={metadata_key},
+        local_pre_limit=True,
+    )
+    interceptor.engine.redis_client = RedisAdapter(RedisConfig(MASTER_HOST="127.0.0.1", PORT=1))
+    scenario_context.store("grpc_interceptor", interceptor)
+    scenario_context.store("grpc_metadata_key", metadata_key)
+    scenario_context.store("grpc_accepted", 0)
+    scenario_context.store("grpc_aborted", [])
+
+
+@when('user "{user_id}" calls "{method}" {count:d} times through the interceptor')
+def step_when_user_calls_through_interceptor(context, user_id, method, count):
+    scenario_context = get_current_scenario_context(context)
+    interceptor = scenario_context.get("grpc_interceptor")
+    metadata_key = scenario_context.get("grpc_metadata_key")
+    aborted = scenario_context.get("grpc_aborted")
+    accepted = scenario_context.get("grpc_accepted")
+    method_name_model = parse_method_name(method)
+
+    for _ in range(count):
+        servicer_context = FakeServicerContext(((metadata_key, user_id),))
+        try:
+            interceptor.intercept(lambda request, ctx: "ok", object(), servicer_context, method_name_model)
+            accepted += 1
+        except AbortedError as error:
+            aborted.append(error.code)
+    scenario_context.store("grpc_accepted", accepted)
+    interceptor.engine.close()
+
+
+@then("{count:d} gRPC calls should be accepted")
+def step_then_grpc_calls_accepted(context, count):
+    scenario_context = get_current_scenario_context(context)
+    accepted = scenario_context.get("grpc_accepted")
+    assert accepted == count, f"Expected {count} accepted calls, got {accepted}"
+
+
+@then('{count:d} gRPC call should be aborted with status "{status}"')
+def step_then_grpc_calls_aborted(context, count, status):
+    scenario_context = get_current_scenario_context(context)
+    aborted = scenario_context.get("grpc_aborted")
+    assert len(aborted) == count, f"Expected {count} aborted calls, got {len(aborted)}"
+    assert all(code == getattr(grpc.StatusCode, status) for code in aborted)
@@ -0,0 +1,130 @@
+"""Implementation of steps for testing SCAN-based bulk key management."""
+
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.redis.mocks import AsyncRedisMock, RedisMock
+from archipy.configs.config_template import RedisConfig
+
+
+def build_redis_config():
+    """Build the Redis configuration used by the bulk key scenarios."""
+    return RedisConfig(MASTER_HOST="localhost", PORT=6379, DATABASE=0, DECODE_RESPONSES=True)
+
+
+@given('a Redis mock with {count:d} keys prefixed "{prefix}" and {other_count:d} keys prefixed "{other_prefix}"')
+def step_given_redis_mock_with_keys(context, count, prefix, other_count, other_prefix):
+    """Set up a RedisMock holding keys under two prefixes."""
+    redis = RedisMock(redis_config=build_redis_config())
+    redis.mset({f"{prefix}:{index}": index for index in range(count)})
+    if other_count:
+        redis.mset({f"{other_prefix}:{index}": index for index in range(other_count)})
+    get_current_scenario_context(context).store("redis", redis)
+
+
+@when('keys matching "{pattern}" are deleted in batches of {batch_size:d}')
+def step_when_keys_deleted(context, pattern, batch_size):
+    """Delete keys by pattern."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("affected", scenario_context.get("redis").delete_by_pattern(pattern, batch_size=batch_size))
+
+
+@when('keys matching "{pattern}" expire in {seconds:d} seconds')
+def step_when_keys_expire(context, pattern, seconds):
+    """Set the time to live of keys by pattern."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("affected", scenario_context.get("redis").expire_by_pattern(pattern, seconds))
+
+
+@when('keys matching "{pattern}" are deleted at {rate:d} keys per second in batches of {batch_size:d}')
+def step_when_keys_deleted_rate_limited(context, pattern, rate, batch_size):
+    """Delete keys by pattern with a rate limit and measure the duration."""
+    scenario_context = get_current_scenario_context(context)
+    started = time.monotonic()
+    affected = scenario_context.get("redis").delete_by_pattern(
+        pattern,
+        batch_size=batch_size,
+        max_keys_per_second=rate,
+    )
+    scenario_context.store("elapsed_ms", (time.monotonic() - started) * 1000)
+    scenario_context.store("affected", affected)
+
+
+@then("{count:d} keys should have been affected")
+def step_then_keys_affected(context, count):
+    """Verify the number of keys affected by a bulk operation."""
+    affected = get_current_scenario_context(context).get("affected")
+    assert affected == count, f"Expected {count} affected keys, got {affected}"
+
+
+@then('{count:d} keys should match "{pattern}"')
+def step_then_keys_match(context, count, pattern):
+    """Verify the number of keys matching a pattern."""
+    matching = get_current_scenario_context(context).get("redis").count_by_pattern(pattern)
+    assert matching == count, f"Expected {count} keys matching '{pattern}', got {matching}"
+
+
+@then('keys prefixed "{prefix}" should expire within {seconds:d} seconds')
+def step_then_keys_expire(context, prefix, seconds):
+    """Verify every key under a prefix has a time to live."""
+    redis = get_current_scenario_context(context).get("redis")
+    ttls = [redis.ttl(key) for key in redis.scan_iter(f"{prefix}:*")]
+    assert ttls, f"No keys prefixed '{prefix}'"
+    assert all(0 < ttl <= seconds for ttl in ttls), f"Unexpected TTLs: {ttls}"
+
+
+@then('keys prefixed "{prefix}" should not expire')
+def step_then_keys_persist(context, prefix):
+    """Verify no key under a prefix has a time to live."""
+    redis = get_current_scenario_context(context).get("redis")
+    ttls = [redis.ttl(key) for key in redis.scan_iter(f"{prefix}:*")]
+    assert all(ttl == -1 for ttl in ttls), f"Unexpected TTLs: {ttls}"
+
+
+@then("the deletion should have taken at least {milliseconds:d} milliseconds")
+def step_then_deletion_paced(context, milliseconds):
+    """Verify the rate limit slowed the deletion down."""
+    elapsed_ms = get_current_scenario_context(context).get("elapsed_ms")
+    assert elapsed_ms >= milliseconds, f"Deletion took only {elapsed_ms:.0f} ms"
+
+
+@given('an async Redis mock with {count:d} keys prefixed "{prefix}" and {other_count:d} keys prefixed "{other_prefix}"')
+async def step_given_async_redis_mock_with_keys(context, count, prefix, other_count, other_prefix):
+    """Set up an AsyncRedisMock holding keys under two prefixes."""
+    redis = AsyncRedisMock(redis_config=build_redis_config())
+    await redis.mset({f"{prefix}:{index}": index for index in range(count)})
+    await redis.mset({f"{other_prefix}:{index}": index for index in range(other_count)})
+    get_current_scenario_context(context).store("async_redis", redis)
+
+
+@when('async keys matching "{pattern}" are counted and deleted in batches of {batch_size:d}')
+async def step_when_async_keys_counted_and_deleted(context, pattern, batch_size):
+    """Count and delete keys by pattern with the async adapter."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    scenario_context.store("counted", await redis.count_by_pattern(pattern, batch_size=batch_size))
+    scenario_context.store("deleted", await redis.delete_by_pattern(pattern, batch_size=batch_size))
+    scenario_context.store("remaining", await redis.count_by_pattern("*"))
+
+
+@then("{count:d} keys should have been counted asynchronously")
+def step_then_async_counted(context, count):
+    """Verify the async count."""
+    counted = get_current_scenario_context(context).get("counted")
+    assert counted == count, f"Expected {count} counted keys, got {counted}"
+
+
+@then("{count:d} keys should have been deleted asynchronously")
+def step_then_async_deleted(context, count):
+    """Verify the async deletion."""
+    deleted = get_current_scenario_context(context).get("deleted")
+    assert deleted == count, f"Expected {count} deleted keys, got {deleted}"
+
+
+@then("{count:d} keys should remain asynchronously")
+def step_then_async_remaining(context, count):
+    """Verify the keys left after the async deletion."""
+    remaining = get_current_scenario_context(context).get("remaining")
+    assert remaining == count, f"Expected {count} remaining keys, got {remaining}"
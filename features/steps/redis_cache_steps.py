@@ -0,0 +1,156 @@
+"""Implementation of steps for testing the Redis cache decorators."""
+
+import asyncio
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.redis.mocks import AsyncRedisMock, RedisMock
+from archipy.configs.config_template import RedisConfig
+from archipy.helpers.decorators.redis_cache import async_redis_cache_decorator, redis_cache_decorator
+
+
+def build_redis_config():
+    """Build the Redis configuration used by the cache scenarios."""
+    return RedisConfig(MASTER_HOST="localhost", PORT=6379, DATABASE=0, DECODE_RESPONSES=True)
+
+
+def expected_value(user_id):
+    """Return the value the cached functions compute for a user."""
+    return {"id": user_id, "name": f"User {user_id}", "scores": [user_id, user_id * 2]}
+
+
+def register_cached_function(context, name, **decorator_kwargs):
+    """Decorate a counting function and store it with its call log in the scenario context."""
+    scenario_context = get_current_scenario_context(context)
+    calls = []
+
+    def compute(user_id):
+        calls.append(user_id)
+        return expected_value(user_id)
+
+    decorator_kwargs.setdefault("key_prefix", f"cache:{name}")
+    cached = redis_cache_decorator(redis_client=scenario_context.get("redis"), **decorator_kwargs)(compute)
+    scenario_context.store(f"function:{name}", cached)
+    scenario_context.store(f"calls:{name}", calls)
+
+
+@given("a Redis mock for caching")
+def step_given_redis_mock_for_caching(context):
+    """Set up a RedisMock instance for the cache scenarios."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config()))
+
+
+@given('a cached function "{name}" with serializer "{serializer}"')
+def step_given_cached_function_with_serializer(context, name, serializer):
+    """Set up a cached function using the given serializer."""
+    register_cached_function(context, name, serializer=serializer)
+
+
+@given('a cached function "{name}" with key prefix "{key_prefix}"')
+def step_given_cached_function_with_key_prefix(context, name, key_prefix):
+    """Set up a cached function sharing its keys with other functions."""
+    register_cached_function(context, name, key_prefix=key_prefix)
+
+
+@given('a cached function "{name}" tagged by user')
+def step_given_cached_function_tagged_by_user(context, name):
+    """Set up a cached function whose results are tagged with the user ID."""
+    register_cached_function(context, name, tags=lambda user_id: [f"user:{user_id}"])
+
+
+@given('a slow cached function "{name}" that always refreshes early')
+def step_given_slow_cached_function(context, name):
+    """Set up a slow cached function with a very eager early expiration."""
+    scenario_context = get_current_scenario_context(context)
+    calls = []
+
+    def compute(user_id):
+        calls.append(user_id)
+        time.sleep(0.05)
+        return expected_value(user_id)
+
+    decorator = redis_cache_decorator(redis_client=scenario_context.get("redis"), key_prefix=f"cache:{name}", beta=1e9)
+    scenario_context.store(f"function:{name}", decorator(compute))
+    scenario_context.store(f"calls:{name}", calls)
+
+
+@when('"{name}" is called with {user_id:d}')
+def step_when_function_called(context, name, user_id):
+    """Call a cached function."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get(f"function:{name}")(user_id) == expected_value(user_id)
+
+
+@when('the local cache of "{name}" is cleared')
+def step_when_local_cache_cleared(context, name):
+    """Clear the in-process cache of a cached function."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.get(f"function:{name}").clear_local_cache()
+
+
+@when('the tag "{tag}" is invalidated for "{name}"')
+def step_when_tag_invalidated(context, tag, name):
+    """Invalidate every result attached to a tag."""
+    scenario_context = get_current_scenario_context(context)
+    invalidated = scenario_context.get(f"function:{name}").invalidate_tags(tag)
+    assert invalidated == 1, f"Expected 1 invalidated key, got {invalidated}"
+
+
+@then('"{name}" should have been computed {count:d} time')
+@then('"{name}" should have been computed {count:d} times')
+def step_then_function_computed(context, name, count):
+    """Verify how many times the underlying function ran."""
+    scenario_context = get_current_scenario_context(context)
+    calls = scenario_context.get(f"calls:{name}")
+    assert len(calls) == count, f"Expected {count} computations of '{name}', got {len(calls)}"
+
+
+@then('"{name}" should return the value for {user_id:d}')
+def step_then_function_returns_value(context, name, user_id):
+    """Verify a cached function returns the expected value."""
+    scenario_context = get_current_scenario_context(context)
+    result = scenario_context.get(f"function:{name}")(user_id)
+    assert result == expected_value(user_id), f"Unexpected cached value: {result}"
+
+
+@given("an async Redis mock for caching")
+def step_given_async_redis_mock_for_caching(context):
+    """Set up an AsyncRedisMock instance for the cache scenarios."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("async_redis", AsyncRedisMock(redis_config=build_redis_config()))
+
+
+@when("{count:d} callers request an async cached value concurrently")
+async def step_when_async_callers_request_value(context, count):
+    """Call an async cached function from many concurrent callers."""
+    scenario_context = get_current_scenario_context(context)
+    calls = []
+
+    @async_redis_cache_decorator(redis_client=scenario_context.get("async_redis"), key_prefix="cache:async")
+    async def compute(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(0.05)
+        return expected_value(user_id)
+
+    results = await asyncio.gather(*(compute(9) for _ in range(count)))
+    scenario_context.store("async_calls", calls)
+    scenario_context.store("async_results", results)
+
+
+@then("the async cached function should have been computed {count:d} time")
+def step_then_async_function_computed(context, count):
+    """Verify how many times the async function ran."""
+    scenario_context = get_current_scenario_context(context)
+    calls = scenario_context.get("async_calls")
+    assert len(calls) == count, f"Expected {count} computations, got {len(calls)}"
+
+
+@then("all async callers should receive the same value")
+def step_then_async_callers_same_value(context):
+    """Verify every async caller received the computed value."""
+    scenario_context = get_current_scenario_context(context)
+    results = scenario_context.get("async_results")
+    assert all(result == expected_value(9) for result in results), f"Unexpected results: {results}"
@@ -0,0 +1,198 @@
+"""Implementation of steps for testing the Redis value codecs and model helpers."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.redis.mocks import AsyncRedisMock, RedisMock
+from archipy.adapters.redis.serializers import RedisCodec
+from archipy.configs.config_template import RedisConfig
+from archipy.models.dtos.base_dtos import BaseDTO
+
+
+class OrderDTO(BaseDTO):
+    """Order line of the profile DTO used by the codec scenarios."""
+
+    sku: str
+    quantity: int
+    price: float
+
+
+class ProfileDTO(BaseDTO):
+    """Profile DTO used by the codec scenarios."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    tags: list[str]
+    orders: list[OrderDTO]
+
+
+def build_profile(order_count):
+    """Build a profile DTO with the given number of orders."""
+    return ProfileDTO(
+        id=uuid4(),
+        name="Ada Lovelace",
+        created_at=datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+        tags=["premium", "beta"],
+        orders=[OrderDTO(sku=f"SKU-{index:05d}", quantity=index % 7 + 1, price=9.99) for index in range(order_count)],
+    )
+
+
+def build_redis_config(serializer, compression=None, threshold=1024):
+    """Build the Redis configuration used by the codec scenarios."""
+    return RedisConfig(
+        MASTER_HOST="localhost",
+        PORT=6379,
+        DATABASE=0,
+        DECODE_RESPONSES=True,
+        SERIALIZER=serializer,
+        COMPRESSION=compression,
+        COMPRESSION_THRESHOLD=threshold,
+    )
+
+
+@given('a Redis mock with the "{serializer}" serializer and no compression')
+def step_given_redis_mock_without_compression(context, serializer):
+    """Set up a RedisMock whose codec does not compress."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config(serializer)))
+    scenario_context.store("stored", {})
+
+
+@given('a Redis mock with the "{serializer}" serializer and "{compression}" compression above {threshold:d} bytes')
+def step_given_redis_mock_with_compression(context, serializer, compression, threshold):
+    """Set up a RedisMock whose codec compresses large values."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config(serializer, compression, threshold)))
+    scenario_context.store("stored", {})
+
+
+@when('a profile DTO with {order_count:d} orders is stored under "{key}"')
+def step_when_profile_stored(context, order_count, key):
+    """Store a profile DTO with set_model."""
+    scenario_context = get_current_scenario_context(context)
+    profile = build_profile(order_count)
+    assert scenario_context.get("redis").set_model(key, profile, ex=60)
+    scenario_context.get("stored")[key] = profile
+
+
+@when('profile DTOs are stored under "{first_key}" and "{second_key}"')
+def step_when_profiles_stored(context, first_key, second_key):
+    """Store two profile DTOs with set_model."""
+    for key in (first_key, second_key):
+        step_when_profile_stored(context, 2, key)
+
+
+@given('a "{serializer}" codec with "{compression}" compression above {threshold:d} bytes')
+def step_given_codec(context, serializer, compression, threshold):
+    """Set up a codec shared by the threads of a scenario."""
+    codec = RedisCodec(serializer, compression=compression, compression_threshold=threshold)
+    get_current_scenario_context(context).store("codec", codec)
+
+
+@when("{thread_count:d} threads each encode and decode {profile_count:d} profile DTOs with the codec")
+def step_when_threads_round_trip(context, thread_count, profile_count):
+    """Encode and decode profile DTOs through one codec from several threads at once."""
+    scenario_context = get_current_scenario_context(context)
+    codec = scenario_context.get("codec")
+    barrier = threading.Barrier(thread_count)
+
+    def round_trip(thread_index):
+        profiles = [build_profile(thread_index + index % 20) for index in range(profile_count)]
+        barrier.wait()
+        return [(profile, codec.decode_model(codec.encode_model(profile), ProfileDTO)) for profile in profiles]
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        results = list(executor.map(round_trip, range(thread_count)))
+    scenario_context.store("round_trips", [pair for result in results for pair in result])
+
+
+@then("every DTO should survive the round trip")
+def step_then_round_trips(context):
+    """Verify every DTO decoded by the threads equals the one they encoded."""
+    round_trips = get_current_scenario_context(context).get("round_trips")
+    assert round_trips, "No DTO was encoded"
+    assert all(profile == decoded for profile, decoded in round_trips), "A DTO differs after the round trip"
+
+
+@then('reading "{key}" as a profile DTO should return the stored DTO')
+def step_then_profile_read(context, key):
+    """Verify get_model returns the stored DTO."""
+    scenario_context = get_current_scenario_context(context)
+    profile = scenario_context.get("redis").get_model(key, ProfileDTO)
+    assert isinstance(profile, ProfileDTO), f"Expected a ProfileDTO, got {type(profile)}"
+    assert profile == scenario_context.get("stored")[key], "The DTO read differs from the stored one"
+
+
+@then('reading "{key}" without compression should return the stored DTO')
+def step_then_profile_read_without_compression(context, key):
+    """Verify a codec without compression reads compressed values."""
+    scenario_context = get_current_scenario_context(context)
+    profile = scenario_context.get("redis").get_model(key, ProfileDTO, codec=RedisCodec("json"))
+    assert profile == scenario_context.get("stored")[key], "The DTO read differs from the stored one"
+
+
+@then('the value of "{key}" should be compressed with "{compression}"')
+def step_then_value_compressed(context, key, compression):
+    """Verify a stored value is compressed and smaller than its serialized form."""
+    scenario_context = get_current_scenario_context(context)
+    data = scenario_context.get("redis").get_bytes(key)
+    expected_header = {"zstd": b"\x01", "lz4": b"\x02"}[compression]
+    uncompressed = RedisCodec("json").encode_model(scenario_context.get("stored")[key])
+    assert data[:1] == expected_header, f"Unexpected header {data[:1]!r}"
+    assert len(data) < len(uncompressed) / 2, f"Compressed {len(data)} bytes, uncompressed {len(uncompressed)} bytes"
+
+
+@then('the value of "{key}" should not be compressed')
+def step_then_value_not_compressed(context, key):
+    """Verify a small stored value is not compressed."""
+    data = get_current_scenario_context(context).get("redis").get_bytes(key)
+    assert data[:1] == b"\x00", f"Unexpected header {data[:1]!r}"
+
+
+@then('reading "{first_key}", "{missing_key}" and "{second_key}" at once should return 2 DTOs and 1 missing')
+def step_then_profiles_read_at_once(context, first_key, missing_key, second_key):
+    """Verify mget_models keeps the key order and returns None for missing keys."""
+    scenario_context = get_current_scenario_context(context)
+    stored = scenario_context.get("stored")
+    profiles = scenario_context.get("redis").mget_models([first_key, missing_key, second_key], ProfileDTO)
+    assert profiles == [stored[first_key], None, stored[second_key]], f"Unexpected models: {profiles}"
+
+
+@given(
+    'an async Redis mock with the "{serializer}" serializer and "{compression}" compression above {threshold:d} bytes'
+)
+def step_given_async_redis_mock_with_compression(context, serializer, compression, threshold):
+    """Set up an AsyncRedisMock whose codec compresses large values."""
+    scenario_context = get_current_scenario_context(context)
+    redis = AsyncRedisMock(redis_config=build_redis_config(serializer, compression, threshold))
+    scenario_context.store("async_redis", redis)
+
+
+@when(
+    'profile DTOs with {order_count:d} orders are stored asynchronously under "{first_key}" and "{second_key}"',
+)
+async def step_when_profiles_stored_async(context, order_count, first_key, second_key):
+    """Store two profile DTOs with the async adapter."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    stored = {key: build_profile(order_count) for key in (first_key, second_key)}
+    for key, profile in stored.items():
+        assert await redis.set_model(key, profile)
+    scenario_context.store("stored", stored)
+    scenario_context.store("read_one", await redis.get_model(first_key, ProfileDTO))
+    scenario_context.store("read_many", await redis.mget_models(list(stored), ProfileDTO))
+
+
+@then("reading them asynchronously should return both DTOs")
+def step_then_profiles_read_async(context):
+    """Verify the async model helpers return the stored DTOs."""
+    scenario_context = get_current_scenario_context(context)
+    stored = list(scenario_context.get("stored").values())
+    assert scenario_context.get("read_one") == stored[0], "get_model returned a different DTO"
+    assert scenario_context.get("read_many") == stored, "mget_models returned different DTOs"
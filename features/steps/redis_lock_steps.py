@@ -0,0 +1,243 @@
+"""Implementation of steps for testing RedisLock, AsyncRedisLock and single-flight helpers."""
+
+import asyncio
+import logging
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.redis.lock import AsyncRedisLock, RedisLock
+from archipy.adapters.redis.mocks import AsyncRedisMock, RedisMock
+from archipy.adapters.redis.single_flight import AsyncSingleFlight
+from archipy.configs.config_template import RedisConfig
+
+
+def get_logger(context):
+    """Return the logger attached to the context or the default behave logger."""
+    return getattr(context, "logger", logging.getLogger("behave.steps"))
+
+
+def build_redis_config():
+    """Build the Redis configuration used by the lock scenarios."""
+    return RedisConfig(MASTER_HOST="localhost", PORT=6379, DATABASE=0, DECODE_RESPONSES=True)
+
+
+@given("a configured Redis mock for locking")
+def step_given_redis_mock_for_locking(context):
+    """Set up a RedisMock instance for the lock scenarios."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config()))
+    scenario_context.store("locks", {})
+
+
+@given("a configured async Redis mock for locking")
+def step_given_async_redis_mock_for_locking(context):
+    """Set up an AsyncRedisMock instance for the lock scenarios."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("async_redis", AsyncRedisMock(redis_config=build_redis_config()))
+
+
+@when('lock owner "{owner}" acquires the lock "{name}"')
+def step_when_owner_acquires_lock(context, owner, name):
+    """Acquire a lock on behalf of the given owner."""
+    scenario_context = get_current_scenario_context(context)
+    lock = RedisLock(scenario_context.get("redis"), name)
+    assert lock.acquire(), f"Owner '{owner}' could not acquire lock '{name}'"
+    scenario_context.get("locks")[owner] = lock
+
+
+@when('lock owner "{owner}" acquires the lock "{name}" with a lease of {lease_ms:d} milliseconds')
+def step_when_owner_acquires_lock_with_lease(context, owner, name, lease_ms):
+    """Acquire a lock with a short lease on behalf of the given owner."""
+    scenario_context = get_current_scenario_context(context)
+    lock = RedisLock(scenario_context.get("redis"), name, timeout_ms=lease_ms)
+    assert lock.acquire(), f"Owner '{owner}' could not acquire lock '{name}'"
+    scenario_context.get("locks")[owner] = lock
+    scenario_context.store("lease_ms", lease_ms)
+
+
+@when('lock owner "{owner}" tries to acquire the lock "{name}" without waiting')
+def step_when_owner_tries_lock(context, owner, name):
+    """Try to acquire a lock without waiting on behalf of the given owner."""
+    scenario_context = get_current_scenario_context(context)
+    lock = RedisLock(scenario_context.get("redis"), name)
+    lock.acquire(blocking=False)
+    scenario_context.get("locks")[owner] = lock
+    get_logger(context).info(f"Owner '{owner}' holds lock '{name}': {lock.owned}")
+
+
+@when('lock owner "{owner}" releases the lock')
+def step_when_owner_releases_lock(context, owner):
+    """Release the lock held by the given owner."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("locks")[owner].release(), f"Owner '{owner}' could not release the lock"
+
+
+@when("the lease expires")
+def step_when_lease_expires(context):
+    """Wait until the lease of the acquired lock has expired."""
+    scenario_context = get_current_scenario_context(context)
+    time.sleep(scenario_context.get("lease_ms") * 2 / 1000)
+
+
+@then('lock owner "{owner}" should hold the lock with fencing token {fencing_token:d}')
+def step_then_owner_holds_lock(context, owner, fencing_token):
+    """Verify the owner holds the lock with the expected fencing token."""
+    scenario_context = get_current_scenario_context(context)
+    lock = scenario_context.get("locks")[owner]
+    assert lock.owned, f"Owner '{owner}' does not hold the lock"
+    assert lock.fencing_token == fencing_token, f"Expected fencing token {fencing_token}, got {lock.fencing_token}"
+    assert scenario_context.get("redis").get(lock.lock_key) == lock.token
+
+
+@then('lock owner "{owner}" should not hold the lock')
+def step_then_owner_does_not_hold_lock(context, owner):
+    """Verify the owner does not hold the lock."""
+    scenario_context = get_current_scenario_context(context)
+    lock = scenario_context.get("locks")[owner]
+    assert not lock.owned, f"Owner '{owner}' unexpectedly holds the lock"
+
+
+@then('releasing the lock by owner "{owner}" should fail')
+def step_then_release_fails(context, owner):
+    """Verify an owner whose lease expired cannot release the lock."""
+    scenario_context = get_current_scenario_context(context)
+    assert not scenario_context.get("locks")[owner].release(), f"Owner '{owner}' released a lock it did not own"
+
+
+@when(
+    'an async lock "{name}" with a lease of {lease_ms:d} milliseconds and auto extension '
+    "is held for {hold_ms:d} milliseconds",
+)
+async def step_when_async_lock_held(context, name, lease_ms, hold_ms):
+    """Hold an auto-extended async lock for longer than its lease."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    lock = AsyncRedisLock(redis, name, timeout_ms=lease_ms, auto_extend=True)
+    async with lock:
+        await asyncio.sleep(hold_ms / 1000)
+        scenario_context.store("owned_while_held", lock.owned and await redis.get(lock.lock_key) == lock.token)
+    scenario_context.store("exists_after_release", await redis.exists(lock.lock_key))
+
+
+@then("the async lock should still be owned")
+def step_then_async_lock_owned(context):
+    """Verify the async lock was still owned at the end of the critical section."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("owned_while_held"), "The lock expired while it was held"
+
+
+@then("the async lock should be released afterwards")
+def step_then_async_lock_released(context):
+    """Verify the async lock key was deleted on release."""
+    scenario_context = get_current_scenario_context(context)
+    assert scenario_context.get("exists_after_release") == 0, "The lock key still exists after release"
+
+
+@given("an in-process async single flight")
+def step_given_in_process_single_flight(context):
+    """Set up an AsyncSingleFlight without cross-process locking."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("flights", [AsyncSingleFlight()])
+
+
+@given("{count:d} async single flights sharing the Redis mock")
+def step_given_shared_single_flights(context, count):
+    """Set up several AsyncSingleFlight instances simulating separate processes."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    scenario_context.store("flights", [AsyncSingleFlight(redis, lock_timeout_ms=1000) for _ in range(count)])
+
+
+@when('{count:d} callers request the key "{key}" concurrently')
+async def step_when_callers_request_key(context, count, key):
+    """Request the same key from many concurrent callers."""
+    scenario_context = get_current_scenario_context(context)
+    flight = scenario_context.get("flights")[0]
+    calls = []
+
+    async def compute():
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return {"key": key, "value": len(calls)}
+
+    results = await asyncio.gather(*(flight.do(key, compute) for _ in range(count)))
+    scenario_context.store("calls", calls)
+    scenario_context.store("results", results)
+
+
+@when('the first of 2 callers requesting the key "{key}" is cancelled')
+async def step_when_first_caller_cancelled(context, key):
+    """Cancel the caller that started the computation while a second caller awaits it."""
+    scenario_context = get_current_scenario_context(context)
+    flight = scenario_context.get("flights")[0]
+    calls = []
+
+    async def compute():
+        calls.append(key)
+        await asyncio.sleep(0.1)
+        return {"key": key, "value": len(calls)}
+
+    first = asyncio.create_task(flight.do(key, compute))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(flight.do(key, compute))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    scenario_context.store("calls", calls)
+    scenario_context.store("results", results)
+
+
+@when('both single flights request the key "{key}" concurrently with a shared cache')
+async def step_when_flights_request_key(context, key):
+    """Request the same key from every single flight at once."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    calls = []
+
+    async def compute():
+        calls.append(key)
+        await asyncio.sleep(0.1)
+        value = f"value-{len(calls)}"
+        await redis.set(f"cache:{key}", value)
+        return value
+
+    async def recheck():
+        return await redis.get(f"cache:{key}")
+
+    results = await asyncio.gather(
+        *(flight.do(key, compute, recheck=recheck) for flight in scenario_context.get("flights")),
+    )
+    scenario_context.store("calls", calls)
+    scenario_context.store("results", results)
+
+
+@then("the computation should run {count:d} time")
+def step_then_computation_runs(context, count):
+    """Verify how many times the computation ran."""
+    scenario_context = get_current_scenario_context(context)
+    calls = scenario_context.get("calls")
+    assert len(calls) == count, f"Expected {count} computations, got {len(calls)}"
+
+
+@then("all callers should receive the same result")
+def step_then_same_result(context):
+    """Verify every caller received the same result."""
+    scenario_context = get_current_scenario_context(context)
+    results = scenario_context.get("results")
+    assert all(result == results[0] for result in results), f"Callers received different results: {results}"
+
+
+@then("the first caller should have been cancelled")
+def step_then_first_caller_cancelled(context):
+    """Verify the first caller saw its own cancellation."""
+    results = get_current_scenario_context(context).get("results")
+    assert isinstance(results[0], asyncio.CancelledError), f"Expected a cancellation, got {results[0]!r}"
+
+
+@then("the second caller should receive the computed value")
+def step_then_second_caller_value(context):
+    """Verify the second caller received the value despite the first caller being cancelled."""
+    results = get_current_scenario_context(context).get("results")
+    assert results[1] == {"key": "dashboard", "value": 1}, f"Unexpected result: {results[1]!r}"
@@ -0,0 +1,226 @@
+"""Implementation of steps for testing the simulated Redis cluster and fault injection."""
+
+import asyncio
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+from redis.exceptions import ConnectionError as RedisConnectionError, RedisClusterException
+
+from archipy.adapters.redis.mocks import AsyncRedisMock, RedisFaultInjector, RedisMock
+from archipy.configs.config_template import RedisConfig, RedisMode
+
+
+def build_cluster_config(primaries):
+    """Build the configuration of a Redis cluster with the given number of primaries."""
+    return RedisConfig(
+        MODE=RedisMode.CLUSTER,
+        CLUSTER_NODES=[f"127.0.0.1:{7000 + index}" for index in range(primaries)],
+    )
+
+
+def build_redis_config():
+    """Build the configuration of a standalone Redis."""
+    return RedisConfig(MASTER_HOST="localhost", PORT=6379, DATABASE=0, DECODE_RESPONSES=True)
+
+
+@given("a simulated Redis cluster with {primaries:d} primaries")
+def step_given_simulated_cluster(context, primaries):
+    """Set up a RedisMock in cluster mode."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("redis", RedisMock(redis_config=build_cluster_config(primaries)))
+
+
+@given("a Redis mock with {latency_ms:d} milliseconds of latency per round trip")
+def step_given_redis_mock_with_latency(context, latency_ms):
+    """Set up a RedisMock adding latency to every round trip."""
+    scenario_context = get_current_scenario_context(context)
+    faults = RedisFaultInjector(latency_ms=latency_ms)
+    scenario_context.store("faults", faults)
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config(), faults=faults))
+
+
+@given('a Redis mock where "{command}" always fails')
+def step_given_redis_mock_with_failing_command(context, command):
+    """Set up a RedisMock failing every call of a command."""
+    scenario_context = get_current_scenario_context(context)
+    faults = RedisFaultInjector(failing_commands=[command])
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config(), faults=faults))
+
+
+@then('the key "{key}" should map to slot {slot:d}')
+def step_then_key_maps_to_slot(context, key, slot):
+    """Verify the CRC16 slot of a key."""
+    actual = get_current_scenario_context(context).get("redis").cluster_keyslot(key)
+    assert actual == slot, f"Expected slot {slot}, got {actual}"
+
+
+@then('the keys "{first_key}" and "{second_key}" should map to the same slot')
+def step_then_keys_share_slot(context, first_key, second_key):
+    """Verify keys with the same hash tag share a slot."""
+    redis = get_current_scenario_context(context).get("redis")
+    assert redis.cluster_keyslot(first_key) == redis.cluster_keyslot(second_key), "Hash tags were ignored"
+
+
+@when('{count:d} keys with the prefix "{prefix}" are stored')
+def step_when_prefixed_keys_stored(context, count, prefix):
+    """Store keys with a common prefix."""
+    redis = get_current_scenario_context(context).get("redis")
+    for index in range(count):
+        redis.set(f"{prefix}{index}", index)
+
+
+@then("every primary should hold some of the keys")
+def step_then_keys_spread(context):
+    """Verify the keys are spread over every primary."""
+    cluster = get_current_scenario_context(context).get("redis").client
+    sizes = {name: node_client.dbsize() for name, node_client in cluster.node_clients.items()}
+    assert all(sizes.values()), f"Some primaries hold no keys: {sizes}"
+
+
+@then('counting the keys matching "{pattern}" should return {count:d}')
+def step_then_keys_counted(context, pattern, count):
+    """Verify the keys counted on every primary."""
+    actual = get_current_scenario_context(context).get("redis").count_by_pattern(pattern)
+    assert actual == count, f"Expected {count} keys, got {actual}"
+
+
+@then('deleting the keys matching "{pattern}" should remove {count:d} keys')
+def step_then_keys_deleted(context, pattern, count):
+    """Verify the keys deleted on every primary."""
+    redis = get_current_scenario_context(context).get("redis")
+    deleted = redis.delete_by_pattern(pattern)
+    assert deleted == count, f"Expected {count} deleted keys, got {deleted}"
+    assert redis.count_by_pattern(pattern) == 0, "Keys remain after the deletion"
+
+
+@when('the keys "{first_key}" and "{second_key}" and "{third_key}" are stored')
+def step_when_keys_stored(context, first_key, second_key, third_key):
+    """Store keys named after themselves."""
+    redis = get_current_scenario_context(context).get("redis")
+    for key in (first_key, second_key, third_key):
+        redis.set(key, key)
+
+
+@then('getting "{first_key}" and "{second_key}" at once should succeed')
+def step_then_mget_succeeds(context, first_key, second_key):
+    """Verify MGET of keys in one slot."""
+    values = get_current_scenario_context(context).get("redis").mget([first_key, second_key])
+    assert values == [first_key, second_key], f"Unexpected values: {values}"
+
+
+@then('getting "{first_key}" and "{second_key}" at once should fail with a cross-slot error')
+def step_then_mget_fails(context, first_key, second_key):
+    """Verify MGET of keys in different slots is rejected."""
+    try:
+        get_current_scenario_context(context).get("redis").mget([first_key, second_key])
+    except RedisClusterException as exception:
+        assert "same key slot" in str(exception), f"Unexpected error: {exception}"
+    else:
+        raise AssertionError("MGET across slots did not fail")
+
+
+@then("pipelining GET over all three keys should return every value")
+def step_then_pipeline_spans_slots(context):
+    """Verify a non-transactional pipeline spans slots and keeps the order of the replies."""
+    pipeline = get_current_scenario_context(context).get("redis").get_pipeline(transaction=False)
+    keys = ["order:1", "{cart:7}:items", "{cart:7}:total"]
+    for key in keys:
+        pipeline.get(key)
+    values = pipeline.execute()
+    assert values == keys, f"Unexpected values: {values}"
+
+
+@when("{count:d} keys are written one command at a time")
+def step_when_keys_written_individually(context, count):
+    """Write keys with one round trip each."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("redis")
+    started = time.monotonic()
+    for index in range(count):
+        redis.set(f"single:{index}", index)
+    scenario_context.store("single_seconds", time.monotonic() - started)
+
+
+@when("{count:d} keys are written in one pipeline")
+def step_when_keys_written_pipelined(context, count):
+    """Write keys in one pipelined round trip."""
+    scenario_context = get_current_scenario_context(context)
+    pipeline = scenario_context.get("redis").get_pipeline(transaction=False)
+    started = time.monotonic()
+    for index in range(count):
+        pipeline.set(f"pipelined:{index}", index)
+    pipeline.execute()
+    scenario_context.store("pipeline_seconds", time.monotonic() - started)
+
+
+@then("the pipeline should take less than half the time of the single commands")
+def step_then_pipeline_faster(context):
+    """Verify the pipeline paid the latency once."""
+    scenario_context = get_current_scenario_context(context)
+    single_seconds = scenario_context.get("single_seconds")
+    pipeline_seconds = scenario_context.get("pipeline_seconds")
+    assert pipeline_seconds < single_seconds / 2, f"Pipeline {pipeline_seconds:.3f}s, single {single_seconds:.3f}s"
+
+
+@then("the mock should have counted {sets:d} SET round trips and {pipelines:d} PIPELINE round trip")
+def step_then_round_trips_counted(context, sets, pipelines):
+    """Verify the round trips counted by the fault injector."""
+    round_trips = get_current_scenario_context(context).get("faults").round_trips
+    assert round_trips["SET"] == sets, f"Unexpected round trips: {round_trips}"
+    assert round_trips["PIPELINE"] == pipelines, f"Unexpected round trips: {round_trips}"
+
+
+@then("incrementing a counter should raise a connection error")
+def step_then_increment_fails(context):
+    """Verify the failing command raises a connection error."""
+    try:
+        get_current_scenario_context(context).get("redis").incrby("counter", 1)
+    except RedisConnectionError as exception:
+        assert "INCRBY" in str(exception), f"Unexpected error: {exception}"
+    else:
+        raise AssertionError("INCRBY did not fail")
+
+
+@then("setting a key should still succeed")
+def step_then_set_succeeds(context):
+    """Verify other commands are not affected."""
+    redis = get_current_scenario_context(context).get("redis")
+    assert redis.set("key", "value"), "SET failed"
+    assert redis.get("key") == "value"
+
+
+@given("an async simulated Redis cluster with {primaries:d} primaries and {latency_ms:d} milliseconds of latency")
+def step_given_async_simulated_cluster(context, primaries, latency_ms):
+    """Set up an AsyncRedisMock in cluster mode adding latency to every round trip."""
+    scenario_context = get_current_scenario_context(context)
+    faults = RedisFaultInjector(latency_ms=latency_ms)
+    scenario_context.store("latency_ms", latency_ms)
+    scenario_context.store("async_redis", AsyncRedisMock(redis_config=build_cluster_config(primaries), faults=faults))
+
+
+@when("{count:d} keys are written concurrently")
+async def step_when_keys_written_concurrently(context, count):
+    """Write keys concurrently and count them on every primary."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    started = time.monotonic()
+    await asyncio.gather(*(redis.set(f"event:{index}", index) for index in range(count)))
+    scenario_context.store("concurrent_seconds", time.monotonic() - started)
+    scenario_context.store("counted", await redis.count_by_pattern("event:*"))
+
+
+@then("the writes should take less than {round_trips:d} round trips of latency")
+def step_then_writes_overlap(context, round_trips):
+    """Verify the latency of concurrent writes overlaps."""
+    scenario_context = get_current_scenario_context(context)
+    seconds = scenario_context.get("concurrent_seconds")
+    limit = round_trips * scenario_context.get("latency_ms") / 1000
+    assert seconds < limit, f"Concurrent writes took {seconds:.3f}s, limit {limit:.3f}s"
+
+
+@then("counting the keys asynchronously should return {count:d}")
+def step_then_keys_counted_async(context, count):
+    """Verify the keys counted on every primary of the async cluster."""
+    counted = get_current_scenario_context(context).get("counted")
+    assert counted == count, f"Expected {count} keys, got {counted}"
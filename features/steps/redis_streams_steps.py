@@ -0,0 +1,200 @@
+"""Implementation of steps for testing the Redis stream consumers."""
+
+import asyncio
+import threading
+import time
+
+from behave import given, then, when
+from features.test_helpers import get_current_scenario_context
+
+from archipy.adapters.redis.mocks import AsyncRedisMock, RedisMock
+from archipy.adapters.redis.streams import AsyncRedisStreamConsumer, RedisStreamConsumer
+from archipy.configs.config_template import RedisConfig
+
+
+def build_redis_config():
+    """Build the Redis configuration used by the stream scenarios."""
+    return RedisConfig(MASTER_HOST="localhost", PORT=6379, DATABASE=0, DECODE_RESPONSES=True)
+
+
+def wait_until(predicate, timeout_seconds=5):
+    """Poll a predicate until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout_seconds
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@given("a Redis mock for streams")
+def step_given_redis_mock_for_streams(context):
+    """Set up a RedisMock instance for the stream scenarios."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("redis", RedisMock(redis_config=build_redis_config()))
+
+
+@given("an async Redis mock for streams")
+def step_given_async_redis_mock_for_streams(context):
+    """Set up an AsyncRedisMock instance for the stream scenarios."""
+    scenario_context = get_current_scenario_context(context)
+    scenario_context.store("async_redis", AsyncRedisMock(redis_config=build_redis_config()))
+
+
+@given('{count:d} jobs in the stream "{stream}"')
+def step_given_jobs_in_stream(context, count, stream):
+    """Add numbered jobs to a stream."""
+    redis = get_current_scenario_context(context).get("redis")
+    for job in range(1, count + 1):
+        redis.xadd(stream, {"job": job})
+
+
+@when('{count:d} entries are added to the stream "{stream}" with a maximum length of {maxlen:d}')
+def step_when_entries_added_with_maxlen(context, count, stream, maxlen):
+    """Add entries to a stream with exact MAXLEN trimming."""
+    redis = get_current_scenario_context(context).get("redis")
+    for entry in range(count):
+        redis.xadd(stream, {"entry": entry}, maxlen=maxlen, approximate=False)
+
+
+@then('the stream "{stream}" should contain {count:d} entries')
+def step_then_stream_contains(context, stream, count):
+    """Verify the length of a stream."""
+    length = get_current_scenario_context(context).get("redis").xlen(stream)
+    assert length == count, f"Expected {count} entries, got {length}"
+
+
+def run_sync_consumer(context, group, stream, count, failing_job=None):
+    """Run a sync consumer in a thread until the given number of jobs were handled."""
+    scenario_context = get_current_scenario_context(context)
+    handled = []
+
+    def handler(message):
+        handled.append(message.fields["job"])
+        if message.fields["job"] == str(failing_job):
+            raise ValueError(f"Job {failing_job} failed")
+
+    consumer = RedisStreamConsumer(scenario_context.get("redis"), stream, group, handler, block_ms=10, concurrency=4)
+    thread = threading.Thread(target=consumer.run, daemon=True)
+    thread.start()
+    assert wait_until(lambda: len(handled) >= count), f"Only {len(handled)} of {count} jobs were handled"
+    consumer.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "The consumer did not stop"
+    scenario_context.store("handled", handled)
+
+
+@when('a stream consumer of group "{group}" processes {count:d} jobs from "{stream}"')
+def step_when_consumer_processes_jobs(context, group, count, stream):
+    """Consume jobs with a sync consumer."""
+    run_sync_consumer(context, group, stream, count)
+
+
+@when('a stream consumer of group "{group}" processes {count:d} jobs from "{stream}" failing job {failing_job:d}')
+def step_when_consumer_processes_jobs_with_failure(context, group, count, stream, failing_job):
+    """Consume jobs with a sync consumer whose handler fails for one job."""
+    run_sync_consumer(context, group, stream, count, failing_job)
+
+
+@then("every job should have been handled once")
+def step_then_every_job_handled_once(context):
+    """Verify each job was handled exactly once."""
+    handled = get_current_scenario_context(context).get("handled")
+    assert len(handled) == len(set(handled)), f"Some jobs were handled more than once: {handled}"
+
+
+@then('the group "{group}" of "{stream}" should have {count:d} pending entries')
+def step_then_group_pending(context, group, stream, count):
+    """Verify the number of unacknowledged entries of a group."""
+    redis = get_current_scenario_context(context).get("redis")
+    pending = redis.xpending(stream, group)["pending"]
+    assert pending == count, f"Expected {count} pending entries, got {pending}"
+
+
+@when('consumer "{consumer}" of group "{group}" reads {count:d} jobs from "{stream}" without acknowledging them')
+async def step_when_consumer_reads_without_ack(context, consumer, group, count, stream):
+    """Simulate a consumer that crashes after reading jobs."""
+    redis = get_current_scenario_context(context).get("async_redis")
+    await redis.xgroup_create(stream, group, id="0", mkstream=True)
+    for job in range(1, count + 1):
+        await redis.xadd(stream, {"job": job})
+    response = await redis.xreadgroup(group, consumer, {stream: ">"}, count=count)
+    assert len(response[0][1]) == count
+
+
+async def run_async_consumer(context, consumer, count):
+    """Run an async consumer until the given number of jobs were handled."""
+    task = asyncio.create_task(consumer.run())
+    deadline = time.monotonic() + 5
+    while len(consumer.handled) < count and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    consumer.stop()
+    await asyncio.wait_for(task, timeout=5)
+
+
+@when('an async stream consumer of group "{group}" runs on "{stream}" until {count:d} jobs are handled')
+async def step_when_async_consumer_runs(context, group, stream, count):
+    """Run an async consumer that reclaims stale entries immediately."""
+    scenario_context = get_current_scenario_context(context)
+    handled = []
+
+    async def handler(message):
+        handled.append(message.fields["job"])
+
+    consumer = AsyncRedisStreamConsumer(
+        scenario_context.get("async_redis"),
+        stream,
+        group,
+        handler,
+        consumer_name="survivor",
+        block_ms=10,
+        claim_min_idle_ms=0,
+    )
+    consumer.handled = handled
+    await run_async_consumer(context, consumer, count)
+    scenario_context.store("handled", handled)
+    scenario_context.store("pending", await scenario_context.get("async_redis").xpending(stream, group))
+
+
+@when("an async stream consumer with concurrency {concurrency:d} runs on {count:d} slow jobs")
+async def step_when_async_consumer_runs_slow_jobs(context, concurrency, count):
+    """Run an async consumer with a small concurrency on slow jobs."""
+    scenario_context = get_current_scenario_context(context)
+    redis = scenario_context.get("async_redis")
+    for job in range(1, count + 1):
+        await redis.xadd("jobs", {"job": job})
+    handled = []
+    in_flight = {"current": 0, "max": 0}
+
+    async def handler(message):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.02)
+        in_flight["current"] -= 1
+        handled.append(message.fields["job"])
+
+    consumer = AsyncRedisStreamConsumer(redis, "jobs", "workers", handler, block_ms=10, concurrency=concurrency)
+    consumer.handled = handled
+    await run_async_consumer(context, consumer, count)
+    scenario_context.store("handled", handled)
+    scenario_context.store("max_in_flight", in_flight["max"])
+    scenario_context.store("pending", await redis.xpending("jobs", "workers"))
+
+
+@then("the async stream consumer should have handled {count:d} jobs")
+def step_then_async_consumer_handled(context, count):
+    """Verify how many jobs the async consumer handled."""
+    handled = get_current_scenario_context(context).get("handled")
+    assert len(handled) == count, f"Expected {count} handled jobs, got {len(handled)}"
+
+
+@then("no more than {count:d} jobs should have been in flight at once")
+def step_then_max_in_flight(context, count):
+    """Verify the concurrency bound of the async consumer."""
+    max_in_flight = get_current_scenario_context(context).get("max_in_flight")
+    assert max_in_flight <= count, f"{max_in_flight} jobs were in flight at once"
+
+
+@then('the async group "{group}" of "{stream}" should have {count:d} pending entries')
+def step_then_async_group_pending(context, group, stream, count):
+    """Verify the number of unacknowledged entries recorded after the async consumer stopped."""
+    pending = get_current_scenario_context(context).get("pending")["pending"]
+    assert pending == count, f"Expected {count} pending entries, got {pending}"